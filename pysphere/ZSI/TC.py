@@ -1452,13 +1452,7 @@ class AnyElement(AnyType):
         nspname,pname = _get_element_nsuri_name(elt)
         what = GED(nspname, pname)
         if not skip and what is not None:
-            pyobj = what.parse(elt, ps)
-            try:
-                pyobj.typecode = what
-            except AttributeError, ex:
-                # Assume this means builtin type.
-                pyobj = WrapImmutable(pyobj, what)
-            return pyobj
+            return self._set_typecode(what.parse(elt, ps), what)
 
         # Allow use of "<any>" element declarations w/ local
         # element declarations
@@ -1469,13 +1463,7 @@ class AnyElement(AnyType):
             # look for 'primitives'.
             pyclass = GTD(namespaceURI, typeName) or Any
             what = pyclass(pname=(nspname,pname))
-            pyobj = what.parse(elt, ps)
-            try:
-                pyobj.typecode = what
-            except AttributeError, ex:
-                # Assume this means builtin type.
-                pyobj = WrapImmutable(pyobj, what)
-
+            pyobj = self._set_typecode(what.parse(elt, ps), what)
             what.typed = True
             return pyobj
 
@@ -1507,11 +1495,24 @@ class AnyElement(AnyType):
         if isinstance(pyobj, dict):
             return pyobj
 
+        return self._set_typecode(pyobj, what)
+
+    def _set_typecode(self, pyobj, what):
+        '''Makes pyobj self-describing, ie. serializable, by setting its
+        typecode. Holders already carry their own typecode as a class
+        attribute, and slotted holders (see pyclass_type.use_slots) can't
+        take an instance one.
+        '''
+        if getattr(type(pyobj), 'typecode', None) is what:
+            return pyobj
         try:
             pyobj.typecode = what
         except AttributeError:
+            if hasattr(type(pyobj), '__slots__') and \
+                hasattr(type(pyobj), 'typecode'):
+                return pyobj
+            # Assume this means builtin type.
             pyobj = WrapImmutable(pyobj, what)
-
         return pyobj
 
 
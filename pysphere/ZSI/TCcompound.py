@@ -24,6 +24,8 @@ _find_arrayposition = lambda E: E.getAttributeNS(SOAP.ENC, "position")
 _offset_pat = re.compile(r'\[[0-9]+\]')
 _position_pat = _offset_pat
 
+_name_match = TypeCode.name_match.im_func
+
 def _check_typecode_list(ofwhat, tcname):
     '''Check a list of typecodes for compliance with Struct
     requirements.'''
@@ -127,6 +129,36 @@ class ComplexType(TypeCode):
                         str(type(self.pyclass)))
             _check_typecode_list(self.ofwhat, 'ComplexType')
 
+    def _get_child_table(self):
+        '''Returns a dict mapping (namespace, localname) of child elements
+        to their typecode, built from ofwhat on first use, or None if the
+        content model needs the sequential scan in parse (inorder, wildcards,
+        substitution groups, defaults or repeated names).
+        '''
+        cached = self.__dict__.get('_child_table')
+        if cached is not None and cached[0] is self.ofwhat:
+            return cached[1]
+
+        table, names = {}, set()
+        if self.inorder is not True:
+            for what in self.ofwhat:
+                if callable(what): what = what()
+                if isinstance(what, (AnyElement, ElementDeclaration)) or \
+                    hasattr(what, 'default') or \
+                    getattr(what.name_match, 'im_func', None) is not _name_match:
+                    table = None
+                    break
+                if what.pname in names:
+                    table = None
+                    break
+                names.add(what.pname)
+                table[(what.nspname or None, what.pname)] = what
+        else:
+            table = None
+
+        self._child_table = (self.ofwhat, table)
+        return table
+
     def parse(self, elt, ps):
         debug = self.logger.debugOn()
         debug and self.logger.debug('parse')
@@ -175,6 +207,34 @@ class ComplexType(TypeCode):
         if self.mixed is True:
             setattr(pyobj, self.mixed_aname, self.simple_value(elt,ps, mixed=True))
 
+        # Dispatch each kid straight to its typecode when the content model
+        # allows it, rather than scanning ofwhat for every kid.
+        table = self._get_child_table()
+        if table is not None:
+            for c_elt in c:
+                what = table.get((c_elt.namespaceURI, c_elt.localName)) or \
+                    table.get((None, c_elt.localName))
+                if what is None:
+                    if debug:
+                        self.logger.debug("no element (%s,%s)",
+                                          c_elt.namespaceURI, c_elt.localName)
+                    continue
+
+                value = what.parse(c_elt, ps)
+                if what.maxOccurs > 1:
+                    attr = getattr(pyobj, what.aname, None)
+                    if attr is not None:
+                        attr.append(value)
+                    else:
+                        setattr(pyobj, what.aname, [value])
+                else:
+                    setattr(pyobj, what.aname, value)
+
+            if isinstance(pyobj, ComplexType._DictHolder):
+                return pyobj.__dict__
+
+            return pyobj
+
         # Clone list of kids (we null it out as we process)
         c, crange = c[:], range(len(c))
         # Loop over all items we're expecting
@@ -363,24 +423,18 @@ class ComplexType(TypeCode):
                          self.nspname,self.pname,what.aname,whatTC.maxOccurs,_seqtypes),
                          sw.Backtrace(elt))
 
-                for v2 in v:
-                    occurs += 1
-                    if occurs > whatTC.maxOccurs:
-                        raise EvaluateException('occurances (%d) exceeded maxOccurs(%d) for <%s>' %(
-                                occurs, whatTC.maxOccurs, what.pname),
-                                sw.Backtrace(elt))
-
-                    what = _get_type_or_substitute(whatTC, v2, sw, elt)
-                    if debug and what is not whatTC:
-                        self.logger.debug('substitute derived type: %s' %
-                                          what.__class__)
-
-                    what.serialize(elem, sw, v2, **kw)
-#                    try:
-#                        what.serialize(elem, sw, v2, **kw)
-#                    except Exception, e:
-#                        raise EvaluateException('Serializing %s.%s, %s %s' %
-#                            (n, whatTC.aname or '?', e.__class__.__name__, str(e)))
+                # A writer.FragmentList is serialized once for each namespace
+                # scope, then its elements are appended again
+                fragments = getattr(v, 'fragments', None)
+                if fragments is not None and \
+                   hasattr(elem, 'createAppendFragment'):
+                    elem.createAppendFragment(fragments,
+                        (whatTC.nspname, whatTC.pname),
+                        lambda e: self._serialize_occurs(e, sw, whatTC, v,
+                                                         **kw))
+                    occurs = len(v)
+                else:
+                    occurs = self._serialize_occurs(elem, sw, whatTC, v, **kw)
 
                 if occurs < whatTC.minOccurs:
                     raise EvaluateException(\
@@ -410,6 +464,26 @@ class ComplexType(TypeCode):
                     sw.Backtrace(elt))
 
 
+    def _serialize_occurs(self, elt, sw, whatTC, v, **kw):
+        '''Serializes each item of the sequence @v, the occurrences of the
+        element @whatTC, and returns how many there are.
+        '''
+        occurs = 0
+        for v2 in v:
+            occurs += 1
+            if occurs > whatTC.maxOccurs:
+                raise EvaluateException('occurances (%d) exceeded maxOccurs(%d) for <%s>' %(
+                        occurs, whatTC.maxOccurs, whatTC.pname),
+                        sw.Backtrace(elt))
+
+            what = _get_type_or_substitute(whatTC, v2, sw, elt)
+            if what is not whatTC and self.logger.debugOn():
+                self.logger.debug('substitute derived type: %s' %
+                                  what.__class__)
+
+            what.serialize(elt, sw, v2, **kw)
+        return occurs
+
     def setDerivedTypeContents(self, extensions=None, restrictions=None):
         """For derived types set appropriate parameter and
         """
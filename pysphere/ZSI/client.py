@@ -12,7 +12,7 @@ from pysphere.ZSI import _seqtypes, ParsedSoap, SoapWriter, TC, ZSI_SCHEMA_URI,\
 from pysphere.ZSI.auth import AUTH
 from pysphere.ZSI.TC import String
 from pysphere.ZSI.TCcompound import Struct
-import base64, httplib, Cookie, time, urlparse
+import base64, httplib, Cookie, time, urlparse, socket, select
 from pysphere.ZSI.address import Address
 from pysphere.ZSI.wstools.logging import getLogger as _GetLogger
 _b64_encode = base64.encodestring
@@ -85,6 +85,79 @@ class _NamedParamCaller:
                    **kw)
 
 
+def _is_stale(conn):
+    '''Return True if an idle connection can't be reused: it has no socket,
+    or its socket is readable, meaning the server closed it (or sent data
+    nobody asked for).
+    '''
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        return bool(select.select([sock], [], [], 0)[0])
+    except (select.error, socket.error, ValueError):
+        return True
+
+
+class _ConnectionPool:
+    '''Keeps idle persistent (HTTP/1.1 keep-alive) connections so they can be
+    reused by later requests instead of paying a new TCP and SSL handshake
+    on every call. A connection is only handed to one thread at a time.
+    Connections the server closed while idle are discarded.
+    '''
+
+    def __init__(self, max_size, max_idle):
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self._idle = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        '''Return an idle connection for key, or None if there is none
+        younger than max_idle seconds.
+        '''
+        now = time.time()
+        self._lock.acquire()
+        try:
+            conns = self._idle.get(key, [])
+            while conns:
+                conn, stamp = conns.pop()
+                self._count -= 1
+                if now - stamp <= self.max_idle and not _is_stale(conn):
+                    return conn
+                conn.close()
+        finally:
+            self._lock.release()
+        return None
+
+    def put(self, key, conn):
+        '''Give back a connection whose response was fully read.
+        '''
+        self._lock.acquire()
+        try:
+            if self._count < self.max_size:
+                self._idle.setdefault(key, []).append((conn, time.time()))
+                self._count += 1
+                return
+        finally:
+            self._lock.release()
+        conn.close()
+
+    def clear(self):
+        '''Close every idle connection.
+        '''
+        self._lock.acquire()
+        try:
+            for conns in self._idle.itervalues():
+                for conn, _ in conns:
+                    conn.close()
+            self._idle = {}
+            self._count = 0
+        finally:
+            self._lock.release()
+
+
 class _Binding:
     '''Object that represents a binding (connection) to a SOAP server.
     Once the binding is created, various ways of sending and
@@ -92,11 +165,14 @@ class _Binding:
     '''
     defaultHttpTransport = httplib.HTTPConnection
     defaultHttpsTransport = httplib.HTTPSConnection
+    defaultPoolSize = 10
+    defaultMaxIdle = 30
     logger = _GetLogger('ZSI.client.Binding')
 
     def __init__(self, nsdict=None, transport=None, url=None, tracefile=None,
                  readerclass=None, writerclass=None, soapaction='',
-                 wsAddressURI=None, sig_handler=None, transdict=None, **kw):
+                 wsAddressURI=None, sig_handler=None, transdict=None,
+                 pool_size=None, max_idle=None, **kw):
         '''Initialize.
         Keyword arguments include:
             transport -- default use HTTPConnection.
@@ -107,12 +183,17 @@ class _Binding:
             nsdict -- namespace entries to add
             tracefile -- file to dump packet traces
             cert_file, key_file -- SSL data (q.v.)
-            readerclass -- DOM reader class
+            readerclass -- DOM reader class (e.g. parse.CompactReader)
             writerclass -- DOM writer class, implements MessageInterface
+            (e.g. writer.StringElementProxy)
             wsAddressURI -- namespaceURI of WS-Address to use.  By default
             it's not used.
             sig_handler -- XML Signature handler, must sign and verify.
             endPointReference -- optional Endpoint Reference.
+            pool_size -- max number of idle keep-alive connections kept for
+            reuse, 0 opens a new connection for every request.
+            max_idle -- seconds an idle connection may wait in the pool
+            before being discarded.
         '''
         #self.data = None
         #self.ps = None
@@ -131,6 +212,14 @@ class _Binding:
         self.endPointReference = kw.get('endPointReference', None)
         self.cookies = Cookie.SimpleCookie()
         self.http_callbacks = {}
+
+        if pool_size is None:
+            pool_size = self.defaultPoolSize
+        if max_idle is None:
+            max_idle = self.defaultMaxIdle
+        self.pool = None
+        if pool_size > 0:
+            self.pool = _ConnectionPool(pool_size, max_idle)
         
         #thread local data
         self.local = threading.local()
@@ -164,6 +253,12 @@ class _Binding:
         '''
         self.cookies = Cookie.SimpleCookie()
 
+    def CloseConnections(self):
+        '''Close the idle keep-alive connections.
+        '''
+        if self.pool is not None:
+            self.pool.clear()
+
     def AddHeader(self, header, value):
         '''Add a header to send.
         '''
@@ -187,6 +282,56 @@ class _Binding:
                 attrs.append('$Domain=%s' % value)
             self.local.h.putheader('Cookie', "; ".join(attrs))
 
+    def __connect(self, transport, netloc, reuse=True):
+        '''Set self.local.h to a connection to netloc, taking an idle one
+        from the pool when possible.
+        '''
+        h = None
+        key = (transport, netloc)
+        if reuse and self.pool is not None:
+            h = self.pool.get(key)
+        self.local.reused = h is not None
+        if h is None:
+            h = transport(netloc, None, **self.transdict)
+            try:
+                h.connect()
+            except:
+                h.close()
+                raise
+        self.local.h, self.local.pool_key = h, key
+
+    def __release(self, response):
+        '''Return the connection to the pool once its response was read, or
+        close it if the server won't keep it open.
+        '''
+        if self.pool is not None and not response.will_close:
+            self.pool.put(self.local.pool_key, self.local.h)
+        else:
+            self.local.h.close()
+        self.local.h, self.local.reused = None, False
+
+    def __discard(self):
+        '''Close the current connection, it won't be reused.
+        '''
+        h = getattr(self.local, 'h', None)
+        if h is not None:
+            h.close()
+        self.local.h, self.local.reused = None, False
+
+    def __resend(self):
+        '''Re-issue the last request on a fresh connection. Only used when
+        writing the request to a reused keep-alive connection failed, so the
+        server can't have received it in full.
+        '''
+        self.__discard()
+        transport, netloc, soapdata, url, soapaction, kw = self.local.request
+        self.__connect(transport, netloc, reuse=False)
+        try:
+            self.SendSOAPData(soapdata, url, soapaction, **kw)
+        except:
+            self.__discard()
+            raise
+
     def RPC(self, url, opname, obj, replytype=None, **kw):
         '''Send a request, return the reply.  See Send() and Recieve()
         docstrings for details.
@@ -291,11 +436,20 @@ class _Binding:
             raise TypeError('transport must be a HTTPConnection')
 
         soapdata = str(sw)
-        self.local.h = transport(netloc, None, **self.transdict)
-        self.local.h.connect()
         self.local.boundary = sw.getMIMEBoundary()
         self.local.startCID = sw.getStartCID()
-        self.SendSOAPData(soapdata, url, soapaction, **kw)
+        self.local.request = (transport, netloc, soapdata, url, soapaction, kw)
+        self.__connect(transport, netloc)
+        try:
+            self.SendSOAPData(soapdata, url, soapaction, **kw)
+        except (httplib.HTTPException, socket.error):
+            if not self.local.reused:
+                self.__discard()
+                raise
+            self.__resend()
+        except:
+            self.__discard()
+            raise
 
     def SendSOAPData(self, soapdata, url, soapaction, headers={}, **kw):
         # Tracing?
@@ -377,6 +531,17 @@ class _Binding:
         '''Read a server reply, unconverted to any format and return it.
         '''
         if self.local.data: return self.local.data
+        try:
+            response = self.__receive_response()
+        except:
+            # The request was written, the server may have acted on it:
+            # never send it again, just drop the connection.
+            self.__discard()
+            raise
+        self.__release(response)
+        return self.local.data
+
+    def __receive_response(self):
         trace = self.trace
         while 1:
             response = self.local.h.getresponse()
@@ -408,7 +573,7 @@ class _Binding:
             # Horrible internals hack to patch things up.
             self.local.h._HTTPConnection__state = httplib._CS_REQ_SENT
             self.local.h._HTTPConnection__response = None
-        return self.local.data
+        return response
 
     def IsSOAP(self):
         if self.local.ps: return 1
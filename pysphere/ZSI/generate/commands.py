@@ -41,6 +41,10 @@ def SetUpLazyEvaluation(option, opt, value, parser, *args, **kwargs):
     from pysphere.ZSI.generate.containers import TypecodeContainerBase
     TypecodeContainerBase.lazy = True
 
+def SetUpPyclassSlots(option, opt, value, parser, *args, **kwargs):
+    from pysphere.ZSI.generate.containers import TypecodeContainerBase
+    TypecodeContainerBase.slots = True
+
 
 
 def wsdl2py(args=None):
@@ -87,6 +91,11 @@ def wsdl2py(args=None):
                       'metaclass':'pyclass_type'},
                   help="add convenience functions for complexTypes, including Getters, Setters, factory methods, and properties (via metaclass). *** DONT USE WITH --simple-naming ***")
 
+    op.add_option("-S", "--slots",
+                  action="callback", callback=SetUpPyclassSlots,
+                  callback_kwargs={},
+                  help="complexType pyclasses use __slots__ derived from their elements instead of a per-instance __dict__, requires --complexType")
+
     # Lazy Evaluation of Typecodes (done at serialization/parsing when needed).
     op.add_option("-l", "--lazy",
                   action="callback", callback=SetUpLazyEvaluation,
@@ -306,7 +306,7 @@ class ServiceHeaderContainer(ServiceContainerBase):
     imports = ['\nimport urlparse, types',
               'from pysphere.ZSI.TCcompound import ComplexType, Struct',
               'from pysphere.ZSI import client',
-              'from pysphere.ZSI.schema import GED, GTD',
+              'from pysphere.ZSI.schema import GED, GTD, LazyPyclass',
               'import pysphere.ZSI'
               ]
     logger = _GetLogger("ServiceHeaderContainer")
@@ -915,7 +915,7 @@ class ServiceDocumentLiteralMessageContainer(ServiceContainerBase,
 #
         # These messsages are just global element declarations
 #        self.writeArray(['%(message)s = %(prefix)s.%(typecode)s().pyclass' %kw])
-        self.writeArray(['%(message)s = GED("%(nsuri)s", "%(name)s").pyclass' %kw])
+        self.writeArray(['%(message)s = LazyPyclass("%(nsuri)s", "%(name)s")' %kw])
 
 class ServiceRPCEncodedMessageContainer(ServiceContainerBase, MessageContainerInterface):
     logger = _GetLogger("ServiceRPCEncodedMessageContainer")
@@ -1163,11 +1163,13 @@ class TypecodeContainerBase(TypesContainerBase):
         mixed_content_aname -- text content will be placed in this attribute.
         attributes_aname -- attributes will be placed in this attribute.
         metaclass -- set this attribute to specify a pyclass __metaclass__
+        slots -- pyclasses ask the metaclass for __slots__ (pyclass_type)
     '''
     mixed_content_aname = 'text'
     attributes_aname = 'attrs'
     metaclass = None
     lazy = False
+    slots = False
     logger = _GetLogger("TypecodeContainerBase")
 
     def __init__(self, do_extended=False, extPyClasses=None):
@@ -1313,6 +1315,8 @@ class TypecodeContainerBase(TypesContainerBase):
         if self.metaclass is not None:
             kw['type'] = self.metaclass
             definition.append('%(ID4)s__metaclass__ = %(type)s' %kw)
+            if self.slots is True:
+                definition.append('%(ID4)s_pyclass_slots = True' %kw)
         definition.append('%(ID4)stypecode = self' %kw)
 
         #TODO: Remove pyclass holder __init__ -->
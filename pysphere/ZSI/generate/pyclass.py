@@ -56,13 +56,21 @@ class pyclass_type(type):
 
               (NCNAME)-(letter U digit U "_")
 
+    class variables:
+        use_slots -- if True, pyclasses of complexTypes get __slots__
+            derived from the typecode's ofwhat instead of a per-instance
+            __dict__, a class can also set _pyclass_slots to override it.
+            Instances only accept the element, attribute and text anames.
     """
+    use_slots = False
+
     def __new__(cls, classname, bases, classdict):
         """
         """
         #import new
         typecode = classdict.get('typecode')
         assert typecode is not None, 'MUST HAVE A TYPECODE.'
+        use_slots = classdict.pop('_pyclass_slots', pyclass_type.use_slots)
 
         # Assume this means immutable type. ie. str
         if len(bases) > 0:
@@ -121,6 +129,11 @@ class pyclass_type(type):
                         %(what.nspname,what.pname,what.minOccurs,what.maxOccurs,what.nillable)
                         )
 
+            if use_slots and '__slots__' not in classdict:
+                slots = cls.__slots_from_typecode(typecode)
+                if slots is not None:
+                    classdict['__slots__'] = slots
+
         #
         # mutable type <complexType> complexContent | modelGroup
         # or immutable type <complexType> simpleContent (float, str, etc)
@@ -142,6 +155,26 @@ class pyclass_type(type):
 
         return type.__new__(cls,classname,bases,classdict)
 
+    def __slots_from_typecode(typecode):
+        """returns the attribute names pyclass instances of typecode are
+        given, or None if some are unknown (element references not yet
+        revealed) or would be mangled.
+        """
+        slots = []
+        if typecode.attribute_typecode_dict:
+            slots.append(typecode.attrs_aname)
+        if typecode.mixed:
+            slots.append(typecode.mixed_aname)
+        for what in typecode.ofwhat:
+            slots.append(getattr(what, 'aname', None))
+
+        for aname in slots:
+            if not isinstance(aname, basestring) or \
+                (aname.startswith('__') and not aname.endswith('__')):
+                return None
+        return tuple(sorted(set(slots)))
+    __slots_from_typecode = staticmethod(__slots_from_typecode)
+
     def __create_functions_from_what(what):
         if not callable(what):
             def get(self):
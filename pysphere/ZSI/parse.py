@@ -4,6 +4,7 @@
 '''
 
 from xml.dom import expatbuilder
+from xml.parsers import expat
 from pysphere.ZSI import _children, _attrs, _child_elements, _stringtypes, \
         _backtrace, EvaluateException, ParseException, _valid_encoding, \
         _Node, _find_attr, _resolve_prefix
@@ -22,6 +23,210 @@ class DefaultReader:
     fromString = staticmethod(expatbuilder.parseString)
     fromStream = staticmethod(expatbuilder.parse)
 
+
+class _CompactNode(object):
+    '''Base of the nodes built by CompactReader. Only the subset of the DOM
+    interface used by ParsedSoap and the typecodes is implemented.
+    '''
+    __slots__ = ()
+    attributes = None
+    childNodes = ()
+    localName = namespaceURI = prefix = None
+
+
+class _CompactDocument(_CompactNode):
+    __slots__ = ('childNodes',)
+    nodeType = _Node.DOCUMENT_NODE
+    nodeName = '#document'
+    parentNode = None
+
+    def __init__(self):
+        self.childNodes = []
+
+
+class _CompactText(_CompactNode):
+    __slots__ = ('nodeValue', 'parentNode')
+    nodeType = _Node.TEXT_NODE
+    nodeName = '#text'
+
+    def __init__(self, data, parent):
+        self.nodeValue, self.parentNode = data, parent
+
+    data = property(lambda self: self.nodeValue)
+
+
+class _CompactProcessingInstruction(_CompactNode):
+    __slots__ = ('nodeName', 'nodeValue', 'parentNode')
+    nodeType = _Node.PROCESSING_INSTRUCTION_NODE
+
+    def __init__(self, target, data, parent):
+        self.nodeName, self.nodeValue, self.parentNode = target, data, parent
+
+
+class _CompactAttr(object):
+    __slots__ = ('namespaceURI', 'localName', 'nodeName', 'nodeValue')
+    nodeType = _Node.ATTRIBUTE_NODE
+
+    def __init__(self, namespaceURI, localName, nodeName, nodeValue):
+        self.namespaceURI, self.localName = namespaceURI, localName
+        self.nodeName, self.nodeValue = nodeName, nodeValue
+
+    name = property(lambda self: self.nodeName)
+    value = property(lambda self: self.nodeValue)
+
+
+class _CompactAttributes(object):
+    '''Read only NamedNodeMap over the attributes of a _CompactElement.
+    '''
+    __slots__ = ('_attrs',)
+
+    def __init__(self, attrs):
+        self._attrs = attrs
+
+    def __len__(self):
+        return len(self._attrs)
+
+    def keys(self):
+        return [ qname for qname,_ in self._attrs.itervalues() ]
+
+    def values(self):
+        return [ _CompactAttr(ns, name, qname, value)
+                 for (ns,name),(qname,value) in self._attrs.iteritems() ]
+
+
+class _CompactElement(_CompactNode):
+    __slots__ = ('namespaceURI', 'localName', 'prefix', 'nodeName',
+                 'parentNode', 'childNodes', '_attrs')
+    nodeType = _Node.ELEMENT_NODE
+
+    def __init__(self, namespaceURI, localName, prefix, nodeName, parent,
+                 attrs):
+        self.namespaceURI, self.localName = namespaceURI, localName
+        self.prefix, self.nodeName = prefix, nodeName
+        self.parentNode, self.childNodes = parent, []
+        self._attrs = attrs
+
+    tagName = property(lambda self: self.nodeName)
+
+    def _get_attributes(self):
+        if not self._attrs: return None
+        return _CompactAttributes(self._attrs)
+    attributes = property(_get_attributes)
+
+    def getAttributeNS(self, namespaceURI, localName):
+        attr = self._attrs.get((namespaceURI, localName))
+        if attr is None: return ''
+        return attr[1]
+
+    def getAttributeNodeNS(self, namespaceURI, localName):
+        attr = self._attrs.get((namespaceURI, localName))
+        if attr is None: return None
+        return _CompactAttr(namespaceURI, localName, attr[0], attr[1])
+
+
+def _split_expat_name(name):
+    '''Split a "uri local [prefix]" name as reported by a namespace aware
+    expat parser created with namespace_prefixes set.
+    '''
+    parts = name.split(' ')
+    if len(parts) == 3:
+        return parts[0], parts[1], parts[2], '%s:%s' %(parts[2], parts[1])
+    if len(parts) == 2:
+        return parts[0], parts[1], None, parts[1]
+    return None, name, None, name
+
+
+class _CompactBuilder:
+    '''Expat handlers that build the compact tree. Whitespace only text
+    between child elements is dropped, text content of leaf elements is kept
+    as a single text node.
+    '''
+
+    def __init__(self):
+        self.document = _CompactDocument()
+        self.current = self.document
+        self.text = []
+        self.nsdecls = []
+
+    def install(self, parser):
+        parser.StartElementHandler = self.start_element
+        parser.EndElementHandler = self.end_element
+        parser.CharacterDataHandler = self.text.append
+        parser.StartNamespaceDeclHandler = self.start_namespace
+        parser.ProcessingInstructionHandler = self.processing_instruction
+
+    def start_namespace(self, prefix, uri):
+        self.nsdecls.append((prefix, uri or ''))
+
+    def start_element(self, name, attributes):
+        parent = self.current
+        if self.text:
+            text = ''.join(self.text)
+            del self.text[:]
+            if text.strip():
+                parent.childNodes.append(_CompactText(text, parent))
+
+        attrs = {}
+        if self.nsdecls:
+            for prefix,uri in self.nsdecls:
+                if prefix:
+                    attrs[(XMLNS.BASE, prefix)] = ('xmlns:%s' %prefix, uri)
+                else:
+                    attrs[(XMLNS.BASE, 'xmlns')] = ('xmlns', uri)
+            del self.nsdecls[:]
+        for i in xrange(0, len(attributes), 2):
+            ns,local,_,qname = _split_expat_name(attributes[i])
+            attrs[(ns, local)] = (qname, attributes[i+1])
+
+        ns,local,prefix,qname = _split_expat_name(name)
+        elt = _CompactElement(ns, local, prefix, qname, parent, attrs)
+        parent.childNodes.append(elt)
+        self.current = elt
+
+    def end_element(self, name):
+        elt = self.current
+        if self.text:
+            text = ''.join(self.text)
+            del self.text[:]
+            if not elt.childNodes or text.strip():
+                elt.childNodes.append(_CompactText(text, elt))
+        self.current = elt.parentNode
+
+    def processing_instruction(self, target, data):
+        self.current.childNodes.append(
+            _CompactProcessingInstruction(target, data, self.current))
+
+
+class CompactReader:
+    """Reader class for ParsedSoap (see the readerclass keyword of
+    ParsedSoap and client.Binding). Builds a lightweight element tree
+    straight from expat events instead of a minidom document: no Attr,
+    NamedNodeMap or ignorable whitespace nodes are created, which cuts
+    memory and parse time for large responses. Typecodes that need a real
+    DOM (TC.XML) must keep using DefaultReader.
+    """
+
+    def _create_parser(self, builder):
+        parser = expat.ParserCreate(None, ' ')
+        parser.namespace_prefixes = True
+        parser.ordered_attributes = True
+        parser.buffer_text = True
+        builder.install(parser)
+        return parser
+
+    def fromString(self, data):
+        builder = _CompactBuilder()
+        self._create_parser(builder).Parse(data, True)
+        return builder.document
+
+    def fromStream(self, stream):
+        builder = _CompactBuilder()
+        self._create_parser(builder).ParseFile(stream)
+        return builder.document
+
+    def releaseNode(self, node):
+        pass
+
 class ParsedSoap:
     '''A Parsed SOAP object.
         Convert the text to a DOM tree and parse SOAP elements.
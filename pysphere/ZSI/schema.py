@@ -5,7 +5,9 @@
 
 from pysphere.ZSI import _find_type, _get_element_nsuri_name, EvaluateException
 from pysphere.ZSI.wstools.Utility import SplitQName
+from threading import RLock
 
+_lazy_lock = RLock()
 
 def _get_type_definition(namespaceURI, name, **kw):
     return SchemaInstanceType.getTypeDefinition(namespaceURI, name, **kw)
@@ -61,6 +63,13 @@ def _is_substitute_element(head, sub):
 GED = _get_global_element_declaration
 GTD = _get_type_definition
 
+def RegisterLoader(namespaceURI, loader):
+    """Register a callable that defines the types and elements of
+    namespaceURI, it is called once, the first time a GED or GTD lookup
+    in that namespace is made.
+    """
+    SchemaInstanceType.registerLoader(namespaceURI, loader)
+
 
 def WrapImmutable(pyobj, what):
     """Wrap immutable instance so a typecode can be
@@ -100,6 +109,7 @@ class SchemaInstanceType(type):
     types = {}
     elements = {}
     element_typecode_cache = {}
+    loaders = {}
     #substitution_registry = {}
 
     def __new__(cls,classname,bases,classdict):
@@ -137,6 +147,32 @@ class SchemaInstanceType(type):
 
         raise TypeError('SchemaInstanceType must be an ElementDeclaration or TypeDefinition')
 
+    def registerLoader(cls, namespaceURI, loader):
+        """Defer defining the schema items of namespaceURI until one of
+        them is looked up.
+
+        Parameters:
+            namespaceURI --
+            loader -- callable taking no arguments, usually importing the
+                module with the generated typecodes.
+        """
+        cls.loaders[namespaceURI] = loader
+    registerLoader = classmethod(registerLoader)
+
+    def loadNamespace(cls, namespaceURI):
+        """Call the loader registered for namespaceURI, if it has not been
+        called yet.
+        """
+        _lazy_lock.acquire()
+        try:
+            loader = cls.loaders.get(namespaceURI)
+            if loader is not None:
+                loader()
+                cls.loaders.pop(namespaceURI, None)
+        finally:
+            _lazy_lock.release()
+    loadNamespace = classmethod(loadNamespace)
+
     def getTypeDefinition(cls, namespaceURI, name, lazy=False):
         """Grab a type definition, returns a typecode class definition
         because the facets (name, minOccurs, maxOccurs) must be provided.
@@ -146,6 +182,7 @@ class SchemaInstanceType(type):
            name --
         """
         if namespaceURI is None: namespaceURI = "urn:vim25"
+        if namespaceURI in cls.loaders: cls.loadNamespace(namespaceURI)
         klass = cls.types.get((namespaceURI, name), None)
         if lazy and klass is not None:
             return _Mirage(klass)
@@ -163,6 +200,7 @@ class SchemaInstanceType(type):
             name --
             isref -- if element reference, return class definition.
         """
+        if namespaceURI in cls.loaders: cls.loadNamespace(namespaceURI)
         key = (namespaceURI, name)
         if isref:
             klass = cls.elements.get(key,None)
@@ -289,6 +327,51 @@ class TypeDefinition:
 
 
 
+class LazyPyclass(object):
+    """Stands in for GED(namespaceURI, name).pyclass, the element typecode
+    and its pyclass are only built the first time the message is used.
+    Calling it creates an instance of the pyclass, isinstance checks and
+    attribute access (eg. typecode) are delegated to the pyclass.
+    """
+    def __init__(self, namespaceURI, name):
+        self.__key = (namespaceURI, name)
+        self.__pyclass = None
+
+    def _resolve(self):
+        pyclass = self.__pyclass
+        if pyclass is None:
+            _lazy_lock.acquire()
+            try:
+                if self.__pyclass is None:
+                    typecode = GED(*self.__key)
+                    if typecode is None:
+                        raise TypeError(
+                            'No global element declaration (%s, %s)' %
+                            self.__key)
+                    self.__pyclass = typecode.pyclass
+                pyclass = self.__pyclass
+            finally:
+                _lazy_lock.release()
+        return pyclass
+
+    def __call__(self, *args, **kw):
+        return self._resolve()(*args, **kw)
+
+    def __getattr__(self, name):
+        if name.startswith('_LazyPyclass__'):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self._resolve())
+
+    def __subclasscheck__(self, subclass):
+        return issubclass(subclass, self._resolve())
+
+    def __repr__(self):
+        return "<LazyPyclass id=%s, GED %s>" %(id(self), self.__key)
+
+
 class _Mirage:
     """Used with SchemaInstanceType for lazy evaluation, eval during serialize or
     parse as needed.  Mirage is callable, TypeCodes are not.  When called it returns the
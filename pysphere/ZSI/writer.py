@@ -5,7 +5,9 @@
 
 from pysphere.ZSI import _get_idstr, ZSI_SCHEMA_URI
 from pysphere.ZSI import _backtrace
-from pysphere.ZSI.wstools.Utility import MessageInterface, ElementProxy
+from xml.dom import Node as _Node
+from pysphere.ZSI.wstools.Utility import MessageInterface, ElementProxy, \
+    NamespaceError, DOMException, SplitQName
 from pysphere.ZSI.wstools.Namespaces import XMLNS, SOAP, SCHEMA
 from pysphere.ZSI.wstools.MIMEAttachment import MIMEMessage
 
@@ -215,3 +217,383 @@ class SoapWriter:
 
     def __del__(self):
         if not self.closed: self.close()
+
+
+class _StringAttr(object):
+    '''Attribute of a StringElementProxy element.
+    '''
+    __slots__ = ('nodeName', 'namespaceURI', 'localName', 'prefix', 'value')
+
+    def __init__(self, namespaceURI, qualifiedName, localName, prefix, value):
+        self.nodeName, self.namespaceURI = qualifiedName, namespaceURI
+        self.localName, self.prefix, self.value = localName, prefix, value
+
+
+class _StringText(object):
+    '''Text node of a StringElementProxy element.
+    '''
+    __slots__ = ('data', 'parentNode')
+    nodeType = _Node.TEXT_NODE
+    nodeName = '#text'
+    childNodes = ()
+
+    def __init__(self, data, parent):
+        self.data, self.parentNode = data, parent
+
+
+class _StringFragment(object):
+    '''Elements appended by StringElementProxy.createAppendFragment, shared
+    by all the messages that include them. Their text is written once for
+    each set of namespace declarations rendered by their ancestors.
+    '''
+    __slots__ = ('childNodes', 'indx', '_texts')
+    nodeType = _Node.DOCUMENT_FRAGMENT_NODE
+    nodeName = '#document-fragment'
+    parentNode = None
+
+    def __init__(self, childNodes, indx):
+        self.childNodes, self.indx = childNodes, indx
+        self._texts = {}
+        for child in childNodes:
+            child.parentNode = None
+
+    def _write(self, write, ns_rendered):
+        key = tuple(sorted(ns_rendered.iteritems()))
+        text = self._texts.get(key)
+        if text is None:
+            out = []
+            for child in self.childNodes:
+                child._write(out.append, ns_rendered)
+            text = self._texts[key] = _join(out)
+        write(text)
+
+
+class FragmentList(list):
+    '''List of values for an element with maxOccurs > 1 that is included,
+    unchanged, in many messages. When written with StringElementProxy, the
+    elements of the list are serialized and written once for each namespace
+    scope they appear in, and that text is spliced into the later messages.
+    The list and its values must not be modified once it was serialized.
+    '''
+    def __init__(self, *args):
+        list.__init__(self, *args)
+        self.fragments = {}
+
+
+class _StringDocument(object):
+    '''Document node holding the root element of a StringElementProxy.
+    '''
+    __slots__ = ('childNodes',)
+    nodeType = _Node.DOCUMENT_NODE
+    nodeName = '#document'
+    parentNode = None
+
+    def __init__(self):
+        self.childNodes = []
+
+
+class StringElementProxy(MessageInterface):
+    '''Output class for SoapWriter (see the outputclass keyword of SoapWriter
+    and the writerclass keyword of client.Binding) that writes the XML text
+    directly instead of building a minidom document and canonicalizing it.
+    Elements are lightweight objects that keep their attributes and children
+    in plain containers, and text and attribute values are escaped once, as
+    the message is written. The output is byte for byte the same as the one
+    of ElementProxy: namespace prefixes are chosen with the same rules and
+    the message is written in canonical form (see wstools.c14n). Typecodes
+    that import DOM nodes (TC.XML) must keep using ElementProxy.
+    '''
+    _soap_env_prefix = ElementProxy._soap_env_prefix
+    _xml_prefix = ElementProxy._xml_prefix
+    _xsi_nsuri = ElementProxy._xsi_nsuri
+    reserved_ns = ElementProxy.reserved_ns
+
+    nodeType = None
+    nodeName = None
+    namespaceURI = None
+    localName = None
+    prefix = None
+    parentNode = None
+
+    def __init__(self, sw, namespaceURI=None, qualifiedName=None):
+        MessageInterface.__init__(self, sw)
+        self._indx = 0
+        self.childNodes = []
+        self._attrs = {}
+        self._attrsNS = {}
+        if qualifiedName is not None:
+            self._setName(namespaceURI, qualifiedName)
+
+    def __str__(self):
+        return self.toString()
+
+    def _setName(self, namespaceURI, qualifiedName):
+        self.nodeType = _Node.ELEMENT_NODE
+        self.nodeName = qualifiedName
+        self.namespaceURI = namespaceURI
+        self.prefix, self.localName = _nssplit(qualifiedName)
+
+    def _getNode(self):
+        return self
+
+    def _setAttributeNS(self, namespaceURI, qualifiedName, value):
+        '''Same as minidom's Element.setAttributeNS
+        '''
+        if self.nodeType != _Node.ELEMENT_NODE:
+            raise AttributeError('setAttributeNS')
+        prefix, localName = _nssplit(qualifiedName)
+        attr = self._attrsNS.get((namespaceURI, localName))
+        if attr is None:
+            old = self._attrs.get(qualifiedName)
+            if old is not None:
+                del self._attrs[old.nodeName]
+                del self._attrsNS[(old.namespaceURI, old.localName)]
+            attr = _StringAttr(namespaceURI, qualifiedName, localName, prefix,
+                               value)
+            self._attrs[qualifiedName] = attr
+            self._attrsNS[(namespaceURI, localName)] = attr
+        else:
+            attr.value = value
+            if attr.prefix != prefix:
+                attr.prefix, attr.nodeName = prefix, qualifiedName
+
+    def _findNamespaceURI(self, prefix):
+        node = self
+        while node is not None and node.nodeType == _Node.ELEMENT_NODE:
+            attr = node._attrsNS.get((XMLNS.BASE, prefix))
+            if attr is not None:
+                return attr.value
+            node = node.parentNode
+        raise DOMException('Value for prefix %s not found.' % prefix)
+
+    def _findDefaultNS(self):
+        return self._findNamespaceURI('xmlns')
+
+    def _getUniquePrefix(self):
+        while 1:
+            self._indx += 1
+            prefix = 'ns%d' %self._indx
+            try:
+                self._findNamespaceURI(prefix)
+            except DOMException:
+                break
+        return prefix
+
+    def _getPrefix(self, nsuri):
+        node = self
+        while node is not None and node.nodeType == _Node.ELEMENT_NODE:
+            try:
+                if nsuri == node._findDefaultNS():
+                    return None
+            except DOMException:
+                pass
+            if nsuri == XMLNS.XML:
+                return self._xml_prefix
+            #same iteration order as minidom's attributes.values()
+            for attr in node._attrs.values():
+                if attr.namespaceURI == XMLNS.BASE and nsuri == attr.value:
+                    return attr.localName
+            node = node.parentNode
+        if nsuri == XMLNS.XML:
+            return self._xml_prefix
+        raise NamespaceError('namespaceURI "%s" is not defined' % nsuri)
+
+    def getPrefix(self, namespaceURI):
+        try:
+            prefix = self._getPrefix(namespaceURI)
+        except NamespaceError:
+            prefix = self._getUniquePrefix()
+            self.setNamespaceAttribute(prefix, namespaceURI)
+        return prefix
+
+    def getDocument(self):
+        raise TypeError('StringElementProxy builds no DOM document, '
+                        'use ElementProxy instead')
+
+    def createDocument(self, namespaceURI, localName, doctype=None):
+        '''If specified must be a SOAP envelope, else may contruct an empty
+        document.
+        '''
+        prefix = self._soap_env_prefix
+        if namespaceURI == self.reserved_ns[prefix]:
+            self._setName(namespaceURI, '%s:%s' %(prefix, localName))
+            self.parentNode = _StringDocument()
+            self.parentNode.childNodes.append(self)
+        elif namespaceURI is localName is None:
+            self.nodeType = _Node.DOCUMENT_NODE
+            self.nodeName = '#document'
+            return
+        else:
+            raise KeyError('only support creation of document in %s'
+                           %self.reserved_ns[prefix])
+
+        for prefix, nsuri in self.reserved_ns.iteritems():
+            self._setAttributeNS(XMLNS.BASE, 'xmlns:%s' %prefix, nsuri)
+
+    def setAttributeType(self, namespaceURI, localName):
+        '''set xsi:type
+        '''
+        value = localName
+        if namespaceURI:
+            value = '%s:%s' %(self.getPrefix(namespaceURI), localName)
+
+        xsi_prefix = self.getPrefix(self._xsi_nsuri)
+        self._setAttributeNS(self._xsi_nsuri, '%s:type' %xsi_prefix, value)
+
+    def setAttributeNS(self, namespaceURI, localName, value):
+        prefix = None
+        if namespaceURI:
+            prefix = self.getPrefix(namespaceURI)
+        qualifiedName = localName
+        if prefix:
+            qualifiedName = '%s:%s' %(prefix, localName)
+        self._setAttributeNS(namespaceURI, qualifiedName, value)
+
+    def setNamespaceAttribute(self, prefix, namespaceURI):
+        self._setAttributeNS(XMLNS.BASE, 'xmlns:%s' %prefix, namespaceURI)
+
+    def createAppendElement(self, namespaceURI, localName, prefix=None):
+        '''Create a new element (namespaceURI,name), append it to current
+        node, and return the newly created node.
+        '''
+        declare = False
+        qualifiedName = localName
+        if namespaceURI:
+            try:
+                prefix = self.getPrefix(namespaceURI)
+            except:
+                declare = True
+                prefix = prefix or self._getUniquePrefix()
+            if prefix:
+                qualifiedName = '%s:%s' %(prefix, localName)
+        node = StringElementProxy(self.sw, namespaceURI, qualifiedName)
+        if declare:
+            node._setAttributeNS(XMLNS.BASE, 'xmlns:%s' %prefix, namespaceURI)
+        node.parentNode = self
+        self.childNodes.append(node)
+        return node
+
+    def createAppendTextNode(self, pyobj):
+        if not isinstance(pyobj, basestring):
+            raise TypeError('node contents must be a string')
+        node = _StringText(pyobj, self)
+        self.childNodes.append(node)
+        return node
+
+    def findNamespaceURI(self, qualifiedName):
+        return self._findNamespaceURI(SplitQName(qualifiedName)[0])
+
+    def resolvePrefix(self, prefix):
+        return self._findNamespaceURI(prefix)
+
+    def createAppendFragment(self, fragments, key, serialize):
+        '''Calls @serialize(self), which appends child elements to this
+        element, unless the dict @fragments already holds the ones it appended
+        for @key to an element with the same namespace declarations in scope.
+        Then those (see _StringFragment) are appended instead.
+        '''
+        scope = [self._indx]
+        node = self
+        while node is not None and node.nodeType == _Node.ELEMENT_NODE:
+            scope.append(tuple([(attr.nodeName, attr.value)
+                                for attr in node._attrs.values()
+                                if attr.namespaceURI == XMLNS.BASE]))
+            node = node.parentNode
+        key = (key, tuple(scope))
+        fragment = fragments.get(key)
+        if fragment is not None:
+            self._indx = fragment.indx
+            self.childNodes.append(fragment)
+            return
+
+        nattrs, start = len(self._attrs), len(self.childNodes)
+        serialize(self)
+        if len(self._attrs) != nattrs:
+            #the scope of the elements depends on what they declared here
+            return
+        fragment = _StringFragment(self.childNodes[start:], self._indx)
+        self.childNodes[start:] = [fragment]
+        fragments[key] = fragment
+
+    def isEmpty(self):
+        return self.nodeType is None
+
+    def canonicalize(self):
+        out = []
+        if self.nodeType == _Node.DOCUMENT_NODE:
+            for child in self.childNodes:
+                child._write(out.append, {'xml':''})
+        else:
+            self._write(out.append, {'xml':''})
+        return str(_join(out))
+
+    def toString(self):
+        return self.canonicalize()
+
+    def _write(self, write, ns_rendered):
+        '''Writes the element in canonical form, as
+        wstools.c14n.Canonicalize does.
+        '''
+        write('<')
+        write(self.nodeName)
+
+        ns_to_render = []
+        other_attrs = []
+        for attr in self._attrs.itervalues():
+            if attr.namespaceURI != XMLNS.BASE:
+                other_attrs.append(attr)
+                continue
+            n, v = attr.nodeName, attr.value
+            if n == "xmlns:": n = "xmlns"
+            if n == "xmlns" and v in [XMLNS.BASE, ''] \
+            and ns_rendered.get('xmlns') in [XMLNS.BASE, '', None]:
+                continue
+            if n in ["xmlns:xml", "xml"] and v == XMLNS.XML:
+                continue
+            if n not in ns_rendered or ns_rendered[n] != v:
+                ns_to_render.append((n, v))
+
+        if ns_to_render:
+            ns_rendered = ns_rendered.copy()
+            ns_to_render.sort(key=lambda nv: (nv[0] != 'xmlns', nv[0]))
+            for n, v in ns_to_render:
+                write(' %s="%s"' %(n, _escape_attr(v)))
+                ns_rendered[n] = v
+        if other_attrs:
+            other_attrs.sort(key=lambda a: (a.namespaceURI, a.localName))
+            for attr in other_attrs:
+                write(' %s="%s"' %(attr.nodeName, _escape_attr(attr.value)))
+        write('>')
+
+        for child in self.childNodes:
+            if child.nodeType == _Node.TEXT_NODE:
+                if child.data:
+                    write(_escape_text(child.data))
+            else:
+                child._write(write, ns_rendered)
+
+        write('</%s>' % self.nodeName)
+
+
+def _join(out):
+    try:
+        return ''.join(out)
+    except UnicodeError:
+        #byte and unicode strings mixed, join them as cStringIO does
+        return ''.join([str(s) for s in out])
+
+def _nssplit(qualifiedName):
+    fields = qualifiedName.split(':', 1)
+    if len(fields) == 2:
+        return fields
+    return (None, fields[0])
+
+def _escape_text(s):
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(
+                             ">", "&gt;").replace("\015", "&#xD;")
+
+def _escape_attr(s):
+    #the missing semicolons are what wstools.c14n writes
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(
+                 '"', '&quot;').replace('\011', '&#x9').replace(
+                 '\012', '&#xA').replace('\015', '&#xD')
@@ -6,16 +6,35 @@
 #
 ##################################################
 
-from VimService_services_types import *
 import urlparse, types
 from pysphere.ZSI.TCcompound import ComplexType, Struct
 from pysphere.ZSI import client
-from pysphere.ZSI.schema import GED, GTD
+from pysphere.ZSI.schema import GED, GTD, LazyPyclass, RegisterLoader
 import pysphere.ZSI
 #alias
 ZSI = pysphere.ZSI
 from pysphere.ZSI.generate.pyclass import pyclass_type
 
+# Types are defined on the first GED/GTD lookup in urn:vim25, or on the
+# first access to ns0, rather than when this module is imported.
+def _load_types():
+    from pysphere.resources import VimService_services_types
+
+RegisterLoader("urn:vim25", _load_types)
+
+class _LazyNamespace(object):
+    def __init__(self, name):
+        self._name = name
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        from pysphere.resources import VimService_services_types
+        value = getattr(getattr(VimService_services_types, self._name), attr)
+        setattr(self, attr, value)
+        return value
+
+ns0 = _LazyNamespace("ns0")
+
 # Locator
 class VimServiceLocator:
     VimPortType_address = "https://localhost/sdk/vimService"
@@ -5854,2330 +5873,2330 @@ class VimBindingSOAP:
         response = self.binding.Receive(ReadEnvironmentVariableInGuestResponseMsg.typecode)
         return response
 
-DestroyPropertyFilterRequestMsg = GED("urn:vim25", "DestroyPropertyFilter").pyclass
+DestroyPropertyFilterRequestMsg = LazyPyclass("urn:vim25", "DestroyPropertyFilter")
 
-DestroyPropertyFilterResponseMsg = GED("urn:vim25", "DestroyPropertyFilterResponse").pyclass
+DestroyPropertyFilterResponseMsg = LazyPyclass("urn:vim25", "DestroyPropertyFilterResponse")
 
-CreateFilterRequestMsg = GED("urn:vim25", "CreateFilter").pyclass
+CreateFilterRequestMsg = LazyPyclass("urn:vim25", "CreateFilter")
 
-CreateFilterResponseMsg = GED("urn:vim25", "CreateFilterResponse").pyclass
+CreateFilterResponseMsg = LazyPyclass("urn:vim25", "CreateFilterResponse")
 
-RetrievePropertiesRequestMsg = GED("urn:vim25", "RetrieveProperties").pyclass
+RetrievePropertiesRequestMsg = LazyPyclass("urn:vim25", "RetrieveProperties")
 
-RetrievePropertiesResponseMsg = GED("urn:vim25", "RetrievePropertiesResponse").pyclass
+RetrievePropertiesResponseMsg = LazyPyclass("urn:vim25", "RetrievePropertiesResponse")
 
-CheckForUpdatesRequestMsg = GED("urn:vim25", "CheckForUpdates").pyclass
+CheckForUpdatesRequestMsg = LazyPyclass("urn:vim25", "CheckForUpdates")
 
-CheckForUpdatesResponseMsg = GED("urn:vim25", "CheckForUpdatesResponse").pyclass
+CheckForUpdatesResponseMsg = LazyPyclass("urn:vim25", "CheckForUpdatesResponse")
 
-WaitForUpdatesRequestMsg = GED("urn:vim25", "WaitForUpdates").pyclass
+WaitForUpdatesRequestMsg = LazyPyclass("urn:vim25", "WaitForUpdates")
 
-WaitForUpdatesResponseMsg = GED("urn:vim25", "WaitForUpdatesResponse").pyclass
+WaitForUpdatesResponseMsg = LazyPyclass("urn:vim25", "WaitForUpdatesResponse")
 
-CancelWaitForUpdatesRequestMsg = GED("urn:vim25", "CancelWaitForUpdates").pyclass
+CancelWaitForUpdatesRequestMsg = LazyPyclass("urn:vim25", "CancelWaitForUpdates")
 
-CancelWaitForUpdatesResponseMsg = GED("urn:vim25", "CancelWaitForUpdatesResponse").pyclass
+CancelWaitForUpdatesResponseMsg = LazyPyclass("urn:vim25", "CancelWaitForUpdatesResponse")
 
-WaitForUpdatesExRequestMsg = GED("urn:vim25", "WaitForUpdatesEx").pyclass
+WaitForUpdatesExRequestMsg = LazyPyclass("urn:vim25", "WaitForUpdatesEx")
 
-WaitForUpdatesExResponseMsg = GED("urn:vim25", "WaitForUpdatesExResponse").pyclass
+WaitForUpdatesExResponseMsg = LazyPyclass("urn:vim25", "WaitForUpdatesExResponse")
 
-RetrievePropertiesExRequestMsg = GED("urn:vim25", "RetrievePropertiesEx").pyclass
+RetrievePropertiesExRequestMsg = LazyPyclass("urn:vim25", "RetrievePropertiesEx")
 
-RetrievePropertiesExResponseMsg = GED("urn:vim25", "RetrievePropertiesExResponse").pyclass
+RetrievePropertiesExResponseMsg = LazyPyclass("urn:vim25", "RetrievePropertiesExResponse")
 
-ContinueRetrievePropertiesExRequestMsg = GED("urn:vim25", "ContinueRetrievePropertiesEx").pyclass
+ContinueRetrievePropertiesExRequestMsg = LazyPyclass("urn:vim25", "ContinueRetrievePropertiesEx")
 
-ContinueRetrievePropertiesExResponseMsg = GED("urn:vim25", "ContinueRetrievePropertiesExResponse").pyclass
+ContinueRetrievePropertiesExResponseMsg = LazyPyclass("urn:vim25", "ContinueRetrievePropertiesExResponse")
 
-CancelRetrievePropertiesExRequestMsg = GED("urn:vim25", "CancelRetrievePropertiesEx").pyclass
+CancelRetrievePropertiesExRequestMsg = LazyPyclass("urn:vim25", "CancelRetrievePropertiesEx")
 
-CancelRetrievePropertiesExResponseMsg = GED("urn:vim25", "CancelRetrievePropertiesExResponse").pyclass
+CancelRetrievePropertiesExResponseMsg = LazyPyclass("urn:vim25", "CancelRetrievePropertiesExResponse")
 
-CreatePropertyCollectorRequestMsg = GED("urn:vim25", "CreatePropertyCollector").pyclass
+CreatePropertyCollectorRequestMsg = LazyPyclass("urn:vim25", "CreatePropertyCollector")
 
-CreatePropertyCollectorResponseMsg = GED("urn:vim25", "CreatePropertyCollectorResponse").pyclass
+CreatePropertyCollectorResponseMsg = LazyPyclass("urn:vim25", "CreatePropertyCollectorResponse")
 
-DestroyPropertyCollectorRequestMsg = GED("urn:vim25", "DestroyPropertyCollector").pyclass
+DestroyPropertyCollectorRequestMsg = LazyPyclass("urn:vim25", "DestroyPropertyCollector")
 
-DestroyPropertyCollectorResponseMsg = GED("urn:vim25", "DestroyPropertyCollectorResponse").pyclass
+DestroyPropertyCollectorResponseMsg = LazyPyclass("urn:vim25", "DestroyPropertyCollectorResponse")
 
-AddAuthorizationRoleRequestMsg = GED("urn:vim25", "AddAuthorizationRole").pyclass
+AddAuthorizationRoleRequestMsg = LazyPyclass("urn:vim25", "AddAuthorizationRole")
 
-AddAuthorizationRoleResponseMsg = GED("urn:vim25", "AddAuthorizationRoleResponse").pyclass
+AddAuthorizationRoleResponseMsg = LazyPyclass("urn:vim25", "AddAuthorizationRoleResponse")
 
-RemoveAuthorizationRoleRequestMsg = GED("urn:vim25", "RemoveAuthorizationRole").pyclass
+RemoveAuthorizationRoleRequestMsg = LazyPyclass("urn:vim25", "RemoveAuthorizationRole")
 
-RemoveAuthorizationRoleResponseMsg = GED("urn:vim25", "RemoveAuthorizationRoleResponse").pyclass
+RemoveAuthorizationRoleResponseMsg = LazyPyclass("urn:vim25", "RemoveAuthorizationRoleResponse")
 
-UpdateAuthorizationRoleRequestMsg = GED("urn:vim25", "UpdateAuthorizationRole").pyclass
+UpdateAuthorizationRoleRequestMsg = LazyPyclass("urn:vim25", "UpdateAuthorizationRole")
 
-UpdateAuthorizationRoleResponseMsg = GED("urn:vim25", "UpdateAuthorizationRoleResponse").pyclass
+UpdateAuthorizationRoleResponseMsg = LazyPyclass("urn:vim25", "UpdateAuthorizationRoleResponse")
 
-MergePermissionsRequestMsg = GED("urn:vim25", "MergePermissions").pyclass
+MergePermissionsRequestMsg = LazyPyclass("urn:vim25", "MergePermissions")
 
-MergePermissionsResponseMsg = GED("urn:vim25", "MergePermissionsResponse").pyclass
+MergePermissionsResponseMsg = LazyPyclass("urn:vim25", "MergePermissionsResponse")
 
-RetrieveRolePermissionsRequestMsg = GED("urn:vim25", "RetrieveRolePermissions").pyclass
+RetrieveRolePermissionsRequestMsg = LazyPyclass("urn:vim25", "RetrieveRolePermissions")
 
-RetrieveRolePermissionsResponseMsg = GED("urn:vim25", "RetrieveRolePermissionsResponse").pyclass
+RetrieveRolePermissionsResponseMsg = LazyPyclass("urn:vim25", "RetrieveRolePermissionsResponse")
 
-RetrieveEntityPermissionsRequestMsg = GED("urn:vim25", "RetrieveEntityPermissions").pyclass
+RetrieveEntityPermissionsRequestMsg = LazyPyclass("urn:vim25", "RetrieveEntityPermissions")
 
-RetrieveEntityPermissionsResponseMsg = GED("urn:vim25", "RetrieveEntityPermissionsResponse").pyclass
+RetrieveEntityPermissionsResponseMsg = LazyPyclass("urn:vim25", "RetrieveEntityPermissionsResponse")
 
-RetrieveAllPermissionsRequestMsg = GED("urn:vim25", "RetrieveAllPermissions").pyclass
+RetrieveAllPermissionsRequestMsg = LazyPyclass("urn:vim25", "RetrieveAllPermissions")
 
-RetrieveAllPermissionsResponseMsg = GED("urn:vim25", "RetrieveAllPermissionsResponse").pyclass
+RetrieveAllPermissionsResponseMsg = LazyPyclass("urn:vim25", "RetrieveAllPermissionsResponse")
 
-SetEntityPermissionsRequestMsg = GED("urn:vim25", "SetEntityPermissions").pyclass
+SetEntityPermissionsRequestMsg = LazyPyclass("urn:vim25", "SetEntityPermissions")
 
-SetEntityPermissionsResponseMsg = GED("urn:vim25", "SetEntityPermissionsResponse").pyclass
+SetEntityPermissionsResponseMsg = LazyPyclass("urn:vim25", "SetEntityPermissionsResponse")
 
-ResetEntityPermissionsRequestMsg = GED("urn:vim25", "ResetEntityPermissions").pyclass
+ResetEntityPermissionsRequestMsg = LazyPyclass("urn:vim25", "ResetEntityPermissions")
 
-ResetEntityPermissionsResponseMsg = GED("urn:vim25", "ResetEntityPermissionsResponse").pyclass
+ResetEntityPermissionsResponseMsg = LazyPyclass("urn:vim25", "ResetEntityPermissionsResponse")
 
-RemoveEntityPermissionRequestMsg = GED("urn:vim25", "RemoveEntityPermission").pyclass
+RemoveEntityPermissionRequestMsg = LazyPyclass("urn:vim25", "RemoveEntityPermission")
 
-RemoveEntityPermissionResponseMsg = GED("urn:vim25", "RemoveEntityPermissionResponse").pyclass
+RemoveEntityPermissionResponseMsg = LazyPyclass("urn:vim25", "RemoveEntityPermissionResponse")
 
-HasPrivilegeOnEntityRequestMsg = GED("urn:vim25", "HasPrivilegeOnEntity").pyclass
+HasPrivilegeOnEntityRequestMsg = LazyPyclass("urn:vim25", "HasPrivilegeOnEntity")
 
-HasPrivilegeOnEntityResponseMsg = GED("urn:vim25", "HasPrivilegeOnEntityResponse").pyclass
+HasPrivilegeOnEntityResponseMsg = LazyPyclass("urn:vim25", "HasPrivilegeOnEntityResponse")
 
-ReconfigureCluster_TaskRequestMsg = GED("urn:vim25", "ReconfigureCluster_Task").pyclass
+ReconfigureCluster_TaskRequestMsg = LazyPyclass("urn:vim25", "ReconfigureCluster_Task")
 
-ReconfigureCluster_TaskResponseMsg = GED("urn:vim25", "ReconfigureCluster_TaskResponse").pyclass
+ReconfigureCluster_TaskResponseMsg = LazyPyclass("urn:vim25", "ReconfigureCluster_TaskResponse")
 
-ApplyRecommendationRequestMsg = GED("urn:vim25", "ApplyRecommendation").pyclass
+ApplyRecommendationRequestMsg = LazyPyclass("urn:vim25", "ApplyRecommendation")
 
-ApplyRecommendationResponseMsg = GED("urn:vim25", "ApplyRecommendationResponse").pyclass
+ApplyRecommendationResponseMsg = LazyPyclass("urn:vim25", "ApplyRecommendationResponse")
 
-CancelRecommendationRequestMsg = GED("urn:vim25", "CancelRecommendation").pyclass
+CancelRecommendationRequestMsg = LazyPyclass("urn:vim25", "CancelRecommendation")
 
-CancelRecommendationResponseMsg = GED("urn:vim25", "CancelRecommendationResponse").pyclass
+CancelRecommendationResponseMsg = LazyPyclass("urn:vim25", "CancelRecommendationResponse")
 
-RecommendHostsForVmRequestMsg = GED("urn:vim25", "RecommendHostsForVm").pyclass
+RecommendHostsForVmRequestMsg = LazyPyclass("urn:vim25", "RecommendHostsForVm")
 
-RecommendHostsForVmResponseMsg = GED("urn:vim25", "RecommendHostsForVmResponse").pyclass
+RecommendHostsForVmResponseMsg = LazyPyclass("urn:vim25", "RecommendHostsForVmResponse")
 
-AddHost_TaskRequestMsg = GED("urn:vim25", "AddHost_Task").pyclass
+AddHost_TaskRequestMsg = LazyPyclass("urn:vim25", "AddHost_Task")
 
-AddHost_TaskResponseMsg = GED("urn:vim25", "AddHost_TaskResponse").pyclass
+AddHost_TaskResponseMsg = LazyPyclass("urn:vim25", "AddHost_TaskResponse")
 
-MoveInto_TaskRequestMsg = GED("urn:vim25", "MoveInto_Task").pyclass
+MoveInto_TaskRequestMsg = LazyPyclass("urn:vim25", "MoveInto_Task")
 
-MoveInto_TaskResponseMsg = GED("urn:vim25", "MoveInto_TaskResponse").pyclass
+MoveInto_TaskResponseMsg = LazyPyclass("urn:vim25", "MoveInto_TaskResponse")
 
-MoveHostInto_TaskRequestMsg = GED("urn:vim25", "MoveHostInto_Task").pyclass
+MoveHostInto_TaskRequestMsg = LazyPyclass("urn:vim25", "MoveHostInto_Task")
 
-MoveHostInto_TaskResponseMsg = GED("urn:vim25", "MoveHostInto_TaskResponse").pyclass
+MoveHostInto_TaskResponseMsg = LazyPyclass("urn:vim25", "MoveHostInto_TaskResponse")
 
-RefreshRecommendationRequestMsg = GED("urn:vim25", "RefreshRecommendation").pyclass
+RefreshRecommendationRequestMsg = LazyPyclass("urn:vim25", "RefreshRecommendation")
 
-RefreshRecommendationResponseMsg = GED("urn:vim25", "RefreshRecommendationResponse").pyclass
+RefreshRecommendationResponseMsg = LazyPyclass("urn:vim25", "RefreshRecommendationResponse")
 
-RetrieveDasAdvancedRuntimeInfoRequestMsg = GED("urn:vim25", "RetrieveDasAdvancedRuntimeInfo").pyclass
+RetrieveDasAdvancedRuntimeInfoRequestMsg = LazyPyclass("urn:vim25", "RetrieveDasAdvancedRuntimeInfo")
 
-RetrieveDasAdvancedRuntimeInfoResponseMsg = GED("urn:vim25", "RetrieveDasAdvancedRuntimeInfoResponse").pyclass
+RetrieveDasAdvancedRuntimeInfoResponseMsg = LazyPyclass("urn:vim25", "RetrieveDasAdvancedRuntimeInfoResponse")
 
-ClusterEnterMaintenanceModeRequestMsg = GED("urn:vim25", "ClusterEnterMaintenanceMode").pyclass
+ClusterEnterMaintenanceModeRequestMsg = LazyPyclass("urn:vim25", "ClusterEnterMaintenanceMode")
 
-ClusterEnterMaintenanceModeResponseMsg = GED("urn:vim25", "ClusterEnterMaintenanceModeResponse").pyclass
+ClusterEnterMaintenanceModeResponseMsg = LazyPyclass("urn:vim25", "ClusterEnterMaintenanceModeResponse")
 
-ReconfigureComputeResource_TaskRequestMsg = GED("urn:vim25", "ReconfigureComputeResource_Task").pyclass
+ReconfigureComputeResource_TaskRequestMsg = LazyPyclass("urn:vim25", "ReconfigureComputeResource_Task")
 
-ReconfigureComputeResource_TaskResponseMsg = GED("urn:vim25", "ReconfigureComputeResource_TaskResponse").pyclass
+ReconfigureComputeResource_TaskResponseMsg = LazyPyclass("urn:vim25", "ReconfigureComputeResource_TaskResponse")
 
-AddCustomFieldDefRequestMsg = GED("urn:vim25", "AddCustomFieldDef").pyclass
+AddCustomFieldDefRequestMsg = LazyPyclass("urn:vim25", "AddCustomFieldDef")
 
-AddCustomFieldDefResponseMsg = GED("urn:vim25", "AddCustomFieldDefResponse").pyclass
+AddCustomFieldDefResponseMsg = LazyPyclass("urn:vim25", "AddCustomFieldDefResponse")
 
-RemoveCustomFieldDefRequestMsg = GED("urn:vim25", "RemoveCustomFieldDef").pyclass
+RemoveCustomFieldDefRequestMsg = LazyPyclass("urn:vim25", "RemoveCustomFieldDef")
 
-RemoveCustomFieldDefResponseMsg = GED("urn:vim25", "RemoveCustomFieldDefResponse").pyclass
+RemoveCustomFieldDefResponseMsg = LazyPyclass("urn:vim25", "RemoveCustomFieldDefResponse")
 
-RenameCustomFieldDefRequestMsg = GED("urn:vim25", "RenameCustomFieldDef").pyclass
+RenameCustomFieldDefRequestMsg = LazyPyclass("urn:vim25", "RenameCustomFieldDef")
 
-RenameCustomFieldDefResponseMsg = GED("urn:vim25", "RenameCustomFieldDefResponse").pyclass
+RenameCustomFieldDefResponseMsg = LazyPyclass("urn:vim25", "RenameCustomFieldDefResponse")
 
-SetFieldRequestMsg = GED("urn:vim25", "SetField").pyclass
+SetFieldRequestMsg = LazyPyclass("urn:vim25", "SetField")
 
-SetFieldResponseMsg = GED("urn:vim25", "SetFieldResponse").pyclass
+SetFieldResponseMsg = LazyPyclass("urn:vim25", "SetFieldResponse")
 
-DoesCustomizationSpecExistRequestMsg = GED("urn:vim25", "DoesCustomizationSpecExist").pyclass
+DoesCustomizationSpecExistRequestMsg = LazyPyclass("urn:vim25", "DoesCustomizationSpecExist")
 
-DoesCustomizationSpecExistResponseMsg = GED("urn:vim25", "DoesCustomizationSpecExistResponse").pyclass
+DoesCustomizationSpecExistResponseMsg = LazyPyclass("urn:vim25", "DoesCustomizationSpecExistResponse")
 
-GetCustomizationSpecRequestMsg = GED("urn:vim25", "GetCustomizationSpec").pyclass
+GetCustomizationSpecRequestMsg = LazyPyclass("urn:vim25", "GetCustomizationSpec")
 
-GetCustomizationSpecResponseMsg = GED("urn:vim25", "GetCustomizationSpecResponse").pyclass
+GetCustomizationSpecResponseMsg = LazyPyclass("urn:vim25", "GetCustomizationSpecResponse")
 
-CreateCustomizationSpecRequestMsg = GED("urn:vim25", "CreateCustomizationSpec").pyclass
+CreateCustomizationSpecRequestMsg = LazyPyclass("urn:vim25", "CreateCustomizationSpec")
 
-CreateCustomizationSpecResponseMsg = GED("urn:vim25", "CreateCustomizationSpecResponse").pyclass
+CreateCustomizationSpecResponseMsg = LazyPyclass("urn:vim25", "CreateCustomizationSpecResponse")
 
-OverwriteCustomizationSpecRequestMsg = GED("urn:vim25", "OverwriteCustomizationSpec").pyclass
+OverwriteCustomizationSpecRequestMsg = LazyPyclass("urn:vim25", "OverwriteCustomizationSpec")
 
-OverwriteCustomizationSpecResponseMsg = GED("urn:vim25", "OverwriteCustomizationSpecResponse").pyclass
+OverwriteCustomizationSpecResponseMsg = LazyPyclass("urn:vim25", "OverwriteCustomizationSpecResponse")
 
-DeleteCustomizationSpecRequestMsg = GED("urn:vim25", "DeleteCustomizationSpec").pyclass
+DeleteCustomizationSpecRequestMsg = LazyPyclass("urn:vim25", "DeleteCustomizationSpec")
 
-DeleteCustomizationSpecResponseMsg = GED("urn:vim25", "DeleteCustomizationSpecResponse").pyclass
+DeleteCustomizationSpecResponseMsg = LazyPyclass("urn:vim25", "DeleteCustomizationSpecResponse")
 
-DuplicateCustomizationSpecRequestMsg = GED("urn:vim25", "DuplicateCustomizationSpec").pyclass
+DuplicateCustomizationSpecRequestMsg = LazyPyclass("urn:vim25", "DuplicateCustomizationSpec")
 
-DuplicateCustomizationSpecResponseMsg = GED("urn:vim25", "DuplicateCustomizationSpecResponse").pyclass
+DuplicateCustomizationSpecResponseMsg = LazyPyclass("urn:vim25", "DuplicateCustomizationSpecResponse")
 
-RenameCustomizationSpecRequestMsg = GED("urn:vim25", "RenameCustomizationSpec").pyclass
+RenameCustomizationSpecRequestMsg = LazyPyclass("urn:vim25", "RenameCustomizationSpec")
 
-RenameCustomizationSpecResponseMsg = GED("urn:vim25", "RenameCustomizationSpecResponse").pyclass
+RenameCustomizationSpecResponseMsg = LazyPyclass("urn:vim25", "RenameCustomizationSpecResponse")
 
-CustomizationSpecItemToXmlRequestMsg = GED("urn:vim25", "CustomizationSpecItemToXml").pyclass
+CustomizationSpecItemToXmlRequestMsg = LazyPyclass("urn:vim25", "CustomizationSpecItemToXml")
 
-CustomizationSpecItemToXmlResponseMsg = GED("urn:vim25", "CustomizationSpecItemToXmlResponse").pyclass
+CustomizationSpecItemToXmlResponseMsg = LazyPyclass("urn:vim25", "CustomizationSpecItemToXmlResponse")
 
-XmlToCustomizationSpecItemRequestMsg = GED("urn:vim25", "XmlToCustomizationSpecItem").pyclass
+XmlToCustomizationSpecItemRequestMsg = LazyPyclass("urn:vim25", "XmlToCustomizationSpecItem")
 
-XmlToCustomizationSpecItemResponseMsg = GED("urn:vim25", "XmlToCustomizationSpecItemResponse").pyclass
+XmlToCustomizationSpecItemResponseMsg = LazyPyclass("urn:vim25", "XmlToCustomizationSpecItemResponse")
 
-CheckCustomizationResourcesRequestMsg = GED("urn:vim25", "CheckCustomizationResources").pyclass
+CheckCustomizationResourcesRequestMsg = LazyPyclass("urn:vim25", "CheckCustomizationResources")
 
-CheckCustomizationResourcesResponseMsg = GED("urn:vim25", "CheckCustomizationResourcesResponse").pyclass
+CheckCustomizationResourcesResponseMsg = LazyPyclass("urn:vim25", "CheckCustomizationResourcesResponse")
 
-QueryConnectionInfoRequestMsg = GED("urn:vim25", "QueryConnectionInfo").pyclass
+QueryConnectionInfoRequestMsg = LazyPyclass("urn:vim25", "QueryConnectionInfo")
 
-QueryConnectionInfoResponseMsg = GED("urn:vim25", "QueryConnectionInfoResponse").pyclass
+QueryConnectionInfoResponseMsg = LazyPyclass("urn:vim25", "QueryConnectionInfoResponse")
 
-PowerOnMultiVM_TaskRequestMsg = GED("urn:vim25", "PowerOnMultiVM_Task").pyclass
+PowerOnMultiVM_TaskRequestMsg = LazyPyclass("urn:vim25", "PowerOnMultiVM_Task")
 
-PowerOnMultiVM_TaskResponseMsg = GED("urn:vim25", "PowerOnMultiVM_TaskResponse").pyclass
+PowerOnMultiVM_TaskResponseMsg = LazyPyclass("urn:vim25", "PowerOnMultiVM_TaskResponse")
 
-queryDatacenterConfigOptionDescriptorRequestMsg = GED("urn:vim25", "queryDatacenterConfigOptionDescriptor").pyclass
+queryDatacenterConfigOptionDescriptorRequestMsg = LazyPyclass("urn:vim25", "queryDatacenterConfigOptionDescriptor")
 
-queryDatacenterConfigOptionDescriptorResponseMsg = GED("urn:vim25", "queryDatacenterConfigOptionDescriptorResponse").pyclass
+queryDatacenterConfigOptionDescriptorResponseMsg = LazyPyclass("urn:vim25", "queryDatacenterConfigOptionDescriptorResponse")
 
-ReconfigureDatacenter_TaskRequestMsg = GED("urn:vim25", "ReconfigureDatacenter_Task").pyclass
+ReconfigureDatacenter_TaskRequestMsg = LazyPyclass("urn:vim25", "ReconfigureDatacenter_Task")
 
-ReconfigureDatacenter_TaskResponseMsg = GED("urn:vim25", "ReconfigureDatacenter_TaskResponse").pyclass
+ReconfigureDatacenter_TaskResponseMsg = LazyPyclass("urn:vim25", "ReconfigureDatacenter_TaskResponse")
 
-RefreshDatastoreRequestMsg = GED("urn:vim25", "RefreshDatastore").pyclass
+RefreshDatastoreRequestMsg = LazyPyclass("urn:vim25", "RefreshDatastore")
 
-RefreshDatastoreResponseMsg = GED("urn:vim25", "RefreshDatastoreResponse").pyclass
+RefreshDatastoreResponseMsg = LazyPyclass("urn:vim25", "RefreshDatastoreResponse")
 
-RefreshDatastoreStorageInfoRequestMsg = GED("urn:vim25", "RefreshDatastoreStorageInfo").pyclass
+RefreshDatastoreStorageInfoRequestMsg = LazyPyclass("urn:vim25", "RefreshDatastoreStorageInfo")
 
-RefreshDatastoreStorageInfoResponseMsg = GED("urn:vim25", "RefreshDatastoreStorageInfoResponse").pyclass
+RefreshDatastoreStorageInfoResponseMsg = LazyPyclass("urn:vim25", "RefreshDatastoreStorageInfoResponse")
 
-UpdateVirtualMachineFiles_TaskRequestMsg = GED("urn:vim25", "UpdateVirtualMachineFiles_Task").pyclass
+UpdateVirtualMachineFiles_TaskRequestMsg = LazyPyclass("urn:vim25", "UpdateVirtualMachineFiles_Task")
 
-UpdateVirtualMachineFiles_TaskResponseMsg = GED("urn:vim25", "UpdateVirtualMachineFiles_TaskResponse").pyclass
+UpdateVirtualMachineFiles_TaskResponseMsg = LazyPyclass("urn:vim25", "UpdateVirtualMachineFiles_TaskResponse")
 
-RenameDatastoreRequestMsg = GED("urn:vim25", "RenameDatastore").pyclass
+RenameDatastoreRequestMsg = LazyPyclass("urn:vim25", "RenameDatastore")
 
-RenameDatastoreResponseMsg = GED("urn:vim25", "RenameDatastoreResponse").pyclass
+RenameDatastoreResponseMsg = LazyPyclass("urn:vim25", "RenameDatastoreResponse")
 
-DestroyDatastoreRequestMsg = GED("urn:vim25", "DestroyDatastore").pyclass
+DestroyDatastoreRequestMsg = LazyPyclass("urn:vim25", "DestroyDatastore")
 
-DestroyDatastoreResponseMsg = GED("urn:vim25", "DestroyDatastoreResponse").pyclass
+DestroyDatastoreResponseMsg = LazyPyclass("urn:vim25", "DestroyDatastoreResponse")
 
-DatastoreEnterMaintenanceModeRequestMsg = GED("urn:vim25", "DatastoreEnterMaintenanceMode").pyclass
+DatastoreEnterMaintenanceModeRequestMsg = LazyPyclass("urn:vim25", "DatastoreEnterMaintenanceMode")
 
-DatastoreEnterMaintenanceModeResponseMsg = GED("urn:vim25", "DatastoreEnterMaintenanceModeResponse").pyclass
+DatastoreEnterMaintenanceModeResponseMsg = LazyPyclass("urn:vim25", "DatastoreEnterMaintenanceModeResponse")
 
-DatastoreExitMaintenanceMode_TaskRequestMsg = GED("urn:vim25", "DatastoreExitMaintenanceMode_Task").pyclass
+DatastoreExitMaintenanceMode_TaskRequestMsg = LazyPyclass("urn:vim25", "DatastoreExitMaintenanceMode_Task")
 
-DatastoreExitMaintenanceMode_TaskResponseMsg = GED("urn:vim25", "DatastoreExitMaintenanceMode_TaskResponse").pyclass
+DatastoreExitMaintenanceMode_TaskResponseMsg = LazyPyclass("urn:vim25", "DatastoreExitMaintenanceMode_TaskResponse")
 
-QueryDescriptionsRequestMsg = GED("urn:vim25", "QueryDescriptions").pyclass
+QueryDescriptionsRequestMsg = LazyPyclass("urn:vim25", "QueryDescriptions")
 
-QueryDescriptionsResponseMsg = GED("urn:vim25", "QueryDescriptionsResponse").pyclass
+QueryDescriptionsResponseMsg = LazyPyclass("urn:vim25", "QueryDescriptionsResponse")
 
-BrowseDiagnosticLogRequestMsg = GED("urn:vim25", "BrowseDiagnosticLog").pyclass
+BrowseDiagnosticLogRequestMsg = LazyPyclass("urn:vim25", "BrowseDiagnosticLog")
 
-BrowseDiagnosticLogResponseMsg = GED("urn:vim25", "BrowseDiagnosticLogResponse").pyclass
+BrowseDiagnosticLogResponseMsg = LazyPyclass("urn:vim25", "BrowseDiagnosticLogResponse")
 
-GenerateLogBundles_TaskRequestMsg = GED("urn:vim25", "GenerateLogBundles_Task").pyclass
+GenerateLogBundles_TaskRequestMsg = LazyPyclass("urn:vim25", "GenerateLogBundles_Task")
 
-GenerateLogBundles_TaskResponseMsg = GED("urn:vim25", "GenerateLogBundles_TaskResponse").pyclass
+GenerateLogBundles_TaskResponseMsg = LazyPyclass("urn:vim25", "GenerateLogBundles_TaskResponse")
 
-FetchDVPortKeysRequestMsg = GED("urn:vim25", "FetchDVPortKeys").pyclass
+FetchDVPortKeysRequestMsg = LazyPyclass("urn:vim25", "FetchDVPortKeys")
 
-FetchDVPortKeysResponseMsg = GED("urn:vim25", "FetchDVPortKeysResponse").pyclass
+FetchDVPortKeysResponseMsg = LazyPyclass("urn:vim25", "FetchDVPortKeysResponse")
 
-FetchDVPortsRequestMsg = GED("urn:vim25", "FetchDVPorts").pyclass
+FetchDVPortsRequestMsg = LazyPyclass("urn:vim25", "FetchDVPorts")
 
-FetchDVPortsResponseMsg = GED("urn:vim25", "FetchDVPortsResponse").pyclass
+FetchDVPortsResponseMsg = LazyPyclass("urn:vim25", "FetchDVPortsResponse")
 
-QueryUsedVlanIdInDvsRequestMsg = GED("urn:vim25", "QueryUsedVlanIdInDvs").pyclass
+QueryUsedVlanIdInDvsRequestMsg = LazyPyclass("urn:vim25", "QueryUsedVlanIdInDvs")
 
-QueryUsedVlanIdInDvsResponseMsg = GED("urn:vim25", "QueryUsedVlanIdInDvsResponse").pyclass
+QueryUsedVlanIdInDvsResponseMsg = LazyPyclass("urn:vim25", "QueryUsedVlanIdInDvsResponse")
 
-ReconfigureDvs_TaskRequestMsg = GED("urn:vim25", "ReconfigureDvs_Task").pyclass
+ReconfigureDvs_TaskRequestMsg = LazyPyclass("urn:vim25", "ReconfigureDvs_Task")
 
-ReconfigureDvs_TaskResponseMsg = GED("urn:vim25", "ReconfigureDvs_TaskResponse").pyclass
+ReconfigureDvs_TaskResponseMsg = LazyPyclass("urn:vim25", "ReconfigureDvs_TaskResponse")
 
-PerformDvsProductSpecOperation_TaskRequestMsg = GED("urn:vim25", "PerformDvsProductSpecOperation_Task").pyclass
+PerformDvsProductSpecOperation_TaskRequestMsg = LazyPyclass("urn:vim25", "PerformDvsProductSpecOperation_Task")
 
-PerformDvsProductSpecOperation_TaskResponseMsg = GED("urn:vim25", "PerformDvsProductSpecOperation_TaskResponse").pyclass
+PerformDvsProductSpecOperation_TaskResponseMsg = LazyPyclass("urn:vim25", "PerformDvsProductSpecOperation_TaskResponse")
 
-MergeDvs_TaskRequestMsg = GED("urn:vim25", "MergeDvs_Task").pyclass
+MergeDvs_TaskRequestMsg = LazyPyclass("urn:vim25", "MergeDvs_Task")
 
-MergeDvs_TaskResponseMsg = GED("urn:vim25", "MergeDvs_TaskResponse").pyclass
+MergeDvs_TaskResponseMsg = LazyPyclass("urn:vim25", "MergeDvs_TaskResponse")
 
-AddDVPortgroup_TaskRequestMsg = GED("urn:vim25", "AddDVPortgroup_Task").pyclass
+AddDVPortgroup_TaskRequestMsg = LazyPyclass("urn:vim25", "AddDVPortgroup_Task")
 
-AddDVPortgroup_TaskResponseMsg = GED("urn:vim25", "AddDVPortgroup_TaskResponse").pyclass
+AddDVPortgroup_TaskResponseMsg = LazyPyclass("urn:vim25", "AddDVPortgroup_TaskResponse")
 
-MoveDVPort_TaskRequestMsg = GED("urn:vim25", "MoveDVPort_Task").pyclass
+MoveDVPort_TaskRequestMsg = LazyPyclass("urn:vim25", "MoveDVPort_Task")
 
-MoveDVPort_TaskResponseMsg = GED("urn:vim25", "MoveDVPort_TaskResponse").pyclass
+MoveDVPort_TaskResponseMsg = LazyPyclass("urn:vim25", "MoveDVPort_TaskResponse")
 
-UpdateDvsCapabilityRequestMsg = GED("urn:vim25", "UpdateDvsCapability").pyclass
+UpdateDvsCapabilityRequestMsg = LazyPyclass("urn:vim25", "UpdateDvsCapability")
 
-UpdateDvsCapabilityResponseMsg = GED("urn:vim25", "UpdateDvsCapabilityResponse").pyclass
+UpdateDvsCapabilityResponseMsg = LazyPyclass("urn:vim25", "UpdateDvsCapabilityResponse")
 
-ReconfigureDVPort_TaskRequestMsg = GED("urn:vim25", "ReconfigureDVPort_Task").pyclass
+ReconfigureDVPort_TaskRequestMsg = LazyPyclass("urn:vim25", "ReconfigureDVPort_Task")
 
-ReconfigureDVPort_TaskResponseMsg = GED("urn:vim25", "ReconfigureDVPort_TaskResponse").pyclass
+ReconfigureDVPort_TaskResponseMsg = LazyPyclass("urn:vim25", "ReconfigureDVPort_TaskResponse")
 
-RefreshDVPortStateRequestMsg = GED("urn:vim25", "RefreshDVPortState").pyclass
+RefreshDVPortStateRequestMsg = LazyPyclass("urn:vim25", "RefreshDVPortState")
 
-RefreshDVPortStateResponseMsg = GED("urn:vim25", "RefreshDVPortStateResponse").pyclass
+RefreshDVPortStateResponseMsg = LazyPyclass("urn:vim25", "RefreshDVPortStateResponse")
 
-RectifyDvsHost_TaskRequestMsg = GED("urn:vim25", "RectifyDvsHost_Task").pyclass
+RectifyDvsHost_TaskRequestMsg = LazyPyclass("urn:vim25", "RectifyDvsHost_Task")
 
-RectifyDvsHost_TaskResponseMsg = GED("urn:vim25", "RectifyDvsHost_TaskResponse").pyclass
+RectifyDvsHost_TaskResponseMsg = LazyPyclass("urn:vim25", "RectifyDvsHost_TaskResponse")
 
-UpdateNetworkResourcePoolRequestMsg = GED("urn:vim25", "UpdateNetworkResourcePool").pyclass
+UpdateNetworkResourcePoolRequestMsg = LazyPyclass("urn:vim25", "UpdateNetworkResourcePool")
 
-UpdateNetworkResourcePoolResponseMsg = GED("urn:vim25", "UpdateNetworkResourcePoolResponse").pyclass
+UpdateNetworkResourcePoolResponseMsg = LazyPyclass("urn:vim25", "UpdateNetworkResourcePoolResponse")
 
-AddNetworkResourcePoolRequestMsg = GED("urn:vim25", "AddNetworkResourcePool").pyclass
+AddNetworkResourcePoolRequestMsg = LazyPyclass("urn:vim25", "AddNetworkResourcePool")
 
-AddNetworkResourcePoolResponseMsg = GED("urn:vim25", "AddNetworkResourcePoolResponse").pyclass
+AddNetworkResourcePoolResponseMsg = LazyPyclass("urn:vim25", "AddNetworkResourcePoolResponse")
 
-RemoveNetworkResourcePoolRequestMsg = GED("urn:vim25", "RemoveNetworkResourcePool").pyclass
+RemoveNetworkResourcePoolRequestMsg = LazyPyclass("urn:vim25", "RemoveNetworkResourcePool")
 
-RemoveNetworkResourcePoolResponseMsg = GED("urn:vim25", "RemoveNetworkResourcePoolResponse").pyclass
+RemoveNetworkResourcePoolResponseMsg = LazyPyclass("urn:vim25", "RemoveNetworkResourcePoolResponse")
 
-EnableNetworkResourceManagementRequestMsg = GED("urn:vim25", "EnableNetworkResourceManagement").pyclass
+EnableNetworkResourceManagementRequestMsg = LazyPyclass("urn:vim25", "EnableNetworkResourceManagement")
 
-EnableNetworkResourceManagementResponseMsg = GED("urn:vim25", "EnableNetworkResourceManagementResponse").pyclass
+EnableNetworkResourceManagementResponseMsg = LazyPyclass("urn:vim25", "EnableNetworkResourceManagementResponse")
 
-DVSRollback_TaskRequestMsg = GED("urn:vim25", "DVSRollback_Task").pyclass
+DVSRollback_TaskRequestMsg = LazyPyclass("urn:vim25", "DVSRollback_Task")
 
-DVSRollback_TaskResponseMsg = GED("urn:vim25", "DVSRollback_TaskResponse").pyclass
+DVSRollback_TaskResponseMsg = LazyPyclass("urn:vim25", "DVSRollback_TaskResponse")
 
-CreateDVPortgroup_TaskRequestMsg = GED("urn:vim25", "CreateDVPortgroup_Task").pyclass
+CreateDVPortgroup_TaskRequestMsg = LazyPyclass("urn:vim25", "CreateDVPortgroup_Task")
 
-CreateDVPortgroup_TaskResponseMsg = GED("urn:vim25", "CreateDVPortgroup_TaskResponse").pyclass
+CreateDVPortgroup_TaskResponseMsg = LazyPyclass("urn:vim25", "CreateDVPortgroup_TaskResponse")
 
-UpdateDVSHealthCheckConfig_TaskRequestMsg = GED("urn:vim25", "UpdateDVSHealthCheckConfig_Task").pyclass
+UpdateDVSHealthCheckConfig_TaskRequestMsg = LazyPyclass("urn:vim25", "UpdateDVSHealthCheckConfig_Task")
 
-UpdateDVSHealthCheckConfig_TaskResponseMsg = GED("urn:vim25", "UpdateDVSHealthCheckConfig_TaskResponse").pyclass
+UpdateDVSHealthCheckConfig_TaskResponseMsg = LazyPyclass("urn:vim25", "UpdateDVSHealthCheckConfig_TaskResponse")
 
-LookupDvPortGroupRequestMsg = GED("urn:vim25", "LookupDvPortGroup").pyclass
+LookupDvPortGroupRequestMsg = LazyPyclass("urn:vim25", "LookupDvPortGroup")
 
-LookupDvPortGroupResponseMsg = GED("urn:vim25", "LookupDvPortGroupResponse").pyclass
+LookupDvPortGroupResponseMsg = LazyPyclass("urn:vim25", "LookupDvPortGroupResponse")
 
-QueryConfigOptionDescriptorRequestMsg = GED("urn:vim25", "QueryConfigOptionDescriptor").pyclass
+QueryConfigOptionDescriptorRequestMsg = LazyPyclass("urn:vim25", "QueryConfigOptionDescriptor")
 
-QueryConfigOptionDescriptorResponseMsg = GED("urn:vim25", "QueryConfigOptionDescriptorResponse").pyclass
+QueryConfigOptionDescriptorResponseMsg = LazyPyclass("urn:vim25", "QueryConfigOptionDescriptorResponse")
 
-QueryConfigOptionRequestMsg = GED("urn:vim25", "QueryConfigOption").pyclass
+QueryConfigOptionRequestMsg = LazyPyclass("urn:vim25", "QueryConfigOption")
 
-QueryConfigOptionResponseMsg = GED("urn:vim25", "QueryConfigOptionResponse").pyclass
+QueryConfigOptionResponseMsg = LazyPyclass("urn:vim25", "QueryConfigOptionResponse")
 
-QueryConfigTargetRequestMsg = GED("urn:vim25", "QueryConfigTarget").pyclass
+QueryConfigTargetRequestMsg = LazyPyclass("urn:vim25", "QueryConfigTarget")
 
-QueryConfigTargetResponseMsg = GED("urn:vim25", "QueryConfigTargetResponse").pyclass
+QueryConfigTargetResponseMsg = LazyPyclass("urn:vim25", "QueryConfigTargetResponse")
 
-QueryTargetCapabilitiesRequestMsg = GED("urn:vim25", "QueryTargetCapabilities").pyclass
+QueryTargetCapabilitiesRequestMsg = LazyPyclass("urn:vim25", "QueryTargetCapabilities")
 
-QueryTargetCapabilitiesResponseMsg = GED("urn:vim25", "QueryTargetCapabilitiesResponse").pyclass
+QueryTargetCapabilitiesResponseMsg = LazyPyclass("urn:vim25", "QueryTargetCapabilitiesResponse")
 
-setCustomValueRequestMsg = GED("urn:vim25", "setCustomValue").pyclass
+setCustomValueRequestMsg = LazyPyclass("urn:vim25", "setCustomValue")
 
-setCustomValueResponseMsg = GED("urn:vim25", "setCustomValueResponse").pyclass
+setCustomValueResponseMsg = LazyPyclass("urn:vim25", "setCustomValueResponse")
 
-UnregisterExtensionRequestMsg = GED("urn:vim25", "UnregisterExtension").pyclass
+UnregisterExtensionRequestMsg = LazyPyclass("urn:vim25", "UnregisterExtension")
 
-UnregisterExtensionResponseMsg = GED("urn:vim25", "UnregisterExtensionResponse").pyclass
+UnregisterExtensionResponseMsg = LazyPyclass("urn:vim25", "UnregisterExtensionResponse")
 
-FindExtensionRequestMsg = GED("urn:vim25", "FindExtension").pyclass
+FindExtensionRequestMsg = LazyPyclass("urn:vim25", "FindExtension")
 
-FindExtensionResponseMsg = GED("urn:vim25", "FindExtensionResponse").pyclass
+FindExtensionResponseMsg = LazyPyclass("urn:vim25", "FindExtensionResponse")
 
-RegisterExtensionRequestMsg = GED("urn:vim25", "RegisterExtension").pyclass
+RegisterExtensionRequestMsg = LazyPyclass("urn:vim25", "RegisterExtension")
 
-RegisterExtensionResponseMsg = GED("urn:vim25", "RegisterExtensionResponse").pyclass
+RegisterExtensionResponseMsg = LazyPyclass("urn:vim25", "RegisterExtensionResponse")
 
-UpdateExtensionRequestMsg = GED("urn:vim25", "UpdateExtension").pyclass
+UpdateExtensionRequestMsg = LazyPyclass("urn:vim25", "UpdateExtension")
 
-UpdateExtensionResponseMsg = GED("urn:vim25", "UpdateExtensionResponse").pyclass
+UpdateExtensionResponseMsg = LazyPyclass("urn:vim25", "UpdateExtensionResponse")
 
-GetPublicKeyRequestMsg = GED("urn:vim25", "GetPublicKey").pyclass
+GetPublicKeyRequestMsg = LazyPyclass("urn:vim25", "GetPublicKey")
 
-GetPublicKeyResponseMsg = GED("urn:vim25", "GetPublicKeyResponse").pyclass
+GetPublicKeyResponseMsg = LazyPyclass("urn:vim25", "GetPublicKeyResponse")
 
-SetPublicKeyRequestMsg = GED("urn:vim25", "SetPublicKey").pyclass
+SetPublicKeyRequestMsg = LazyPyclass("urn:vim25", "SetPublicKey")
 
-SetPublicKeyResponseMsg = GED("urn:vim25", "SetPublicKeyResponse").pyclass
+SetPublicKeyResponseMsg = LazyPyclass("urn:vim25", "SetPublicKeyResponse")
 
-SetExtensionCertificateRequestMsg = GED("urn:vim25", "SetExtensionCertificate").pyclass
+SetExtensionCertificateRequestMsg = LazyPyclass("urn:vim25", "SetExtensionCertificate")
 
-SetExtensionCertificateResponseMsg = GED("urn:vim25", "SetExtensionCertificateResponse").pyclass
+SetExtensionCertificateResponseMsg = LazyPyclass("urn:vim25", "SetExtensionCertificateResponse")
 
-QueryManagedByRequestMsg = GED("urn:vim25", "QueryManagedBy").pyclass
+QueryManagedByRequestMsg = LazyPyclass("urn:vim25", "QueryManagedBy")
 
-QueryManagedByResponseMsg = GED("urn:vim25", "QueryManagedByResponse").pyclass
+QueryManagedByResponseMsg = LazyPyclass("urn:vim25", "QueryManagedByResponse")
 
-QueryExtensionIpAllocationUsageRequestMsg = GED("urn:vim25", "QueryExtensionIpAllocationUsage").pyclass
+QueryExtensionIpAllocationUsageRequestMsg = LazyPyclass("urn:vim25", "QueryExtensionIpAllocationUsage")
 
-QueryExtensionIpAllocationUsageResponseMsg = GED("urn:vim25", "QueryExtensionIpAllocationUsageResponse").pyclass
+QueryExtensionIpAllocationUsageResponseMsg = LazyPyclass("urn:vim25", "QueryExtensionIpAllocationUsageResponse")
 
-MoveDatastoreFile_TaskRequestMsg = GED("urn:vim25", "MoveDatastoreFile_Task").pyclass
+MoveDatastoreFile_TaskRequestMsg = LazyPyclass("urn:vim25", "MoveDatastoreFile_Task")
 
-MoveDatastoreFile_TaskResponseMsg = GED("urn:vim25", "MoveDatastoreFile_TaskResponse").pyclass
+MoveDatastoreFile_TaskResponseMsg = LazyPyclass("urn:vim25", "MoveDatastoreFile_TaskResponse")
 
-CopyDatastoreFile_TaskRequestMsg = GED("urn:vim25", "CopyDatastoreFile_Task").pyclass
+CopyDatastoreFile_TaskRequestMsg = LazyPyclass("urn:vim25", "CopyDatastoreFile_Task")
 
-CopyDatastoreFile_TaskResponseMsg = GED("urn:vim25", "CopyDatastoreFile_TaskResponse").pyclass
+CopyDatastoreFile_TaskResponseMsg = LazyPyclass("urn:vim25", "CopyDatastoreFile_TaskResponse")
 
-DeleteDatastoreFile_TaskRequestMsg = GED("urn:vim25", "DeleteDatastoreFile_Task").pyclass
+DeleteDatastoreFile_TaskRequestMsg = LazyPyclass("urn:vim25", "DeleteDatastoreFile_Task")
 
-DeleteDatastoreFile_TaskResponseMsg = GED("urn:vim25", "DeleteDatastoreFile_TaskResponse").pyclass
+DeleteDatastoreFile_TaskResponseMsg = LazyPyclass("urn:vim25", "DeleteDatastoreFile_TaskResponse")
 
-MakeDirectoryRequestMsg = GED("urn:vim25", "MakeDirectory").pyclass
+MakeDirectoryRequestMsg = LazyPyclass("urn:vim25", "MakeDirectory")
 
-MakeDirectoryResponseMsg = GED("urn:vim25", "MakeDirectoryResponse").pyclass
+MakeDirectoryResponseMsg = LazyPyclass("urn:vim25", "MakeDirectoryResponse")
 
-ChangeOwnerRequestMsg = GED("urn:vim25", "ChangeOwner").pyclass
+ChangeOwnerRequestMsg = LazyPyclass("urn:vim25", "ChangeOwner")
 
-ChangeOwnerResponseMsg = GED("urn:vim25", "ChangeOwnerResponse").pyclass
+ChangeOwnerResponseMsg = LazyPyclass("urn:vim25", "ChangeOwnerResponse")
 
-CreateFolderRequestMsg = GED("urn:vim25", "CreateFolder").pyclass
+CreateFolderRequestMsg = LazyPyclass("urn:vim25", "CreateFolder")
 
-CreateFolderResponseMsg = GED("urn:vim25", "CreateFolderResponse").pyclass
+CreateFolderResponseMsg = LazyPyclass("urn:vim25", "CreateFolderResponse")
 
-MoveIntoFolder_TaskRequestMsg = GED("urn:vim25", "MoveIntoFolder_Task").pyclass
+MoveIntoFolder_TaskRequestMsg = LazyPyclass("urn:vim25", "MoveIntoFolder_Task")
 
-MoveIntoFolder_TaskResponseMsg = GED("urn:vim25", "MoveIntoFolder_TaskResponse").pyclass
+MoveIntoFolder_TaskResponseMsg = LazyPyclass("urn:vim25", "MoveIntoFolder_TaskResponse")
 
-CreateVM_TaskRequestMsg = GED("urn:vim25", "CreateVM_Task").pyclass
+CreateVM_TaskRequestMsg = LazyPyclass("urn:vim25", "CreateVM_Task")
 
-CreateVM_TaskResponseMsg = GED("urn:vim25", "CreateVM_TaskResponse").pyclass
+CreateVM_TaskResponseMsg = LazyPyclass("urn:vim25", "CreateVM_TaskResponse")
 
-RegisterVM_TaskRequestMsg = GED("urn:vim25", "RegisterVM_Task").pyclass
+RegisterVM_TaskRequestMsg = LazyPyclass("urn:vim25", "RegisterVM_Task")
 
-RegisterVM_TaskResponseMsg = GED("urn:vim25", "RegisterVM_TaskResponse").pyclass
+RegisterVM_TaskResponseMsg = LazyPyclass("urn:vim25", "RegisterVM_TaskResponse")
 
-CreateClusterRequestMsg = GED("urn:vim25", "CreateCluster").pyclass
+CreateClusterRequestMsg = LazyPyclass("urn:vim25", "CreateCluster")
 
-CreateClusterResponseMsg = GED("urn:vim25", "CreateClusterResponse").pyclass
+CreateClusterResponseMsg = LazyPyclass("urn:vim25", "CreateClusterResponse")
 
-CreateClusterExRequestMsg = GED("urn:vim25", "CreateClusterEx").pyclass
+CreateClusterExRequestMsg = LazyPyclass("urn:vim25", "CreateClusterEx")
 
-CreateClusterExResponseMsg = GED("urn:vim25", "CreateClusterExResponse").pyclass
+CreateClusterExResponseMsg = LazyPyclass("urn:vim25", "CreateClusterExResponse")
 
-AddStandaloneHost_TaskRequestMsg = GED("urn:vim25", "AddStandaloneHost_Task").pyclass
+AddStandaloneHost_TaskRequestMsg = LazyPyclass("urn:vim25", "AddStandaloneHost_Task")
 
-AddStandaloneHost_TaskResponseMsg = GED("urn:vim25", "AddStandaloneHost_TaskResponse").pyclass
+AddStandaloneHost_TaskResponseMsg = LazyPyclass("urn:vim25", "AddStandaloneHost_TaskResponse")
 
-CreateDatacenterRequestMsg = GED("urn:vim25", "CreateDatacenter").pyclass
+CreateDatacenterRequestMsg = LazyPyclass("urn:vim25", "CreateDatacenter")
 
-CreateDatacenterResponseMsg = GED("urn:vim25", "CreateDatacenterResponse").pyclass
+CreateDatacenterResponseMsg = LazyPyclass("urn:vim25", "CreateDatacenterResponse")
 
-UnregisterAndDestroy_TaskRequestMsg = GED("urn:vim25", "UnregisterAndDestroy_Task").pyclass
+UnregisterAndDestroy_TaskRequestMsg = LazyPyclass("urn:vim25", "UnregisterAndDestroy_Task")
 
-UnregisterAndDestroy_TaskResponseMsg = GED("urn:vim25", "UnregisterAndDestroy_TaskResponse").pyclass
+UnregisterAndDestroy_TaskResponseMsg = LazyPyclass("urn:vim25", "UnregisterAndDestroy_TaskResponse")
 
-CreateDVS_TaskRequestMsg = GED("urn:vim25", "CreateDVS_Task").pyclass
+CreateDVS_TaskRequestMsg = LazyPyclass("urn:vim25", "CreateDVS_Task")
 
-CreateDVS_TaskResponseMsg = GED("urn:vim25", "CreateDVS_TaskResponse").pyclass
+CreateDVS_TaskResponseMsg = LazyPyclass("urn:vim25", "CreateDVS_TaskResponse")
 
-CreateStoragePodRequestMsg = GED("urn:vim25", "CreateStoragePod").pyclass
+CreateStoragePodRequestMsg = LazyPyclass("urn:vim25", "CreateStoragePod")
 
-CreateStoragePodResponseMsg = GED("urn:vim25", "CreateStoragePodResponse").pyclass
+CreateStoragePodResponseMsg = LazyPyclass("urn:vim25", "CreateStoragePodResponse")
 
-SetCollectorPageSizeRequestMsg = GED("urn:vim25", "SetCollectorPageSize").pyclass
+SetCollectorPageSizeRequestMsg = LazyPyclass("urn:vim25", "SetCollectorPageSize")
 
-SetCollectorPageSizeResponseMsg = GED("urn:vim25", "SetCollectorPageSizeResponse").pyclass
+SetCollectorPageSizeResponseMsg = LazyPyclass("urn:vim25", "SetCollectorPageSizeResponse")
 
-RewindCollectorRequestMsg = GED("urn:vim25", "RewindCollector").pyclass
+RewindCollectorRequestMsg = LazyPyclass("urn:vim25", "RewindCollector")
 
-RewindCollectorResponseMsg = GED("urn:vim25", "RewindCollectorResponse").pyclass
+RewindCollectorResponseMsg = LazyPyclass("urn:vim25", "RewindCollectorResponse")
 
-ResetCollectorRequestMsg = GED("urn:vim25", "ResetCollector").pyclass
+ResetCollectorRequestMsg = LazyPyclass("urn:vim25", "ResetCollector")
 
-ResetCollectorResponseMsg = GED("urn:vim25", "ResetCollectorResponse").pyclass
+ResetCollectorResponseMsg = LazyPyclass("urn:vim25", "ResetCollectorResponse")
 
-DestroyCollectorRequestMsg = GED("urn:vim25", "DestroyCollector").pyclass
+DestroyCollectorRequestMsg = LazyPyclass("urn:vim25", "DestroyCollector")
 
-DestroyCollectorResponseMsg = GED("urn:vim25", "DestroyCollectorResponse").pyclass
+DestroyCollectorResponseMsg = LazyPyclass("urn:vim25", "DestroyCollectorResponse")
 
-QueryTpmAttestationReportRequestMsg = GED("urn:vim25", "QueryTpmAttestationReport").pyclass
+QueryTpmAttestationReportRequestMsg = LazyPyclass("urn:vim25", "QueryTpmAttestationReport")
 
-QueryTpmAttestationReportResponseMsg = GED("urn:vim25", "QueryTpmAttestationReportResponse").pyclass
+QueryTpmAttestationReportResponseMsg = LazyPyclass("urn:vim25", "QueryTpmAttestationReportResponse")
 
-QueryHostConnectionInfoRequestMsg = GED("urn:vim25", "QueryHostConnectionInfo").pyclass
+QueryHostConnectionInfoRequestMsg = LazyPyclass("urn:vim25", "QueryHostConnectionInfo")
 
-QueryHostConnectionInfoResponseMsg = GED("urn:vim25", "QueryHostConnectionInfoResponse").pyclass
+QueryHostConnectionInfoResponseMsg = LazyPyclass("urn:vim25", "QueryHostConnectionInfoResponse")
 
-UpdateSystemResourcesRequestMsg = GED("urn:vim25", "UpdateSystemResources").pyclass
+UpdateSystemResourcesRequestMsg = LazyPyclass("urn:vim25", "UpdateSystemResources")
 
-UpdateSystemResourcesResponseMsg = GED("urn:vim25", "UpdateSystemResourcesResponse").pyclass
+UpdateSystemResourcesResponseMsg = LazyPyclass("urn:vim25", "UpdateSystemResourcesResponse")
 
-UpdateSystemSwapConfigurationRequestMsg = GED("urn:vim25", "UpdateSystemSwapConfiguration").pyclass
+UpdateSystemSwapConfigurationRequestMsg = LazyPyclass("urn:vim25", "UpdateSystemSwapConfiguration")
 
-UpdateSystemSwapConfigurationResponseMsg = GED("urn:vim25", "UpdateSystemSwapConfigurationResponse").pyclass
+UpdateSystemSwapConfigurationResponseMsg = LazyPyclass("urn:vim25", "UpdateSystemSwapConfigurationResponse")
 
-ReconnectHost_TaskRequestMsg = GED("urn:vim25", "ReconnectHost_Task").pyclass
+ReconnectHost_TaskRequestMsg = LazyPyclass("urn:vim25", "ReconnectHost_Task")
 
-ReconnectHost_TaskResponseMsg = GED("urn:vim25", "ReconnectHost_TaskResponse").pyclass
+ReconnectHost_TaskResponseMsg = LazyPyclass("urn:vim25", "ReconnectHost_TaskResponse")
 
-DisconnectHost_TaskRequestMsg = GED("urn:vim25", "DisconnectHost_Task").pyclass
+DisconnectHost_TaskRequestMsg = LazyPyclass("urn:vim25", "DisconnectHost_Task")
 
-DisconnectHost_TaskResponseMsg = GED("urn:vim25", "DisconnectHost_TaskResponse").pyclass
+DisconnectHost_TaskResponseMsg = LazyPyclass("urn:vim25", "DisconnectHost_TaskResponse")
 
-EnterMaintenanceMode_TaskRequestMsg = GED("urn:vim25", "EnterMaintenanceMode_Task").pyclass
+EnterMaintenanceMode_TaskRequestMsg = LazyPyclass("urn:vim25", "EnterMaintenanceMode_Task")
 
-EnterMaintenanceMode_TaskResponseMsg = GED("urn:vim25", "EnterMaintenanceMode_TaskResponse").pyclass
+EnterMaintenanceMode_TaskResponseMsg = LazyPyclass("urn:vim25", "EnterMaintenanceMode_TaskResponse")
 
-ExitMaintenanceMode_TaskRequestMsg = GED("urn:vim25", "ExitMaintenanceMode_Task").pyclass
+ExitMaintenanceMode_TaskRequestMsg = LazyPyclass("urn:vim25", "ExitMaintenanceMode_Task")
 
-ExitMaintenanceMode_TaskResponseMsg = GED("urn:vim25", "ExitMaintenanceMode_TaskResponse").pyclass
+ExitMaintenanceMode_TaskResponseMsg = LazyPyclass("urn:vim25", "ExitMaintenanceMode_TaskResponse")
 
-RebootHost_TaskRequestMsg = GED("urn:vim25", "RebootHost_Task").pyclass
+RebootHost_TaskRequestMsg = LazyPyclass("urn:vim25", "RebootHost_Task")
 
-RebootHost_TaskResponseMsg = GED("urn:vim25", "RebootHost_TaskResponse").pyclass
+RebootHost_TaskResponseMsg = LazyPyclass("urn:vim25", "RebootHost_TaskResponse")
 
-ShutdownHost_TaskRequestMsg = GED("urn:vim25", "ShutdownHost_Task").pyclass
+ShutdownHost_TaskRequestMsg = LazyPyclass("urn:vim25", "ShutdownHost_Task")
 
-ShutdownHost_TaskResponseMsg = GED("urn:vim25", "ShutdownHost_TaskResponse").pyclass
+ShutdownHost_TaskResponseMsg = LazyPyclass("urn:vim25", "ShutdownHost_TaskResponse")
 
-PowerDownHostToStandBy_TaskRequestMsg = GED("urn:vim25", "PowerDownHostToStandBy_Task").pyclass
+PowerDownHostToStandBy_TaskRequestMsg = LazyPyclass("urn:vim25", "PowerDownHostToStandBy_Task")
 
-PowerDownHostToStandBy_TaskResponseMsg = GED("urn:vim25", "PowerDownHostToStandBy_TaskResponse").pyclass
+PowerDownHostToStandBy_TaskResponseMsg = LazyPyclass("urn:vim25", "PowerDownHostToStandBy_TaskResponse")
 
-PowerUpHostFromStandBy_TaskRequestMsg = GED("urn:vim25", "PowerUpHostFromStandBy_Task").pyclass
+PowerUpHostFromStandBy_TaskRequestMsg = LazyPyclass("urn:vim25", "PowerUpHostFromStandBy_Task")
 
-PowerUpHostFromStandBy_TaskResponseMsg = GED("urn:vim25", "PowerUpHostFromStandBy_TaskResponse").pyclass
+PowerUpHostFromStandBy_TaskResponseMsg = LazyPyclass("urn:vim25", "PowerUpHostFromStandBy_TaskResponse")
 
-QueryMemoryOverheadRequestMsg = GED("urn:vim25", "QueryMemoryOverhead").pyclass
+QueryMemoryOverheadRequestMsg = LazyPyclass("urn:vim25", "QueryMemoryOverhead")
 
-QueryMemoryOverheadResponseMsg = GED("urn:vim25", "QueryMemoryOverheadResponse").pyclass
+QueryMemoryOverheadResponseMsg = LazyPyclass("urn:vim25", "QueryMemoryOverheadResponse")
 
-QueryMemoryOverheadExRequestMsg = GED("urn:vim25", "QueryMemoryOverheadEx").pyclass
+QueryMemoryOverheadExRequestMsg = LazyPyclass("urn:vim25", "QueryMemoryOverheadEx")
 
-QueryMemoryOverheadExResponseMsg = GED("urn:vim25", "QueryMemoryOverheadExResponse").pyclass
+QueryMemoryOverheadExResponseMsg = LazyPyclass("urn:vim25", "QueryMemoryOverheadExResponse")
 
-ReconfigureHostForDAS_TaskRequestMsg = GED("urn:vim25", "ReconfigureHostForDAS_Task").pyclass
+ReconfigureHostForDAS_TaskRequestMsg = LazyPyclass("urn:vim25", "ReconfigureHostForDAS_Task")
 
-ReconfigureHostForDAS_TaskResponseMsg = GED("urn:vim25", "ReconfigureHostForDAS_TaskResponse").pyclass
+ReconfigureHostForDAS_TaskResponseMsg = LazyPyclass("urn:vim25", "ReconfigureHostForDAS_TaskResponse")
 
-UpdateFlagsRequestMsg = GED("urn:vim25", "UpdateFlags").pyclass
+UpdateFlagsRequestMsg = LazyPyclass("urn:vim25", "UpdateFlags")
 
-UpdateFlagsResponseMsg = GED("urn:vim25", "UpdateFlagsResponse").pyclass
+UpdateFlagsResponseMsg = LazyPyclass("urn:vim25", "UpdateFlagsResponse")
 
-EnterLockdownModeRequestMsg = GED("urn:vim25", "EnterLockdownMode").pyclass
+EnterLockdownModeRequestMsg = LazyPyclass("urn:vim25", "EnterLockdownMode")
 
-EnterLockdownModeResponseMsg = GED("urn:vim25", "EnterLockdownModeResponse").pyclass
+EnterLockdownModeResponseMsg = LazyPyclass("urn:vim25", "EnterLockdownModeResponse")
 
-ExitLockdownModeRequestMsg = GED("urn:vim25", "ExitLockdownMode").pyclass
+ExitLockdownModeRequestMsg = LazyPyclass("urn:vim25", "ExitLockdownMode")
 
-ExitLockdownModeResponseMsg = GED("urn:vim25", "ExitLockdownModeResponse").pyclass
+ExitLockdownModeResponseMsg = LazyPyclass("urn:vim25", "ExitLockdownModeResponse")
 
-AcquireCimServicesTicketRequestMsg = GED("urn:vim25", "AcquireCimServicesTicket").pyclass
+AcquireCimServicesTicketRequestMsg = LazyPyclass("urn:vim25", "AcquireCimServicesTicket")
 
-AcquireCimServicesTicketResponseMsg = GED("urn:vim25", "AcquireCimServicesTicketResponse").pyclass
+AcquireCimServicesTicketResponseMsg = LazyPyclass("urn:vim25", "AcquireCimServicesTicketResponse")
 
-UpdateIpmiRequestMsg = GED("urn:vim25", "UpdateIpmi").pyclass
+UpdateIpmiRequestMsg = LazyPyclass("urn:vim25", "UpdateIpmi")
 
-UpdateIpmiResponseMsg = GED("urn:vim25", "UpdateIpmiResponse").pyclass
+UpdateIpmiResponseMsg = LazyPyclass("urn:vim25", "UpdateIpmiResponse")
 
-RetrieveHardwareUptimeRequestMsg = GED("urn:vim25", "RetrieveHardwareUptime").pyclass
+RetrieveHardwareUptimeRequestMsg = LazyPyclass("urn:vim25", "RetrieveHardwareUptime")
 
-RetrieveHardwareUptimeResponseMsg = GED("urn:vim25", "RetrieveHardwareUptimeResponse").pyclass
+RetrieveHardwareUptimeResponseMsg = LazyPyclass("urn:vim25", "RetrieveHardwareUptimeResponse")
 
-HttpNfcLeaseGetManifestRequestMsg = GED("urn:vim25", "HttpNfcLeaseGetManifest").pyclass
+HttpNfcLeaseGetManifestRequestMsg = LazyPyclass("urn:vim25", "HttpNfcLeaseGetManifest")
 
-HttpNfcLeaseGetManifestResponseMsg = GED("urn:vim25", "HttpNfcLeaseGetManifestResponse").pyclass
+HttpNfcLeaseGetManifestResponseMsg = LazyPyclass("urn:vim25", "HttpNfcLeaseGetManifestResponse")
 
-HttpNfcLeaseCompleteRequestMsg = GED("urn:vim25", "HttpNfcLeaseComplete").pyclass
+HttpNfcLeaseCompleteRequestMsg = LazyPyclass("urn:vim25", "HttpNfcLeaseComplete")
 
-HttpNfcLeaseCompleteResponseMsg = GED("urn:vim25", "HttpNfcLeaseCompleteResponse").pyclass
+HttpNfcLeaseCompleteResponseMsg = LazyPyclass("urn:vim25", "HttpNfcLeaseCompleteResponse")
 
-HttpNfcLeaseAbortRequestMsg = GED("urn:vim25", "HttpNfcLeaseAbort").pyclass
+HttpNfcLeaseAbortRequestMsg = LazyPyclass("urn:vim25", "HttpNfcLeaseAbort")
 
-HttpNfcLeaseAbortResponseMsg = GED("urn:vim25", "HttpNfcLeaseAbortResponse").pyclass
+HttpNfcLeaseAbortResponseMsg = LazyPyclass("urn:vim25", "HttpNfcLeaseAbortResponse")
 
-HttpNfcLeaseProgressRequestMsg = GED("urn:vim25", "HttpNfcLeaseProgress").pyclass
+HttpNfcLeaseProgressRequestMsg = LazyPyclass("urn:vim25", "HttpNfcLeaseProgress")
 
-HttpNfcLeaseProgressResponseMsg = GED("urn:vim25", "HttpNfcLeaseProgressResponse").pyclass
+HttpNfcLeaseProgressResponseMsg = LazyPyclass("urn:vim25", "HttpNfcLeaseProgressResponse")
 
-QueryIpPoolsRequestMsg = GED("urn:vim25", "QueryIpPools").pyclass
+QueryIpPoolsRequestMsg = LazyPyclass("urn:vim25", "QueryIpPools")
 
-QueryIpPoolsResponseMsg = GED("urn:vim25", "QueryIpPoolsResponse").pyclass
+QueryIpPoolsResponseMsg = LazyPyclass("urn:vim25", "QueryIpPoolsResponse")
 
-CreateIpPoolRequestMsg = GED("urn:vim25", "CreateIpPool").pyclass
+CreateIpPoolRequestMsg = LazyPyclass("urn:vim25", "CreateIpPool")
 
-CreateIpPoolResponseMsg = GED("urn:vim25", "CreateIpPoolResponse").pyclass
+CreateIpPoolResponseMsg = LazyPyclass("urn:vim25", "CreateIpPoolResponse")
 
-UpdateIpPoolRequestMsg = GED("urn:vim25", "UpdateIpPool").pyclass
+UpdateIpPoolRequestMsg = LazyPyclass("urn:vim25", "UpdateIpPool")
 
-UpdateIpPoolResponseMsg = GED("urn:vim25", "UpdateIpPoolResponse").pyclass
+UpdateIpPoolResponseMsg = LazyPyclass("urn:vim25", "UpdateIpPoolResponse")
 
-DestroyIpPoolRequestMsg = GED("urn:vim25", "DestroyIpPool").pyclass
+DestroyIpPoolRequestMsg = LazyPyclass("urn:vim25", "DestroyIpPool")
 
-DestroyIpPoolResponseMsg = GED("urn:vim25", "DestroyIpPoolResponse").pyclass
+DestroyIpPoolResponseMsg = LazyPyclass("urn:vim25", "DestroyIpPoolResponse")
 
-AllocateIpv4AddressRequestMsg = GED("urn:vim25", "AllocateIpv4Address").pyclass
+AllocateIpv4AddressRequestMsg = LazyPyclass("urn:vim25", "AllocateIpv4Address")
 
-AllocateIpv4AddressResponseMsg = GED("urn:vim25", "AllocateIpv4AddressResponse").pyclass
+AllocateIpv4AddressResponseMsg = LazyPyclass("urn:vim25", "AllocateIpv4AddressResponse")
 
-AllocateIpv6AddressRequestMsg = GED("urn:vim25", "AllocateIpv6Address").pyclass
+AllocateIpv6AddressRequestMsg = LazyPyclass("urn:vim25", "AllocateIpv6Address")
 
-AllocateIpv6AddressResponseMsg = GED("urn:vim25", "AllocateIpv6AddressResponse").pyclass
+AllocateIpv6AddressResponseMsg = LazyPyclass("urn:vim25", "AllocateIpv6AddressResponse")
 
-ReleaseIpAllocationRequestMsg = GED("urn:vim25", "ReleaseIpAllocation").pyclass
+ReleaseIpAllocationRequestMsg = LazyPyclass("urn:vim25", "ReleaseIpAllocation")
 
-ReleaseIpAllocationResponseMsg = GED("urn:vim25", "ReleaseIpAllocationResponse").pyclass
+ReleaseIpAllocationResponseMsg = LazyPyclass("urn:vim25", "ReleaseIpAllocationResponse")
 
-QueryIPAllocationsRequestMsg = GED("urn:vim25", "QueryIPAllocations").pyclass
+QueryIPAllocationsRequestMsg = LazyPyclass("urn:vim25", "QueryIPAllocations")
 
-QueryIPAllocationsResponseMsg = GED("urn:vim25", "QueryIPAllocationsResponse").pyclass
+QueryIPAllocationsResponseMsg = LazyPyclass("urn:vim25", "QueryIPAllocationsResponse")
 
-UpdateAssignedLicenseRequestMsg = GED("urn:vim25", "UpdateAssignedLicense").pyclass
+UpdateAssignedLicenseRequestMsg = LazyPyclass("urn:vim25", "UpdateAssignedLicense")
 
-UpdateAssignedLicenseResponseMsg = GED("urn:vim25", "UpdateAssignedLicenseResponse").pyclass
+UpdateAssignedLicenseResponseMsg = LazyPyclass("urn:vim25", "UpdateAssignedLicenseResponse")
 
-RemoveAssignedLicenseRequestMsg = GED("urn:vim25", "RemoveAssignedLicense").pyclass
+RemoveAssignedLicenseRequestMsg = LazyPyclass("urn:vim25", "RemoveAssignedLicense")
 
-RemoveAssignedLicenseResponseMsg = GED("urn:vim25", "RemoveAssignedLicenseResponse").pyclass
+RemoveAssignedLicenseResponseMsg = LazyPyclass("urn:vim25", "RemoveAssignedLicenseResponse")
 
-QueryAssignedLicensesRequestMsg = GED("urn:vim25", "QueryAssignedLicenses").pyclass
+QueryAssignedLicensesRequestMsg = LazyPyclass("urn:vim25", "QueryAssignedLicenses")
 
-QueryAssignedLicensesResponseMsg = GED("urn:vim25", "QueryAssignedLicensesResponse").pyclass
+QueryAssignedLicensesResponseMsg = LazyPyclass("urn:vim25", "QueryAssignedLicensesResponse")
 
-QuerySupportedFeaturesRequestMsg = GED("urn:vim25", "QuerySupportedFeatures").pyclass
+QuerySupportedFeaturesRequestMsg = LazyPyclass("urn:vim25", "QuerySupportedFeatures")
 
-QuerySupportedFeaturesResponseMsg = GED("urn:vim25", "QuerySupportedFeaturesResponse").pyclass
+QuerySupportedFeaturesResponseMsg = LazyPyclass("urn:vim25", "QuerySupportedFeaturesResponse")
 
-QueryLicenseSourceAvailabilityRequestMsg = GED("urn:vim25", "QueryLicenseSourceAvailability").pyclass
+QueryLicenseSourceAvailabilityRequestMsg = LazyPyclass("urn:vim25", "QueryLicenseSourceAvailability")
 
-QueryLicenseSourceAvailabilityResponseMsg = GED("urn:vim25", "QueryLicenseSourceAvailabilityResponse").pyclass
+QueryLicenseSourceAvailabilityResponseMsg = LazyPyclass("urn:vim25", "QueryLicenseSourceAvailabilityResponse")
 
-QueryLicenseUsageRequestMsg = GED("urn:vim25", "QueryLicenseUsage").pyclass
+QueryLicenseUsageRequestMsg = LazyPyclass("urn:vim25", "QueryLicenseUsage")
 
-QueryLicenseUsageResponseMsg = GED("urn:vim25", "QueryLicenseUsageResponse").pyclass
+QueryLicenseUsageResponseMsg = LazyPyclass("urn:vim25", "QueryLicenseUsageResponse")
 
-SetLicenseEditionRequestMsg = GED("urn:vim25", "SetLicenseEdition").pyclass
+SetLicenseEditionRequestMsg = LazyPyclass("urn:vim25", "SetLicenseEdition")
 
-SetLicenseEditionResponseMsg = GED("urn:vim25", "SetLicenseEditionResponse").pyclass
+SetLicenseEditionResponseMsg = LazyPyclass("urn:vim25", "SetLicenseEditionResponse")
 
-CheckLicenseFeatureRequestMsg = GED("urn:vim25", "CheckLicenseFeature").pyclass
+CheckLicenseFeatureRequestMsg = LazyPyclass("urn:vim25", "CheckLicenseFeature")
 
-CheckLicenseFeatureResponseMsg = GED("urn:vim25", "CheckLicenseFeatureResponse").pyclass
+CheckLicenseFeatureResponseMsg = LazyPyclass("urn:vim25", "CheckLicenseFeatureResponse")
 
-EnableFeatureRequestMsg = GED("urn:vim25", "EnableFeature").pyclass
+EnableFeatureRequestMsg = LazyPyclass("urn:vim25", "EnableFeature")
 
-EnableFeatureResponseMsg = GED("urn:vim25", "EnableFeatureResponse").pyclass
+EnableFeatureResponseMsg = LazyPyclass("urn:vim25", "EnableFeatureResponse")
 
-DisableFeatureRequestMsg = GED("urn:vim25", "DisableFeature").pyclass
+DisableFeatureRequestMsg = LazyPyclass("urn:vim25", "DisableFeature")
 
-DisableFeatureResponseMsg = GED("urn:vim25", "DisableFeatureResponse").pyclass
+DisableFeatureResponseMsg = LazyPyclass("urn:vim25", "DisableFeatureResponse")
 
-ConfigureLicenseSourceRequestMsg = GED("urn:vim25", "ConfigureLicenseSource").pyclass
+ConfigureLicenseSourceRequestMsg = LazyPyclass("urn:vim25", "ConfigureLicenseSource")
 
-ConfigureLicenseSourceResponseMsg = GED("urn:vim25", "ConfigureLicenseSourceResponse").pyclass
+ConfigureLicenseSourceResponseMsg = LazyPyclass("urn:vim25", "ConfigureLicenseSourceResponse")
 
-UpdateLicenseRequestMsg = GED("urn:vim25", "UpdateLicense").pyclass
+UpdateLicenseRequestMsg = LazyPyclass("urn:vim25", "UpdateLicense")
 
-UpdateLicenseResponseMsg = GED("urn:vim25", "UpdateLicenseResponse").pyclass
+UpdateLicenseResponseMsg = LazyPyclass("urn:vim25", "UpdateLicenseResponse")
 
-AddLicenseRequestMsg = GED("urn:vim25", "AddLicense").pyclass
+AddLicenseRequestMsg = LazyPyclass("urn:vim25", "AddLicense")
 
-AddLicenseResponseMsg = GED("urn:vim25", "AddLicenseResponse").pyclass
+AddLicenseResponseMsg = LazyPyclass("urn:vim25", "AddLicenseResponse")
 
-RemoveLicenseRequestMsg = GED("urn:vim25", "RemoveLicense").pyclass
+RemoveLicenseRequestMsg = LazyPyclass("urn:vim25", "RemoveLicense")
 
-RemoveLicenseResponseMsg = GED("urn:vim25", "RemoveLicenseResponse").pyclass
+RemoveLicenseResponseMsg = LazyPyclass("urn:vim25", "RemoveLicenseResponse")
 
-DecodeLicenseRequestMsg = GED("urn:vim25", "DecodeLicense").pyclass
+DecodeLicenseRequestMsg = LazyPyclass("urn:vim25", "DecodeLicense")
 
-DecodeLicenseResponseMsg = GED("urn:vim25", "DecodeLicenseResponse").pyclass
+DecodeLicenseResponseMsg = LazyPyclass("urn:vim25", "DecodeLicenseResponse")
 
-UpdateLicenseLabelRequestMsg = GED("urn:vim25", "UpdateLicenseLabel").pyclass
+UpdateLicenseLabelRequestMsg = LazyPyclass("urn:vim25", "UpdateLicenseLabel")
 
-UpdateLicenseLabelResponseMsg = GED("urn:vim25", "UpdateLicenseLabelResponse").pyclass
+UpdateLicenseLabelResponseMsg = LazyPyclass("urn:vim25", "UpdateLicenseLabelResponse")
 
-RemoveLicenseLabelRequestMsg = GED("urn:vim25", "RemoveLicenseLabel").pyclass
+RemoveLicenseLabelRequestMsg = LazyPyclass("urn:vim25", "RemoveLicenseLabel")
 
-RemoveLicenseLabelResponseMsg = GED("urn:vim25", "RemoveLicenseLabelResponse").pyclass
+RemoveLicenseLabelResponseMsg = LazyPyclass("urn:vim25", "RemoveLicenseLabelResponse")
 
-ReloadRequestMsg = GED("urn:vim25", "Reload").pyclass
+ReloadRequestMsg = LazyPyclass("urn:vim25", "Reload")
 
-ReloadResponseMsg = GED("urn:vim25", "ReloadResponse").pyclass
+ReloadResponseMsg = LazyPyclass("urn:vim25", "ReloadResponse")
 
-Rename_TaskRequestMsg = GED("urn:vim25", "Rename_Task").pyclass
+Rename_TaskRequestMsg = LazyPyclass("urn:vim25", "Rename_Task")
 
-Rename_TaskResponseMsg = GED("urn:vim25", "Rename_TaskResponse").pyclass
+Rename_TaskResponseMsg = LazyPyclass("urn:vim25", "Rename_TaskResponse")
 
-Destroy_TaskRequestMsg = GED("urn:vim25", "Destroy_Task").pyclass
+Destroy_TaskRequestMsg = LazyPyclass("urn:vim25", "Destroy_Task")
 
-Destroy_TaskResponseMsg = GED("urn:vim25", "Destroy_TaskResponse").pyclass
+Destroy_TaskResponseMsg = LazyPyclass("urn:vim25", "Destroy_TaskResponse")
 
-DestroyNetworkRequestMsg = GED("urn:vim25", "DestroyNetwork").pyclass
+DestroyNetworkRequestMsg = LazyPyclass("urn:vim25", "DestroyNetwork")
 
-DestroyNetworkResponseMsg = GED("urn:vim25", "DestroyNetworkResponse").pyclass
+DestroyNetworkResponseMsg = LazyPyclass("urn:vim25", "DestroyNetworkResponse")
 
-ValidateHostRequestMsg = GED("urn:vim25", "ValidateHost").pyclass
+ValidateHostRequestMsg = LazyPyclass("urn:vim25", "ValidateHost")
 
-ValidateHostResponseMsg = GED("urn:vim25", "ValidateHostResponse").pyclass
+ValidateHostResponseMsg = LazyPyclass("urn:vim25", "ValidateHostResponse")
 
-ParseDescriptorRequestMsg = GED("urn:vim25", "ParseDescriptor").pyclass
+ParseDescriptorRequestMsg = LazyPyclass("urn:vim25", "ParseDescriptor")
 
-ParseDescriptorResponseMsg = GED("urn:vim25", "ParseDescriptorResponse").pyclass
+ParseDescriptorResponseMsg = LazyPyclass("urn:vim25", "ParseDescriptorResponse")
 
-CreateImportSpecRequestMsg = GED("urn:vim25", "CreateImportSpec").pyclass
+CreateImportSpecRequestMsg = LazyPyclass("urn:vim25", "CreateImportSpec")
 
-CreateImportSpecResponseMsg = GED("urn:vim25", "CreateImportSpecResponse").pyclass
+CreateImportSpecResponseMsg = LazyPyclass("urn:vim25", "CreateImportSpecResponse")
 
-CreateDescriptorRequestMsg = GED("urn:vim25", "CreateDescriptor").pyclass
+CreateDescriptorRequestMsg = LazyPyclass("urn:vim25", "CreateDescriptor")
 
-CreateDescriptorResponseMsg = GED("urn:vim25", "CreateDescriptorResponse").pyclass
+CreateDescriptorResponseMsg = LazyPyclass("urn:vim25", "CreateDescriptorResponse")
 
-QueryPerfProviderSummaryRequestMsg = GED("urn:vim25", "QueryPerfProviderSummary").pyclass
+QueryPerfProviderSummaryRequestMsg = LazyPyclass("urn:vim25", "QueryPerfProviderSummary")
 
-QueryPerfProviderSummaryResponseMsg = GED("urn:vim25", "QueryPerfProviderSummaryResponse").pyclass
+QueryPerfProviderSummaryResponseMsg = LazyPyclass("urn:vim25", "QueryPerfProviderSummaryResponse")
 
-QueryAvailablePerfMetricRequestMsg = GED("urn:vim25", "QueryAvailablePerfMetric").pyclass
+QueryAvailablePerfMetricRequestMsg = LazyPyclass("urn:vim25", "QueryAvailablePerfMetric")
 
-QueryAvailablePerfMetricResponseMsg = GED("urn:vim25", "QueryAvailablePerfMetricResponse").pyclass
+QueryAvailablePerfMetricResponseMsg = LazyPyclass("urn:vim25", "QueryAvailablePerfMetricResponse")
 
-QueryPerfCounterRequestMsg = GED("urn:vim25", "QueryPerfCounter").pyclass
+QueryPerfCounterRequestMsg = LazyPyclass("urn:vim25", "QueryPerfCounter")
 
-QueryPerfCounterResponseMsg = GED("urn:vim25", "QueryPerfCounterResponse").pyclass
+QueryPerfCounterResponseMsg = LazyPyclass("urn:vim25", "QueryPerfCounterResponse")
 
-QueryPerfCounterByLevelRequestMsg = GED("urn:vim25", "QueryPerfCounterByLevel").pyclass
+QueryPerfCounterByLevelRequestMsg = LazyPyclass("urn:vim25", "QueryPerfCounterByLevel")
 
-QueryPerfCounterByLevelResponseMsg = GED("urn:vim25", "QueryPerfCounterByLevelResponse").pyclass
+QueryPerfCounterByLevelResponseMsg = LazyPyclass("urn:vim25", "QueryPerfCounterByLevelResponse")
 
-QueryPerfRequestMsg = GED("urn:vim25", "QueryPerf").pyclass
+QueryPerfRequestMsg = LazyPyclass("urn:vim25", "QueryPerf")
 
-QueryPerfResponseMsg = GED("urn:vim25", "QueryPerfResponse").pyclass
+QueryPerfResponseMsg = LazyPyclass("urn:vim25", "QueryPerfResponse")
 
-QueryPerfCompositeRequestMsg = GED("urn:vim25", "QueryPerfComposite").pyclass
+QueryPerfCompositeRequestMsg = LazyPyclass("urn:vim25", "QueryPerfComposite")
 
-QueryPerfCompositeResponseMsg = GED("urn:vim25", "QueryPerfCompositeResponse").pyclass
+QueryPerfCompositeResponseMsg = LazyPyclass("urn:vim25", "QueryPerfCompositeResponse")
 
-CreatePerfIntervalRequestMsg = GED("urn:vim25", "CreatePerfInterval").pyclass
+CreatePerfIntervalRequestMsg = LazyPyclass("urn:vim25", "CreatePerfInterval")
 
-CreatePerfIntervalResponseMsg = GED("urn:vim25", "CreatePerfIntervalResponse").pyclass
+CreatePerfIntervalResponseMsg = LazyPyclass("urn:vim25", "CreatePerfIntervalResponse")
 
-RemovePerfIntervalRequestMsg = GED("urn:vim25", "RemovePerfInterval").pyclass
+RemovePerfIntervalRequestMsg = LazyPyclass("urn:vim25", "RemovePerfInterval")
 
-RemovePerfIntervalResponseMsg = GED("urn:vim25", "RemovePerfIntervalResponse").pyclass
+RemovePerfIntervalResponseMsg = LazyPyclass("urn:vim25", "RemovePerfIntervalResponse")
 
-UpdatePerfIntervalRequestMsg = GED("urn:vim25", "UpdatePerfInterval").pyclass
+UpdatePerfIntervalRequestMsg = LazyPyclass("urn:vim25", "UpdatePerfInterval")
 
-UpdatePerfIntervalResponseMsg = GED("urn:vim25", "UpdatePerfIntervalResponse").pyclass
+UpdatePerfIntervalResponseMsg = LazyPyclass("urn:vim25", "UpdatePerfIntervalResponse")
 
-UpdateCounterLevelMappingRequestMsg = GED("urn:vim25", "UpdateCounterLevelMapping").pyclass
+UpdateCounterLevelMappingRequestMsg = LazyPyclass("urn:vim25", "UpdateCounterLevelMapping")
 
-UpdateCounterLevelMappingResponseMsg = GED("urn:vim25", "UpdateCounterLevelMappingResponse").pyclass
+UpdateCounterLevelMappingResponseMsg = LazyPyclass("urn:vim25", "UpdateCounterLevelMappingResponse")
 
-ResetCounterLevelMappingRequestMsg = GED("urn:vim25", "ResetCounterLevelMapping").pyclass
+ResetCounterLevelMappingRequestMsg = LazyPyclass("urn:vim25", "ResetCounterLevelMapping")
 
-ResetCounterLevelMappingResponseMsg = GED("urn:vim25", "ResetCounterLevelMappingResponse").pyclass
+ResetCounterLevelMappingResponseMsg = LazyPyclass("urn:vim25", "ResetCounterLevelMappingResponse")
 
-EstimateDatabaseSizeRequestMsg = GED("urn:vim25", "EstimateDatabaseSize").pyclass
+EstimateDatabaseSizeRequestMsg = LazyPyclass("urn:vim25", "EstimateDatabaseSize")
 
-EstimateDatabaseSizeResponseMsg = GED("urn:vim25", "EstimateDatabaseSizeResponse").pyclass
+EstimateDatabaseSizeResponseMsg = LazyPyclass("urn:vim25", "EstimateDatabaseSizeResponse")
 
-UpdateConfigRequestMsg = GED("urn:vim25", "UpdateConfig").pyclass
+UpdateConfigRequestMsg = LazyPyclass("urn:vim25", "UpdateConfig")
 
-UpdateConfigResponseMsg = GED("urn:vim25", "UpdateConfigResponse").pyclass
+UpdateConfigResponseMsg = LazyPyclass("urn:vim25", "UpdateConfigResponse")
 
-MoveIntoResourcePoolRequestMsg = GED("urn:vim25", "MoveIntoResourcePool").pyclass
+MoveIntoResourcePoolRequestMsg = LazyPyclass("urn:vim25", "MoveIntoResourcePool")
 
-MoveIntoResourcePoolResponseMsg = GED("urn:vim25", "MoveIntoResourcePoolResponse").pyclass
+MoveIntoResourcePoolResponseMsg = LazyPyclass("urn:vim25", "MoveIntoResourcePoolResponse")
 
-UpdateChildResourceConfigurationRequestMsg = GED("urn:vim25", "UpdateChildResourceConfiguration").pyclass
+UpdateChildResourceConfigurationRequestMsg = LazyPyclass("urn:vim25", "UpdateChildResourceConfiguration")
 
-UpdateChildResourceConfigurationResponseMsg = GED("urn:vim25", "UpdateChildResourceConfigurationResponse").pyclass
+UpdateChildResourceConfigurationResponseMsg = LazyPyclass("urn:vim25", "UpdateChildResourceConfigurationResponse")
 
-CreateResourcePoolRequestMsg = GED("urn:vim25", "CreateResourcePool").pyclass
+CreateResourcePoolRequestMsg = LazyPyclass("urn:vim25", "CreateResourcePool")
 
-CreateResourcePoolResponseMsg = GED("urn:vim25", "CreateResourcePoolResponse").pyclass
+CreateResourcePoolResponseMsg = LazyPyclass("urn:vim25", "CreateResourcePoolResponse")
 
-DestroyChildrenRequestMsg = GED("urn:vim25", "DestroyChildren").pyclass
+DestroyChildrenRequestMsg = LazyPyclass("urn:vim25", "DestroyChildren")
 
-DestroyChildrenResponseMsg = GED("urn:vim25", "DestroyChildrenResponse").pyclass
+DestroyChildrenResponseMsg = LazyPyclass("urn:vim25", "DestroyChildrenResponse")
 
-CreateVAppRequestMsg = GED("urn:vim25", "CreateVApp").pyclass
+CreateVAppRequestMsg = LazyPyclass("urn:vim25", "CreateVApp")
 
-CreateVAppResponseMsg = GED("urn:vim25", "CreateVAppResponse").pyclass
+CreateVAppResponseMsg = LazyPyclass("urn:vim25", "CreateVAppResponse")
 
-CreateChildVM_TaskRequestMsg = GED("urn:vim25", "CreateChildVM_Task").pyclass
+CreateChildVM_TaskRequestMsg = LazyPyclass("urn:vim25", "CreateChildVM_Task")
 
-CreateChildVM_TaskResponseMsg = GED("urn:vim25", "CreateChildVM_TaskResponse").pyclass
+CreateChildVM_TaskResponseMsg = LazyPyclass("urn:vim25", "CreateChildVM_TaskResponse")
 
-RegisterChildVM_TaskRequestMsg = GED("urn:vim25", "RegisterChildVM_Task").pyclass
+RegisterChildVM_TaskRequestMsg = LazyPyclass("urn:vim25", "RegisterChildVM_Task")
 
-RegisterChildVM_TaskResponseMsg = GED("urn:vim25", "RegisterChildVM_TaskResponse").pyclass
+RegisterChildVM_TaskResponseMsg = LazyPyclass("urn:vim25", "RegisterChildVM_TaskResponse")
 
-ImportVAppRequestMsg = GED("urn:vim25", "ImportVApp").pyclass
+ImportVAppRequestMsg = LazyPyclass("urn:vim25", "ImportVApp")
 
-ImportVAppResponseMsg = GED("urn:vim25", "ImportVAppResponse").pyclass
+ImportVAppResponseMsg = LazyPyclass("urn:vim25", "ImportVAppResponse")
 
-QueryResourceConfigOptionRequestMsg = GED("urn:vim25", "QueryResourceConfigOption").pyclass
+QueryResourceConfigOptionRequestMsg = LazyPyclass("urn:vim25", "QueryResourceConfigOption")
 
-QueryResourceConfigOptionResponseMsg = GED("urn:vim25", "QueryResourceConfigOptionResponse").pyclass
+QueryResourceConfigOptionResponseMsg = LazyPyclass("urn:vim25", "QueryResourceConfigOptionResponse")
 
-RefreshRuntimeRequestMsg = GED("urn:vim25", "RefreshRuntime").pyclass
+RefreshRuntimeRequestMsg = LazyPyclass("urn:vim25", "RefreshRuntime")
 
-RefreshRuntimeResponseMsg = GED("urn:vim25", "RefreshRuntimeResponse").pyclass
+RefreshRuntimeResponseMsg = LazyPyclass("urn:vim25", "RefreshRuntimeResponse")
 
-FindByUuidRequestMsg = GED("urn:vim25", "FindByUuid").pyclass
+FindByUuidRequestMsg = LazyPyclass("urn:vim25", "FindByUuid")
 
-FindByUuidResponseMsg = GED("urn:vim25", "FindByUuidResponse").pyclass
+FindByUuidResponseMsg = LazyPyclass("urn:vim25", "FindByUuidResponse")
 
-FindByDatastorePathRequestMsg = GED("urn:vim25", "FindByDatastorePath").pyclass
+FindByDatastorePathRequestMsg = LazyPyclass("urn:vim25", "FindByDatastorePath")
 
-FindByDatastorePathResponseMsg = GED("urn:vim25", "FindByDatastorePathResponse").pyclass
+FindByDatastorePathResponseMsg = LazyPyclass("urn:vim25", "FindByDatastorePathResponse")
 
-FindByDnsNameRequestMsg = GED("urn:vim25", "FindByDnsName").pyclass
+FindByDnsNameRequestMsg = LazyPyclass("urn:vim25", "FindByDnsName")
 
-FindByDnsNameResponseMsg = GED("urn:vim25", "FindByDnsNameResponse").pyclass
+FindByDnsNameResponseMsg = LazyPyclass("urn:vim25", "FindByDnsNameResponse")
 
-FindByIpRequestMsg = GED("urn:vim25", "FindByIp").pyclass
+FindByIpRequestMsg = LazyPyclass("urn:vim25", "FindByIp")
 
-FindByIpResponseMsg = GED("urn:vim25", "FindByIpResponse").pyclass
+FindByIpResponseMsg = LazyPyclass("urn:vim25", "FindByIpResponse")
 
-FindByInventoryPathRequestMsg = GED("urn:vim25", "FindByInventoryPath").pyclass
+FindByInventoryPathRequestMsg = LazyPyclass("urn:vim25", "FindByInventoryPath")
 
-FindByInventoryPathResponseMsg = GED("urn:vim25", "FindByInventoryPathResponse").pyclass
+FindByInventoryPathResponseMsg = LazyPyclass("urn:vim25", "FindByInventoryPathResponse")
 
-FindChildRequestMsg = GED("urn:vim25", "FindChild").pyclass
+FindChildRequestMsg = LazyPyclass("urn:vim25", "FindChild")
 
-FindChildResponseMsg = GED("urn:vim25", "FindChildResponse").pyclass
+FindChildResponseMsg = LazyPyclass("urn:vim25", "FindChildResponse")
 
-FindAllByUuidRequestMsg = GED("urn:vim25", "FindAllByUuid").pyclass
+FindAllByUuidRequestMsg = LazyPyclass("urn:vim25", "FindAllByUuid")
 
-FindAllByUuidResponseMsg = GED("urn:vim25", "FindAllByUuidResponse").pyclass
+FindAllByUuidResponseMsg = LazyPyclass("urn:vim25", "FindAllByUuidResponse")
 
-FindAllByDnsNameRequestMsg = GED("urn:vim25", "FindAllByDnsName").pyclass
+FindAllByDnsNameRequestMsg = LazyPyclass("urn:vim25", "FindAllByDnsName")
 
-FindAllByDnsNameResponseMsg = GED("urn:vim25", "FindAllByDnsNameResponse").pyclass
+FindAllByDnsNameResponseMsg = LazyPyclass("urn:vim25", "FindAllByDnsNameResponse")
 
-FindAllByIpRequestMsg = GED("urn:vim25", "FindAllByIp").pyclass
+FindAllByIpRequestMsg = LazyPyclass("urn:vim25", "FindAllByIp")
 
-FindAllByIpResponseMsg = GED("urn:vim25", "FindAllByIpResponse").pyclass
+FindAllByIpResponseMsg = LazyPyclass("urn:vim25", "FindAllByIpResponse")
 
-CurrentTimeRequestMsg = GED("urn:vim25", "CurrentTime").pyclass
+CurrentTimeRequestMsg = LazyPyclass("urn:vim25", "CurrentTime")
 
-CurrentTimeResponseMsg = GED("urn:vim25", "CurrentTimeResponse").pyclass
+CurrentTimeResponseMsg = LazyPyclass("urn:vim25", "CurrentTimeResponse")
 
-RetrieveServiceContentRequestMsg = GED("urn:vim25", "RetrieveServiceContent").pyclass
+RetrieveServiceContentRequestMsg = LazyPyclass("urn:vim25", "RetrieveServiceContent")
 
-RetrieveServiceContentResponseMsg = GED("urn:vim25", "RetrieveServiceContentResponse").pyclass
+RetrieveServiceContentResponseMsg = LazyPyclass("urn:vim25", "RetrieveServiceContentResponse")
 
-ValidateMigrationRequestMsg = GED("urn:vim25", "ValidateMigration").pyclass
+ValidateMigrationRequestMsg = LazyPyclass("urn:vim25", "ValidateMigration")
 
-ValidateMigrationResponseMsg = GED("urn:vim25", "ValidateMigrationResponse").pyclass
+ValidateMigrationResponseMsg = LazyPyclass("urn:vim25", "ValidateMigrationResponse")
 
-QueryVMotionCompatibilityRequestMsg = GED("urn:vim25", "QueryVMotionCompatibility").pyclass
+QueryVMotionCompatibilityRequestMsg = LazyPyclass("urn:vim25", "QueryVMotionCompatibility")
 
-QueryVMotionCompatibilityResponseMsg = GED("urn:vim25", "QueryVMotionCompatibilityResponse").pyclass
+QueryVMotionCompatibilityResponseMsg = LazyPyclass("urn:vim25", "QueryVMotionCompatibilityResponse")
 
-RetrieveProductComponentsRequestMsg = GED("urn:vim25", "RetrieveProductComponents").pyclass
+RetrieveProductComponentsRequestMsg = LazyPyclass("urn:vim25", "RetrieveProductComponents")
 
-RetrieveProductComponentsResponseMsg = GED("urn:vim25", "RetrieveProductComponentsResponse").pyclass
+RetrieveProductComponentsResponseMsg = LazyPyclass("urn:vim25", "RetrieveProductComponentsResponse")
 
-QueryServiceListRequestMsg = GED("urn:vim25", "QueryServiceList").pyclass
+QueryServiceListRequestMsg = LazyPyclass("urn:vim25", "QueryServiceList")
 
-QueryServiceListResponseMsg = GED("urn:vim25", "QueryServiceListResponse").pyclass
+QueryServiceListResponseMsg = LazyPyclass("urn:vim25", "QueryServiceListResponse")
 
-UpdateServiceMessageRequestMsg = GED("urn:vim25", "UpdateServiceMessage").pyclass
+UpdateServiceMessageRequestMsg = LazyPyclass("urn:vim25", "UpdateServiceMessage")
 
-UpdateServiceMessageResponseMsg = GED("urn:vim25", "UpdateServiceMessageResponse").pyclass
+UpdateServiceMessageResponseMsg = LazyPyclass("urn:vim25", "UpdateServiceMessageResponse")
 
-LoginByTokenRequestMsg = GED("urn:vim25", "LoginByToken").pyclass
+LoginByTokenRequestMsg = LazyPyclass("urn:vim25", "LoginByToken")
 
-LoginByTokenResponseMsg = GED("urn:vim25", "LoginByTokenResponse").pyclass
+LoginByTokenResponseMsg = LazyPyclass("urn:vim25", "LoginByTokenResponse")
 
-LoginRequestMsg = GED("urn:vim25", "Login").pyclass
+LoginRequestMsg = LazyPyclass("urn:vim25", "Login")
 
-LoginResponseMsg = GED("urn:vim25", "LoginResponse").pyclass
+LoginResponseMsg = LazyPyclass("urn:vim25", "LoginResponse")
 
-LoginBySSPIRequestMsg = GED("urn:vim25", "LoginBySSPI").pyclass
+LoginBySSPIRequestMsg = LazyPyclass("urn:vim25", "LoginBySSPI")
 
-LoginBySSPIResponseMsg = GED("urn:vim25", "LoginBySSPIResponse").pyclass
+LoginBySSPIResponseMsg = LazyPyclass("urn:vim25", "LoginBySSPIResponse")
 
-LogoutRequestMsg = GED("urn:vim25", "Logout").pyclass
+LogoutRequestMsg = LazyPyclass("urn:vim25", "Logout")
 
-LogoutResponseMsg = GED("urn:vim25", "LogoutResponse").pyclass
+LogoutResponseMsg = LazyPyclass("urn:vim25", "LogoutResponse")
 
-AcquireLocalTicketRequestMsg = GED("urn:vim25", "AcquireLocalTicket").pyclass
+AcquireLocalTicketRequestMsg = LazyPyclass("urn:vim25", "AcquireLocalTicket")
 
-AcquireLocalTicketResponseMsg = GED("urn:vim25", "AcquireLocalTicketResponse").pyclass
+AcquireLocalTicketResponseMsg = LazyPyclass("urn:vim25", "AcquireLocalTicketResponse")
 
-AcquireGenericServiceTicketRequestMsg = GED("urn:vim25", "AcquireGenericServiceTicket").pyclass
+AcquireGenericServiceTicketRequestMsg = LazyPyclass("urn:vim25", "AcquireGenericServiceTicket")
 
-AcquireGenericServiceTicketResponseMsg = GED("urn:vim25", "AcquireGenericServiceTicketResponse").pyclass
+AcquireGenericServiceTicketResponseMsg = LazyPyclass("urn:vim25", "AcquireGenericServiceTicketResponse")
 
-TerminateSessionRequestMsg = GED("urn:vim25", "TerminateSession").pyclass
+TerminateSessionRequestMsg = LazyPyclass("urn:vim25", "TerminateSession")
 
-TerminateSessionResponseMsg = GED("urn:vim25", "TerminateSessionResponse").pyclass
+TerminateSessionResponseMsg = LazyPyclass("urn:vim25", "TerminateSessionResponse")
 
-SetLocaleRequestMsg = GED("urn:vim25", "SetLocale").pyclass
+SetLocaleRequestMsg = LazyPyclass("urn:vim25", "SetLocale")
 
-SetLocaleResponseMsg = GED("urn:vim25", "SetLocaleResponse").pyclass
+SetLocaleResponseMsg = LazyPyclass("urn:vim25", "SetLocaleResponse")
 
-LoginExtensionBySubjectNameRequestMsg = GED("urn:vim25", "LoginExtensionBySubjectName").pyclass
+LoginExtensionBySubjectNameRequestMsg = LazyPyclass("urn:vim25", "LoginExtensionBySubjectName")
 
-LoginExtensionBySubjectNameResponseMsg = GED("urn:vim25", "LoginExtensionBySubjectNameResponse").pyclass
+LoginExtensionBySubjectNameResponseMsg = LazyPyclass("urn:vim25", "LoginExtensionBySubjectNameResponse")
 
-LoginExtensionByCertificateRequestMsg = GED("urn:vim25", "LoginExtensionByCertificate").pyclass
+LoginExtensionByCertificateRequestMsg = LazyPyclass("urn:vim25", "LoginExtensionByCertificate")
 
-LoginExtensionByCertificateResponseMsg = GED("urn:vim25", "LoginExtensionByCertificateResponse").pyclass
+LoginExtensionByCertificateResponseMsg = LazyPyclass("urn:vim25", "LoginExtensionByCertificateResponse")
 
-ImpersonateUserRequestMsg = GED("urn:vim25", "ImpersonateUser").pyclass
+ImpersonateUserRequestMsg = LazyPyclass("urn:vim25", "ImpersonateUser")
 
-ImpersonateUserResponseMsg = GED("urn:vim25", "ImpersonateUserResponse").pyclass
+ImpersonateUserResponseMsg = LazyPyclass("urn:vim25", "ImpersonateUserResponse")
 
-SessionIsActiveRequestMsg = GED("urn:vim25", "SessionIsActive").pyclass
+SessionIsActiveRequestMsg = LazyPyclass("urn:vim25", "SessionIsActive")
 
-SessionIsActiveResponseMsg = GED("urn:vim25", "SessionIsActiveResponse").pyclass
+SessionIsActiveResponseMsg = LazyPyclass("urn:vim25", "SessionIsActiveResponse")
 
-AcquireCloneTicketRequestMsg = GED("urn:vim25", "AcquireCloneTicket").pyclass
+AcquireCloneTicketRequestMsg = LazyPyclass("urn:vim25", "AcquireCloneTicket")
 
-AcquireCloneTicketResponseMsg = GED("urn:vim25", "AcquireCloneTicketResponse").pyclass
+AcquireCloneTicketResponseMsg = LazyPyclass("urn:vim25", "AcquireCloneTicketResponse")
 
-CloneSessionRequestMsg = GED("urn:vim25", "CloneSession").pyclass
+CloneSessionRequestMsg = LazyPyclass("urn:vim25", "CloneSession")
 
-CloneSessionResponseMsg = GED("urn:vim25", "CloneSessionResponse").pyclass
+CloneSessionResponseMsg = LazyPyclass("urn:vim25", "CloneSessionResponse")
 
-ExecuteSimpleCommandRequestMsg = GED("urn:vim25", "ExecuteSimpleCommand").pyclass
+ExecuteSimpleCommandRequestMsg = LazyPyclass("urn:vim25", "ExecuteSimpleCommand")
 
-ExecuteSimpleCommandResponseMsg = GED("urn:vim25", "ExecuteSimpleCommandResponse").pyclass
+ExecuteSimpleCommandResponseMsg = LazyPyclass("urn:vim25", "ExecuteSimpleCommandResponse")
 
-ConfigureDatastoreIORM_TaskRequestMsg = GED("urn:vim25", "ConfigureDatastoreIORM_Task").pyclass
+ConfigureDatastoreIORM_TaskRequestMsg = LazyPyclass("urn:vim25", "ConfigureDatastoreIORM_Task")
 
-ConfigureDatastoreIORM_TaskResponseMsg = GED("urn:vim25", "ConfigureDatastoreIORM_TaskResponse").pyclass
+ConfigureDatastoreIORM_TaskResponseMsg = LazyPyclass("urn:vim25", "ConfigureDatastoreIORM_TaskResponse")
 
-QueryIORMConfigOptionRequestMsg = GED("urn:vim25", "QueryIORMConfigOption").pyclass
+QueryIORMConfigOptionRequestMsg = LazyPyclass("urn:vim25", "QueryIORMConfigOption")
 
-QueryIORMConfigOptionResponseMsg = GED("urn:vim25", "QueryIORMConfigOptionResponse").pyclass
+QueryIORMConfigOptionResponseMsg = LazyPyclass("urn:vim25", "QueryIORMConfigOptionResponse")
 
-QueryDatastorePerformanceSummaryRequestMsg = GED("urn:vim25", "QueryDatastorePerformanceSummary").pyclass
+QueryDatastorePerformanceSummaryRequestMsg = LazyPyclass("urn:vim25", "QueryDatastorePerformanceSummary")
 
-QueryDatastorePerformanceSummaryResponseMsg = GED("urn:vim25", "QueryDatastorePerformanceSummaryResponse").pyclass
+QueryDatastorePerformanceSummaryResponseMsg = LazyPyclass("urn:vim25", "QueryDatastorePerformanceSummaryResponse")
 
-ApplyStorageDrsRecommendationToPod_TaskRequestMsg = GED("urn:vim25", "ApplyStorageDrsRecommendationToPod_Task").pyclass
+ApplyStorageDrsRecommendationToPod_TaskRequestMsg = LazyPyclass("urn:vim25", "ApplyStorageDrsRecommendationToPod_Task")
 
-ApplyStorageDrsRecommendationToPod_TaskResponseMsg = GED("urn:vim25", "ApplyStorageDrsRecommendationToPod_TaskResponse").pyclass
+ApplyStorageDrsRecommendationToPod_TaskResponseMsg = LazyPyclass("urn:vim25", "ApplyStorageDrsRecommendationToPod_TaskResponse")
 
-ApplyStorageDrsRecommendation_TaskRequestMsg = GED("urn:vim25", "ApplyStorageDrsRecommendation_Task").pyclass
+ApplyStorageDrsRecommendation_TaskRequestMsg = LazyPyclass("urn:vim25", "ApplyStorageDrsRecommendation_Task")
 
-ApplyStorageDrsRecommendation_TaskResponseMsg = GED("urn:vim25", "ApplyStorageDrsRecommendation_TaskResponse").pyclass
+ApplyStorageDrsRecommendation_TaskResponseMsg = LazyPyclass("urn:vim25", "ApplyStorageDrsRecommendation_TaskResponse")
 
-CancelStorageDrsRecommendationRequestMsg = GED("urn:vim25", "CancelStorageDrsRecommendation").pyclass
+CancelStorageDrsRecommendationRequestMsg = LazyPyclass("urn:vim25", "CancelStorageDrsRecommendation")
 
-CancelStorageDrsRecommendationResponseMsg = GED("urn:vim25", "CancelStorageDrsRecommendationResponse").pyclass
+CancelStorageDrsRecommendationResponseMsg = LazyPyclass("urn:vim25", "CancelStorageDrsRecommendationResponse")
 
-RefreshStorageDrsRecommendationRequestMsg = GED("urn:vim25", "RefreshStorageDrsRecommendation").pyclass
+RefreshStorageDrsRecommendationRequestMsg = LazyPyclass("urn:vim25", "RefreshStorageDrsRecommendation")
 
-RefreshStorageDrsRecommendationResponseMsg = GED("urn:vim25", "RefreshStorageDrsRecommendationResponse").pyclass
+RefreshStorageDrsRecommendationResponseMsg = LazyPyclass("urn:vim25", "RefreshStorageDrsRecommendationResponse")
 
-ConfigureStorageDrsForPod_TaskRequestMsg = GED("urn:vim25", "ConfigureStorageDrsForPod_Task").pyclass
+ConfigureStorageDrsForPod_TaskRequestMsg = LazyPyclass("urn:vim25", "ConfigureStorageDrsForPod_Task")
 
-ConfigureStorageDrsForPod_TaskResponseMsg = GED("urn:vim25", "ConfigureStorageDrsForPod_TaskResponse").pyclass
+ConfigureStorageDrsForPod_TaskResponseMsg = LazyPyclass("urn:vim25", "ConfigureStorageDrsForPod_TaskResponse")
 
-RecommendDatastoresRequestMsg = GED("urn:vim25", "RecommendDatastores").pyclass
+RecommendDatastoresRequestMsg = LazyPyclass("urn:vim25", "RecommendDatastores")
 
-RecommendDatastoresResponseMsg = GED("urn:vim25", "RecommendDatastoresResponse").pyclass
+RecommendDatastoresResponseMsg = LazyPyclass("urn:vim25", "RecommendDatastoresResponse")
 
-CancelTaskRequestMsg = GED("urn:vim25", "CancelTask").pyclass
+CancelTaskRequestMsg = LazyPyclass("urn:vim25", "CancelTask")
 
-CancelTaskResponseMsg = GED("urn:vim25", "CancelTaskResponse").pyclass
+CancelTaskResponseMsg = LazyPyclass("urn:vim25", "CancelTaskResponse")
 
-UpdateProgressRequestMsg = GED("urn:vim25", "UpdateProgress").pyclass
+UpdateProgressRequestMsg = LazyPyclass("urn:vim25", "UpdateProgress")
 
-UpdateProgressResponseMsg = GED("urn:vim25", "UpdateProgressResponse").pyclass
+UpdateProgressResponseMsg = LazyPyclass("urn:vim25", "UpdateProgressResponse")
 
-SetTaskStateRequestMsg = GED("urn:vim25", "SetTaskState").pyclass
+SetTaskStateRequestMsg = LazyPyclass("urn:vim25", "SetTaskState")
 
-SetTaskStateResponseMsg = GED("urn:vim25", "SetTaskStateResponse").pyclass
+SetTaskStateResponseMsg = LazyPyclass("urn:vim25", "SetTaskStateResponse")
 
-SetTaskDescriptionRequestMsg = GED("urn:vim25", "SetTaskDescription").pyclass
+SetTaskDescriptionRequestMsg = LazyPyclass("urn:vim25", "SetTaskDescription")
 
-SetTaskDescriptionResponseMsg = GED("urn:vim25", "SetTaskDescriptionResponse").pyclass
+SetTaskDescriptionResponseMsg = LazyPyclass("urn:vim25", "SetTaskDescriptionResponse")
 
-ReadNextTasksRequestMsg = GED("urn:vim25", "ReadNextTasks").pyclass
+ReadNextTasksRequestMsg = LazyPyclass("urn:vim25", "ReadNextTasks")
 
-ReadNextTasksResponseMsg = GED("urn:vim25", "ReadNextTasksResponse").pyclass
+ReadNextTasksResponseMsg = LazyPyclass("urn:vim25", "ReadNextTasksResponse")
 
-ReadPreviousTasksRequestMsg = GED("urn:vim25", "ReadPreviousTasks").pyclass
+ReadPreviousTasksRequestMsg = LazyPyclass("urn:vim25", "ReadPreviousTasks")
 
-ReadPreviousTasksResponseMsg = GED("urn:vim25", "ReadPreviousTasksResponse").pyclass
+ReadPreviousTasksResponseMsg = LazyPyclass("urn:vim25", "ReadPreviousTasksResponse")
 
-CreateCollectorForTasksRequestMsg = GED("urn:vim25", "CreateCollectorForTasks").pyclass
+CreateCollectorForTasksRequestMsg = LazyPyclass("urn:vim25", "CreateCollectorForTasks")
 
-CreateCollectorForTasksResponseMsg = GED("urn:vim25", "CreateCollectorForTasksResponse").pyclass
+CreateCollectorForTasksResponseMsg = LazyPyclass("urn:vim25", "CreateCollectorForTasksResponse")
 
-CreateTaskRequestMsg = GED("urn:vim25", "CreateTask").pyclass
+CreateTaskRequestMsg = LazyPyclass("urn:vim25", "CreateTask")
 
-CreateTaskResponseMsg = GED("urn:vim25", "CreateTaskResponse").pyclass
+CreateTaskResponseMsg = LazyPyclass("urn:vim25", "CreateTaskResponse")
 
-RetrieveUserGroupsRequestMsg = GED("urn:vim25", "RetrieveUserGroups").pyclass
+RetrieveUserGroupsRequestMsg = LazyPyclass("urn:vim25", "RetrieveUserGroups")
 
-RetrieveUserGroupsResponseMsg = GED("urn:vim25", "RetrieveUserGroupsResponse").pyclass
+RetrieveUserGroupsResponseMsg = LazyPyclass("urn:vim25", "RetrieveUserGroupsResponse")
 
-UpdateVAppConfigRequestMsg = GED("urn:vim25", "UpdateVAppConfig").pyclass
+UpdateVAppConfigRequestMsg = LazyPyclass("urn:vim25", "UpdateVAppConfig")
 
-UpdateVAppConfigResponseMsg = GED("urn:vim25", "UpdateVAppConfigResponse").pyclass
+UpdateVAppConfigResponseMsg = LazyPyclass("urn:vim25", "UpdateVAppConfigResponse")
 
-UpdateLinkedChildrenRequestMsg = GED("urn:vim25", "UpdateLinkedChildren").pyclass
+UpdateLinkedChildrenRequestMsg = LazyPyclass("urn:vim25", "UpdateLinkedChildren")
 
-UpdateLinkedChildrenResponseMsg = GED("urn:vim25", "UpdateLinkedChildrenResponse").pyclass
+UpdateLinkedChildrenResponseMsg = LazyPyclass("urn:vim25", "UpdateLinkedChildrenResponse")
 
-CloneVApp_TaskRequestMsg = GED("urn:vim25", "CloneVApp_Task").pyclass
+CloneVApp_TaskRequestMsg = LazyPyclass("urn:vim25", "CloneVApp_Task")
 
-CloneVApp_TaskResponseMsg = GED("urn:vim25", "CloneVApp_TaskResponse").pyclass
+CloneVApp_TaskResponseMsg = LazyPyclass("urn:vim25", "CloneVApp_TaskResponse")
 
-ExportVAppRequestMsg = GED("urn:vim25", "ExportVApp").pyclass
+ExportVAppRequestMsg = LazyPyclass("urn:vim25", "ExportVApp")
 
-ExportVAppResponseMsg = GED("urn:vim25", "ExportVAppResponse").pyclass
+ExportVAppResponseMsg = LazyPyclass("urn:vim25", "ExportVAppResponse")
 
-PowerOnVApp_TaskRequestMsg = GED("urn:vim25", "PowerOnVApp_Task").pyclass
+PowerOnVApp_TaskRequestMsg = LazyPyclass("urn:vim25", "PowerOnVApp_Task")
 
-PowerOnVApp_TaskResponseMsg = GED("urn:vim25", "PowerOnVApp_TaskResponse").pyclass
+PowerOnVApp_TaskResponseMsg = LazyPyclass("urn:vim25", "PowerOnVApp_TaskResponse")
 
-PowerOffVApp_TaskRequestMsg = GED("urn:vim25", "PowerOffVApp_Task").pyclass
+PowerOffVApp_TaskRequestMsg = LazyPyclass("urn:vim25", "PowerOffVApp_Task")
 
-PowerOffVApp_TaskResponseMsg = GED("urn:vim25", "PowerOffVApp_TaskResponse").pyclass
+PowerOffVApp_TaskResponseMsg = LazyPyclass("urn:vim25", "PowerOffVApp_TaskResponse")
 
-SuspendVApp_TaskRequestMsg = GED("urn:vim25", "SuspendVApp_Task").pyclass
+SuspendVApp_TaskRequestMsg = LazyPyclass("urn:vim25", "SuspendVApp_Task")
 
-SuspendVApp_TaskResponseMsg = GED("urn:vim25", "SuspendVApp_TaskResponse").pyclass
+SuspendVApp_TaskResponseMsg = LazyPyclass("urn:vim25", "SuspendVApp_TaskResponse")
 
-unregisterVApp_TaskRequestMsg = GED("urn:vim25", "unregisterVApp_Task").pyclass
+unregisterVApp_TaskRequestMsg = LazyPyclass("urn:vim25", "unregisterVApp_Task")
 
-unregisterVApp_TaskResponseMsg = GED("urn:vim25", "unregisterVApp_TaskResponse").pyclass
+unregisterVApp_TaskResponseMsg = LazyPyclass("urn:vim25", "unregisterVApp_TaskResponse")
 
-CreateVirtualDisk_TaskRequestMsg = GED("urn:vim25", "CreateVirtualDisk_Task").pyclass
+CreateVirtualDisk_TaskRequestMsg = LazyPyclass("urn:vim25", "CreateVirtualDisk_Task")
 
-CreateVirtualDisk_TaskResponseMsg = GED("urn:vim25", "CreateVirtualDisk_TaskResponse").pyclass
+CreateVirtualDisk_TaskResponseMsg = LazyPyclass("urn:vim25", "CreateVirtualDisk_TaskResponse")
 
-DeleteVirtualDisk_TaskRequestMsg = GED("urn:vim25", "DeleteVirtualDisk_Task").pyclass
+DeleteVirtualDisk_TaskRequestMsg = LazyPyclass("urn:vim25", "DeleteVirtualDisk_Task")
 
-DeleteVirtualDisk_TaskResponseMsg = GED("urn:vim25", "DeleteVirtualDisk_TaskResponse").pyclass
+DeleteVirtualDisk_TaskResponseMsg = LazyPyclass("urn:vim25", "DeleteVirtualDisk_TaskResponse")
 
-MoveVirtualDisk_TaskRequestMsg = GED("urn:vim25", "MoveVirtualDisk_Task").pyclass
+MoveVirtualDisk_TaskRequestMsg = LazyPyclass("urn:vim25", "MoveVirtualDisk_Task")
 
-MoveVirtualDisk_TaskResponseMsg = GED("urn:vim25", "MoveVirtualDisk_TaskResponse").pyclass
+MoveVirtualDisk_TaskResponseMsg = LazyPyclass("urn:vim25", "MoveVirtualDisk_TaskResponse")
 
-CopyVirtualDisk_TaskRequestMsg = GED("urn:vim25", "CopyVirtualDisk_Task").pyclass
+CopyVirtualDisk_TaskRequestMsg = LazyPyclass("urn:vim25", "CopyVirtualDisk_Task")
 
-CopyVirtualDisk_TaskResponseMsg = GED("urn:vim25", "CopyVirtualDisk_TaskResponse").pyclass
+CopyVirtualDisk_TaskResponseMsg = LazyPyclass("urn:vim25", "CopyVirtualDisk_TaskResponse")
 
-ExtendVirtualDisk_TaskRequestMsg = GED("urn:vim25", "ExtendVirtualDisk_Task").pyclass
+ExtendVirtualDisk_TaskRequestMsg = LazyPyclass("urn:vim25", "ExtendVirtualDisk_Task")
 
-ExtendVirtualDisk_TaskResponseMsg = GED("urn:vim25", "ExtendVirtualDisk_TaskResponse").pyclass
+ExtendVirtualDisk_TaskResponseMsg = LazyPyclass("urn:vim25", "ExtendVirtualDisk_TaskResponse")
 
-QueryVirtualDiskFragmentationRequestMsg = GED("urn:vim25", "QueryVirtualDiskFragmentation").pyclass
+QueryVirtualDiskFragmentationRequestMsg = LazyPyclass("urn:vim25", "QueryVirtualDiskFragmentation")
 
-QueryVirtualDiskFragmentationResponseMsg = GED("urn:vim25", "QueryVirtualDiskFragmentationResponse").pyclass
+QueryVirtualDiskFragmentationResponseMsg = LazyPyclass("urn:vim25", "QueryVirtualDiskFragmentationResponse")
 
-DefragmentVirtualDisk_TaskRequestMsg = GED("urn:vim25", "DefragmentVirtualDisk_Task").pyclass
+DefragmentVirtualDisk_TaskRequestMsg = LazyPyclass("urn:vim25", "DefragmentVirtualDisk_Task")
 
-DefragmentVirtualDisk_TaskResponseMsg = GED("urn:vim25", "DefragmentVirtualDisk_TaskResponse").pyclass
+DefragmentVirtualDisk_TaskResponseMsg = LazyPyclass("urn:vim25", "DefragmentVirtualDisk_TaskResponse")
 
-ShrinkVirtualDisk_TaskRequestMsg = GED("urn:vim25", "ShrinkVirtualDisk_Task").pyclass
+ShrinkVirtualDisk_TaskRequestMsg = LazyPyclass("urn:vim25", "ShrinkVirtualDisk_Task")
 
-ShrinkVirtualDisk_TaskResponseMsg = GED("urn:vim25", "ShrinkVirtualDisk_TaskResponse").pyclass
+ShrinkVirtualDisk_TaskResponseMsg = LazyPyclass("urn:vim25", "ShrinkVirtualDisk_TaskResponse")
 
-InflateVirtualDisk_TaskRequestMsg = GED("urn:vim25", "InflateVirtualDisk_Task").pyclass
+InflateVirtualDisk_TaskRequestMsg = LazyPyclass("urn:vim25", "InflateVirtualDisk_Task")
 
-InflateVirtualDisk_TaskResponseMsg = GED("urn:vim25", "InflateVirtualDisk_TaskResponse").pyclass
+InflateVirtualDisk_TaskResponseMsg = LazyPyclass("urn:vim25", "InflateVirtualDisk_TaskResponse")
 
-EagerZeroVirtualDisk_TaskRequestMsg = GED("urn:vim25", "EagerZeroVirtualDisk_Task").pyclass
+EagerZeroVirtualDisk_TaskRequestMsg = LazyPyclass("urn:vim25", "EagerZeroVirtualDisk_Task")
 
-EagerZeroVirtualDisk_TaskResponseMsg = GED("urn:vim25", "EagerZeroVirtualDisk_TaskResponse").pyclass
+EagerZeroVirtualDisk_TaskResponseMsg = LazyPyclass("urn:vim25", "EagerZeroVirtualDisk_TaskResponse")
 
-ZeroFillVirtualDisk_TaskRequestMsg = GED("urn:vim25", "ZeroFillVirtualDisk_Task").pyclass
+ZeroFillVirtualDisk_TaskRequestMsg = LazyPyclass("urn:vim25", "ZeroFillVirtualDisk_Task")
 
-ZeroFillVirtualDisk_TaskResponseMsg = GED("urn:vim25", "ZeroFillVirtualDisk_TaskResponse").pyclass
+ZeroFillVirtualDisk_TaskResponseMsg = LazyPyclass("urn:vim25", "ZeroFillVirtualDisk_TaskResponse")
 
-SetVirtualDiskUuidRequestMsg = GED("urn:vim25", "SetVirtualDiskUuid").pyclass
+SetVirtualDiskUuidRequestMsg = LazyPyclass("urn:vim25", "SetVirtualDiskUuid")
 
-SetVirtualDiskUuidResponseMsg = GED("urn:vim25", "SetVirtualDiskUuidResponse").pyclass
+SetVirtualDiskUuidResponseMsg = LazyPyclass("urn:vim25", "SetVirtualDiskUuidResponse")
 
-QueryVirtualDiskUuidRequestMsg = GED("urn:vim25", "QueryVirtualDiskUuid").pyclass
+QueryVirtualDiskUuidRequestMsg = LazyPyclass("urn:vim25", "QueryVirtualDiskUuid")
 
-QueryVirtualDiskUuidResponseMsg = GED("urn:vim25", "QueryVirtualDiskUuidResponse").pyclass
+QueryVirtualDiskUuidResponseMsg = LazyPyclass("urn:vim25", "QueryVirtualDiskUuidResponse")
 
-QueryVirtualDiskGeometryRequestMsg = GED("urn:vim25", "QueryVirtualDiskGeometry").pyclass
+QueryVirtualDiskGeometryRequestMsg = LazyPyclass("urn:vim25", "QueryVirtualDiskGeometry")
 
-QueryVirtualDiskGeometryResponseMsg = GED("urn:vim25", "QueryVirtualDiskGeometryResponse").pyclass
+QueryVirtualDiskGeometryResponseMsg = LazyPyclass("urn:vim25", "QueryVirtualDiskGeometryResponse")
 
-RefreshStorageInfoRequestMsg = GED("urn:vim25", "RefreshStorageInfo").pyclass
+RefreshStorageInfoRequestMsg = LazyPyclass("urn:vim25", "RefreshStorageInfo")
 
-RefreshStorageInfoResponseMsg = GED("urn:vim25", "RefreshStorageInfoResponse").pyclass
+RefreshStorageInfoResponseMsg = LazyPyclass("urn:vim25", "RefreshStorageInfoResponse")
 
-CreateSnapshot_TaskRequestMsg = GED("urn:vim25", "CreateSnapshot_Task").pyclass
+CreateSnapshot_TaskRequestMsg = LazyPyclass("urn:vim25", "CreateSnapshot_Task")
 
-CreateSnapshot_TaskResponseMsg = GED("urn:vim25", "CreateSnapshot_TaskResponse").pyclass
+CreateSnapshot_TaskResponseMsg = LazyPyclass("urn:vim25", "CreateSnapshot_TaskResponse")
 
-RevertToCurrentSnapshot_TaskRequestMsg = GED("urn:vim25", "RevertToCurrentSnapshot_Task").pyclass
+RevertToCurrentSnapshot_TaskRequestMsg = LazyPyclass("urn:vim25", "RevertToCurrentSnapshot_Task")
 
-RevertToCurrentSnapshot_TaskResponseMsg = GED("urn:vim25", "RevertToCurrentSnapshot_TaskResponse").pyclass
+RevertToCurrentSnapshot_TaskResponseMsg = LazyPyclass("urn:vim25", "RevertToCurrentSnapshot_TaskResponse")
 
-RemoveAllSnapshots_TaskRequestMsg = GED("urn:vim25", "RemoveAllSnapshots_Task").pyclass
+RemoveAllSnapshots_TaskRequestMsg = LazyPyclass("urn:vim25", "RemoveAllSnapshots_Task")
 
-RemoveAllSnapshots_TaskResponseMsg = GED("urn:vim25", "RemoveAllSnapshots_TaskResponse").pyclass
+RemoveAllSnapshots_TaskResponseMsg = LazyPyclass("urn:vim25", "RemoveAllSnapshots_TaskResponse")
 
-ConsolidateVMDisks_TaskRequestMsg = GED("urn:vim25", "ConsolidateVMDisks_Task").pyclass
+ConsolidateVMDisks_TaskRequestMsg = LazyPyclass("urn:vim25", "ConsolidateVMDisks_Task")
 
-ConsolidateVMDisks_TaskResponseMsg = GED("urn:vim25", "ConsolidateVMDisks_TaskResponse").pyclass
+ConsolidateVMDisks_TaskResponseMsg = LazyPyclass("urn:vim25", "ConsolidateVMDisks_TaskResponse")
 
-EstimateStorageForConsolidateSnapshots_TaskRequestMsg = GED("urn:vim25", "EstimateStorageForConsolidateSnapshots_Task").pyclass
+EstimateStorageForConsolidateSnapshots_TaskRequestMsg = LazyPyclass("urn:vim25", "EstimateStorageForConsolidateSnapshots_Task")
 
-EstimateStorageForConsolidateSnapshots_TaskResponseMsg = GED("urn:vim25", "EstimateStorageForConsolidateSnapshots_TaskResponse").pyclass
+EstimateStorageForConsolidateSnapshots_TaskResponseMsg = LazyPyclass("urn:vim25", "EstimateStorageForConsolidateSnapshots_TaskResponse")
 
-ReconfigVM_TaskRequestMsg = GED("urn:vim25", "ReconfigVM_Task").pyclass
+ReconfigVM_TaskRequestMsg = LazyPyclass("urn:vim25", "ReconfigVM_Task")
 
-ReconfigVM_TaskResponseMsg = GED("urn:vim25", "ReconfigVM_TaskResponse").pyclass
+ReconfigVM_TaskResponseMsg = LazyPyclass("urn:vim25", "ReconfigVM_TaskResponse")
 
-UpgradeVM_TaskRequestMsg = GED("urn:vim25", "UpgradeVM_Task").pyclass
+UpgradeVM_TaskRequestMsg = LazyPyclass("urn:vim25", "UpgradeVM_Task")
 
-UpgradeVM_TaskResponseMsg = GED("urn:vim25", "UpgradeVM_TaskResponse").pyclass
+UpgradeVM_TaskResponseMsg = LazyPyclass("urn:vim25", "UpgradeVM_TaskResponse")
 
-ExtractOvfEnvironmentRequestMsg = GED("urn:vim25", "ExtractOvfEnvironment").pyclass
+ExtractOvfEnvironmentRequestMsg = LazyPyclass("urn:vim25", "ExtractOvfEnvironment")
 
-ExtractOvfEnvironmentResponseMsg = GED("urn:vim25", "ExtractOvfEnvironmentResponse").pyclass
+ExtractOvfEnvironmentResponseMsg = LazyPyclass("urn:vim25", "ExtractOvfEnvironmentResponse")
 
-PowerOnVM_TaskRequestMsg = GED("urn:vim25", "PowerOnVM_Task").pyclass
+PowerOnVM_TaskRequestMsg = LazyPyclass("urn:vim25", "PowerOnVM_Task")
 
-PowerOnVM_TaskResponseMsg = GED("urn:vim25", "PowerOnVM_TaskResponse").pyclass
+PowerOnVM_TaskResponseMsg = LazyPyclass("urn:vim25", "PowerOnVM_TaskResponse")
 
-PowerOffVM_TaskRequestMsg = GED("urn:vim25", "PowerOffVM_Task").pyclass
+PowerOffVM_TaskRequestMsg = LazyPyclass("urn:vim25", "PowerOffVM_Task")
 
-PowerOffVM_TaskResponseMsg = GED("urn:vim25", "PowerOffVM_TaskResponse").pyclass
+PowerOffVM_TaskResponseMsg = LazyPyclass("urn:vim25", "PowerOffVM_TaskResponse")
 
-SuspendVM_TaskRequestMsg = GED("urn:vim25", "SuspendVM_Task").pyclass
+SuspendVM_TaskRequestMsg = LazyPyclass("urn:vim25", "SuspendVM_Task")
 
-SuspendVM_TaskResponseMsg = GED("urn:vim25", "SuspendVM_TaskResponse").pyclass
+SuspendVM_TaskResponseMsg = LazyPyclass("urn:vim25", "SuspendVM_TaskResponse")
 
-ResetVM_TaskRequestMsg = GED("urn:vim25", "ResetVM_Task").pyclass
+ResetVM_TaskRequestMsg = LazyPyclass("urn:vim25", "ResetVM_Task")
 
-ResetVM_TaskResponseMsg = GED("urn:vim25", "ResetVM_TaskResponse").pyclass
+ResetVM_TaskResponseMsg = LazyPyclass("urn:vim25", "ResetVM_TaskResponse")
 
-ShutdownGuestRequestMsg = GED("urn:vim25", "ShutdownGuest").pyclass
+ShutdownGuestRequestMsg = LazyPyclass("urn:vim25", "ShutdownGuest")
 
-ShutdownGuestResponseMsg = GED("urn:vim25", "ShutdownGuestResponse").pyclass
+ShutdownGuestResponseMsg = LazyPyclass("urn:vim25", "ShutdownGuestResponse")
 
-RebootGuestRequestMsg = GED("urn:vim25", "RebootGuest").pyclass
+RebootGuestRequestMsg = LazyPyclass("urn:vim25", "RebootGuest")
 
-RebootGuestResponseMsg = GED("urn:vim25", "RebootGuestResponse").pyclass
+RebootGuestResponseMsg = LazyPyclass("urn:vim25", "RebootGuestResponse")
 
-StandbyGuestRequestMsg = GED("urn:vim25", "StandbyGuest").pyclass
+StandbyGuestRequestMsg = LazyPyclass("urn:vim25", "StandbyGuest")
 
-StandbyGuestResponseMsg = GED("urn:vim25", "StandbyGuestResponse").pyclass
+StandbyGuestResponseMsg = LazyPyclass("urn:vim25", "StandbyGuestResponse")
 
-AnswerVMRequestMsg = GED("urn:vim25", "AnswerVM").pyclass
+AnswerVMRequestMsg = LazyPyclass("urn:vim25", "AnswerVM")
 
-AnswerVMResponseMsg = GED("urn:vim25", "AnswerVMResponse").pyclass
+AnswerVMResponseMsg = LazyPyclass("urn:vim25", "AnswerVMResponse")
 
-CustomizeVM_TaskRequestMsg = GED("urn:vim25", "CustomizeVM_Task").pyclass
+CustomizeVM_TaskRequestMsg = LazyPyclass("urn:vim25", "CustomizeVM_Task")
 
-CustomizeVM_TaskResponseMsg = GED("urn:vim25", "CustomizeVM_TaskResponse").pyclass
+CustomizeVM_TaskResponseMsg = LazyPyclass("urn:vim25", "CustomizeVM_TaskResponse")
 
-CheckCustomizationSpecRequestMsg = GED("urn:vim25", "CheckCustomizationSpec").pyclass
+CheckCustomizationSpecRequestMsg = LazyPyclass("urn:vim25", "CheckCustomizationSpec")
 
-CheckCustomizationSpecResponseMsg = GED("urn:vim25", "CheckCustomizationSpecResponse").pyclass
+CheckCustomizationSpecResponseMsg = LazyPyclass("urn:vim25", "CheckCustomizationSpecResponse")
 
-MigrateVM_TaskRequestMsg = GED("urn:vim25", "MigrateVM_Task").pyclass
+MigrateVM_TaskRequestMsg = LazyPyclass("urn:vim25", "MigrateVM_Task")
 
-MigrateVM_TaskResponseMsg = GED("urn:vim25", "MigrateVM_TaskResponse").pyclass
+MigrateVM_TaskResponseMsg = LazyPyclass("urn:vim25", "MigrateVM_TaskResponse")
 
-RelocateVM_TaskRequestMsg = GED("urn:vim25", "RelocateVM_Task").pyclass
+RelocateVM_TaskRequestMsg = LazyPyclass("urn:vim25", "RelocateVM_Task")
 
-RelocateVM_TaskResponseMsg = GED("urn:vim25", "RelocateVM_TaskResponse").pyclass
+RelocateVM_TaskResponseMsg = LazyPyclass("urn:vim25", "RelocateVM_TaskResponse")
 
-CloneVM_TaskRequestMsg = GED("urn:vim25", "CloneVM_Task").pyclass
+CloneVM_TaskRequestMsg = LazyPyclass("urn:vim25", "CloneVM_Task")
 
-CloneVM_TaskResponseMsg = GED("urn:vim25", "CloneVM_TaskResponse").pyclass
+CloneVM_TaskResponseMsg = LazyPyclass("urn:vim25", "CloneVM_TaskResponse")
 
-ExportVmRequestMsg = GED("urn:vim25", "ExportVm").pyclass
+ExportVmRequestMsg = LazyPyclass("urn:vim25", "ExportVm")
 
-ExportVmResponseMsg = GED("urn:vim25", "ExportVmResponse").pyclass
+ExportVmResponseMsg = LazyPyclass("urn:vim25", "ExportVmResponse")
 
-MarkAsTemplateRequestMsg = GED("urn:vim25", "MarkAsTemplate").pyclass
+MarkAsTemplateRequestMsg = LazyPyclass("urn:vim25", "MarkAsTemplate")
 
-MarkAsTemplateResponseMsg = GED("urn:vim25", "MarkAsTemplateResponse").pyclass
+MarkAsTemplateResponseMsg = LazyPyclass("urn:vim25", "MarkAsTemplateResponse")
 
-MarkAsVirtualMachineRequestMsg = GED("urn:vim25", "MarkAsVirtualMachine").pyclass
+MarkAsVirtualMachineRequestMsg = LazyPyclass("urn:vim25", "MarkAsVirtualMachine")
 
-MarkAsVirtualMachineResponseMsg = GED("urn:vim25", "MarkAsVirtualMachineResponse").pyclass
+MarkAsVirtualMachineResponseMsg = LazyPyclass("urn:vim25", "MarkAsVirtualMachineResponse")
 
-UnregisterVMRequestMsg = GED("urn:vim25", "UnregisterVM").pyclass
+UnregisterVMRequestMsg = LazyPyclass("urn:vim25", "UnregisterVM")
 
-UnregisterVMResponseMsg = GED("urn:vim25", "UnregisterVMResponse").pyclass
+UnregisterVMResponseMsg = LazyPyclass("urn:vim25", "UnregisterVMResponse")
 
-ResetGuestInformationRequestMsg = GED("urn:vim25", "ResetGuestInformation").pyclass
+ResetGuestInformationRequestMsg = LazyPyclass("urn:vim25", "ResetGuestInformation")
 
-ResetGuestInformationResponseMsg = GED("urn:vim25", "ResetGuestInformationResponse").pyclass
+ResetGuestInformationResponseMsg = LazyPyclass("urn:vim25", "ResetGuestInformationResponse")
 
-MountToolsInstallerRequestMsg = GED("urn:vim25", "MountToolsInstaller").pyclass
+MountToolsInstallerRequestMsg = LazyPyclass("urn:vim25", "MountToolsInstaller")
 
-MountToolsInstallerResponseMsg = GED("urn:vim25", "MountToolsInstallerResponse").pyclass
+MountToolsInstallerResponseMsg = LazyPyclass("urn:vim25", "MountToolsInstallerResponse")
 
-UnmountToolsInstallerRequestMsg = GED("urn:vim25", "UnmountToolsInstaller").pyclass
+UnmountToolsInstallerRequestMsg = LazyPyclass("urn:vim25", "UnmountToolsInstaller")
 
-UnmountToolsInstallerResponseMsg = GED("urn:vim25", "UnmountToolsInstallerResponse").pyclass
+UnmountToolsInstallerResponseMsg = LazyPyclass("urn:vim25", "UnmountToolsInstallerResponse")
 
-UpgradeTools_TaskRequestMsg = GED("urn:vim25", "UpgradeTools_Task").pyclass
+UpgradeTools_TaskRequestMsg = LazyPyclass("urn:vim25", "UpgradeTools_Task")
 
-UpgradeTools_TaskResponseMsg = GED("urn:vim25", "UpgradeTools_TaskResponse").pyclass
+UpgradeTools_TaskResponseMsg = LazyPyclass("urn:vim25", "UpgradeTools_TaskResponse")
 
-AcquireMksTicketRequestMsg = GED("urn:vim25", "AcquireMksTicket").pyclass
+AcquireMksTicketRequestMsg = LazyPyclass("urn:vim25", "AcquireMksTicket")
 
-AcquireMksTicketResponseMsg = GED("urn:vim25", "AcquireMksTicketResponse").pyclass
+AcquireMksTicketResponseMsg = LazyPyclass("urn:vim25", "AcquireMksTicketResponse")
 
-AcquireTicketRequestMsg = GED("urn:vim25", "AcquireTicket").pyclass
+AcquireTicketRequestMsg = LazyPyclass("urn:vim25", "AcquireTicket")
 
-AcquireTicketResponseMsg = GED("urn:vim25", "AcquireTicketResponse").pyclass
+AcquireTicketResponseMsg = LazyPyclass("urn:vim25", "AcquireTicketResponse")
 
-SetScreenResolutionRequestMsg = GED("urn:vim25", "SetScreenResolution").pyclass
+SetScreenResolutionRequestMsg = LazyPyclass("urn:vim25", "SetScreenResolution")
 
-SetScreenResolutionResponseMsg = GED("urn:vim25", "SetScreenResolutionResponse").pyclass
+SetScreenResolutionResponseMsg = LazyPyclass("urn:vim25", "SetScreenResolutionResponse")
 
-DefragmentAllDisksRequestMsg = GED("urn:vim25", "DefragmentAllDisks").pyclass
+DefragmentAllDisksRequestMsg = LazyPyclass("urn:vim25", "DefragmentAllDisks")
 
-DefragmentAllDisksResponseMsg = GED("urn:vim25", "DefragmentAllDisksResponse").pyclass
+DefragmentAllDisksResponseMsg = LazyPyclass("urn:vim25", "DefragmentAllDisksResponse")
 
-CreateSecondaryVM_TaskRequestMsg = GED("urn:vim25", "CreateSecondaryVM_Task").pyclass
+CreateSecondaryVM_TaskRequestMsg = LazyPyclass("urn:vim25", "CreateSecondaryVM_Task")
 
-CreateSecondaryVM_TaskResponseMsg = GED("urn:vim25", "CreateSecondaryVM_TaskResponse").pyclass
+CreateSecondaryVM_TaskResponseMsg = LazyPyclass("urn:vim25", "CreateSecondaryVM_TaskResponse")
 
-TurnOffFaultToleranceForVM_TaskRequestMsg = GED("urn:vim25", "TurnOffFaultToleranceForVM_Task").pyclass
+TurnOffFaultToleranceForVM_TaskRequestMsg = LazyPyclass("urn:vim25", "TurnOffFaultToleranceForVM_Task")
 
-TurnOffFaultToleranceForVM_TaskResponseMsg = GED("urn:vim25", "TurnOffFaultToleranceForVM_TaskResponse").pyclass
+TurnOffFaultToleranceForVM_TaskResponseMsg = LazyPyclass("urn:vim25", "TurnOffFaultToleranceForVM_TaskResponse")
 
-MakePrimaryVM_TaskRequestMsg = GED("urn:vim25", "MakePrimaryVM_Task").pyclass
+MakePrimaryVM_TaskRequestMsg = LazyPyclass("urn:vim25", "MakePrimaryVM_Task")
 
-MakePrimaryVM_TaskResponseMsg = GED("urn:vim25", "MakePrimaryVM_TaskResponse").pyclass
+MakePrimaryVM_TaskResponseMsg = LazyPyclass("urn:vim25", "MakePrimaryVM_TaskResponse")
 
-TerminateFaultTolerantVM_TaskRequestMsg = GED("urn:vim25", "TerminateFaultTolerantVM_Task").pyclass
+TerminateFaultTolerantVM_TaskRequestMsg = LazyPyclass("urn:vim25", "TerminateFaultTolerantVM_Task")
 
-TerminateFaultTolerantVM_TaskResponseMsg = GED("urn:vim25", "TerminateFaultTolerantVM_TaskResponse").pyclass
+TerminateFaultTolerantVM_TaskResponseMsg = LazyPyclass("urn:vim25", "TerminateFaultTolerantVM_TaskResponse")
 
-DisableSecondaryVM_TaskRequestMsg = GED("urn:vim25", "DisableSecondaryVM_Task").pyclass
+DisableSecondaryVM_TaskRequestMsg = LazyPyclass("urn:vim25", "DisableSecondaryVM_Task")
 
-DisableSecondaryVM_TaskResponseMsg = GED("urn:vim25", "DisableSecondaryVM_TaskResponse").pyclass
+DisableSecondaryVM_TaskResponseMsg = LazyPyclass("urn:vim25", "DisableSecondaryVM_TaskResponse")
 
-EnableSecondaryVM_TaskRequestMsg = GED("urn:vim25", "EnableSecondaryVM_Task").pyclass
+EnableSecondaryVM_TaskRequestMsg = LazyPyclass("urn:vim25", "EnableSecondaryVM_Task")
 
-EnableSecondaryVM_TaskResponseMsg = GED("urn:vim25", "EnableSecondaryVM_TaskResponse").pyclass
+EnableSecondaryVM_TaskResponseMsg = LazyPyclass("urn:vim25", "EnableSecondaryVM_TaskResponse")
 
-SetDisplayTopologyRequestMsg = GED("urn:vim25", "SetDisplayTopology").pyclass
+SetDisplayTopologyRequestMsg = LazyPyclass("urn:vim25", "SetDisplayTopology")
 
-SetDisplayTopologyResponseMsg = GED("urn:vim25", "SetDisplayTopologyResponse").pyclass
+SetDisplayTopologyResponseMsg = LazyPyclass("urn:vim25", "SetDisplayTopologyResponse")
 
-StartRecording_TaskRequestMsg = GED("urn:vim25", "StartRecording_Task").pyclass
+StartRecording_TaskRequestMsg = LazyPyclass("urn:vim25", "StartRecording_Task")
 
-StartRecording_TaskResponseMsg = GED("urn:vim25", "StartRecording_TaskResponse").pyclass
+StartRecording_TaskResponseMsg = LazyPyclass("urn:vim25", "StartRecording_TaskResponse")
 
-StopRecording_TaskRequestMsg = GED("urn:vim25", "StopRecording_Task").pyclass
+StopRecording_TaskRequestMsg = LazyPyclass("urn:vim25", "StopRecording_Task")
 
-StopRecording_TaskResponseMsg = GED("urn:vim25", "StopRecording_TaskResponse").pyclass
+StopRecording_TaskResponseMsg = LazyPyclass("urn:vim25", "StopRecording_TaskResponse")
 
-StartReplaying_TaskRequestMsg = GED("urn:vim25", "StartReplaying_Task").pyclass
+StartReplaying_TaskRequestMsg = LazyPyclass("urn:vim25", "StartReplaying_Task")
 
-StartReplaying_TaskResponseMsg = GED("urn:vim25", "StartReplaying_TaskResponse").pyclass
+StartReplaying_TaskResponseMsg = LazyPyclass("urn:vim25", "StartReplaying_TaskResponse")
 
-StopReplaying_TaskRequestMsg = GED("urn:vim25", "StopReplaying_Task").pyclass
+StopReplaying_TaskRequestMsg = LazyPyclass("urn:vim25", "StopReplaying_Task")
 
-StopReplaying_TaskResponseMsg = GED("urn:vim25", "StopReplaying_TaskResponse").pyclass
+StopReplaying_TaskResponseMsg = LazyPyclass("urn:vim25", "StopReplaying_TaskResponse")
 
-PromoteDisks_TaskRequestMsg = GED("urn:vim25", "PromoteDisks_Task").pyclass
+PromoteDisks_TaskRequestMsg = LazyPyclass("urn:vim25", "PromoteDisks_Task")
 
-PromoteDisks_TaskResponseMsg = GED("urn:vim25", "PromoteDisks_TaskResponse").pyclass
+PromoteDisks_TaskResponseMsg = LazyPyclass("urn:vim25", "PromoteDisks_TaskResponse")
 
-CreateScreenshot_TaskRequestMsg = GED("urn:vim25", "CreateScreenshot_Task").pyclass
+CreateScreenshot_TaskRequestMsg = LazyPyclass("urn:vim25", "CreateScreenshot_Task")
 
-CreateScreenshot_TaskResponseMsg = GED("urn:vim25", "CreateScreenshot_TaskResponse").pyclass
+CreateScreenshot_TaskResponseMsg = LazyPyclass("urn:vim25", "CreateScreenshot_TaskResponse")
 
-QueryChangedDiskAreasRequestMsg = GED("urn:vim25", "QueryChangedDiskAreas").pyclass
+QueryChangedDiskAreasRequestMsg = LazyPyclass("urn:vim25", "QueryChangedDiskAreas")
 
-QueryChangedDiskAreasResponseMsg = GED("urn:vim25", "QueryChangedDiskAreasResponse").pyclass
+QueryChangedDiskAreasResponseMsg = LazyPyclass("urn:vim25", "QueryChangedDiskAreasResponse")
 
-QueryUnownedFilesRequestMsg = GED("urn:vim25", "QueryUnownedFiles").pyclass
+QueryUnownedFilesRequestMsg = LazyPyclass("urn:vim25", "QueryUnownedFiles")
 
-QueryUnownedFilesResponseMsg = GED("urn:vim25", "QueryUnownedFilesResponse").pyclass
+QueryUnownedFilesResponseMsg = LazyPyclass("urn:vim25", "QueryUnownedFilesResponse")
 
-reloadVirtualMachineFromPath_TaskRequestMsg = GED("urn:vim25", "reloadVirtualMachineFromPath_Task").pyclass
+reloadVirtualMachineFromPath_TaskRequestMsg = LazyPyclass("urn:vim25", "reloadVirtualMachineFromPath_Task")
 
-reloadVirtualMachineFromPath_TaskResponseMsg = GED("urn:vim25", "reloadVirtualMachineFromPath_TaskResponse").pyclass
+reloadVirtualMachineFromPath_TaskResponseMsg = LazyPyclass("urn:vim25", "reloadVirtualMachineFromPath_TaskResponse")
 
-QueryFaultToleranceCompatibilityRequestMsg = GED("urn:vim25", "QueryFaultToleranceCompatibility").pyclass
+QueryFaultToleranceCompatibilityRequestMsg = LazyPyclass("urn:vim25", "QueryFaultToleranceCompatibility")
 
-QueryFaultToleranceCompatibilityResponseMsg = GED("urn:vim25", "QueryFaultToleranceCompatibilityResponse").pyclass
+QueryFaultToleranceCompatibilityResponseMsg = LazyPyclass("urn:vim25", "QueryFaultToleranceCompatibilityResponse")
 
-TerminateVMRequestMsg = GED("urn:vim25", "TerminateVM").pyclass
+TerminateVMRequestMsg = LazyPyclass("urn:vim25", "TerminateVM")
 
-TerminateVMResponseMsg = GED("urn:vim25", "TerminateVMResponse").pyclass
+TerminateVMResponseMsg = LazyPyclass("urn:vim25", "TerminateVMResponse")
 
-RemoveAlarmRequestMsg = GED("urn:vim25", "RemoveAlarm").pyclass
+RemoveAlarmRequestMsg = LazyPyclass("urn:vim25", "RemoveAlarm")
 
-RemoveAlarmResponseMsg = GED("urn:vim25", "RemoveAlarmResponse").pyclass
+RemoveAlarmResponseMsg = LazyPyclass("urn:vim25", "RemoveAlarmResponse")
 
-ReconfigureAlarmRequestMsg = GED("urn:vim25", "ReconfigureAlarm").pyclass
+ReconfigureAlarmRequestMsg = LazyPyclass("urn:vim25", "ReconfigureAlarm")
 
-ReconfigureAlarmResponseMsg = GED("urn:vim25", "ReconfigureAlarmResponse").pyclass
+ReconfigureAlarmResponseMsg = LazyPyclass("urn:vim25", "ReconfigureAlarmResponse")
 
-CreateAlarmRequestMsg = GED("urn:vim25", "CreateAlarm").pyclass
+CreateAlarmRequestMsg = LazyPyclass("urn:vim25", "CreateAlarm")
 
-CreateAlarmResponseMsg = GED("urn:vim25", "CreateAlarmResponse").pyclass
+CreateAlarmResponseMsg = LazyPyclass("urn:vim25", "CreateAlarmResponse")
 
-GetAlarmRequestMsg = GED("urn:vim25", "GetAlarm").pyclass
+GetAlarmRequestMsg = LazyPyclass("urn:vim25", "GetAlarm")
 
-GetAlarmResponseMsg = GED("urn:vim25", "GetAlarmResponse").pyclass
+GetAlarmResponseMsg = LazyPyclass("urn:vim25", "GetAlarmResponse")
 
-AreAlarmActionsEnabledRequestMsg = GED("urn:vim25", "AreAlarmActionsEnabled").pyclass
+AreAlarmActionsEnabledRequestMsg = LazyPyclass("urn:vim25", "AreAlarmActionsEnabled")
 
-AreAlarmActionsEnabledResponseMsg = GED("urn:vim25", "AreAlarmActionsEnabledResponse").pyclass
+AreAlarmActionsEnabledResponseMsg = LazyPyclass("urn:vim25", "AreAlarmActionsEnabledResponse")
 
-EnableAlarmActionsRequestMsg = GED("urn:vim25", "EnableAlarmActions").pyclass
+EnableAlarmActionsRequestMsg = LazyPyclass("urn:vim25", "EnableAlarmActions")
 
-EnableAlarmActionsResponseMsg = GED("urn:vim25", "EnableAlarmActionsResponse").pyclass
+EnableAlarmActionsResponseMsg = LazyPyclass("urn:vim25", "EnableAlarmActionsResponse")
 
-GetAlarmStateRequestMsg = GED("urn:vim25", "GetAlarmState").pyclass
+GetAlarmStateRequestMsg = LazyPyclass("urn:vim25", "GetAlarmState")
 
-GetAlarmStateResponseMsg = GED("urn:vim25", "GetAlarmStateResponse").pyclass
+GetAlarmStateResponseMsg = LazyPyclass("urn:vim25", "GetAlarmStateResponse")
 
-AcknowledgeAlarmRequestMsg = GED("urn:vim25", "AcknowledgeAlarm").pyclass
+AcknowledgeAlarmRequestMsg = LazyPyclass("urn:vim25", "AcknowledgeAlarm")
 
-AcknowledgeAlarmResponseMsg = GED("urn:vim25", "AcknowledgeAlarmResponse").pyclass
+AcknowledgeAlarmResponseMsg = LazyPyclass("urn:vim25", "AcknowledgeAlarmResponse")
 
-ReconfigureDVPortgroup_TaskRequestMsg = GED("urn:vim25", "ReconfigureDVPortgroup_Task").pyclass
+ReconfigureDVPortgroup_TaskRequestMsg = LazyPyclass("urn:vim25", "ReconfigureDVPortgroup_Task")
 
-ReconfigureDVPortgroup_TaskResponseMsg = GED("urn:vim25", "ReconfigureDVPortgroup_TaskResponse").pyclass
+ReconfigureDVPortgroup_TaskResponseMsg = LazyPyclass("urn:vim25", "ReconfigureDVPortgroup_TaskResponse")
 
-DVPortgroupRollback_TaskRequestMsg = GED("urn:vim25", "DVPortgroupRollback_Task").pyclass
+DVPortgroupRollback_TaskRequestMsg = LazyPyclass("urn:vim25", "DVPortgroupRollback_Task")
 
-DVPortgroupRollback_TaskResponseMsg = GED("urn:vim25", "DVPortgroupRollback_TaskResponse").pyclass
+DVPortgroupRollback_TaskResponseMsg = LazyPyclass("urn:vim25", "DVPortgroupRollback_TaskResponse")
 
-QueryAvailableDvsSpecRequestMsg = GED("urn:vim25", "QueryAvailableDvsSpec").pyclass
+QueryAvailableDvsSpecRequestMsg = LazyPyclass("urn:vim25", "QueryAvailableDvsSpec")
 
-QueryAvailableDvsSpecResponseMsg = GED("urn:vim25", "QueryAvailableDvsSpecResponse").pyclass
+QueryAvailableDvsSpecResponseMsg = LazyPyclass("urn:vim25", "QueryAvailableDvsSpecResponse")
 
-QueryCompatibleHostForNewDvsRequestMsg = GED("urn:vim25", "QueryCompatibleHostForNewDvs").pyclass
+QueryCompatibleHostForNewDvsRequestMsg = LazyPyclass("urn:vim25", "QueryCompatibleHostForNewDvs")
 
-QueryCompatibleHostForNewDvsResponseMsg = GED("urn:vim25", "QueryCompatibleHostForNewDvsResponse").pyclass
+QueryCompatibleHostForNewDvsResponseMsg = LazyPyclass("urn:vim25", "QueryCompatibleHostForNewDvsResponse")
 
-QueryCompatibleHostForExistingDvsRequestMsg = GED("urn:vim25", "QueryCompatibleHostForExistingDvs").pyclass
+QueryCompatibleHostForExistingDvsRequestMsg = LazyPyclass("urn:vim25", "QueryCompatibleHostForExistingDvs")
 
-QueryCompatibleHostForExistingDvsResponseMsg = GED("urn:vim25", "QueryCompatibleHostForExistingDvsResponse").pyclass
+QueryCompatibleHostForExistingDvsResponseMsg = LazyPyclass("urn:vim25", "QueryCompatibleHostForExistingDvsResponse")
 
-QueryDvsCompatibleHostSpecRequestMsg = GED("urn:vim25", "QueryDvsCompatibleHostSpec").pyclass
+QueryDvsCompatibleHostSpecRequestMsg = LazyPyclass("urn:vim25", "QueryDvsCompatibleHostSpec")
 
-QueryDvsCompatibleHostSpecResponseMsg = GED("urn:vim25", "QueryDvsCompatibleHostSpecResponse").pyclass
+QueryDvsCompatibleHostSpecResponseMsg = LazyPyclass("urn:vim25", "QueryDvsCompatibleHostSpecResponse")
 
-QueryDvsFeatureCapabilityRequestMsg = GED("urn:vim25", "QueryDvsFeatureCapability").pyclass
+QueryDvsFeatureCapabilityRequestMsg = LazyPyclass("urn:vim25", "QueryDvsFeatureCapability")
 
-QueryDvsFeatureCapabilityResponseMsg = GED("urn:vim25", "QueryDvsFeatureCapabilityResponse").pyclass
+QueryDvsFeatureCapabilityResponseMsg = LazyPyclass("urn:vim25", "QueryDvsFeatureCapabilityResponse")
 
-QueryDvsByUuidRequestMsg = GED("urn:vim25", "QueryDvsByUuid").pyclass
+QueryDvsByUuidRequestMsg = LazyPyclass("urn:vim25", "QueryDvsByUuid")
 
-QueryDvsByUuidResponseMsg = GED("urn:vim25", "QueryDvsByUuidResponse").pyclass
+QueryDvsByUuidResponseMsg = LazyPyclass("urn:vim25", "QueryDvsByUuidResponse")
 
-QueryDvsConfigTargetRequestMsg = GED("urn:vim25", "QueryDvsConfigTarget").pyclass
+QueryDvsConfigTargetRequestMsg = LazyPyclass("urn:vim25", "QueryDvsConfigTarget")
 
-QueryDvsConfigTargetResponseMsg = GED("urn:vim25", "QueryDvsConfigTargetResponse").pyclass
+QueryDvsConfigTargetResponseMsg = LazyPyclass("urn:vim25", "QueryDvsConfigTargetResponse")
 
-QueryDvsCheckCompatibilityRequestMsg = GED("urn:vim25", "QueryDvsCheckCompatibility").pyclass
+QueryDvsCheckCompatibilityRequestMsg = LazyPyclass("urn:vim25", "QueryDvsCheckCompatibility")
 
-QueryDvsCheckCompatibilityResponseMsg = GED("urn:vim25", "QueryDvsCheckCompatibilityResponse").pyclass
+QueryDvsCheckCompatibilityResponseMsg = LazyPyclass("urn:vim25", "QueryDvsCheckCompatibilityResponse")
 
-RectifyDvsOnHost_TaskRequestMsg = GED("urn:vim25", "RectifyDvsOnHost_Task").pyclass
+RectifyDvsOnHost_TaskRequestMsg = LazyPyclass("urn:vim25", "RectifyDvsOnHost_Task")
 
-RectifyDvsOnHost_TaskResponseMsg = GED("urn:vim25", "RectifyDvsOnHost_TaskResponse").pyclass
+RectifyDvsOnHost_TaskResponseMsg = LazyPyclass("urn:vim25", "RectifyDvsOnHost_TaskResponse")
 
-DVSManagerExportEntity_TaskRequestMsg = GED("urn:vim25", "DVSManagerExportEntity_Task").pyclass
+DVSManagerExportEntity_TaskRequestMsg = LazyPyclass("urn:vim25", "DVSManagerExportEntity_Task")
 
-DVSManagerExportEntity_TaskResponseMsg = GED("urn:vim25", "DVSManagerExportEntity_TaskResponse").pyclass
+DVSManagerExportEntity_TaskResponseMsg = LazyPyclass("urn:vim25", "DVSManagerExportEntity_TaskResponse")
 
-DVSManagerImportEntity_TaskRequestMsg = GED("urn:vim25", "DVSManagerImportEntity_Task").pyclass
+DVSManagerImportEntity_TaskRequestMsg = LazyPyclass("urn:vim25", "DVSManagerImportEntity_Task")
 
-DVSManagerImportEntity_TaskResponseMsg = GED("urn:vim25", "DVSManagerImportEntity_TaskResponse").pyclass
+DVSManagerImportEntity_TaskResponseMsg = LazyPyclass("urn:vim25", "DVSManagerImportEntity_TaskResponse")
 
-DVSManagerLookupDvPortGroupRequestMsg = GED("urn:vim25", "DVSManagerLookupDvPortGroup").pyclass
+DVSManagerLookupDvPortGroupRequestMsg = LazyPyclass("urn:vim25", "DVSManagerLookupDvPortGroup")
 
-DVSManagerLookupDvPortGroupResponseMsg = GED("urn:vim25", "DVSManagerLookupDvPortGroupResponse").pyclass
+DVSManagerLookupDvPortGroupResponseMsg = LazyPyclass("urn:vim25", "DVSManagerLookupDvPortGroupResponse")
 
-ReadNextEventsRequestMsg = GED("urn:vim25", "ReadNextEvents").pyclass
+ReadNextEventsRequestMsg = LazyPyclass("urn:vim25", "ReadNextEvents")
 
-ReadNextEventsResponseMsg = GED("urn:vim25", "ReadNextEventsResponse").pyclass
+ReadNextEventsResponseMsg = LazyPyclass("urn:vim25", "ReadNextEventsResponse")
 
-ReadPreviousEventsRequestMsg = GED("urn:vim25", "ReadPreviousEvents").pyclass
+ReadPreviousEventsRequestMsg = LazyPyclass("urn:vim25", "ReadPreviousEvents")
 
-ReadPreviousEventsResponseMsg = GED("urn:vim25", "ReadPreviousEventsResponse").pyclass
+ReadPreviousEventsResponseMsg = LazyPyclass("urn:vim25", "ReadPreviousEventsResponse")
 
-RetrieveArgumentDescriptionRequestMsg = GED("urn:vim25", "RetrieveArgumentDescription").pyclass
+RetrieveArgumentDescriptionRequestMsg = LazyPyclass("urn:vim25", "RetrieveArgumentDescription")
 
-RetrieveArgumentDescriptionResponseMsg = GED("urn:vim25", "RetrieveArgumentDescriptionResponse").pyclass
+RetrieveArgumentDescriptionResponseMsg = LazyPyclass("urn:vim25", "RetrieveArgumentDescriptionResponse")
 
-CreateCollectorForEventsRequestMsg = GED("urn:vim25", "CreateCollectorForEvents").pyclass
+CreateCollectorForEventsRequestMsg = LazyPyclass("urn:vim25", "CreateCollectorForEvents")
 
-CreateCollectorForEventsResponseMsg = GED("urn:vim25", "CreateCollectorForEventsResponse").pyclass
+CreateCollectorForEventsResponseMsg = LazyPyclass("urn:vim25", "CreateCollectorForEventsResponse")
 
-LogUserEventRequestMsg = GED("urn:vim25", "LogUserEvent").pyclass
+LogUserEventRequestMsg = LazyPyclass("urn:vim25", "LogUserEvent")
 
-LogUserEventResponseMsg = GED("urn:vim25", "LogUserEventResponse").pyclass
+LogUserEventResponseMsg = LazyPyclass("urn:vim25", "LogUserEventResponse")
 
-QueryEventsRequestMsg = GED("urn:vim25", "QueryEvents").pyclass
+QueryEventsRequestMsg = LazyPyclass("urn:vim25", "QueryEvents")
 
-QueryEventsResponseMsg = GED("urn:vim25", "QueryEventsResponse").pyclass
+QueryEventsResponseMsg = LazyPyclass("urn:vim25", "QueryEventsResponse")
 
-PostEventRequestMsg = GED("urn:vim25", "PostEvent").pyclass
+PostEventRequestMsg = LazyPyclass("urn:vim25", "PostEvent")
 
-PostEventResponseMsg = GED("urn:vim25", "PostEventResponse").pyclass
+PostEventResponseMsg = LazyPyclass("urn:vim25", "PostEventResponse")
 
-JoinDomain_TaskRequestMsg = GED("urn:vim25", "JoinDomain_Task").pyclass
+JoinDomain_TaskRequestMsg = LazyPyclass("urn:vim25", "JoinDomain_Task")
 
-JoinDomain_TaskResponseMsg = GED("urn:vim25", "JoinDomain_TaskResponse").pyclass
+JoinDomain_TaskResponseMsg = LazyPyclass("urn:vim25", "JoinDomain_TaskResponse")
 
-JoinDomainWithCAM_TaskRequestMsg = GED("urn:vim25", "JoinDomainWithCAM_Task").pyclass
+JoinDomainWithCAM_TaskRequestMsg = LazyPyclass("urn:vim25", "JoinDomainWithCAM_Task")
 
-JoinDomainWithCAM_TaskResponseMsg = GED("urn:vim25", "JoinDomainWithCAM_TaskResponse").pyclass
+JoinDomainWithCAM_TaskResponseMsg = LazyPyclass("urn:vim25", "JoinDomainWithCAM_TaskResponse")
 
-ImportCertificateForCAM_TaskRequestMsg = GED("urn:vim25", "ImportCertificateForCAM_Task").pyclass
+ImportCertificateForCAM_TaskRequestMsg = LazyPyclass("urn:vim25", "ImportCertificateForCAM_Task")
 
-ImportCertificateForCAM_TaskResponseMsg = GED("urn:vim25", "ImportCertificateForCAM_TaskResponse").pyclass
+ImportCertificateForCAM_TaskResponseMsg = LazyPyclass("urn:vim25", "ImportCertificateForCAM_TaskResponse")
 
-LeaveCurrentDomain_TaskRequestMsg = GED("urn:vim25", "LeaveCurrentDomain_Task").pyclass
+LeaveCurrentDomain_TaskRequestMsg = LazyPyclass("urn:vim25", "LeaveCurrentDomain_Task")
 
-LeaveCurrentDomain_TaskResponseMsg = GED("urn:vim25", "LeaveCurrentDomain_TaskResponse").pyclass
+LeaveCurrentDomain_TaskResponseMsg = LazyPyclass("urn:vim25", "LeaveCurrentDomain_TaskResponse")
 
-ReconfigureAutostartRequestMsg = GED("urn:vim25", "ReconfigureAutostart").pyclass
+ReconfigureAutostartRequestMsg = LazyPyclass("urn:vim25", "ReconfigureAutostart")
 
-ReconfigureAutostartResponseMsg = GED("urn:vim25", "ReconfigureAutostartResponse").pyclass
+ReconfigureAutostartResponseMsg = LazyPyclass("urn:vim25", "ReconfigureAutostartResponse")
 
-AutoStartPowerOnRequestMsg = GED("urn:vim25", "AutoStartPowerOn").pyclass
+AutoStartPowerOnRequestMsg = LazyPyclass("urn:vim25", "AutoStartPowerOn")
 
-AutoStartPowerOnResponseMsg = GED("urn:vim25", "AutoStartPowerOnResponse").pyclass
+AutoStartPowerOnResponseMsg = LazyPyclass("urn:vim25", "AutoStartPowerOnResponse")
 
-AutoStartPowerOffRequestMsg = GED("urn:vim25", "AutoStartPowerOff").pyclass
+AutoStartPowerOffRequestMsg = LazyPyclass("urn:vim25", "AutoStartPowerOff")
 
-AutoStartPowerOffResponseMsg = GED("urn:vim25", "AutoStartPowerOffResponse").pyclass
+AutoStartPowerOffResponseMsg = LazyPyclass("urn:vim25", "AutoStartPowerOffResponse")
 
-QueryBootDevicesRequestMsg = GED("urn:vim25", "QueryBootDevices").pyclass
+QueryBootDevicesRequestMsg = LazyPyclass("urn:vim25", "QueryBootDevices")
 
-QueryBootDevicesResponseMsg = GED("urn:vim25", "QueryBootDevicesResponse").pyclass
+QueryBootDevicesResponseMsg = LazyPyclass("urn:vim25", "QueryBootDevicesResponse")
 
-UpdateBootDeviceRequestMsg = GED("urn:vim25", "UpdateBootDevice").pyclass
+UpdateBootDeviceRequestMsg = LazyPyclass("urn:vim25", "UpdateBootDevice")
 
-UpdateBootDeviceResponseMsg = GED("urn:vim25", "UpdateBootDeviceResponse").pyclass
+UpdateBootDeviceResponseMsg = LazyPyclass("urn:vim25", "UpdateBootDeviceResponse")
 
-ConfigureHostCache_TaskRequestMsg = GED("urn:vim25", "ConfigureHostCache_Task").pyclass
+ConfigureHostCache_TaskRequestMsg = LazyPyclass("urn:vim25", "ConfigureHostCache_Task")
 
-ConfigureHostCache_TaskResponseMsg = GED("urn:vim25", "ConfigureHostCache_TaskResponse").pyclass
+ConfigureHostCache_TaskResponseMsg = LazyPyclass("urn:vim25", "ConfigureHostCache_TaskResponse")
 
-EnableHyperThreadingRequestMsg = GED("urn:vim25", "EnableHyperThreading").pyclass
+EnableHyperThreadingRequestMsg = LazyPyclass("urn:vim25", "EnableHyperThreading")
 
-EnableHyperThreadingResponseMsg = GED("urn:vim25", "EnableHyperThreadingResponse").pyclass
+EnableHyperThreadingResponseMsg = LazyPyclass("urn:vim25", "EnableHyperThreadingResponse")
 
-DisableHyperThreadingRequestMsg = GED("urn:vim25", "DisableHyperThreading").pyclass
+DisableHyperThreadingRequestMsg = LazyPyclass("urn:vim25", "DisableHyperThreading")
 
-DisableHyperThreadingResponseMsg = GED("urn:vim25", "DisableHyperThreadingResponse").pyclass
+DisableHyperThreadingResponseMsg = LazyPyclass("urn:vim25", "DisableHyperThreadingResponse")
 
-SearchDatastore_TaskRequestMsg = GED("urn:vim25", "SearchDatastore_Task").pyclass
+SearchDatastore_TaskRequestMsg = LazyPyclass("urn:vim25", "SearchDatastore_Task")
 
-SearchDatastore_TaskResponseMsg = GED("urn:vim25", "SearchDatastore_TaskResponse").pyclass
+SearchDatastore_TaskResponseMsg = LazyPyclass("urn:vim25", "SearchDatastore_TaskResponse")
 
-SearchDatastoreSubFolders_TaskRequestMsg = GED("urn:vim25", "SearchDatastoreSubFolders_Task").pyclass
+SearchDatastoreSubFolders_TaskRequestMsg = LazyPyclass("urn:vim25", "SearchDatastoreSubFolders_Task")
 
-SearchDatastoreSubFolders_TaskResponseMsg = GED("urn:vim25", "SearchDatastoreSubFolders_TaskResponse").pyclass
+SearchDatastoreSubFolders_TaskResponseMsg = LazyPyclass("urn:vim25", "SearchDatastoreSubFolders_TaskResponse")
 
-DeleteFileRequestMsg = GED("urn:vim25", "DeleteFile").pyclass
+DeleteFileRequestMsg = LazyPyclass("urn:vim25", "DeleteFile")
 
-DeleteFileResponseMsg = GED("urn:vim25", "DeleteFileResponse").pyclass
+DeleteFileResponseMsg = LazyPyclass("urn:vim25", "DeleteFileResponse")
 
-UpdateLocalSwapDatastoreRequestMsg = GED("urn:vim25", "UpdateLocalSwapDatastore").pyclass
+UpdateLocalSwapDatastoreRequestMsg = LazyPyclass("urn:vim25", "UpdateLocalSwapDatastore")
 
-UpdateLocalSwapDatastoreResponseMsg = GED("urn:vim25", "UpdateLocalSwapDatastoreResponse").pyclass
+UpdateLocalSwapDatastoreResponseMsg = LazyPyclass("urn:vim25", "UpdateLocalSwapDatastoreResponse")
 
-QueryAvailableDisksForVmfsRequestMsg = GED("urn:vim25", "QueryAvailableDisksForVmfs").pyclass
+QueryAvailableDisksForVmfsRequestMsg = LazyPyclass("urn:vim25", "QueryAvailableDisksForVmfs")
 
-QueryAvailableDisksForVmfsResponseMsg = GED("urn:vim25", "QueryAvailableDisksForVmfsResponse").pyclass
+QueryAvailableDisksForVmfsResponseMsg = LazyPyclass("urn:vim25", "QueryAvailableDisksForVmfsResponse")
 
-QueryVmfsDatastoreCreateOptionsRequestMsg = GED("urn:vim25", "QueryVmfsDatastoreCreateOptions").pyclass
+QueryVmfsDatastoreCreateOptionsRequestMsg = LazyPyclass("urn:vim25", "QueryVmfsDatastoreCreateOptions")
 
-QueryVmfsDatastoreCreateOptionsResponseMsg = GED("urn:vim25", "QueryVmfsDatastoreCreateOptionsResponse").pyclass
+QueryVmfsDatastoreCreateOptionsResponseMsg = LazyPyclass("urn:vim25", "QueryVmfsDatastoreCreateOptionsResponse")
 
-CreateVmfsDatastoreRequestMsg = GED("urn:vim25", "CreateVmfsDatastore").pyclass
+CreateVmfsDatastoreRequestMsg = LazyPyclass("urn:vim25", "CreateVmfsDatastore")
 
-CreateVmfsDatastoreResponseMsg = GED("urn:vim25", "CreateVmfsDatastoreResponse").pyclass
+CreateVmfsDatastoreResponseMsg = LazyPyclass("urn:vim25", "CreateVmfsDatastoreResponse")
 
-QueryVmfsDatastoreExtendOptionsRequestMsg = GED("urn:vim25", "QueryVmfsDatastoreExtendOptions").pyclass
+QueryVmfsDatastoreExtendOptionsRequestMsg = LazyPyclass("urn:vim25", "QueryVmfsDatastoreExtendOptions")
 
-QueryVmfsDatastoreExtendOptionsResponseMsg = GED("urn:vim25", "QueryVmfsDatastoreExtendOptionsResponse").pyclass
+QueryVmfsDatastoreExtendOptionsResponseMsg = LazyPyclass("urn:vim25", "QueryVmfsDatastoreExtendOptionsResponse")
 
-QueryVmfsDatastoreExpandOptionsRequestMsg = GED("urn:vim25", "QueryVmfsDatastoreExpandOptions").pyclass
+QueryVmfsDatastoreExpandOptionsRequestMsg = LazyPyclass("urn:vim25", "QueryVmfsDatastoreExpandOptions")
 
-QueryVmfsDatastoreExpandOptionsResponseMsg = GED("urn:vim25", "QueryVmfsDatastoreExpandOptionsResponse").pyclass
+QueryVmfsDatastoreExpandOptionsResponseMsg = LazyPyclass("urn:vim25", "QueryVmfsDatastoreExpandOptionsResponse")
 
-ExtendVmfsDatastoreRequestMsg = GED("urn:vim25", "ExtendVmfsDatastore").pyclass
+ExtendVmfsDatastoreRequestMsg = LazyPyclass("urn:vim25", "ExtendVmfsDatastore")
 
-ExtendVmfsDatastoreResponseMsg = GED("urn:vim25", "ExtendVmfsDatastoreResponse").pyclass
+ExtendVmfsDatastoreResponseMsg = LazyPyclass("urn:vim25", "ExtendVmfsDatastoreResponse")
 
-ExpandVmfsDatastoreRequestMsg = GED("urn:vim25", "ExpandVmfsDatastore").pyclass
+ExpandVmfsDatastoreRequestMsg = LazyPyclass("urn:vim25", "ExpandVmfsDatastore")
 
-ExpandVmfsDatastoreResponseMsg = GED("urn:vim25", "ExpandVmfsDatastoreResponse").pyclass
+ExpandVmfsDatastoreResponseMsg = LazyPyclass("urn:vim25", "ExpandVmfsDatastoreResponse")
 
-CreateNasDatastoreRequestMsg = GED("urn:vim25", "CreateNasDatastore").pyclass
+CreateNasDatastoreRequestMsg = LazyPyclass("urn:vim25", "CreateNasDatastore")
 
-CreateNasDatastoreResponseMsg = GED("urn:vim25", "CreateNasDatastoreResponse").pyclass
+CreateNasDatastoreResponseMsg = LazyPyclass("urn:vim25", "CreateNasDatastoreResponse")
 
-CreateLocalDatastoreRequestMsg = GED("urn:vim25", "CreateLocalDatastore").pyclass
+CreateLocalDatastoreRequestMsg = LazyPyclass("urn:vim25", "CreateLocalDatastore")
 
-CreateLocalDatastoreResponseMsg = GED("urn:vim25", "CreateLocalDatastoreResponse").pyclass
+CreateLocalDatastoreResponseMsg = LazyPyclass("urn:vim25", "CreateLocalDatastoreResponse")
 
-RemoveDatastoreRequestMsg = GED("urn:vim25", "RemoveDatastore").pyclass
+RemoveDatastoreRequestMsg = LazyPyclass("urn:vim25", "RemoveDatastore")
 
-RemoveDatastoreResponseMsg = GED("urn:vim25", "RemoveDatastoreResponse").pyclass
+RemoveDatastoreResponseMsg = LazyPyclass("urn:vim25", "RemoveDatastoreResponse")
 
-ConfigureDatastorePrincipalRequestMsg = GED("urn:vim25", "ConfigureDatastorePrincipal").pyclass
+ConfigureDatastorePrincipalRequestMsg = LazyPyclass("urn:vim25", "ConfigureDatastorePrincipal")
 
-ConfigureDatastorePrincipalResponseMsg = GED("urn:vim25", "ConfigureDatastorePrincipalResponse").pyclass
+ConfigureDatastorePrincipalResponseMsg = LazyPyclass("urn:vim25", "ConfigureDatastorePrincipalResponse")
 
-QueryUnresolvedVmfsVolumesRequestMsg = GED("urn:vim25", "QueryUnresolvedVmfsVolumes").pyclass
+QueryUnresolvedVmfsVolumesRequestMsg = LazyPyclass("urn:vim25", "QueryUnresolvedVmfsVolumes")
 
-QueryUnresolvedVmfsVolumesResponseMsg = GED("urn:vim25", "QueryUnresolvedVmfsVolumesResponse").pyclass
+QueryUnresolvedVmfsVolumesResponseMsg = LazyPyclass("urn:vim25", "QueryUnresolvedVmfsVolumesResponse")
 
-ResignatureUnresolvedVmfsVolume_TaskRequestMsg = GED("urn:vim25", "ResignatureUnresolvedVmfsVolume_Task").pyclass
+ResignatureUnresolvedVmfsVolume_TaskRequestMsg = LazyPyclass("urn:vim25", "ResignatureUnresolvedVmfsVolume_Task")
 
-ResignatureUnresolvedVmfsVolume_TaskResponseMsg = GED("urn:vim25", "ResignatureUnresolvedVmfsVolume_TaskResponse").pyclass
+ResignatureUnresolvedVmfsVolume_TaskResponseMsg = LazyPyclass("urn:vim25", "ResignatureUnresolvedVmfsVolume_TaskResponse")
 
-UpdateDateTimeConfigRequestMsg = GED("urn:vim25", "UpdateDateTimeConfig").pyclass
+UpdateDateTimeConfigRequestMsg = LazyPyclass("urn:vim25", "UpdateDateTimeConfig")
 
-UpdateDateTimeConfigResponseMsg = GED("urn:vim25", "UpdateDateTimeConfigResponse").pyclass
+UpdateDateTimeConfigResponseMsg = LazyPyclass("urn:vim25", "UpdateDateTimeConfigResponse")
 
-QueryAvailableTimeZonesRequestMsg = GED("urn:vim25", "QueryAvailableTimeZones").pyclass
+QueryAvailableTimeZonesRequestMsg = LazyPyclass("urn:vim25", "QueryAvailableTimeZones")
 
-QueryAvailableTimeZonesResponseMsg = GED("urn:vim25", "QueryAvailableTimeZonesResponse").pyclass
+QueryAvailableTimeZonesResponseMsg = LazyPyclass("urn:vim25", "QueryAvailableTimeZonesResponse")
 
-QueryDateTimeRequestMsg = GED("urn:vim25", "QueryDateTime").pyclass
+QueryDateTimeRequestMsg = LazyPyclass("urn:vim25", "QueryDateTime")
 
-QueryDateTimeResponseMsg = GED("urn:vim25", "QueryDateTimeResponse").pyclass
+QueryDateTimeResponseMsg = LazyPyclass("urn:vim25", "QueryDateTimeResponse")
 
-UpdateDateTimeRequestMsg = GED("urn:vim25", "UpdateDateTime").pyclass
+UpdateDateTimeRequestMsg = LazyPyclass("urn:vim25", "UpdateDateTime")
 
-UpdateDateTimeResponseMsg = GED("urn:vim25", "UpdateDateTimeResponse").pyclass
+UpdateDateTimeResponseMsg = LazyPyclass("urn:vim25", "UpdateDateTimeResponse")
 
-RefreshDateTimeSystemRequestMsg = GED("urn:vim25", "RefreshDateTimeSystem").pyclass
+RefreshDateTimeSystemRequestMsg = LazyPyclass("urn:vim25", "RefreshDateTimeSystem")
 
-RefreshDateTimeSystemResponseMsg = GED("urn:vim25", "RefreshDateTimeSystemResponse").pyclass
+RefreshDateTimeSystemResponseMsg = LazyPyclass("urn:vim25", "RefreshDateTimeSystemResponse")
 
-QueryAvailablePartitionRequestMsg = GED("urn:vim25", "QueryAvailablePartition").pyclass
+QueryAvailablePartitionRequestMsg = LazyPyclass("urn:vim25", "QueryAvailablePartition")
 
-QueryAvailablePartitionResponseMsg = GED("urn:vim25", "QueryAvailablePartitionResponse").pyclass
+QueryAvailablePartitionResponseMsg = LazyPyclass("urn:vim25", "QueryAvailablePartitionResponse")
 
-SelectActivePartitionRequestMsg = GED("urn:vim25", "SelectActivePartition").pyclass
+SelectActivePartitionRequestMsg = LazyPyclass("urn:vim25", "SelectActivePartition")
 
-SelectActivePartitionResponseMsg = GED("urn:vim25", "SelectActivePartitionResponse").pyclass
+SelectActivePartitionResponseMsg = LazyPyclass("urn:vim25", "SelectActivePartitionResponse")
 
-QueryPartitionCreateOptionsRequestMsg = GED("urn:vim25", "QueryPartitionCreateOptions").pyclass
+QueryPartitionCreateOptionsRequestMsg = LazyPyclass("urn:vim25", "QueryPartitionCreateOptions")
 
-QueryPartitionCreateOptionsResponseMsg = GED("urn:vim25", "QueryPartitionCreateOptionsResponse").pyclass
+QueryPartitionCreateOptionsResponseMsg = LazyPyclass("urn:vim25", "QueryPartitionCreateOptionsResponse")
 
-QueryPartitionCreateDescRequestMsg = GED("urn:vim25", "QueryPartitionCreateDesc").pyclass
+QueryPartitionCreateDescRequestMsg = LazyPyclass("urn:vim25", "QueryPartitionCreateDesc")
 
-QueryPartitionCreateDescResponseMsg = GED("urn:vim25", "QueryPartitionCreateDescResponse").pyclass
+QueryPartitionCreateDescResponseMsg = LazyPyclass("urn:vim25", "QueryPartitionCreateDescResponse")
 
-CreateDiagnosticPartitionRequestMsg = GED("urn:vim25", "CreateDiagnosticPartition").pyclass
+CreateDiagnosticPartitionRequestMsg = LazyPyclass("urn:vim25", "CreateDiagnosticPartition")
 
-CreateDiagnosticPartitionResponseMsg = GED("urn:vim25", "CreateDiagnosticPartitionResponse").pyclass
+CreateDiagnosticPartitionResponseMsg = LazyPyclass("urn:vim25", "CreateDiagnosticPartitionResponse")
 
-EsxAgentHostManagerUpdateConfigRequestMsg = GED("urn:vim25", "EsxAgentHostManagerUpdateConfig").pyclass
+EsxAgentHostManagerUpdateConfigRequestMsg = LazyPyclass("urn:vim25", "EsxAgentHostManagerUpdateConfig")
 
-EsxAgentHostManagerUpdateConfigResponseMsg = GED("urn:vim25", "EsxAgentHostManagerUpdateConfigResponse").pyclass
+EsxAgentHostManagerUpdateConfigResponseMsg = LazyPyclass("urn:vim25", "EsxAgentHostManagerUpdateConfigResponse")
 
-UpdateDefaultPolicyRequestMsg = GED("urn:vim25", "UpdateDefaultPolicy").pyclass
+UpdateDefaultPolicyRequestMsg = LazyPyclass("urn:vim25", "UpdateDefaultPolicy")
 
-UpdateDefaultPolicyResponseMsg = GED("urn:vim25", "UpdateDefaultPolicyResponse").pyclass
+UpdateDefaultPolicyResponseMsg = LazyPyclass("urn:vim25", "UpdateDefaultPolicyResponse")
 
-EnableRulesetRequestMsg = GED("urn:vim25", "EnableRuleset").pyclass
+EnableRulesetRequestMsg = LazyPyclass("urn:vim25", "EnableRuleset")
 
-EnableRulesetResponseMsg = GED("urn:vim25", "EnableRulesetResponse").pyclass
+EnableRulesetResponseMsg = LazyPyclass("urn:vim25", "EnableRulesetResponse")
 
-DisableRulesetRequestMsg = GED("urn:vim25", "DisableRuleset").pyclass
+DisableRulesetRequestMsg = LazyPyclass("urn:vim25", "DisableRuleset")
 
-DisableRulesetResponseMsg = GED("urn:vim25", "DisableRulesetResponse").pyclass
+DisableRulesetResponseMsg = LazyPyclass("urn:vim25", "DisableRulesetResponse")
 
-UpdateRulesetRequestMsg = GED("urn:vim25", "UpdateRuleset").pyclass
+UpdateRulesetRequestMsg = LazyPyclass("urn:vim25", "UpdateRuleset")
 
-UpdateRulesetResponseMsg = GED("urn:vim25", "UpdateRulesetResponse").pyclass
+UpdateRulesetResponseMsg = LazyPyclass("urn:vim25", "UpdateRulesetResponse")
 
-RefreshFirewallRequestMsg = GED("urn:vim25", "RefreshFirewall").pyclass
+RefreshFirewallRequestMsg = LazyPyclass("urn:vim25", "RefreshFirewall")
 
-RefreshFirewallResponseMsg = GED("urn:vim25", "RefreshFirewallResponse").pyclass
+RefreshFirewallResponseMsg = LazyPyclass("urn:vim25", "RefreshFirewallResponse")
 
-ResetFirmwareToFactoryDefaultsRequestMsg = GED("urn:vim25", "ResetFirmwareToFactoryDefaults").pyclass
+ResetFirmwareToFactoryDefaultsRequestMsg = LazyPyclass("urn:vim25", "ResetFirmwareToFactoryDefaults")
 
-ResetFirmwareToFactoryDefaultsResponseMsg = GED("urn:vim25", "ResetFirmwareToFactoryDefaultsResponse").pyclass
+ResetFirmwareToFactoryDefaultsResponseMsg = LazyPyclass("urn:vim25", "ResetFirmwareToFactoryDefaultsResponse")
 
-BackupFirmwareConfigurationRequestMsg = GED("urn:vim25", "BackupFirmwareConfiguration").pyclass
+BackupFirmwareConfigurationRequestMsg = LazyPyclass("urn:vim25", "BackupFirmwareConfiguration")
 
-BackupFirmwareConfigurationResponseMsg = GED("urn:vim25", "BackupFirmwareConfigurationResponse").pyclass
+BackupFirmwareConfigurationResponseMsg = LazyPyclass("urn:vim25", "BackupFirmwareConfigurationResponse")
 
-QueryFirmwareConfigUploadURLRequestMsg = GED("urn:vim25", "QueryFirmwareConfigUploadURL").pyclass
+QueryFirmwareConfigUploadURLRequestMsg = LazyPyclass("urn:vim25", "QueryFirmwareConfigUploadURL")
 
-QueryFirmwareConfigUploadURLResponseMsg = GED("urn:vim25", "QueryFirmwareConfigUploadURLResponse").pyclass
+QueryFirmwareConfigUploadURLResponseMsg = LazyPyclass("urn:vim25", "QueryFirmwareConfigUploadURLResponse")
 
-RestoreFirmwareConfigurationRequestMsg = GED("urn:vim25", "RestoreFirmwareConfiguration").pyclass
+RestoreFirmwareConfigurationRequestMsg = LazyPyclass("urn:vim25", "RestoreFirmwareConfiguration")
 
-RestoreFirmwareConfigurationResponseMsg = GED("urn:vim25", "RestoreFirmwareConfigurationResponse").pyclass
+RestoreFirmwareConfigurationResponseMsg = LazyPyclass("urn:vim25", "RestoreFirmwareConfigurationResponse")
 
-RefreshHealthStatusSystemRequestMsg = GED("urn:vim25", "RefreshHealthStatusSystem").pyclass
+RefreshHealthStatusSystemRequestMsg = LazyPyclass("urn:vim25", "RefreshHealthStatusSystem")
 
-RefreshHealthStatusSystemResponseMsg = GED("urn:vim25", "RefreshHealthStatusSystemResponse").pyclass
+RefreshHealthStatusSystemResponseMsg = LazyPyclass("urn:vim25", "RefreshHealthStatusSystemResponse")
 
-ResetSystemHealthInfoRequestMsg = GED("urn:vim25", "ResetSystemHealthInfo").pyclass
+ResetSystemHealthInfoRequestMsg = LazyPyclass("urn:vim25", "ResetSystemHealthInfo")
 
-ResetSystemHealthInfoResponseMsg = GED("urn:vim25", "ResetSystemHealthInfoResponse").pyclass
+ResetSystemHealthInfoResponseMsg = LazyPyclass("urn:vim25", "ResetSystemHealthInfoResponse")
 
-HostImageConfigGetAcceptanceRequestMsg = GED("urn:vim25", "HostImageConfigGetAcceptance").pyclass
+HostImageConfigGetAcceptanceRequestMsg = LazyPyclass("urn:vim25", "HostImageConfigGetAcceptance")
 
-HostImageConfigGetAcceptanceResponseMsg = GED("urn:vim25", "HostImageConfigGetAcceptanceResponse").pyclass
+HostImageConfigGetAcceptanceResponseMsg = LazyPyclass("urn:vim25", "HostImageConfigGetAcceptanceResponse")
 
-HostImageConfigGetProfileRequestMsg = GED("urn:vim25", "HostImageConfigGetProfile").pyclass
+HostImageConfigGetProfileRequestMsg = LazyPyclass("urn:vim25", "HostImageConfigGetProfile")
 
-HostImageConfigGetProfileResponseMsg = GED("urn:vim25", "HostImageConfigGetProfileResponse").pyclass
+HostImageConfigGetProfileResponseMsg = LazyPyclass("urn:vim25", "HostImageConfigGetProfileResponse")
 
-UpdateHostImageAcceptanceLevelRequestMsg = GED("urn:vim25", "UpdateHostImageAcceptanceLevel").pyclass
+UpdateHostImageAcceptanceLevelRequestMsg = LazyPyclass("urn:vim25", "UpdateHostImageAcceptanceLevel")
 
-UpdateHostImageAcceptanceLevelResponseMsg = GED("urn:vim25", "UpdateHostImageAcceptanceLevelResponse").pyclass
+UpdateHostImageAcceptanceLevelResponseMsg = LazyPyclass("urn:vim25", "UpdateHostImageAcceptanceLevelResponse")
 
-QueryVnicStatusRequestMsg = GED("urn:vim25", "QueryVnicStatus").pyclass
+QueryVnicStatusRequestMsg = LazyPyclass("urn:vim25", "QueryVnicStatus")
 
-QueryVnicStatusResponseMsg = GED("urn:vim25", "QueryVnicStatusResponse").pyclass
+QueryVnicStatusResponseMsg = LazyPyclass("urn:vim25", "QueryVnicStatusResponse")
 
-QueryPnicStatusRequestMsg = GED("urn:vim25", "QueryPnicStatus").pyclass
+QueryPnicStatusRequestMsg = LazyPyclass("urn:vim25", "QueryPnicStatus")
 
-QueryPnicStatusResponseMsg = GED("urn:vim25", "QueryPnicStatusResponse").pyclass
+QueryPnicStatusResponseMsg = LazyPyclass("urn:vim25", "QueryPnicStatusResponse")
 
-QueryBoundVnicsRequestMsg = GED("urn:vim25", "QueryBoundVnics").pyclass
+QueryBoundVnicsRequestMsg = LazyPyclass("urn:vim25", "QueryBoundVnics")
 
-QueryBoundVnicsResponseMsg = GED("urn:vim25", "QueryBoundVnicsResponse").pyclass
+QueryBoundVnicsResponseMsg = LazyPyclass("urn:vim25", "QueryBoundVnicsResponse")
 
-QueryCandidateNicsRequestMsg = GED("urn:vim25", "QueryCandidateNics").pyclass
+QueryCandidateNicsRequestMsg = LazyPyclass("urn:vim25", "QueryCandidateNics")
 
-QueryCandidateNicsResponseMsg = GED("urn:vim25", "QueryCandidateNicsResponse").pyclass
+QueryCandidateNicsResponseMsg = LazyPyclass("urn:vim25", "QueryCandidateNicsResponse")
 
-BindVnicRequestMsg = GED("urn:vim25", "BindVnic").pyclass
+BindVnicRequestMsg = LazyPyclass("urn:vim25", "BindVnic")
 
-BindVnicResponseMsg = GED("urn:vim25", "BindVnicResponse").pyclass
+BindVnicResponseMsg = LazyPyclass("urn:vim25", "BindVnicResponse")
 
-UnbindVnicRequestMsg = GED("urn:vim25", "UnbindVnic").pyclass
+UnbindVnicRequestMsg = LazyPyclass("urn:vim25", "UnbindVnic")
 
-UnbindVnicResponseMsg = GED("urn:vim25", "UnbindVnicResponse").pyclass
+UnbindVnicResponseMsg = LazyPyclass("urn:vim25", "UnbindVnicResponse")
 
-QueryMigrationDependenciesRequestMsg = GED("urn:vim25", "QueryMigrationDependencies").pyclass
+QueryMigrationDependenciesRequestMsg = LazyPyclass("urn:vim25", "QueryMigrationDependencies")
 
-QueryMigrationDependenciesResponseMsg = GED("urn:vim25", "QueryMigrationDependenciesResponse").pyclass
+QueryMigrationDependenciesResponseMsg = LazyPyclass("urn:vim25", "QueryMigrationDependenciesResponse")
 
-QueryModulesRequestMsg = GED("urn:vim25", "QueryModules").pyclass
+QueryModulesRequestMsg = LazyPyclass("urn:vim25", "QueryModules")
 
-QueryModulesResponseMsg = GED("urn:vim25", "QueryModulesResponse").pyclass
+QueryModulesResponseMsg = LazyPyclass("urn:vim25", "QueryModulesResponse")
 
-UpdateModuleOptionStringRequestMsg = GED("urn:vim25", "UpdateModuleOptionString").pyclass
+UpdateModuleOptionStringRequestMsg = LazyPyclass("urn:vim25", "UpdateModuleOptionString")
 
-UpdateModuleOptionStringResponseMsg = GED("urn:vim25", "UpdateModuleOptionStringResponse").pyclass
+UpdateModuleOptionStringResponseMsg = LazyPyclass("urn:vim25", "UpdateModuleOptionStringResponse")
 
-QueryConfiguredModuleOptionStringRequestMsg = GED("urn:vim25", "QueryConfiguredModuleOptionString").pyclass
+QueryConfiguredModuleOptionStringRequestMsg = LazyPyclass("urn:vim25", "QueryConfiguredModuleOptionString")
 
-QueryConfiguredModuleOptionStringResponseMsg = GED("urn:vim25", "QueryConfiguredModuleOptionStringResponse").pyclass
+QueryConfiguredModuleOptionStringResponseMsg = LazyPyclass("urn:vim25", "QueryConfiguredModuleOptionStringResponse")
 
-CreateUserRequestMsg = GED("urn:vim25", "CreateUser").pyclass
+CreateUserRequestMsg = LazyPyclass("urn:vim25", "CreateUser")
 
-CreateUserResponseMsg = GED("urn:vim25", "CreateUserResponse").pyclass
+CreateUserResponseMsg = LazyPyclass("urn:vim25", "CreateUserResponse")
 
-UpdateUserRequestMsg = GED("urn:vim25", "UpdateUser").pyclass
+UpdateUserRequestMsg = LazyPyclass("urn:vim25", "UpdateUser")
 
-UpdateUserResponseMsg = GED("urn:vim25", "UpdateUserResponse").pyclass
+UpdateUserResponseMsg = LazyPyclass("urn:vim25", "UpdateUserResponse")
 
-CreateGroupRequestMsg = GED("urn:vim25", "CreateGroup").pyclass
+CreateGroupRequestMsg = LazyPyclass("urn:vim25", "CreateGroup")
 
-CreateGroupResponseMsg = GED("urn:vim25", "CreateGroupResponse").pyclass
+CreateGroupResponseMsg = LazyPyclass("urn:vim25", "CreateGroupResponse")
 
-RemoveUserRequestMsg = GED("urn:vim25", "RemoveUser").pyclass
+RemoveUserRequestMsg = LazyPyclass("urn:vim25", "RemoveUser")
 
-RemoveUserResponseMsg = GED("urn:vim25", "RemoveUserResponse").pyclass
+RemoveUserResponseMsg = LazyPyclass("urn:vim25", "RemoveUserResponse")
 
-RemoveGroupRequestMsg = GED("urn:vim25", "RemoveGroup").pyclass
+RemoveGroupRequestMsg = LazyPyclass("urn:vim25", "RemoveGroup")
 
-RemoveGroupResponseMsg = GED("urn:vim25", "RemoveGroupResponse").pyclass
+RemoveGroupResponseMsg = LazyPyclass("urn:vim25", "RemoveGroupResponse")
 
-AssignUserToGroupRequestMsg = GED("urn:vim25", "AssignUserToGroup").pyclass
+AssignUserToGroupRequestMsg = LazyPyclass("urn:vim25", "AssignUserToGroup")
 
-AssignUserToGroupResponseMsg = GED("urn:vim25", "AssignUserToGroupResponse").pyclass
+AssignUserToGroupResponseMsg = LazyPyclass("urn:vim25", "AssignUserToGroupResponse")
 
-UnassignUserFromGroupRequestMsg = GED("urn:vim25", "UnassignUserFromGroup").pyclass
+UnassignUserFromGroupRequestMsg = LazyPyclass("urn:vim25", "UnassignUserFromGroup")
 
-UnassignUserFromGroupResponseMsg = GED("urn:vim25", "UnassignUserFromGroupResponse").pyclass
+UnassignUserFromGroupResponseMsg = LazyPyclass("urn:vim25", "UnassignUserFromGroupResponse")
 
-ReconfigureServiceConsoleReservationRequestMsg = GED("urn:vim25", "ReconfigureServiceConsoleReservation").pyclass
+ReconfigureServiceConsoleReservationRequestMsg = LazyPyclass("urn:vim25", "ReconfigureServiceConsoleReservation")
 
-ReconfigureServiceConsoleReservationResponseMsg = GED("urn:vim25", "ReconfigureServiceConsoleReservationResponse").pyclass
+ReconfigureServiceConsoleReservationResponseMsg = LazyPyclass("urn:vim25", "ReconfigureServiceConsoleReservationResponse")
 
-ReconfigureVirtualMachineReservationRequestMsg = GED("urn:vim25", "ReconfigureVirtualMachineReservation").pyclass
+ReconfigureVirtualMachineReservationRequestMsg = LazyPyclass("urn:vim25", "ReconfigureVirtualMachineReservation")
 
-ReconfigureVirtualMachineReservationResponseMsg = GED("urn:vim25", "ReconfigureVirtualMachineReservationResponse").pyclass
+ReconfigureVirtualMachineReservationResponseMsg = LazyPyclass("urn:vim25", "ReconfigureVirtualMachineReservationResponse")
 
-UpdateNetworkConfigRequestMsg = GED("urn:vim25", "UpdateNetworkConfig").pyclass
+UpdateNetworkConfigRequestMsg = LazyPyclass("urn:vim25", "UpdateNetworkConfig")
 
-UpdateNetworkConfigResponseMsg = GED("urn:vim25", "UpdateNetworkConfigResponse").pyclass
+UpdateNetworkConfigResponseMsg = LazyPyclass("urn:vim25", "UpdateNetworkConfigResponse")
 
-UpdateDnsConfigRequestMsg = GED("urn:vim25", "UpdateDnsConfig").pyclass
+UpdateDnsConfigRequestMsg = LazyPyclass("urn:vim25", "UpdateDnsConfig")
 
-UpdateDnsConfigResponseMsg = GED("urn:vim25", "UpdateDnsConfigResponse").pyclass
+UpdateDnsConfigResponseMsg = LazyPyclass("urn:vim25", "UpdateDnsConfigResponse")
 
-UpdateIpRouteConfigRequestMsg = GED("urn:vim25", "UpdateIpRouteConfig").pyclass
+UpdateIpRouteConfigRequestMsg = LazyPyclass("urn:vim25", "UpdateIpRouteConfig")
 
-UpdateIpRouteConfigResponseMsg = GED("urn:vim25", "UpdateIpRouteConfigResponse").pyclass
+UpdateIpRouteConfigResponseMsg = LazyPyclass("urn:vim25", "UpdateIpRouteConfigResponse")
 
-UpdateConsoleIpRouteConfigRequestMsg = GED("urn:vim25", "UpdateConsoleIpRouteConfig").pyclass
+UpdateConsoleIpRouteConfigRequestMsg = LazyPyclass("urn:vim25", "UpdateConsoleIpRouteConfig")
 
-UpdateConsoleIpRouteConfigResponseMsg = GED("urn:vim25", "UpdateConsoleIpRouteConfigResponse").pyclass
+UpdateConsoleIpRouteConfigResponseMsg = LazyPyclass("urn:vim25", "UpdateConsoleIpRouteConfigResponse")
 
-UpdateIpRouteTableConfigRequestMsg = GED("urn:vim25", "UpdateIpRouteTableConfig").pyclass
+UpdateIpRouteTableConfigRequestMsg = LazyPyclass("urn:vim25", "UpdateIpRouteTableConfig")
 
-UpdateIpRouteTableConfigResponseMsg = GED("urn:vim25", "UpdateIpRouteTableConfigResponse").pyclass
+UpdateIpRouteTableConfigResponseMsg = LazyPyclass("urn:vim25", "UpdateIpRouteTableConfigResponse")
 
-AddVirtualSwitchRequestMsg = GED("urn:vim25", "AddVirtualSwitch").pyclass
+AddVirtualSwitchRequestMsg = LazyPyclass("urn:vim25", "AddVirtualSwitch")
 
-AddVirtualSwitchResponseMsg = GED("urn:vim25", "AddVirtualSwitchResponse").pyclass
+AddVirtualSwitchResponseMsg = LazyPyclass("urn:vim25", "AddVirtualSwitchResponse")
 
-RemoveVirtualSwitchRequestMsg = GED("urn:vim25", "RemoveVirtualSwitch").pyclass
+RemoveVirtualSwitchRequestMsg = LazyPyclass("urn:vim25", "RemoveVirtualSwitch")
 
-RemoveVirtualSwitchResponseMsg = GED("urn:vim25", "RemoveVirtualSwitchResponse").pyclass
+RemoveVirtualSwitchResponseMsg = LazyPyclass("urn:vim25", "RemoveVirtualSwitchResponse")
 
-UpdateVirtualSwitchRequestMsg = GED("urn:vim25", "UpdateVirtualSwitch").pyclass
+UpdateVirtualSwitchRequestMsg = LazyPyclass("urn:vim25", "UpdateVirtualSwitch")
 
-UpdateVirtualSwitchResponseMsg = GED("urn:vim25", "UpdateVirtualSwitchResponse").pyclass
+UpdateVirtualSwitchResponseMsg = LazyPyclass("urn:vim25", "UpdateVirtualSwitchResponse")
 
-AddPortGroupRequestMsg = GED("urn:vim25", "AddPortGroup").pyclass
+AddPortGroupRequestMsg = LazyPyclass("urn:vim25", "AddPortGroup")
 
-AddPortGroupResponseMsg = GED("urn:vim25", "AddPortGroupResponse").pyclass
+AddPortGroupResponseMsg = LazyPyclass("urn:vim25", "AddPortGroupResponse")
 
-RemovePortGroupRequestMsg = GED("urn:vim25", "RemovePortGroup").pyclass
+RemovePortGroupRequestMsg = LazyPyclass("urn:vim25", "RemovePortGroup")
 
-RemovePortGroupResponseMsg = GED("urn:vim25", "RemovePortGroupResponse").pyclass
+RemovePortGroupResponseMsg = LazyPyclass("urn:vim25", "RemovePortGroupResponse")
 
-UpdatePortGroupRequestMsg = GED("urn:vim25", "UpdatePortGroup").pyclass
+UpdatePortGroupRequestMsg = LazyPyclass("urn:vim25", "UpdatePortGroup")
 
-UpdatePortGroupResponseMsg = GED("urn:vim25", "UpdatePortGroupResponse").pyclass
+UpdatePortGroupResponseMsg = LazyPyclass("urn:vim25", "UpdatePortGroupResponse")
 
-UpdatePhysicalNicLinkSpeedRequestMsg = GED("urn:vim25", "UpdatePhysicalNicLinkSpeed").pyclass
+UpdatePhysicalNicLinkSpeedRequestMsg = LazyPyclass("urn:vim25", "UpdatePhysicalNicLinkSpeed")
 
-UpdatePhysicalNicLinkSpeedResponseMsg = GED("urn:vim25", "UpdatePhysicalNicLinkSpeedResponse").pyclass
+UpdatePhysicalNicLinkSpeedResponseMsg = LazyPyclass("urn:vim25", "UpdatePhysicalNicLinkSpeedResponse")
 
-QueryNetworkHintRequestMsg = GED("urn:vim25", "QueryNetworkHint").pyclass
+QueryNetworkHintRequestMsg = LazyPyclass("urn:vim25", "QueryNetworkHint")
 
-QueryNetworkHintResponseMsg = GED("urn:vim25", "QueryNetworkHintResponse").pyclass
+QueryNetworkHintResponseMsg = LazyPyclass("urn:vim25", "QueryNetworkHintResponse")
 
-AddVirtualNicRequestMsg = GED("urn:vim25", "AddVirtualNic").pyclass
+AddVirtualNicRequestMsg = LazyPyclass("urn:vim25", "AddVirtualNic")
 
-AddVirtualNicResponseMsg = GED("urn:vim25", "AddVirtualNicResponse").pyclass
+AddVirtualNicResponseMsg = LazyPyclass("urn:vim25", "AddVirtualNicResponse")
 
-RemoveVirtualNicRequestMsg = GED("urn:vim25", "RemoveVirtualNic").pyclass
+RemoveVirtualNicRequestMsg = LazyPyclass("urn:vim25", "RemoveVirtualNic")
 
-RemoveVirtualNicResponseMsg = GED("urn:vim25", "RemoveVirtualNicResponse").pyclass
+RemoveVirtualNicResponseMsg = LazyPyclass("urn:vim25", "RemoveVirtualNicResponse")
 
-UpdateVirtualNicRequestMsg = GED("urn:vim25", "UpdateVirtualNic").pyclass
+UpdateVirtualNicRequestMsg = LazyPyclass("urn:vim25", "UpdateVirtualNic")
 
-UpdateVirtualNicResponseMsg = GED("urn:vim25", "UpdateVirtualNicResponse").pyclass
+UpdateVirtualNicResponseMsg = LazyPyclass("urn:vim25", "UpdateVirtualNicResponse")
 
-AddServiceConsoleVirtualNicRequestMsg = GED("urn:vim25", "AddServiceConsoleVirtualNic").pyclass
+AddServiceConsoleVirtualNicRequestMsg = LazyPyclass("urn:vim25", "AddServiceConsoleVirtualNic")
 
-AddServiceConsoleVirtualNicResponseMsg = GED("urn:vim25", "AddServiceConsoleVirtualNicResponse").pyclass
+AddServiceConsoleVirtualNicResponseMsg = LazyPyclass("urn:vim25", "AddServiceConsoleVirtualNicResponse")
 
-RemoveServiceConsoleVirtualNicRequestMsg = GED("urn:vim25", "RemoveServiceConsoleVirtualNic").pyclass
+RemoveServiceConsoleVirtualNicRequestMsg = LazyPyclass("urn:vim25", "RemoveServiceConsoleVirtualNic")
 
-RemoveServiceConsoleVirtualNicResponseMsg = GED("urn:vim25", "RemoveServiceConsoleVirtualNicResponse").pyclass
+RemoveServiceConsoleVirtualNicResponseMsg = LazyPyclass("urn:vim25", "RemoveServiceConsoleVirtualNicResponse")
 
-UpdateServiceConsoleVirtualNicRequestMsg = GED("urn:vim25", "UpdateServiceConsoleVirtualNic").pyclass
+UpdateServiceConsoleVirtualNicRequestMsg = LazyPyclass("urn:vim25", "UpdateServiceConsoleVirtualNic")
 
-UpdateServiceConsoleVirtualNicResponseMsg = GED("urn:vim25", "UpdateServiceConsoleVirtualNicResponse").pyclass
+UpdateServiceConsoleVirtualNicResponseMsg = LazyPyclass("urn:vim25", "UpdateServiceConsoleVirtualNicResponse")
 
-RestartServiceConsoleVirtualNicRequestMsg = GED("urn:vim25", "RestartServiceConsoleVirtualNic").pyclass
+RestartServiceConsoleVirtualNicRequestMsg = LazyPyclass("urn:vim25", "RestartServiceConsoleVirtualNic")
 
-RestartServiceConsoleVirtualNicResponseMsg = GED("urn:vim25", "RestartServiceConsoleVirtualNicResponse").pyclass
+RestartServiceConsoleVirtualNicResponseMsg = LazyPyclass("urn:vim25", "RestartServiceConsoleVirtualNicResponse")
 
-RefreshNetworkSystemRequestMsg = GED("urn:vim25", "RefreshNetworkSystem").pyclass
+RefreshNetworkSystemRequestMsg = LazyPyclass("urn:vim25", "RefreshNetworkSystem")
 
-RefreshNetworkSystemResponseMsg = GED("urn:vim25", "RefreshNetworkSystemResponse").pyclass
+RefreshNetworkSystemResponseMsg = LazyPyclass("urn:vim25", "RefreshNetworkSystemResponse")
 
-CheckHostPatch_TaskRequestMsg = GED("urn:vim25", "CheckHostPatch_Task").pyclass
+CheckHostPatch_TaskRequestMsg = LazyPyclass("urn:vim25", "CheckHostPatch_Task")
 
-CheckHostPatch_TaskResponseMsg = GED("urn:vim25", "CheckHostPatch_TaskResponse").pyclass
+CheckHostPatch_TaskResponseMsg = LazyPyclass("urn:vim25", "CheckHostPatch_TaskResponse")
 
-ScanHostPatch_TaskRequestMsg = GED("urn:vim25", "ScanHostPatch_Task").pyclass
+ScanHostPatch_TaskRequestMsg = LazyPyclass("urn:vim25", "ScanHostPatch_Task")
 
-ScanHostPatch_TaskResponseMsg = GED("urn:vim25", "ScanHostPatch_TaskResponse").pyclass
+ScanHostPatch_TaskResponseMsg = LazyPyclass("urn:vim25", "ScanHostPatch_TaskResponse")
 
-ScanHostPatchV2_TaskRequestMsg = GED("urn:vim25", "ScanHostPatchV2_Task").pyclass
+ScanHostPatchV2_TaskRequestMsg = LazyPyclass("urn:vim25", "ScanHostPatchV2_Task")
 
-ScanHostPatchV2_TaskResponseMsg = GED("urn:vim25", "ScanHostPatchV2_TaskResponse").pyclass
+ScanHostPatchV2_TaskResponseMsg = LazyPyclass("urn:vim25", "ScanHostPatchV2_TaskResponse")
 
-StageHostPatch_TaskRequestMsg = GED("urn:vim25", "StageHostPatch_Task").pyclass
+StageHostPatch_TaskRequestMsg = LazyPyclass("urn:vim25", "StageHostPatch_Task")
 
-StageHostPatch_TaskResponseMsg = GED("urn:vim25", "StageHostPatch_TaskResponse").pyclass
+StageHostPatch_TaskResponseMsg = LazyPyclass("urn:vim25", "StageHostPatch_TaskResponse")
 
-InstallHostPatch_TaskRequestMsg = GED("urn:vim25", "InstallHostPatch_Task").pyclass
+InstallHostPatch_TaskRequestMsg = LazyPyclass("urn:vim25", "InstallHostPatch_Task")
 
-InstallHostPatch_TaskResponseMsg = GED("urn:vim25", "InstallHostPatch_TaskResponse").pyclass
+InstallHostPatch_TaskResponseMsg = LazyPyclass("urn:vim25", "InstallHostPatch_TaskResponse")
 
-InstallHostPatchV2_TaskRequestMsg = GED("urn:vim25", "InstallHostPatchV2_Task").pyclass
+InstallHostPatchV2_TaskRequestMsg = LazyPyclass("urn:vim25", "InstallHostPatchV2_Task")
 
-InstallHostPatchV2_TaskResponseMsg = GED("urn:vim25", "InstallHostPatchV2_TaskResponse").pyclass
+InstallHostPatchV2_TaskResponseMsg = LazyPyclass("urn:vim25", "InstallHostPatchV2_TaskResponse")
 
-UninstallHostPatch_TaskRequestMsg = GED("urn:vim25", "UninstallHostPatch_Task").pyclass
+UninstallHostPatch_TaskRequestMsg = LazyPyclass("urn:vim25", "UninstallHostPatch_Task")
 
-UninstallHostPatch_TaskResponseMsg = GED("urn:vim25", "UninstallHostPatch_TaskResponse").pyclass
+UninstallHostPatch_TaskResponseMsg = LazyPyclass("urn:vim25", "UninstallHostPatch_TaskResponse")
 
-QueryHostPatch_TaskRequestMsg = GED("urn:vim25", "QueryHostPatch_Task").pyclass
+QueryHostPatch_TaskRequestMsg = LazyPyclass("urn:vim25", "QueryHostPatch_Task")
 
-QueryHostPatch_TaskResponseMsg = GED("urn:vim25", "QueryHostPatch_TaskResponse").pyclass
+QueryHostPatch_TaskResponseMsg = LazyPyclass("urn:vim25", "QueryHostPatch_TaskResponse")
 
-RefreshRequestMsg = GED("urn:vim25", "Refresh").pyclass
+RefreshRequestMsg = LazyPyclass("urn:vim25", "Refresh")
 
-RefreshResponseMsg = GED("urn:vim25", "RefreshResponse").pyclass
+RefreshResponseMsg = LazyPyclass("urn:vim25", "RefreshResponse")
 
-UpdatePassthruConfigRequestMsg = GED("urn:vim25", "UpdatePassthruConfig").pyclass
+UpdatePassthruConfigRequestMsg = LazyPyclass("urn:vim25", "UpdatePassthruConfig")
 
-UpdatePassthruConfigResponseMsg = GED("urn:vim25", "UpdatePassthruConfigResponse").pyclass
+UpdatePassthruConfigResponseMsg = LazyPyclass("urn:vim25", "UpdatePassthruConfigResponse")
 
-ConfigurePowerPolicyRequestMsg = GED("urn:vim25", "ConfigurePowerPolicy").pyclass
+ConfigurePowerPolicyRequestMsg = LazyPyclass("urn:vim25", "ConfigurePowerPolicy")
 
-ConfigurePowerPolicyResponseMsg = GED("urn:vim25", "ConfigurePowerPolicyResponse").pyclass
+ConfigurePowerPolicyResponseMsg = LazyPyclass("urn:vim25", "ConfigurePowerPolicyResponse")
 
-UpdateServicePolicyRequestMsg = GED("urn:vim25", "UpdateServicePolicy").pyclass
+UpdateServicePolicyRequestMsg = LazyPyclass("urn:vim25", "UpdateServicePolicy")
 
-UpdateServicePolicyResponseMsg = GED("urn:vim25", "UpdateServicePolicyResponse").pyclass
+UpdateServicePolicyResponseMsg = LazyPyclass("urn:vim25", "UpdateServicePolicyResponse")
 
-StartServiceRequestMsg = GED("urn:vim25", "StartService").pyclass
+StartServiceRequestMsg = LazyPyclass("urn:vim25", "StartService")
 
-StartServiceResponseMsg = GED("urn:vim25", "StartServiceResponse").pyclass
+StartServiceResponseMsg = LazyPyclass("urn:vim25", "StartServiceResponse")
 
-StopServiceRequestMsg = GED("urn:vim25", "StopService").pyclass
+StopServiceRequestMsg = LazyPyclass("urn:vim25", "StopService")
 
-StopServiceResponseMsg = GED("urn:vim25", "StopServiceResponse").pyclass
+StopServiceResponseMsg = LazyPyclass("urn:vim25", "StopServiceResponse")
 
-RestartServiceRequestMsg = GED("urn:vim25", "RestartService").pyclass
+RestartServiceRequestMsg = LazyPyclass("urn:vim25", "RestartService")
 
-RestartServiceResponseMsg = GED("urn:vim25", "RestartServiceResponse").pyclass
+RestartServiceResponseMsg = LazyPyclass("urn:vim25", "RestartServiceResponse")
 
-UninstallServiceRequestMsg = GED("urn:vim25", "UninstallService").pyclass
+UninstallServiceRequestMsg = LazyPyclass("urn:vim25", "UninstallService")
 
-UninstallServiceResponseMsg = GED("urn:vim25", "UninstallServiceResponse").pyclass
+UninstallServiceResponseMsg = LazyPyclass("urn:vim25", "UninstallServiceResponse")
 
-RefreshServicesRequestMsg = GED("urn:vim25", "RefreshServices").pyclass
+RefreshServicesRequestMsg = LazyPyclass("urn:vim25", "RefreshServices")
 
-RefreshServicesResponseMsg = GED("urn:vim25", "RefreshServicesResponse").pyclass
+RefreshServicesResponseMsg = LazyPyclass("urn:vim25", "RefreshServicesResponse")
 
-ReconfigureSnmpAgentRequestMsg = GED("urn:vim25", "ReconfigureSnmpAgent").pyclass
+ReconfigureSnmpAgentRequestMsg = LazyPyclass("urn:vim25", "ReconfigureSnmpAgent")
 
-ReconfigureSnmpAgentResponseMsg = GED("urn:vim25", "ReconfigureSnmpAgentResponse").pyclass
+ReconfigureSnmpAgentResponseMsg = LazyPyclass("urn:vim25", "ReconfigureSnmpAgentResponse")
 
-SendTestNotificationRequestMsg = GED("urn:vim25", "SendTestNotification").pyclass
+SendTestNotificationRequestMsg = LazyPyclass("urn:vim25", "SendTestNotification")
 
-SendTestNotificationResponseMsg = GED("urn:vim25", "SendTestNotificationResponse").pyclass
+SendTestNotificationResponseMsg = LazyPyclass("urn:vim25", "SendTestNotificationResponse")
 
-RetrieveDiskPartitionInfoRequestMsg = GED("urn:vim25", "RetrieveDiskPartitionInfo").pyclass
+RetrieveDiskPartitionInfoRequestMsg = LazyPyclass("urn:vim25", "RetrieveDiskPartitionInfo")
 
-RetrieveDiskPartitionInfoResponseMsg = GED("urn:vim25", "RetrieveDiskPartitionInfoResponse").pyclass
+RetrieveDiskPartitionInfoResponseMsg = LazyPyclass("urn:vim25", "RetrieveDiskPartitionInfoResponse")
 
-ComputeDiskPartitionInfoRequestMsg = GED("urn:vim25", "ComputeDiskPartitionInfo").pyclass
+ComputeDiskPartitionInfoRequestMsg = LazyPyclass("urn:vim25", "ComputeDiskPartitionInfo")
 
-ComputeDiskPartitionInfoResponseMsg = GED("urn:vim25", "ComputeDiskPartitionInfoResponse").pyclass
+ComputeDiskPartitionInfoResponseMsg = LazyPyclass("urn:vim25", "ComputeDiskPartitionInfoResponse")
 
-ComputeDiskPartitionInfoForResizeRequestMsg = GED("urn:vim25", "ComputeDiskPartitionInfoForResize").pyclass
+ComputeDiskPartitionInfoForResizeRequestMsg = LazyPyclass("urn:vim25", "ComputeDiskPartitionInfoForResize")
 
-ComputeDiskPartitionInfoForResizeResponseMsg = GED("urn:vim25", "ComputeDiskPartitionInfoForResizeResponse").pyclass
+ComputeDiskPartitionInfoForResizeResponseMsg = LazyPyclass("urn:vim25", "ComputeDiskPartitionInfoForResizeResponse")
 
-UpdateDiskPartitionsRequestMsg = GED("urn:vim25", "UpdateDiskPartitions").pyclass
+UpdateDiskPartitionsRequestMsg = LazyPyclass("urn:vim25", "UpdateDiskPartitions")
 
-UpdateDiskPartitionsResponseMsg = GED("urn:vim25", "UpdateDiskPartitionsResponse").pyclass
+UpdateDiskPartitionsResponseMsg = LazyPyclass("urn:vim25", "UpdateDiskPartitionsResponse")
 
-FormatVmfsRequestMsg = GED("urn:vim25", "FormatVmfs").pyclass
+FormatVmfsRequestMsg = LazyPyclass("urn:vim25", "FormatVmfs")
 
-FormatVmfsResponseMsg = GED("urn:vim25", "FormatVmfsResponse").pyclass
+FormatVmfsResponseMsg = LazyPyclass("urn:vim25", "FormatVmfsResponse")
 
-MountVmfsVolumeRequestMsg = GED("urn:vim25", "MountVmfsVolume").pyclass
+MountVmfsVolumeRequestMsg = LazyPyclass("urn:vim25", "MountVmfsVolume")
 
-MountVmfsVolumeResponseMsg = GED("urn:vim25", "MountVmfsVolumeResponse").pyclass
+MountVmfsVolumeResponseMsg = LazyPyclass("urn:vim25", "MountVmfsVolumeResponse")
 
-UnmountVmfsVolumeRequestMsg = GED("urn:vim25", "UnmountVmfsVolume").pyclass
+UnmountVmfsVolumeRequestMsg = LazyPyclass("urn:vim25", "UnmountVmfsVolume")
 
-UnmountVmfsVolumeResponseMsg = GED("urn:vim25", "UnmountVmfsVolumeResponse").pyclass
+UnmountVmfsVolumeResponseMsg = LazyPyclass("urn:vim25", "UnmountVmfsVolumeResponse")
 
-DeleteVmfsVolumeStateRequestMsg = GED("urn:vim25", "DeleteVmfsVolumeState").pyclass
+DeleteVmfsVolumeStateRequestMsg = LazyPyclass("urn:vim25", "DeleteVmfsVolumeState")
 
-DeleteVmfsVolumeStateResponseMsg = GED("urn:vim25", "DeleteVmfsVolumeStateResponse").pyclass
+DeleteVmfsVolumeStateResponseMsg = LazyPyclass("urn:vim25", "DeleteVmfsVolumeStateResponse")
 
-RescanVmfsRequestMsg = GED("urn:vim25", "RescanVmfs").pyclass
+RescanVmfsRequestMsg = LazyPyclass("urn:vim25", "RescanVmfs")
 
-RescanVmfsResponseMsg = GED("urn:vim25", "RescanVmfsResponse").pyclass
+RescanVmfsResponseMsg = LazyPyclass("urn:vim25", "RescanVmfsResponse")
 
-AttachVmfsExtentRequestMsg = GED("urn:vim25", "AttachVmfsExtent").pyclass
+AttachVmfsExtentRequestMsg = LazyPyclass("urn:vim25", "AttachVmfsExtent")
 
-AttachVmfsExtentResponseMsg = GED("urn:vim25", "AttachVmfsExtentResponse").pyclass
+AttachVmfsExtentResponseMsg = LazyPyclass("urn:vim25", "AttachVmfsExtentResponse")
 
-ExpandVmfsExtentRequestMsg = GED("urn:vim25", "ExpandVmfsExtent").pyclass
+ExpandVmfsExtentRequestMsg = LazyPyclass("urn:vim25", "ExpandVmfsExtent")
 
-ExpandVmfsExtentResponseMsg = GED("urn:vim25", "ExpandVmfsExtentResponse").pyclass
+ExpandVmfsExtentResponseMsg = LazyPyclass("urn:vim25", "ExpandVmfsExtentResponse")
 
-UpgradeVmfsRequestMsg = GED("urn:vim25", "UpgradeVmfs").pyclass
+UpgradeVmfsRequestMsg = LazyPyclass("urn:vim25", "UpgradeVmfs")
 
-UpgradeVmfsResponseMsg = GED("urn:vim25", "UpgradeVmfsResponse").pyclass
+UpgradeVmfsResponseMsg = LazyPyclass("urn:vim25", "UpgradeVmfsResponse")
 
-UpgradeVmLayoutRequestMsg = GED("urn:vim25", "UpgradeVmLayout").pyclass
+UpgradeVmLayoutRequestMsg = LazyPyclass("urn:vim25", "UpgradeVmLayout")
 
-UpgradeVmLayoutResponseMsg = GED("urn:vim25", "UpgradeVmLayoutResponse").pyclass
+UpgradeVmLayoutResponseMsg = LazyPyclass("urn:vim25", "UpgradeVmLayoutResponse")
 
-QueryUnresolvedVmfsVolumeRequestMsg = GED("urn:vim25", "QueryUnresolvedVmfsVolume").pyclass
+QueryUnresolvedVmfsVolumeRequestMsg = LazyPyclass("urn:vim25", "QueryUnresolvedVmfsVolume")
 
-QueryUnresolvedVmfsVolumeResponseMsg = GED("urn:vim25", "QueryUnresolvedVmfsVolumeResponse").pyclass
+QueryUnresolvedVmfsVolumeResponseMsg = LazyPyclass("urn:vim25", "QueryUnresolvedVmfsVolumeResponse")
 
-ResolveMultipleUnresolvedVmfsVolumesRequestMsg = GED("urn:vim25", "ResolveMultipleUnresolvedVmfsVolumes").pyclass
+ResolveMultipleUnresolvedVmfsVolumesRequestMsg = LazyPyclass("urn:vim25", "ResolveMultipleUnresolvedVmfsVolumes")
 
-ResolveMultipleUnresolvedVmfsVolumesResponseMsg = GED("urn:vim25", "ResolveMultipleUnresolvedVmfsVolumesResponse").pyclass
+ResolveMultipleUnresolvedVmfsVolumesResponseMsg = LazyPyclass("urn:vim25", "ResolveMultipleUnresolvedVmfsVolumesResponse")
 
-UnmountForceMountedVmfsVolumeRequestMsg = GED("urn:vim25", "UnmountForceMountedVmfsVolume").pyclass
+UnmountForceMountedVmfsVolumeRequestMsg = LazyPyclass("urn:vim25", "UnmountForceMountedVmfsVolume")
 
-UnmountForceMountedVmfsVolumeResponseMsg = GED("urn:vim25", "UnmountForceMountedVmfsVolumeResponse").pyclass
+UnmountForceMountedVmfsVolumeResponseMsg = LazyPyclass("urn:vim25", "UnmountForceMountedVmfsVolumeResponse")
 
-RescanHbaRequestMsg = GED("urn:vim25", "RescanHba").pyclass
+RescanHbaRequestMsg = LazyPyclass("urn:vim25", "RescanHba")
 
-RescanHbaResponseMsg = GED("urn:vim25", "RescanHbaResponse").pyclass
+RescanHbaResponseMsg = LazyPyclass("urn:vim25", "RescanHbaResponse")
 
-RescanAllHbaRequestMsg = GED("urn:vim25", "RescanAllHba").pyclass
+RescanAllHbaRequestMsg = LazyPyclass("urn:vim25", "RescanAllHba")
 
-RescanAllHbaResponseMsg = GED("urn:vim25", "RescanAllHbaResponse").pyclass
+RescanAllHbaResponseMsg = LazyPyclass("urn:vim25", "RescanAllHbaResponse")
 
-UpdateSoftwareInternetScsiEnabledRequestMsg = GED("urn:vim25", "UpdateSoftwareInternetScsiEnabled").pyclass
+UpdateSoftwareInternetScsiEnabledRequestMsg = LazyPyclass("urn:vim25", "UpdateSoftwareInternetScsiEnabled")
 
-UpdateSoftwareInternetScsiEnabledResponseMsg = GED("urn:vim25", "UpdateSoftwareInternetScsiEnabledResponse").pyclass
+UpdateSoftwareInternetScsiEnabledResponseMsg = LazyPyclass("urn:vim25", "UpdateSoftwareInternetScsiEnabledResponse")
 
-UpdateInternetScsiDiscoveryPropertiesRequestMsg = GED("urn:vim25", "UpdateInternetScsiDiscoveryProperties").pyclass
+UpdateInternetScsiDiscoveryPropertiesRequestMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiDiscoveryProperties")
 
-UpdateInternetScsiDiscoveryPropertiesResponseMsg = GED("urn:vim25", "UpdateInternetScsiDiscoveryPropertiesResponse").pyclass
+UpdateInternetScsiDiscoveryPropertiesResponseMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiDiscoveryPropertiesResponse")
 
-UpdateInternetScsiAuthenticationPropertiesRequestMsg = GED("urn:vim25", "UpdateInternetScsiAuthenticationProperties").pyclass
+UpdateInternetScsiAuthenticationPropertiesRequestMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiAuthenticationProperties")
 
-UpdateInternetScsiAuthenticationPropertiesResponseMsg = GED("urn:vim25", "UpdateInternetScsiAuthenticationPropertiesResponse").pyclass
+UpdateInternetScsiAuthenticationPropertiesResponseMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiAuthenticationPropertiesResponse")
 
-UpdateInternetScsiDigestPropertiesRequestMsg = GED("urn:vim25", "UpdateInternetScsiDigestProperties").pyclass
+UpdateInternetScsiDigestPropertiesRequestMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiDigestProperties")
 
-UpdateInternetScsiDigestPropertiesResponseMsg = GED("urn:vim25", "UpdateInternetScsiDigestPropertiesResponse").pyclass
+UpdateInternetScsiDigestPropertiesResponseMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiDigestPropertiesResponse")
 
-UpdateInternetScsiAdvancedOptionsRequestMsg = GED("urn:vim25", "UpdateInternetScsiAdvancedOptions").pyclass
+UpdateInternetScsiAdvancedOptionsRequestMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiAdvancedOptions")
 
-UpdateInternetScsiAdvancedOptionsResponseMsg = GED("urn:vim25", "UpdateInternetScsiAdvancedOptionsResponse").pyclass
+UpdateInternetScsiAdvancedOptionsResponseMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiAdvancedOptionsResponse")
 
-UpdateInternetScsiIPPropertiesRequestMsg = GED("urn:vim25", "UpdateInternetScsiIPProperties").pyclass
+UpdateInternetScsiIPPropertiesRequestMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiIPProperties")
 
-UpdateInternetScsiIPPropertiesResponseMsg = GED("urn:vim25", "UpdateInternetScsiIPPropertiesResponse").pyclass
+UpdateInternetScsiIPPropertiesResponseMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiIPPropertiesResponse")
 
-UpdateInternetScsiNameRequestMsg = GED("urn:vim25", "UpdateInternetScsiName").pyclass
+UpdateInternetScsiNameRequestMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiName")
 
-UpdateInternetScsiNameResponseMsg = GED("urn:vim25", "UpdateInternetScsiNameResponse").pyclass
+UpdateInternetScsiNameResponseMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiNameResponse")
 
-UpdateInternetScsiAliasRequestMsg = GED("urn:vim25", "UpdateInternetScsiAlias").pyclass
+UpdateInternetScsiAliasRequestMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiAlias")
 
-UpdateInternetScsiAliasResponseMsg = GED("urn:vim25", "UpdateInternetScsiAliasResponse").pyclass
+UpdateInternetScsiAliasResponseMsg = LazyPyclass("urn:vim25", "UpdateInternetScsiAliasResponse")
 
-AddInternetScsiSendTargetsRequestMsg = GED("urn:vim25", "AddInternetScsiSendTargets").pyclass
+AddInternetScsiSendTargetsRequestMsg = LazyPyclass("urn:vim25", "AddInternetScsiSendTargets")
 
-AddInternetScsiSendTargetsResponseMsg = GED("urn:vim25", "AddInternetScsiSendTargetsResponse").pyclass
+AddInternetScsiSendTargetsResponseMsg = LazyPyclass("urn:vim25", "AddInternetScsiSendTargetsResponse")
 
-RemoveInternetScsiSendTargetsRequestMsg = GED("urn:vim25", "RemoveInternetScsiSendTargets").pyclass
+RemoveInternetScsiSendTargetsRequestMsg = LazyPyclass("urn:vim25", "RemoveInternetScsiSendTargets")
 
-RemoveInternetScsiSendTargetsResponseMsg = GED("urn:vim25", "RemoveInternetScsiSendTargetsResponse").pyclass
+RemoveInternetScsiSendTargetsResponseMsg = LazyPyclass("urn:vim25", "RemoveInternetScsiSendTargetsResponse")
 
-AddInternetScsiStaticTargetsRequestMsg = GED("urn:vim25", "AddInternetScsiStaticTargets").pyclass
+AddInternetScsiStaticTargetsRequestMsg = LazyPyclass("urn:vim25", "AddInternetScsiStaticTargets")
 
-AddInternetScsiStaticTargetsResponseMsg = GED("urn:vim25", "AddInternetScsiStaticTargetsResponse").pyclass
+AddInternetScsiStaticTargetsResponseMsg = LazyPyclass("urn:vim25", "AddInternetScsiStaticTargetsResponse")
 
-RemoveInternetScsiStaticTargetsRequestMsg = GED("urn:vim25", "RemoveInternetScsiStaticTargets").pyclass
+RemoveInternetScsiStaticTargetsRequestMsg = LazyPyclass("urn:vim25", "RemoveInternetScsiStaticTargets")
 
-RemoveInternetScsiStaticTargetsResponseMsg = GED("urn:vim25", "RemoveInternetScsiStaticTargetsResponse").pyclass
+RemoveInternetScsiStaticTargetsResponseMsg = LazyPyclass("urn:vim25", "RemoveInternetScsiStaticTargetsResponse")
 
-EnableMultipathPathRequestMsg = GED("urn:vim25", "EnableMultipathPath").pyclass
+EnableMultipathPathRequestMsg = LazyPyclass("urn:vim25", "EnableMultipathPath")
 
-EnableMultipathPathResponseMsg = GED("urn:vim25", "EnableMultipathPathResponse").pyclass
+EnableMultipathPathResponseMsg = LazyPyclass("urn:vim25", "EnableMultipathPathResponse")
 
-DisableMultipathPathRequestMsg = GED("urn:vim25", "DisableMultipathPath").pyclass
+DisableMultipathPathRequestMsg = LazyPyclass("urn:vim25", "DisableMultipathPath")
 
-DisableMultipathPathResponseMsg = GED("urn:vim25", "DisableMultipathPathResponse").pyclass
+DisableMultipathPathResponseMsg = LazyPyclass("urn:vim25", "DisableMultipathPathResponse")
 
-SetMultipathLunPolicyRequestMsg = GED("urn:vim25", "SetMultipathLunPolicy").pyclass
+SetMultipathLunPolicyRequestMsg = LazyPyclass("urn:vim25", "SetMultipathLunPolicy")
 
-SetMultipathLunPolicyResponseMsg = GED("urn:vim25", "SetMultipathLunPolicyResponse").pyclass
+SetMultipathLunPolicyResponseMsg = LazyPyclass("urn:vim25", "SetMultipathLunPolicyResponse")
 
-QueryPathSelectionPolicyOptionsRequestMsg = GED("urn:vim25", "QueryPathSelectionPolicyOptions").pyclass
+QueryPathSelectionPolicyOptionsRequestMsg = LazyPyclass("urn:vim25", "QueryPathSelectionPolicyOptions")
 
-QueryPathSelectionPolicyOptionsResponseMsg = GED("urn:vim25", "QueryPathSelectionPolicyOptionsResponse").pyclass
+QueryPathSelectionPolicyOptionsResponseMsg = LazyPyclass("urn:vim25", "QueryPathSelectionPolicyOptionsResponse")
 
-QueryStorageArrayTypePolicyOptionsRequestMsg = GED("urn:vim25", "QueryStorageArrayTypePolicyOptions").pyclass
+QueryStorageArrayTypePolicyOptionsRequestMsg = LazyPyclass("urn:vim25", "QueryStorageArrayTypePolicyOptions")
 
-QueryStorageArrayTypePolicyOptionsResponseMsg = GED("urn:vim25", "QueryStorageArrayTypePolicyOptionsResponse").pyclass
+QueryStorageArrayTypePolicyOptionsResponseMsg = LazyPyclass("urn:vim25", "QueryStorageArrayTypePolicyOptionsResponse")
 
-UpdateScsiLunDisplayNameRequestMsg = GED("urn:vim25", "UpdateScsiLunDisplayName").pyclass
+UpdateScsiLunDisplayNameRequestMsg = LazyPyclass("urn:vim25", "UpdateScsiLunDisplayName")
 
-UpdateScsiLunDisplayNameResponseMsg = GED("urn:vim25", "UpdateScsiLunDisplayNameResponse").pyclass
+UpdateScsiLunDisplayNameResponseMsg = LazyPyclass("urn:vim25", "UpdateScsiLunDisplayNameResponse")
 
-DetachScsiLunRequestMsg = GED("urn:vim25", "DetachScsiLun").pyclass
+DetachScsiLunRequestMsg = LazyPyclass("urn:vim25", "DetachScsiLun")
 
-DetachScsiLunResponseMsg = GED("urn:vim25", "DetachScsiLunResponse").pyclass
+DetachScsiLunResponseMsg = LazyPyclass("urn:vim25", "DetachScsiLunResponse")
 
-DeleteScsiLunStateRequestMsg = GED("urn:vim25", "DeleteScsiLunState").pyclass
+DeleteScsiLunStateRequestMsg = LazyPyclass("urn:vim25", "DeleteScsiLunState")
 
-DeleteScsiLunStateResponseMsg = GED("urn:vim25", "DeleteScsiLunStateResponse").pyclass
+DeleteScsiLunStateResponseMsg = LazyPyclass("urn:vim25", "DeleteScsiLunStateResponse")
 
-AttachScsiLunRequestMsg = GED("urn:vim25", "AttachScsiLun").pyclass
+AttachScsiLunRequestMsg = LazyPyclass("urn:vim25", "AttachScsiLun")
 
-AttachScsiLunResponseMsg = GED("urn:vim25", "AttachScsiLunResponse").pyclass
+AttachScsiLunResponseMsg = LazyPyclass("urn:vim25", "AttachScsiLunResponse")
 
-RefreshStorageSystemRequestMsg = GED("urn:vim25", "RefreshStorageSystem").pyclass
+RefreshStorageSystemRequestMsg = LazyPyclass("urn:vim25", "RefreshStorageSystem")
 
-RefreshStorageSystemResponseMsg = GED("urn:vim25", "RefreshStorageSystemResponse").pyclass
+RefreshStorageSystemResponseMsg = LazyPyclass("urn:vim25", "RefreshStorageSystemResponse")
 
-DiscoverFcoeHbasRequestMsg = GED("urn:vim25", "DiscoverFcoeHbas").pyclass
+DiscoverFcoeHbasRequestMsg = LazyPyclass("urn:vim25", "DiscoverFcoeHbas")
 
-DiscoverFcoeHbasResponseMsg = GED("urn:vim25", "DiscoverFcoeHbasResponse").pyclass
+DiscoverFcoeHbasResponseMsg = LazyPyclass("urn:vim25", "DiscoverFcoeHbasResponse")
 
-MarkForRemovalRequestMsg = GED("urn:vim25", "MarkForRemoval").pyclass
+MarkForRemovalRequestMsg = LazyPyclass("urn:vim25", "MarkForRemoval")
 
-MarkForRemovalResponseMsg = GED("urn:vim25", "MarkForRemovalResponse").pyclass
+MarkForRemovalResponseMsg = LazyPyclass("urn:vim25", "MarkForRemovalResponse")
 
-UpdateIpConfigRequestMsg = GED("urn:vim25", "UpdateIpConfig").pyclass
+UpdateIpConfigRequestMsg = LazyPyclass("urn:vim25", "UpdateIpConfig")
 
-UpdateIpConfigResponseMsg = GED("urn:vim25", "UpdateIpConfigResponse").pyclass
+UpdateIpConfigResponseMsg = LazyPyclass("urn:vim25", "UpdateIpConfigResponse")
 
-SelectVnicRequestMsg = GED("urn:vim25", "SelectVnic").pyclass
+SelectVnicRequestMsg = LazyPyclass("urn:vim25", "SelectVnic")
 
-SelectVnicResponseMsg = GED("urn:vim25", "SelectVnicResponse").pyclass
+SelectVnicResponseMsg = LazyPyclass("urn:vim25", "SelectVnicResponse")
 
-DeselectVnicRequestMsg = GED("urn:vim25", "DeselectVnic").pyclass
+DeselectVnicRequestMsg = LazyPyclass("urn:vim25", "DeselectVnic")
 
-DeselectVnicResponseMsg = GED("urn:vim25", "DeselectVnicResponse").pyclass
+DeselectVnicResponseMsg = LazyPyclass("urn:vim25", "DeselectVnicResponse")
 
-QueryNetConfigRequestMsg = GED("urn:vim25", "QueryNetConfig").pyclass
+QueryNetConfigRequestMsg = LazyPyclass("urn:vim25", "QueryNetConfig")
 
-QueryNetConfigResponseMsg = GED("urn:vim25", "QueryNetConfigResponse").pyclass
+QueryNetConfigResponseMsg = LazyPyclass("urn:vim25", "QueryNetConfigResponse")
 
-SelectVnicForNicTypeRequestMsg = GED("urn:vim25", "SelectVnicForNicType").pyclass
+SelectVnicForNicTypeRequestMsg = LazyPyclass("urn:vim25", "SelectVnicForNicType")
 
-SelectVnicForNicTypeResponseMsg = GED("urn:vim25", "SelectVnicForNicTypeResponse").pyclass
+SelectVnicForNicTypeResponseMsg = LazyPyclass("urn:vim25", "SelectVnicForNicTypeResponse")
 
-DeselectVnicForNicTypeRequestMsg = GED("urn:vim25", "DeselectVnicForNicType").pyclass
+DeselectVnicForNicTypeRequestMsg = LazyPyclass("urn:vim25", "DeselectVnicForNicType")
 
-DeselectVnicForNicTypeResponseMsg = GED("urn:vim25", "DeselectVnicForNicTypeResponse").pyclass
+DeselectVnicForNicTypeResponseMsg = LazyPyclass("urn:vim25", "DeselectVnicForNicTypeResponse")
 
-QueryOptionsRequestMsg = GED("urn:vim25", "QueryOptions").pyclass
+QueryOptionsRequestMsg = LazyPyclass("urn:vim25", "QueryOptions")
 
-QueryOptionsResponseMsg = GED("urn:vim25", "QueryOptionsResponse").pyclass
+QueryOptionsResponseMsg = LazyPyclass("urn:vim25", "QueryOptionsResponse")
 
-UpdateOptionsRequestMsg = GED("urn:vim25", "UpdateOptions").pyclass
+UpdateOptionsRequestMsg = LazyPyclass("urn:vim25", "UpdateOptions")
 
-UpdateOptionsResponseMsg = GED("urn:vim25", "UpdateOptionsResponse").pyclass
+UpdateOptionsResponseMsg = LazyPyclass("urn:vim25", "UpdateOptionsResponse")
 
-CheckCompliance_TaskRequestMsg = GED("urn:vim25", "CheckCompliance_Task").pyclass
+CheckCompliance_TaskRequestMsg = LazyPyclass("urn:vim25", "CheckCompliance_Task")
 
-CheckCompliance_TaskResponseMsg = GED("urn:vim25", "CheckCompliance_TaskResponse").pyclass
+CheckCompliance_TaskResponseMsg = LazyPyclass("urn:vim25", "CheckCompliance_TaskResponse")
 
-QueryComplianceStatusRequestMsg = GED("urn:vim25", "QueryComplianceStatus").pyclass
+QueryComplianceStatusRequestMsg = LazyPyclass("urn:vim25", "QueryComplianceStatus")
 
-QueryComplianceStatusResponseMsg = GED("urn:vim25", "QueryComplianceStatusResponse").pyclass
+QueryComplianceStatusResponseMsg = LazyPyclass("urn:vim25", "QueryComplianceStatusResponse")
 
-ClearComplianceStatusRequestMsg = GED("urn:vim25", "ClearComplianceStatus").pyclass
+ClearComplianceStatusRequestMsg = LazyPyclass("urn:vim25", "ClearComplianceStatus")
 
-ClearComplianceStatusResponseMsg = GED("urn:vim25", "ClearComplianceStatusResponse").pyclass
+ClearComplianceStatusResponseMsg = LazyPyclass("urn:vim25", "ClearComplianceStatusResponse")
 
-QueryExpressionMetadataRequestMsg = GED("urn:vim25", "QueryExpressionMetadata").pyclass
+QueryExpressionMetadataRequestMsg = LazyPyclass("urn:vim25", "QueryExpressionMetadata")
 
-QueryExpressionMetadataResponseMsg = GED("urn:vim25", "QueryExpressionMetadataResponse").pyclass
+QueryExpressionMetadataResponseMsg = LazyPyclass("urn:vim25", "QueryExpressionMetadataResponse")
 
-RetrieveDescriptionRequestMsg = GED("urn:vim25", "RetrieveDescription").pyclass
+RetrieveDescriptionRequestMsg = LazyPyclass("urn:vim25", "RetrieveDescription")
 
-RetrieveDescriptionResponseMsg = GED("urn:vim25", "RetrieveDescriptionResponse").pyclass
+RetrieveDescriptionResponseMsg = LazyPyclass("urn:vim25", "RetrieveDescriptionResponse")
 
-DestroyProfileRequestMsg = GED("urn:vim25", "DestroyProfile").pyclass
+DestroyProfileRequestMsg = LazyPyclass("urn:vim25", "DestroyProfile")
 
-DestroyProfileResponseMsg = GED("urn:vim25", "DestroyProfileResponse").pyclass
+DestroyProfileResponseMsg = LazyPyclass("urn:vim25", "DestroyProfileResponse")
 
-AssociateProfileRequestMsg = GED("urn:vim25", "AssociateProfile").pyclass
+AssociateProfileRequestMsg = LazyPyclass("urn:vim25", "AssociateProfile")
 
-AssociateProfileResponseMsg = GED("urn:vim25", "AssociateProfileResponse").pyclass
+AssociateProfileResponseMsg = LazyPyclass("urn:vim25", "AssociateProfileResponse")
 
-DissociateProfileRequestMsg = GED("urn:vim25", "DissociateProfile").pyclass
+DissociateProfileRequestMsg = LazyPyclass("urn:vim25", "DissociateProfile")
 
-DissociateProfileResponseMsg = GED("urn:vim25", "DissociateProfileResponse").pyclass
+DissociateProfileResponseMsg = LazyPyclass("urn:vim25", "DissociateProfileResponse")
 
-CheckProfileCompliance_TaskRequestMsg = GED("urn:vim25", "CheckProfileCompliance_Task").pyclass
+CheckProfileCompliance_TaskRequestMsg = LazyPyclass("urn:vim25", "CheckProfileCompliance_Task")
 
-CheckProfileCompliance_TaskResponseMsg = GED("urn:vim25", "CheckProfileCompliance_TaskResponse").pyclass
+CheckProfileCompliance_TaskResponseMsg = LazyPyclass("urn:vim25", "CheckProfileCompliance_TaskResponse")
 
-ExportProfileRequestMsg = GED("urn:vim25", "ExportProfile").pyclass
+ExportProfileRequestMsg = LazyPyclass("urn:vim25", "ExportProfile")
 
-ExportProfileResponseMsg = GED("urn:vim25", "ExportProfileResponse").pyclass
+ExportProfileResponseMsg = LazyPyclass("urn:vim25", "ExportProfileResponse")
 
-CreateProfileRequestMsg = GED("urn:vim25", "CreateProfile").pyclass
+CreateProfileRequestMsg = LazyPyclass("urn:vim25", "CreateProfile")
 
-CreateProfileResponseMsg = GED("urn:vim25", "CreateProfileResponse").pyclass
+CreateProfileResponseMsg = LazyPyclass("urn:vim25", "CreateProfileResponse")
 
-QueryPolicyMetadataRequestMsg = GED("urn:vim25", "QueryPolicyMetadata").pyclass
+QueryPolicyMetadataRequestMsg = LazyPyclass("urn:vim25", "QueryPolicyMetadata")
 
-QueryPolicyMetadataResponseMsg = GED("urn:vim25", "QueryPolicyMetadataResponse").pyclass
+QueryPolicyMetadataResponseMsg = LazyPyclass("urn:vim25", "QueryPolicyMetadataResponse")
 
-FindAssociatedProfileRequestMsg = GED("urn:vim25", "FindAssociatedProfile").pyclass
+FindAssociatedProfileRequestMsg = LazyPyclass("urn:vim25", "FindAssociatedProfile")
 
-FindAssociatedProfileResponseMsg = GED("urn:vim25", "FindAssociatedProfileResponse").pyclass
+FindAssociatedProfileResponseMsg = LazyPyclass("urn:vim25", "FindAssociatedProfileResponse")
 
-UpdateClusterProfileRequestMsg = GED("urn:vim25", "UpdateClusterProfile").pyclass
+UpdateClusterProfileRequestMsg = LazyPyclass("urn:vim25", "UpdateClusterProfile")
 
-UpdateClusterProfileResponseMsg = GED("urn:vim25", "UpdateClusterProfileResponse").pyclass
+UpdateClusterProfileResponseMsg = LazyPyclass("urn:vim25", "UpdateClusterProfileResponse")
 
-UpdateReferenceHostRequestMsg = GED("urn:vim25", "UpdateReferenceHost").pyclass
+UpdateReferenceHostRequestMsg = LazyPyclass("urn:vim25", "UpdateReferenceHost")
 
-UpdateReferenceHostResponseMsg = GED("urn:vim25", "UpdateReferenceHostResponse").pyclass
+UpdateReferenceHostResponseMsg = LazyPyclass("urn:vim25", "UpdateReferenceHostResponse")
 
-UpdateHostProfileRequestMsg = GED("urn:vim25", "UpdateHostProfile").pyclass
+UpdateHostProfileRequestMsg = LazyPyclass("urn:vim25", "UpdateHostProfile")
 
-UpdateHostProfileResponseMsg = GED("urn:vim25", "UpdateHostProfileResponse").pyclass
+UpdateHostProfileResponseMsg = LazyPyclass("urn:vim25", "UpdateHostProfileResponse")
 
-ExecuteHostProfileRequestMsg = GED("urn:vim25", "ExecuteHostProfile").pyclass
+ExecuteHostProfileRequestMsg = LazyPyclass("urn:vim25", "ExecuteHostProfile")
 
-ExecuteHostProfileResponseMsg = GED("urn:vim25", "ExecuteHostProfileResponse").pyclass
+ExecuteHostProfileResponseMsg = LazyPyclass("urn:vim25", "ExecuteHostProfileResponse")
 
-ApplyHostConfig_TaskRequestMsg = GED("urn:vim25", "ApplyHostConfig_Task").pyclass
+ApplyHostConfig_TaskRequestMsg = LazyPyclass("urn:vim25", "ApplyHostConfig_Task")
 
-ApplyHostConfig_TaskResponseMsg = GED("urn:vim25", "ApplyHostConfig_TaskResponse").pyclass
+ApplyHostConfig_TaskResponseMsg = LazyPyclass("urn:vim25", "ApplyHostConfig_TaskResponse")
 
-GenerateConfigTaskListRequestMsg = GED("urn:vim25", "GenerateConfigTaskList").pyclass
+GenerateConfigTaskListRequestMsg = LazyPyclass("urn:vim25", "GenerateConfigTaskList")
 
-GenerateConfigTaskListResponseMsg = GED("urn:vim25", "GenerateConfigTaskListResponse").pyclass
+GenerateConfigTaskListResponseMsg = LazyPyclass("urn:vim25", "GenerateConfigTaskListResponse")
 
-QueryHostProfileMetadataRequestMsg = GED("urn:vim25", "QueryHostProfileMetadata").pyclass
+QueryHostProfileMetadataRequestMsg = LazyPyclass("urn:vim25", "QueryHostProfileMetadata")
 
-QueryHostProfileMetadataResponseMsg = GED("urn:vim25", "QueryHostProfileMetadataResponse").pyclass
+QueryHostProfileMetadataResponseMsg = LazyPyclass("urn:vim25", "QueryHostProfileMetadataResponse")
 
-QueryProfileStructureRequestMsg = GED("urn:vim25", "QueryProfileStructure").pyclass
+QueryProfileStructureRequestMsg = LazyPyclass("urn:vim25", "QueryProfileStructure")
 
-QueryProfileStructureResponseMsg = GED("urn:vim25", "QueryProfileStructureResponse").pyclass
+QueryProfileStructureResponseMsg = LazyPyclass("urn:vim25", "QueryProfileStructureResponse")
 
-CreateDefaultProfileRequestMsg = GED("urn:vim25", "CreateDefaultProfile").pyclass
+CreateDefaultProfileRequestMsg = LazyPyclass("urn:vim25", "CreateDefaultProfile")
 
-CreateDefaultProfileResponseMsg = GED("urn:vim25", "CreateDefaultProfileResponse").pyclass
+CreateDefaultProfileResponseMsg = LazyPyclass("urn:vim25", "CreateDefaultProfileResponse")
 
-UpdateAnswerFile_TaskRequestMsg = GED("urn:vim25", "UpdateAnswerFile_Task").pyclass
+UpdateAnswerFile_TaskRequestMsg = LazyPyclass("urn:vim25", "UpdateAnswerFile_Task")
 
-UpdateAnswerFile_TaskResponseMsg = GED("urn:vim25", "UpdateAnswerFile_TaskResponse").pyclass
+UpdateAnswerFile_TaskResponseMsg = LazyPyclass("urn:vim25", "UpdateAnswerFile_TaskResponse")
 
-RetrieveAnswerFileRequestMsg = GED("urn:vim25", "RetrieveAnswerFile").pyclass
+RetrieveAnswerFileRequestMsg = LazyPyclass("urn:vim25", "RetrieveAnswerFile")
 
-RetrieveAnswerFileResponseMsg = GED("urn:vim25", "RetrieveAnswerFileResponse").pyclass
+RetrieveAnswerFileResponseMsg = LazyPyclass("urn:vim25", "RetrieveAnswerFileResponse")
 
-RetrieveAnswerFileForProfileRequestMsg = GED("urn:vim25", "RetrieveAnswerFileForProfile").pyclass
+RetrieveAnswerFileForProfileRequestMsg = LazyPyclass("urn:vim25", "RetrieveAnswerFileForProfile")
 
-RetrieveAnswerFileForProfileResponseMsg = GED("urn:vim25", "RetrieveAnswerFileForProfileResponse").pyclass
+RetrieveAnswerFileForProfileResponseMsg = LazyPyclass("urn:vim25", "RetrieveAnswerFileForProfileResponse")
 
-ExportAnswerFile_TaskRequestMsg = GED("urn:vim25", "ExportAnswerFile_Task").pyclass
+ExportAnswerFile_TaskRequestMsg = LazyPyclass("urn:vim25", "ExportAnswerFile_Task")
 
-ExportAnswerFile_TaskResponseMsg = GED("urn:vim25", "ExportAnswerFile_TaskResponse").pyclass
+ExportAnswerFile_TaskResponseMsg = LazyPyclass("urn:vim25", "ExportAnswerFile_TaskResponse")
 
-CheckAnswerFileStatus_TaskRequestMsg = GED("urn:vim25", "CheckAnswerFileStatus_Task").pyclass
+CheckAnswerFileStatus_TaskRequestMsg = LazyPyclass("urn:vim25", "CheckAnswerFileStatus_Task")
 
-CheckAnswerFileStatus_TaskResponseMsg = GED("urn:vim25", "CheckAnswerFileStatus_TaskResponse").pyclass
+CheckAnswerFileStatus_TaskResponseMsg = LazyPyclass("urn:vim25", "CheckAnswerFileStatus_TaskResponse")
 
-QueryAnswerFileStatusRequestMsg = GED("urn:vim25", "QueryAnswerFileStatus").pyclass
+QueryAnswerFileStatusRequestMsg = LazyPyclass("urn:vim25", "QueryAnswerFileStatus")
 
-QueryAnswerFileStatusResponseMsg = GED("urn:vim25", "QueryAnswerFileStatusResponse").pyclass
+QueryAnswerFileStatusResponseMsg = LazyPyclass("urn:vim25", "QueryAnswerFileStatusResponse")
 
-RemoveScheduledTaskRequestMsg = GED("urn:vim25", "RemoveScheduledTask").pyclass
+RemoveScheduledTaskRequestMsg = LazyPyclass("urn:vim25", "RemoveScheduledTask")
 
-RemoveScheduledTaskResponseMsg = GED("urn:vim25", "RemoveScheduledTaskResponse").pyclass
+RemoveScheduledTaskResponseMsg = LazyPyclass("urn:vim25", "RemoveScheduledTaskResponse")
 
-ReconfigureScheduledTaskRequestMsg = GED("urn:vim25", "ReconfigureScheduledTask").pyclass
+ReconfigureScheduledTaskRequestMsg = LazyPyclass("urn:vim25", "ReconfigureScheduledTask")
 
-ReconfigureScheduledTaskResponseMsg = GED("urn:vim25", "ReconfigureScheduledTaskResponse").pyclass
+ReconfigureScheduledTaskResponseMsg = LazyPyclass("urn:vim25", "ReconfigureScheduledTaskResponse")
 
-RunScheduledTaskRequestMsg = GED("urn:vim25", "RunScheduledTask").pyclass
+RunScheduledTaskRequestMsg = LazyPyclass("urn:vim25", "RunScheduledTask")
 
-RunScheduledTaskResponseMsg = GED("urn:vim25", "RunScheduledTaskResponse").pyclass
+RunScheduledTaskResponseMsg = LazyPyclass("urn:vim25", "RunScheduledTaskResponse")
 
-CreateScheduledTaskRequestMsg = GED("urn:vim25", "CreateScheduledTask").pyclass
+CreateScheduledTaskRequestMsg = LazyPyclass("urn:vim25", "CreateScheduledTask")
 
-CreateScheduledTaskResponseMsg = GED("urn:vim25", "CreateScheduledTaskResponse").pyclass
+CreateScheduledTaskResponseMsg = LazyPyclass("urn:vim25", "CreateScheduledTaskResponse")
 
-RetrieveEntityScheduledTaskRequestMsg = GED("urn:vim25", "RetrieveEntityScheduledTask").pyclass
+RetrieveEntityScheduledTaskRequestMsg = LazyPyclass("urn:vim25", "RetrieveEntityScheduledTask")
 
-RetrieveEntityScheduledTaskResponseMsg = GED("urn:vim25", "RetrieveEntityScheduledTaskResponse").pyclass
+RetrieveEntityScheduledTaskResponseMsg = LazyPyclass("urn:vim25", "RetrieveEntityScheduledTaskResponse")
 
-CreateObjectScheduledTaskRequestMsg = GED("urn:vim25", "CreateObjectScheduledTask").pyclass
+CreateObjectScheduledTaskRequestMsg = LazyPyclass("urn:vim25", "CreateObjectScheduledTask")
 
-CreateObjectScheduledTaskResponseMsg = GED("urn:vim25", "CreateObjectScheduledTaskResponse").pyclass
+CreateObjectScheduledTaskResponseMsg = LazyPyclass("urn:vim25", "CreateObjectScheduledTaskResponse")
 
-RetrieveObjectScheduledTaskRequestMsg = GED("urn:vim25", "RetrieveObjectScheduledTask").pyclass
+RetrieveObjectScheduledTaskRequestMsg = LazyPyclass("urn:vim25", "RetrieveObjectScheduledTask")
 
-RetrieveObjectScheduledTaskResponseMsg = GED("urn:vim25", "RetrieveObjectScheduledTaskResponse").pyclass
+RetrieveObjectScheduledTaskResponseMsg = LazyPyclass("urn:vim25", "RetrieveObjectScheduledTaskResponse")
 
-OpenInventoryViewFolderRequestMsg = GED("urn:vim25", "OpenInventoryViewFolder").pyclass
+OpenInventoryViewFolderRequestMsg = LazyPyclass("urn:vim25", "OpenInventoryViewFolder")
 
-OpenInventoryViewFolderResponseMsg = GED("urn:vim25", "OpenInventoryViewFolderResponse").pyclass
+OpenInventoryViewFolderResponseMsg = LazyPyclass("urn:vim25", "OpenInventoryViewFolderResponse")
 
-CloseInventoryViewFolderRequestMsg = GED("urn:vim25", "CloseInventoryViewFolder").pyclass
+CloseInventoryViewFolderRequestMsg = LazyPyclass("urn:vim25", "CloseInventoryViewFolder")
 
-CloseInventoryViewFolderResponseMsg = GED("urn:vim25", "CloseInventoryViewFolderResponse").pyclass
+CloseInventoryViewFolderResponseMsg = LazyPyclass("urn:vim25", "CloseInventoryViewFolderResponse")
 
-ModifyListViewRequestMsg = GED("urn:vim25", "ModifyListView").pyclass
+ModifyListViewRequestMsg = LazyPyclass("urn:vim25", "ModifyListView")
 
-ModifyListViewResponseMsg = GED("urn:vim25", "ModifyListViewResponse").pyclass
+ModifyListViewResponseMsg = LazyPyclass("urn:vim25", "ModifyListViewResponse")
 
-ResetListViewRequestMsg = GED("urn:vim25", "ResetListView").pyclass
+ResetListViewRequestMsg = LazyPyclass("urn:vim25", "ResetListView")
 
-ResetListViewResponseMsg = GED("urn:vim25", "ResetListViewResponse").pyclass
+ResetListViewResponseMsg = LazyPyclass("urn:vim25", "ResetListViewResponse")
 
-ResetListViewFromViewRequestMsg = GED("urn:vim25", "ResetListViewFromView").pyclass
+ResetListViewFromViewRequestMsg = LazyPyclass("urn:vim25", "ResetListViewFromView")
 
-ResetListViewFromViewResponseMsg = GED("urn:vim25", "ResetListViewFromViewResponse").pyclass
+ResetListViewFromViewResponseMsg = LazyPyclass("urn:vim25", "ResetListViewFromViewResponse")
 
-DestroyViewRequestMsg = GED("urn:vim25", "DestroyView").pyclass
+DestroyViewRequestMsg = LazyPyclass("urn:vim25", "DestroyView")
 
-DestroyViewResponseMsg = GED("urn:vim25", "DestroyViewResponse").pyclass
+DestroyViewResponseMsg = LazyPyclass("urn:vim25", "DestroyViewResponse")
 
-CreateInventoryViewRequestMsg = GED("urn:vim25", "CreateInventoryView").pyclass
+CreateInventoryViewRequestMsg = LazyPyclass("urn:vim25", "CreateInventoryView")
 
-CreateInventoryViewResponseMsg = GED("urn:vim25", "CreateInventoryViewResponse").pyclass
+CreateInventoryViewResponseMsg = LazyPyclass("urn:vim25", "CreateInventoryViewResponse")
 
-CreateContainerViewRequestMsg = GED("urn:vim25", "CreateContainerView").pyclass
+CreateContainerViewRequestMsg = LazyPyclass("urn:vim25", "CreateContainerView")
 
-CreateContainerViewResponseMsg = GED("urn:vim25", "CreateContainerViewResponse").pyclass
+CreateContainerViewResponseMsg = LazyPyclass("urn:vim25", "CreateContainerViewResponse")
 
-CreateListViewRequestMsg = GED("urn:vim25", "CreateListView").pyclass
+CreateListViewRequestMsg = LazyPyclass("urn:vim25", "CreateListView")
 
-CreateListViewResponseMsg = GED("urn:vim25", "CreateListViewResponse").pyclass
+CreateListViewResponseMsg = LazyPyclass("urn:vim25", "CreateListViewResponse")
 
-CreateListViewFromViewRequestMsg = GED("urn:vim25", "CreateListViewFromView").pyclass
+CreateListViewFromViewRequestMsg = LazyPyclass("urn:vim25", "CreateListViewFromView")
 
-CreateListViewFromViewResponseMsg = GED("urn:vim25", "CreateListViewFromViewResponse").pyclass
+CreateListViewFromViewResponseMsg = LazyPyclass("urn:vim25", "CreateListViewFromViewResponse")
 
-RevertToSnapshot_TaskRequestMsg = GED("urn:vim25", "RevertToSnapshot_Task").pyclass
+RevertToSnapshot_TaskRequestMsg = LazyPyclass("urn:vim25", "RevertToSnapshot_Task")
 
-RevertToSnapshot_TaskResponseMsg = GED("urn:vim25", "RevertToSnapshot_TaskResponse").pyclass
+RevertToSnapshot_TaskResponseMsg = LazyPyclass("urn:vim25", "RevertToSnapshot_TaskResponse")
 
-RemoveSnapshot_TaskRequestMsg = GED("urn:vim25", "RemoveSnapshot_Task").pyclass
+RemoveSnapshot_TaskRequestMsg = LazyPyclass("urn:vim25", "RemoveSnapshot_Task")
 
-RemoveSnapshot_TaskResponseMsg = GED("urn:vim25", "RemoveSnapshot_TaskResponse").pyclass
+RemoveSnapshot_TaskResponseMsg = LazyPyclass("urn:vim25", "RemoveSnapshot_TaskResponse")
 
-RenameSnapshotRequestMsg = GED("urn:vim25", "RenameSnapshot").pyclass
+RenameSnapshotRequestMsg = LazyPyclass("urn:vim25", "RenameSnapshot")
 
-RenameSnapshotResponseMsg = GED("urn:vim25", "RenameSnapshotResponse").pyclass
+RenameSnapshotResponseMsg = LazyPyclass("urn:vim25", "RenameSnapshotResponse")
 
-CheckCompatibility_TaskRequestMsg = GED("urn:vim25", "CheckCompatibility_Task").pyclass
+CheckCompatibility_TaskRequestMsg = LazyPyclass("urn:vim25", "CheckCompatibility_Task")
 
-CheckCompatibility_TaskResponseMsg = GED("urn:vim25", "CheckCompatibility_TaskResponse").pyclass
+CheckCompatibility_TaskResponseMsg = LazyPyclass("urn:vim25", "CheckCompatibility_TaskResponse")
 
-QueryVMotionCompatibilityEx_TaskRequestMsg = GED("urn:vim25", "QueryVMotionCompatibilityEx_Task").pyclass
+QueryVMotionCompatibilityEx_TaskRequestMsg = LazyPyclass("urn:vim25", "QueryVMotionCompatibilityEx_Task")
 
-QueryVMotionCompatibilityEx_TaskResponseMsg = GED("urn:vim25", "QueryVMotionCompatibilityEx_TaskResponse").pyclass
+QueryVMotionCompatibilityEx_TaskResponseMsg = LazyPyclass("urn:vim25", "QueryVMotionCompatibilityEx_TaskResponse")
 
-CheckMigrate_TaskRequestMsg = GED("urn:vim25", "CheckMigrate_Task").pyclass
+CheckMigrate_TaskRequestMsg = LazyPyclass("urn:vim25", "CheckMigrate_Task")
 
-CheckMigrate_TaskResponseMsg = GED("urn:vim25", "CheckMigrate_TaskResponse").pyclass
+CheckMigrate_TaskResponseMsg = LazyPyclass("urn:vim25", "CheckMigrate_TaskResponse")
 
-CheckRelocate_TaskRequestMsg = GED("urn:vim25", "CheckRelocate_Task").pyclass
+CheckRelocate_TaskRequestMsg = LazyPyclass("urn:vim25", "CheckRelocate_Task")
 
-CheckRelocate_TaskResponseMsg = GED("urn:vim25", "CheckRelocate_TaskResponse").pyclass
+CheckRelocate_TaskResponseMsg = LazyPyclass("urn:vim25", "CheckRelocate_TaskResponse")
 
-ValidateCredentialsInGuestRequestMsg = GED("urn:vim25", "ValidateCredentialsInGuest").pyclass
+ValidateCredentialsInGuestRequestMsg = LazyPyclass("urn:vim25", "ValidateCredentialsInGuest")
 
-ValidateCredentialsInGuestResponseMsg = GED("urn:vim25", "ValidateCredentialsInGuestResponse").pyclass
+ValidateCredentialsInGuestResponseMsg = LazyPyclass("urn:vim25", "ValidateCredentialsInGuestResponse")
 
-AcquireCredentialsInGuestRequestMsg = GED("urn:vim25", "AcquireCredentialsInGuest").pyclass
+AcquireCredentialsInGuestRequestMsg = LazyPyclass("urn:vim25", "AcquireCredentialsInGuest")
 
-AcquireCredentialsInGuestResponseMsg = GED("urn:vim25", "AcquireCredentialsInGuestResponse").pyclass
+AcquireCredentialsInGuestResponseMsg = LazyPyclass("urn:vim25", "AcquireCredentialsInGuestResponse")
 
-ReleaseCredentialsInGuestRequestMsg = GED("urn:vim25", "ReleaseCredentialsInGuest").pyclass
+ReleaseCredentialsInGuestRequestMsg = LazyPyclass("urn:vim25", "ReleaseCredentialsInGuest")
 
-ReleaseCredentialsInGuestResponseMsg = GED("urn:vim25", "ReleaseCredentialsInGuestResponse").pyclass
+ReleaseCredentialsInGuestResponseMsg = LazyPyclass("urn:vim25", "ReleaseCredentialsInGuestResponse")
 
-MakeDirectoryInGuestRequestMsg = GED("urn:vim25", "MakeDirectoryInGuest").pyclass
+MakeDirectoryInGuestRequestMsg = LazyPyclass("urn:vim25", "MakeDirectoryInGuest")
 
-MakeDirectoryInGuestResponseMsg = GED("urn:vim25", "MakeDirectoryInGuestResponse").pyclass
+MakeDirectoryInGuestResponseMsg = LazyPyclass("urn:vim25", "MakeDirectoryInGuestResponse")
 
-DeleteFileInGuestRequestMsg = GED("urn:vim25", "DeleteFileInGuest").pyclass
+DeleteFileInGuestRequestMsg = LazyPyclass("urn:vim25", "DeleteFileInGuest")
 
-DeleteFileInGuestResponseMsg = GED("urn:vim25", "DeleteFileInGuestResponse").pyclass
+DeleteFileInGuestResponseMsg = LazyPyclass("urn:vim25", "DeleteFileInGuestResponse")
 
-DeleteDirectoryInGuestRequestMsg = GED("urn:vim25", "DeleteDirectoryInGuest").pyclass
+DeleteDirectoryInGuestRequestMsg = LazyPyclass("urn:vim25", "DeleteDirectoryInGuest")
 
-DeleteDirectoryInGuestResponseMsg = GED("urn:vim25", "DeleteDirectoryInGuestResponse").pyclass
+DeleteDirectoryInGuestResponseMsg = LazyPyclass("urn:vim25", "DeleteDirectoryInGuestResponse")
 
-MoveDirectoryInGuestRequestMsg = GED("urn:vim25", "MoveDirectoryInGuest").pyclass
+MoveDirectoryInGuestRequestMsg = LazyPyclass("urn:vim25", "MoveDirectoryInGuest")
 
-MoveDirectoryInGuestResponseMsg = GED("urn:vim25", "MoveDirectoryInGuestResponse").pyclass
+MoveDirectoryInGuestResponseMsg = LazyPyclass("urn:vim25", "MoveDirectoryInGuestResponse")
 
-MoveFileInGuestRequestMsg = GED("urn:vim25", "MoveFileInGuest").pyclass
+MoveFileInGuestRequestMsg = LazyPyclass("urn:vim25", "MoveFileInGuest")
 
-MoveFileInGuestResponseMsg = GED("urn:vim25", "MoveFileInGuestResponse").pyclass
+MoveFileInGuestResponseMsg = LazyPyclass("urn:vim25", "MoveFileInGuestResponse")
 
-CreateTemporaryFileInGuestRequestMsg = GED("urn:vim25", "CreateTemporaryFileInGuest").pyclass
+CreateTemporaryFileInGuestRequestMsg = LazyPyclass("urn:vim25", "CreateTemporaryFileInGuest")
 
-CreateTemporaryFileInGuestResponseMsg = GED("urn:vim25", "CreateTemporaryFileInGuestResponse").pyclass
+CreateTemporaryFileInGuestResponseMsg = LazyPyclass("urn:vim25", "CreateTemporaryFileInGuestResponse")
 
-CreateTemporaryDirectoryInGuestRequestMsg = GED("urn:vim25", "CreateTemporaryDirectoryInGuest").pyclass
+CreateTemporaryDirectoryInGuestRequestMsg = LazyPyclass("urn:vim25", "CreateTemporaryDirectoryInGuest")
 
-CreateTemporaryDirectoryInGuestResponseMsg = GED("urn:vim25", "CreateTemporaryDirectoryInGuestResponse").pyclass
+CreateTemporaryDirectoryInGuestResponseMsg = LazyPyclass("urn:vim25", "CreateTemporaryDirectoryInGuestResponse")
 
-ListFilesInGuestRequestMsg = GED("urn:vim25", "ListFilesInGuest").pyclass
+ListFilesInGuestRequestMsg = LazyPyclass("urn:vim25", "ListFilesInGuest")
 
-ListFilesInGuestResponseMsg = GED("urn:vim25", "ListFilesInGuestResponse").pyclass
+ListFilesInGuestResponseMsg = LazyPyclass("urn:vim25", "ListFilesInGuestResponse")
 
-ChangeFileAttributesInGuestRequestMsg = GED("urn:vim25", "ChangeFileAttributesInGuest").pyclass
+ChangeFileAttributesInGuestRequestMsg = LazyPyclass("urn:vim25", "ChangeFileAttributesInGuest")
 
-ChangeFileAttributesInGuestResponseMsg = GED("urn:vim25", "ChangeFileAttributesInGuestResponse").pyclass
+ChangeFileAttributesInGuestResponseMsg = LazyPyclass("urn:vim25", "ChangeFileAttributesInGuestResponse")
 
-InitiateFileTransferFromGuestRequestMsg = GED("urn:vim25", "InitiateFileTransferFromGuest").pyclass
+InitiateFileTransferFromGuestRequestMsg = LazyPyclass("urn:vim25", "InitiateFileTransferFromGuest")
 
-InitiateFileTransferFromGuestResponseMsg = GED("urn:vim25", "InitiateFileTransferFromGuestResponse").pyclass
+InitiateFileTransferFromGuestResponseMsg = LazyPyclass("urn:vim25", "InitiateFileTransferFromGuestResponse")
 
-InitiateFileTransferToGuestRequestMsg = GED("urn:vim25", "InitiateFileTransferToGuest").pyclass
+InitiateFileTransferToGuestRequestMsg = LazyPyclass("urn:vim25", "InitiateFileTransferToGuest")
 
-InitiateFileTransferToGuestResponseMsg = GED("urn:vim25", "InitiateFileTransferToGuestResponse").pyclass
+InitiateFileTransferToGuestResponseMsg = LazyPyclass("urn:vim25", "InitiateFileTransferToGuestResponse")
 
-StartProgramInGuestRequestMsg = GED("urn:vim25", "StartProgramInGuest").pyclass
+StartProgramInGuestRequestMsg = LazyPyclass("urn:vim25", "StartProgramInGuest")
 
-StartProgramInGuestResponseMsg = GED("urn:vim25", "StartProgramInGuestResponse").pyclass
+StartProgramInGuestResponseMsg = LazyPyclass("urn:vim25", "StartProgramInGuestResponse")
 
-ListProcessesInGuestRequestMsg = GED("urn:vim25", "ListProcessesInGuest").pyclass
+ListProcessesInGuestRequestMsg = LazyPyclass("urn:vim25", "ListProcessesInGuest")
 
-ListProcessesInGuestResponseMsg = GED("urn:vim25", "ListProcessesInGuestResponse").pyclass
+ListProcessesInGuestResponseMsg = LazyPyclass("urn:vim25", "ListProcessesInGuestResponse")
 
-TerminateProcessInGuestRequestMsg = GED("urn:vim25", "TerminateProcessInGuest").pyclass
+TerminateProcessInGuestRequestMsg = LazyPyclass("urn:vim25", "TerminateProcessInGuest")
 
-TerminateProcessInGuestResponseMsg = GED("urn:vim25", "TerminateProcessInGuestResponse").pyclass
+TerminateProcessInGuestResponseMsg = LazyPyclass("urn:vim25", "TerminateProcessInGuestResponse")
 
-ReadEnvironmentVariableInGuestRequestMsg = GED("urn:vim25", "ReadEnvironmentVariableInGuest").pyclass
+ReadEnvironmentVariableInGuestRequestMsg = LazyPyclass("urn:vim25", "ReadEnvironmentVariableInGuest")
 
-ReadEnvironmentVariableInGuestResponseMsg = GED("urn:vim25", "ReadEnvironmentVariableInGuestResponse").pyclass
+ReadEnvironmentVariableInGuestResponseMsg = LazyPyclass("urn:vim25", "ReadEnvironmentVariableInGuestResponse")
@@ -0,0 +1,332 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#--
+
+import threading
+import time
+
+from pysphere.resources import VimService_services as VI
+from pysphere.resources.vi_exception import VIException, VIApiException, \
+                                            FaultTypes
+from pysphere.vi_mor import MORTypes
+
+class _ObjectContent(object):
+    """Minimal stand-in for the ObjectContent data objects returned by the
+    property collector"""
+    __slots__ = ('Obj', 'PropSet')
+
+    def __init__(self, obj, prop_set):
+        self.Obj = obj
+        self.PropSet = prop_set
+
+    def get_element_obj(self):
+        return self.Obj
+
+    def get_element_propSet(self):
+        return self.PropSet
+
+class _DynamicProperty(object):
+    __slots__ = ('Name', 'Val')
+
+    def __init__(self, name, val):
+        self.Name = name
+        self.Val = val
+
+class InventoryCache(object):
+    """Local index of the inventory managed objects and a set of their
+    properties. It is built with a single property filter and kept up to date
+    incrementally with WaitForUpdatesEx, so lookups don't need to traverse the
+    whole inventory on the server. Requires API 4.1 or later."""
+
+    #Properties kept for each managed object type
+    BASE_PROPERTIES = {
+        MORTypes.Folder: ['name', 'parent'],
+        MORTypes.Datacenter: ['name', 'parent'],
+        MORTypes.ComputeResource: ['name', 'parent'],
+        MORTypes.ClusterComputeResource: ['name', 'parent'],
+        MORTypes.HostSystem: ['name', 'parent'],
+        MORTypes.Datastore: ['name', 'parent'],
+        MORTypes.ResourcePool: ['name', 'parent', 'resourcePool'],
+        MORTypes.VirtualApp: ['name', 'parent', 'resourcePool'],
+        MORTypes.VirtualMachine: ['name', 'parent', 'resourcePool',
+                                  'config.files.vmPathName',
+                                  'runtime.powerState'],
+    }
+
+    #Types whose instances are also returned when querying for the key type
+    SUBTYPES = {
+        MORTypes.ComputeResource: [MORTypes.ClusterComputeResource],
+        MORTypes.ResourcePool: [MORTypes.VirtualApp],
+    }
+
+    #Starting points whose descendants can be found locally by following the
+    #cached properties of the traversal specs (see _descendants)
+    CONTAINER_TYPES = [MORTypes.Folder, MORTypes.Datacenter,
+                       MORTypes.ComputeResource,
+                       MORTypes.ClusterComputeResource,
+                       MORTypes.ResourcePool, MORTypes.VirtualApp]
+
+    def __init__(self, server, properties=None, refresh_interval=0):
+        """Creates the property filter and loads the current inventory.
+        @server: a connected VIServer instance
+        @properties: (optional) dictionary of extra properties to keep for
+            some managed object types (keys of BASE_PROPERTIES), e.g.
+            {'VirtualMachine':['guest.toolsRunningStatus']}
+        @refresh_interval: minimum number of seconds between two checks for
+            changes on the server. 0 (default) checks on every lookup.
+        """
+        if server.get_api_version() < "4.1":
+            raise VIException("The inventory cache requires API 4.1 or later",
+                              FaultTypes.NOT_SUPPORTED)
+        self._server = server
+        self._refresh_interval = refresh_interval
+        self._properties = {}
+        for mo_type, path_set in self.BASE_PROPERTIES.iteritems():
+            self._properties[mo_type] = path_set[:]
+        if properties:
+            for mo_type, path_set in properties.iteritems():
+                if mo_type not in self._properties:
+                    raise VIException("Objects of type '%s' can't be cached"
+                                      % mo_type, FaultTypes.PARAMETER_ERROR)
+                for path in path_set:
+                    if path not in self._properties[mo_type]:
+                        self._properties[mo_type].append(path)
+        self._traversal = {}
+        self._objects = {}
+        self._version = ""
+        self._last_check = 0
+        self._lock = threading.Lock()
+        self._collector = None
+        self._create_filter()
+        self.refresh(force=True)
+
+    def refresh(self, force=False):
+        """Applies the inventory changes that happened on the server since the
+        last check. Unless @force is True, the server is only asked if more than
+        refresh_interval seconds passed since the last check."""
+        self._lock.acquire()
+        try:
+            if not force and \
+               time.time() - self._last_check < self._refresh_interval:
+                return
+            self._wait_for_updates()
+            self._last_check = time.time()
+        finally:
+            self._lock.release()
+
+    def retrieve(self, property_names, from_node, obj_type):
+        """Returns a list of ObjectContent like objects (with Obj and PropSet
+        attributes) for the cached objects of type @obj_type found below the
+        managed object @from_node (None for the whole inventory). Returns None
+        if the query can't be answered from the cache (the type, a property, or
+        the kind of starting point isn't cached), then the server should be
+        queried instead."""
+        types = [obj_type] + self.SUBTYPES.get(obj_type, [])
+        for mo_type in types:
+            if mo_type not in self._properties:
+                return None
+            for name in property_names:
+                if name not in self._properties[mo_type]:
+                    return None
+        root = None
+        if from_node and str(from_node) != str(
+                                     self._server._do_service_content.RootFolder):
+            if from_node.get_attribute_type() not in self.CONTAINER_TYPES:
+                return None
+            root = str(from_node)
+
+        self.refresh()
+        self._lock.acquire()
+        try:
+            below = root and self._descendants(root)
+            ret = []
+            for key, (mor, values) in self._objects.iteritems():
+                if mor.get_attribute_type() not in types:
+                    continue
+                if root and key not in below:
+                    continue
+                prop_set = [_DynamicProperty(name, values[name])
+                            for name in property_names if name in values]
+                ret.append(_ObjectContent(mor, prop_set))
+            return ret
+        finally:
+            self._lock.release()
+
+    def destroy(self):
+        """Destroys the property collector used to track the inventory"""
+        if not self._collector:
+            return
+        try:
+            request = VI.DestroyPropertyCollectorRequestMsg()
+            _this = request.new__this(self._collector)
+            _this.set_attribute_type(MORTypes.PropertyCollector)
+            request.set_element__this(_this)
+            self._server._proxy.DestroyPropertyCollector(request)
+        except (VI.ZSI.FaultException), e:
+            raise VIApiException(e)
+        finally:
+            self._collector = None
+            self._objects = {}
+
+    def _create_filter(self):
+        """Creates a dedicated property collector (so other filters created in
+        this session aren't affected by our updates) and a filter on it for
+        the whole inventory"""
+        service_content = self._server._do_service_content
+        try:
+            request = VI.CreatePropertyCollectorRequestMsg()
+            _this = request.new__this(service_content.PropertyCollector)
+            _this.set_attribute_type(MORTypes.PropertyCollector)
+            request.set_element__this(_this)
+            self._collector = self._server._proxy.CreatePropertyCollector(
+                                                             request)._returnval
+
+            request = VI.CreateFilterRequestMsg()
+            _this = request.new__this(self._collector)
+            _this.set_attribute_type(MORTypes.PropertyCollector)
+            request.set_element__this(_this)
+
+            spec = request.new_spec()
+            root = service_content.RootFolder
+            object_set = spec.new_objectSet()
+            obj = object_set.new_obj(root)
+            obj.set_attribute_type(root.get_attribute_type())
+            object_set.set_element_obj(obj)
+            object_set.set_element_skip(False)
+            traversal_specs = self._server._build_traversal_specs(object_set)
+            object_set.set_element_selectSet(traversal_specs)
+            self._load_traversal(traversal_specs)
+
+            prop_sets = []
+            for mo_type, path_set in self._properties.iteritems():
+                prop_set = spec.new_propSet()
+                prop_set.set_element_type(mo_type)
+                prop_set.set_element_pathSet(path_set)
+                prop_set.set_element_all(False)
+                prop_sets.append(prop_set)
+            spec.set_element_propSet(prop_sets)
+            spec.set_element_objectSet([object_set])
+
+            request.set_element_spec(spec)
+            request.set_element_partialUpdates(False)
+            self._server._proxy.CreateFilter(request)
+
+        except (VI.ZSI.FaultException), e:
+            raise VIApiException(e)
+
+    def _wait_for_updates(self):
+        """Asks (without blocking) for the changes since the last known version
+        and applies them"""
+        try:
+            while True:
+                request = VI.WaitForUpdatesExRequestMsg()
+                _this = request.new__this(self._collector)
+                _this.set_attribute_type(MORTypes.PropertyCollector)
+                request.set_element__this(_this)
+                request.set_element_version(self._version)
+                options = request.new_options()
+                options.set_element_maxWaitSeconds(0)
+                request.set_element_options(options)
+
+                update_set = self._server._proxy.WaitForUpdatesEx(
+                                                             request)._returnval
+                if not update_set:
+                    return
+                self._version = update_set.Version
+                for filter_update in getattr(update_set, "FilterSet", []):
+                    for obj_update in getattr(filter_update, "ObjectSet", []):
+                        self._apply_update(obj_update)
+                if not getattr(update_set, "Truncated", False):
+                    return
+        except (VI.ZSI.FaultException), e:
+            raise VIApiException(e)
+
+    def _apply_update(self, obj_update):
+        key = str(obj_update.Obj)
+        if obj_update.Kind == 'leave':
+            self._objects.pop(key, None)
+            return
+        if obj_update.Kind == 'enter' or key not in self._objects:
+            self._objects[key] = (obj_update.Obj, {})
+        values = self._objects[key][1]
+        for change in getattr(obj_update, "ChangeSet", []):
+            if change.Op in ('remove', 'indirectRemove') or \
+               not hasattr(change, "Val"):
+                values.pop(change.Name, None)
+            else:
+                values[change.Name] = change.Val
+
+    def _load_traversal(self, traversal_specs):
+        """Keeps the type, path and selectSet names of each of the
+        @traversal_specs, and adds their paths to the cached properties of
+        that type, so the objects a query would reach can be found locally"""
+        self._traversal = {}
+        for ts in traversal_specs:
+            mo_type = ts.get_element_type()
+            path = ts.get_element_path()
+            select_set = [ss.get_element_name()
+                          for ss in ts.get_element_selectSet() or []]
+            self._traversal[ts.get_element_name()] = (mo_type, path,
+                                                      select_set)
+            for cached_type in [mo_type] + self.SUBTYPES.get(mo_type, []):
+                if path not in self._properties[cached_type]:
+                    self._properties[cached_type].append(path)
+
+    def _descendants(self, root):
+        """Returns the set of keys of the objects reached from @root (itself
+        included) by the traversal specs, as the property collector would
+        do for a query starting at @root"""
+        found = set([root])
+        visited = set()
+        pending = [(root, self._traversal.keys())]
+        while pending:
+            key, spec_names = pending.pop()
+            entry = self._objects.get(key)
+            if not entry:
+                continue
+            mor, values = entry
+            mo_type = mor.get_attribute_type()
+            for name in spec_names:
+                if (key, name) in visited or name not in self._traversal:
+                    continue
+                visited.add((key, name))
+                spec_type, path, select_set = self._traversal[name]
+                if mo_type != spec_type and \
+                   mo_type not in self.SUBTYPES.get(spec_type, []):
+                    continue
+                val = values.get(path)
+                if hasattr(val, "ManagedObjectReference"):
+                    children = val.ManagedObjectReference or []
+                elif val:
+                    children = [val]
+                else:
+                    children = []
+                for child in children:
+                    found.add(str(child))
+                    pending.append((str(child), select_set))
+        return found
@@ -27,7 +27,7 @@
 #
 #--
 
-from pysphere.resources.VimService_services_types import ns0
+from pysphere.resources.VimService_services import ns0
 
 class VIMor(str):
     """str subclass representing a Managed Object Reference"""
@@ -0,0 +1,255 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#--
+
+import math
+
+from pysphere.resources.vi_exception import VIException, FaultTypes
+from pysphere.vi_mor import MORTypes
+
+class PercentileSketch(object):
+    """Approximate percentiles of a stream of non-negative values in bounded
+    memory. Values are counted in logarithmic buckets, so any percentile is
+    within @relative_accuracy of the exact value. If more than @max_buckets
+    are needed, the lowest buckets are collapsed (losing accuracy only for
+    the lowest percentiles)."""
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        if not 0 < relative_accuracy < 1:
+            raise VIException("relative_accuracy must be between 0 and 1",
+                              FaultTypes.PARAMETER_ERROR)
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._zeros = 0
+        self._buckets = {}
+
+    def add(self, value, count=1):
+        """Adds @value to the sketch @count times"""
+        self.count += count
+        if value <= 0:
+            self._zeros += count
+            return
+        key = int(math.ceil(math.log(value) / self._log_gamma))
+        self._buckets[key] = self._buckets.get(key, 0) + count
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other):
+        """Adds all the values of another sketch (with the same accuracy)"""
+        if other._gamma != self._gamma:
+            raise VIException("Can't merge sketches of different accuracy",
+                              FaultTypes.PARAMETER_ERROR)
+        self.count += other.count
+        self._zeros += other._zeros
+        for key, count in other._buckets.iteritems():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        while len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def percentile(self, p):
+        """Returns the approximate @p percentile (0-100) of the values added,
+        or None if the sketch is empty"""
+        if not self.count:
+            return None
+        rank = int(round(min(max(p, 0), 100) / 100.0 * (self.count - 1)))
+        seen = self._zeros
+        if rank < seen:
+            return 0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if rank < seen:
+                #the value that minimizes the relative error in the bucket
+                return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _collapse(self):
+        keys = sorted(self._buckets)
+        self._buckets[keys[1]] += self._buckets.pop(keys[0])
+
+class WindowStats(object):
+    """Aggregated values of a counter for a group in a time window. The window
+    includes the samples with start < timestamp <= end (sample timestamps
+    are the end of their interval)."""
+
+    def __init__(self, group, counter_id, instance, start, end,
+                 relative_accuracy=0.01):
+        self.group = group
+        self.counter_id = counter_id
+        self.instance = instance
+        self.start = start
+        self.end = end
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+        self.sketch = PercentileSketch(relative_accuracy)
+
+    def add(self, value):
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self.sketch.add(value)
+
+    def avg(self):
+        if not self.count:
+            return None
+        return float(self.sum) / self.count
+
+    def percentile(self, p):
+        return self.sketch.percentile(p)
+
+    def __repr__(self):
+        return "<WindowStats %s %s:%s (%s, %s]: count=%d avg=%s max=%s>" % (
+                        self.group, self.counter_id, self.instance, self.start,
+                        self.end, self.count, self.avg(), self.max)
+
+class PerfAggregator(object):
+    """Aggregates PerfSeries (see vi_performance_series) per group and time
+    window in a single pass over the samples.
+    window [int]: window length in seconds.
+    step [int]: seconds between the end of consecutive windows. Defaults to
+        @window (tumbling windows). A smaller step gives sliding windows, each
+        sample is then added to window/step windows.
+    group_by [dict]: maps str(entity mor) to the group its samples are
+        aggregated in (e.g. see get_inventory_groups). Entities not in the
+        dictionary (or all of them if None) are groups of their own.
+    relative_accuracy [float]: accuracy of the percentiles.
+
+    Memory is bounded by the windows kept open: call flush with the time up to
+    which samples were added to get and discard the complete windows. E.g.:
+        groups = get_inventory_groups(server, vms, 'cluster')
+        aggregator = PerfAggregator(3600, group_by=groups)
+        for series in backfill(server, vms, ['cpu.usage'], start, end,
+                               PerformanceManager.INTERVALS.PAST_DAY):
+            aggregator.add(series)
+        for stats in aggregator.flush():
+            print stats.group, stats.end, stats.avg(), stats.percentile(95)
+    """
+
+    def __init__(self, window, step=None, group_by=None,
+                 relative_accuracy=0.01):
+        if not isinstance(window, int) or window <= 0:
+            raise VIException("window must be a positive integer",
+                              FaultTypes.PARAMETER_ERROR)
+        if step is None:
+            step = window
+        if not isinstance(step, int) or step <= 0 or step > window:
+            raise VIException("step must be a positive integer not greater "
+                              "than window", FaultTypes.PARAMETER_ERROR)
+        self.window = window
+        self.step = step
+        self.group_by = group_by or {}
+        self.relative_accuracy = relative_accuracy
+        self._windows = {}
+
+    def add(self, series):
+        """Adds the samples of a PerfSeries. Missing samples (negative values)
+        are ignored."""
+        group = self.group_by.get(str(series.entity), series.entity)
+        window_ends = [self._window_ends(ts) for ts in series.timestamps]
+        for (counter_id, instance), values in series.values.iteritems():
+            for i, value in enumerate(values):
+                if value < 0:
+                    continue
+                for end in window_ends[i]:
+                    key = (group, counter_id, instance, end)
+                    stats = self._windows.get(key)
+                    if stats is None:
+                        stats = WindowStats(group, counter_id, instance,
+                                            end - self.window, end,
+                                            self.relative_accuracy)
+                        self._windows[key] = stats
+                    stats.add(value)
+
+    def flush(self, until=None):
+        """Returns the WindowStats of the windows ending at or before @until
+        (seconds since the epoch), or of all the windows if None, sorted by
+        end time, and stops tracking them."""
+        keys = [k for k in self._windows if until is None or k[3] <= until]
+        keys.sort(key=lambda k: (k[3], str(k[0]), k[1], k[2]))
+        return [self._windows.pop(k) for k in keys]
+
+    def _window_ends(self, timestamp):
+        timestamp = int(timestamp)
+        end = -(-timestamp // self.step) * self.step
+        ends = []
+        while end - self.window < timestamp:
+            ends.append(end)
+            end += self.step
+        return ends
+
+def get_inventory_groups(server, entities, level="host", batch_size=100):
+    """Returns a dictionary that maps str(mor) of each virtual machine or host
+    in @entities to the mor of its host (@level='host') or its cluster
+    (@level='cluster', the ComputeResource of standalone hosts), as needed by
+    PerfAggregator's group_by. Properties are read with a bulk request for
+    each @batch_size objects."""
+    if level not in ("host", "cluster"):
+        raise VIException("level must be 'host' or 'cluster'",
+                          FaultTypes.PARAMETER_ERROR)
+    entities = list(entities)
+    groups = {}
+    hosts = {}
+    vms = [e for e in entities
+           if e.get_attribute_type() == MORTypes.VirtualMachine]
+    for e in entities:
+        if e.get_attribute_type() == MORTypes.HostSystem:
+            hosts[str(e)] = e
+            groups[str(e)] = e
+
+    vm_hosts = _get_bulk_property(server, vms, MORTypes.VirtualMachine,
+                                  "runtime.host", batch_size)
+    for vm in vms:
+        host = vm_hosts.get(str(vm))
+        if host is not None:
+            hosts[str(host)] = host
+            groups[str(vm)] = host
+
+    if level == "cluster":
+        host_parents = _get_bulk_property(server, hosts.values(),
+                                          MORTypes.HostSystem, "parent",
+                                          batch_size)
+        for key, group in groups.items():
+            groups[key] = host_parents.get(str(group), group)
+    return groups
+
+def _get_bulk_property(server, mors, mor_type, prop_name, batch_size):
+    ret = {}
+    for i in xrange(0, len(mors), batch_size):
+        content = server._get_object_properties_bulk(mors[i:i+batch_size],
+                                                     {mor_type:[prop_name]})
+        for o in content or []:
+            for prop in getattr(o, "PropSet", []):
+                if prop.Name == prop_name:
+                    ret[str(o.Obj)] = prop.Val
+    return ret
@@ -0,0 +1,331 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#--
+
+import re
+import time
+import threading
+import BaseHTTPServer
+
+from pysphere.resources.vi_exception import VIException, FaultTypes
+
+class PerfExporter(object):
+    """Writes PerfSeries (see vi_performance_series, vi_performance_sampler)
+    to a file-like object as they arrive, in OpenMetrics (Prometheus) text
+    exposition format ('openmetrics') or InfluxDB line protocol ('influx').
+    Lines are written one at a time, nothing is buffered. The metric names
+    and label sets of every entity, counter and instance are built once and
+    cached. E.g.:
+        exporter = PerfExporter(server)
+        out = open('metrics.txt', 'w')  #or socket.makefile('w')
+        for series in PerfSampler(server, vms, ['cpu.usage']):
+            exporter.write_series(series, out)
+
+    OpenMetrics metrics are named 'vsphere_<group>_<counter>_<rollup>' and
+    labeled with the entity mor, its type, the instance and the names given
+    in @entity_names. InfluxDB points are written to the 'vsphere_<group>'
+    measurement, with a '<counter>_<rollup>' integer field.
+    """
+
+    FORMATS = ('openmetrics', 'influx')
+
+    def __init__(self, server, format='openmetrics', entity_names=None,
+                 prefix='vsphere'):
+        """server: a connected VIServer instance.
+        format [string]: 'openmetrics' (default) or 'influx'.
+        entity_names [dict]: optional names of the entities (keyed by
+            str(mor)) to add as a 'name' label.
+        prefix [string]: prefix of metric (or measurement) names.
+        """
+        if format not in self.FORMATS:
+            raise VIException("accepted formats are 'openmetrics' and "
+                              "'influx'", FaultTypes.PARAMETER_ERROR)
+        self._pm = server.get_performance_manager()
+        self.format = format
+        self.prefix = prefix
+        self.entity_names = entity_names or {}
+        self._metric_names = {}
+        self._entity_labels = {}
+        self._prefixes = {}
+
+    def write_series(self, series, out, last_only=False):
+        """Writes the samples of @series to @out (any object with a write
+        method). If @last_only, only the latest sample of each metric."""
+        if self.format == 'influx':
+            write_line = self._write_influx
+        else:
+            write_line = self._write_openmetrics
+        timestamps = series.timestamps
+        first = 0
+        if last_only:
+            first = max(0, len(timestamps) - 1)
+        for (counter_id, instance), values in series.values.iteritems():
+            prefix = self._get_prefix(series.entity, counter_id, instance)
+            for i in xrange(first, len(values)):
+                if values[i] >= 0:
+                    write_line(out, prefix, values[i], timestamps[i])
+
+    def write_exposition(self, series_list, out, eof=True):
+        """Writes the latest sample of each metric in @series_list as a
+        complete OpenMetrics exposition (samples grouped in metric families,
+        with their TYPE and HELP metadata, and the final EOF marker unless
+        @eof is False, so more families can be added)"""
+        families = {}
+        for series in series_list:
+            for counter_id, instance in series.values.iterkeys():
+                families.setdefault(counter_id, []).append((series, instance))
+        for counter_id in sorted(families):
+            name = self._get_metric_name(counter_id)
+            info = self._pm._get_shared_counter_info(counter_id)
+            out.write("# TYPE %s gauge\n" % name)
+            if info.description:
+                out.write("# HELP %s %s (%s)\n" % (name,
+                                              _escape_help(info.description),
+                                              _escape_help(info.unit)))
+            for series, instance in families[counter_id]:
+                values = series.values[(counter_id, instance)]
+                if len(values) and values[-1] >= 0:
+                    self._write_openmetrics(out,
+                                    self._get_prefix(series.entity, counter_id,
+                                                     instance, 'openmetrics'),
+                                    values[-1], series.timestamps[-1])
+        if eof:
+            out.write("# EOF\n")
+
+    def _write_openmetrics(self, out, prefix, value, timestamp):
+        out.write("%s %d %d\n" % (prefix, value, timestamp))
+
+    def _write_influx(self, out, prefix, value, timestamp):
+        out.write("%s=%di %d\n" % (prefix, value, timestamp * 1000000000))
+
+    def _get_prefix(self, entity, counter_id, instance, format=None):
+        """Returns the cached beginning of the lines of a metric (everything
+        but the value and timestamp)"""
+        format = format or self.format
+        key = (format, str(entity), counter_id, instance)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            labels = self._get_entity_labels(entity)
+            if format == 'influx':
+                group, field = self._get_influx_names(counter_id)
+                tags = "".join([",%s=%s" % (k, _escape_tag(v))
+                                for k, v in labels])
+                if instance:
+                    tags += ",instance=%s" % _escape_tag(instance)
+                prefix = "%s%s %s" % (group, tags, field)
+            else:
+                labels = labels + [('instance', instance)]
+                prefix = "%s{%s}" % (self._get_metric_name(counter_id),
+                                     ",".join(['%s="%s"' % (k, _escape_label(v))
+                                               for k, v in labels]))
+            self._prefixes[key] = prefix
+        return prefix
+
+    def _get_entity_labels(self, entity):
+        key = str(entity)
+        labels = self._entity_labels.get(key)
+        if labels is None:
+            labels = [('entity', key)]
+            if hasattr(entity, "get_attribute_type"):
+                labels.append(('entity_type', entity.get_attribute_type()))
+            if key in self.entity_names:
+                labels.append(('name', self.entity_names[key]))
+            self._entity_labels[key] = labels
+        return labels
+
+    def _get_metric_name(self, counter_id):
+        name = self._metric_names.get(counter_id)
+        if name is None:
+            group, field = self._get_influx_names(counter_id)
+            name = _sanitize("%s_%s" % (group, field))
+            self._metric_names[counter_id] = name
+        return name
+
+    def _get_influx_names(self, counter_id):
+        """Returns the (measurement, field) names of a counter"""
+        info = self._pm._get_shared_counter_info(counter_id)
+        counter = self._pm._get_counters().get(counter_id)
+        rollup = counter is not None and counter.RollupType or ''
+        if info.name is None:
+            return (_sanitize("%s_unknown" % self.prefix),
+                    _sanitize("counter_%s" % counter_id))
+        return (_sanitize("%s_%s" % (self.prefix, info.group)),
+                _sanitize("%s_%s" % (info.name, rollup)))
+
+class MetricsHTTPServer(object):
+    """Local HTTP server with a /metrics endpoint (OpenMetrics format) for
+    Prometheus to scrape. A background thread polls a PerfSampler and keeps
+    the latest samples of each entity, which are served from memory. If a
+    poll fails, the last samples are still served, the error is kept in
+    last_error, and the '<prefix>_exporter_up' gauge drops to 0 (see also
+    '<prefix>_exporter_poll_errors_total' and
+    '<prefix>_exporter_last_success_timestamp_seconds'). E.g.:
+        sampler = PerfSampler(server, vms, ['cpu.usage', 'mem.usage'])
+        metrics = MetricsHTTPServer(sampler, PerfExporter(server), port=9272)
+        metrics.start()
+        ...
+        metrics.stop()
+    """
+
+    CONTENT_TYPE = ("application/openmetrics-text; version=1.0.0; "
+                    "charset=utf-8")
+
+    def __init__(self, sampler, exporter, port=9272, address=''):
+        self.sampler = sampler
+        self.exporter = exporter
+        self._latest = {}
+        self.last_error = None
+        self.last_error_time = None
+        self.last_success_time = None
+        self.poll_errors = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._httpd = BaseHTTPServer.HTTPServer((address, port),
+                                                self._make_handler())
+        self.port = self._httpd.server_port
+
+    def start(self):
+        """Starts polling the sampler and serving scrapes, in daemon threads"""
+        self._stop.clear()
+        self._threads = [threading.Thread(target=self._poll),
+                         threading.Thread(target=self._httpd.serve_forever)]
+        for t in self._threads:
+            t.daemon = True
+            t.start()
+
+    def stop(self):
+        """Stops the polling and the HTTP server, and waits for their threads.
+        Can be called even if the server wasn't started"""
+        self._stop.set()
+        if self._threads:
+            #shutdown waits for serve_forever to return, so it would block
+            #forever if it never ran
+            self._httpd.shutdown()
+            for t in self._threads:
+                t.join()
+            self._threads = []
+        self._httpd.server_close()
+
+    def write_metrics(self, out):
+        """Writes the latest samples as an OpenMetrics exposition to @out"""
+        self._lock.acquire()
+        try:
+            latest = self._latest.values()
+            up = self.last_error is None and self.last_success_time is not None
+            poll_errors = self.poll_errors
+            last_success_time = self.last_success_time
+        finally:
+            self._lock.release()
+        self.exporter.write_exposition(latest, out, eof=False)
+        name = "%s_exporter_up" % self.exporter.prefix
+        out.write("# TYPE %s gauge\n" % name)
+        out.write("# HELP %s Whether the last poll of the samples succeeded\n"
+                  % name)
+        out.write("%s %d\n" % (name, up))
+        name = "%s_exporter_poll_errors" % self.exporter.prefix
+        out.write("# TYPE %s counter\n" % name)
+        out.write("# HELP %s Polls of the samples that failed\n" % name)
+        out.write("%s_total %d\n" % (name, poll_errors))
+        if last_success_time is not None:
+            name = ("%s_exporter_last_success_timestamp_seconds"
+                    % self.exporter.prefix)
+            out.write("# TYPE %s gauge\n" % name)
+            out.write("# HELP %s Time of the last successful poll\n" % name)
+            out.write("%s %d\n" % (name, last_success_time))
+        out.write("# EOF\n")
+
+    def _poll(self):
+        while not self._stop.isSet():
+            start = time.time()
+            self._poll_once()
+            self._stop.wait(max(0, self.sampler.refresh_rate -
+                                   (time.time() - start)))
+
+    def _poll_once(self):
+        """Polls the sampler once and keeps the new samples, or the error if
+        it fails (the last samples are still served)"""
+        try:
+            for series in self.sampler.poll():
+                self._lock.acquire()
+                try:
+                    self._latest[str(series.entity)] = series
+                finally:
+                    self._lock.release()
+        except Exception, e:
+            self._lock.acquire()
+            try:
+                self.last_error = e
+                self.last_error_time = time.time()
+                self.poll_errors += 1
+            finally:
+                self._lock.release()
+        else:
+            self._lock.acquire()
+            try:
+                self.last_error = None
+                self.last_success_time = time.time()
+            finally:
+                self._lock.release()
+
+    def _make_handler(self):
+        metrics_server = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", metrics_server.CONTENT_TYPE)
+                self.end_headers()
+                metrics_server.write_metrics(self.wfile)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+def _sanitize(name):
+    """Replaces the characters not valid in metric names with underscores"""
+    return re.sub(r'[^a-zA-Z0-9_:]', '_', name)
+
+def _text(value):
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return str(value)
+
+def _escape_label(value):
+    return _text(value).replace('\\', '\\\\').replace('"', '\\"').replace(
+                                                                   '\n', '\\n')
+
+def _escape_help(value):
+    return _text(value).replace('\\', '\\\\').replace('\n', '\\n')
+
+def _escape_tag(value):
+    return re.sub(r'([,= ])', r'\\\1', _text(value))
@@ -29,26 +29,48 @@
 
 from pysphere.resources import VimService_services as VI
 from pysphere.vi_property import VIProperty
+from pysphere.vi_mor import MORTypes
+from pysphere.vi_performance_series import _tuple_to_timestamp
 from pysphere.resources.vi_exception import VIException, VIApiException, \
                     UnsupportedPerfIntervalError, FaultTypes
 import datetime
-
-class EntityStatistics:
-    def __init__(self, mor, counter_key, counter_name, counter_desc, group_name,
-                 group_desc, unit_name, unit_desc, instance_name, value,
-                 time_stamp):
+import time
+
+class CounterInfo(object):
+    """Name, description, group and unit of a performance counter. A single
+    instance per counter is shared by all its EntityStatistics"""
+    __slots__ = ('key', 'name', 'description', 'group', 'group_description',
+                 'unit', 'unit_description')
+
+    def __init__(self, key, name, description, group, group_description, unit,
+                 unit_description):
+        self.key = key
+        self.name = name
+        self.description = description
+        self.group = group
+        self.group_description = group_description
+        self.unit = unit
+        self.unit_description = unit_description
+
+class EntityStatistics(object):
+    __slots__ = ('mor', 'counter_info', 'instance', 'value', 'time')
+
+    def __init__(self, mor, counter_info, instance_name, value, time_stamp):
         self.mor = mor
-        self.counter_key = counter_key
-        self.counter = counter_name
-        self.description = counter_desc
-        self.group = group_name
-        self.group_description = group_desc
-        self.unit = unit_name
-        self.unit_description = unit_desc
+        self.counter_info = counter_info
         self.instance = instance_name
         self.value = value
         self.time = time_stamp
 
+    counter_key = property(lambda self: self.counter_info.key)
+    counter = property(lambda self: self.counter_info.name)
+    description = property(lambda self: self.counter_info.description)
+    group = property(lambda self: self.counter_info.group)
+    group_description = property(
+                               lambda self: self.counter_info.group_description)
+    unit = property(lambda self: self.counter_info.unit)
+    unit_description = property(lambda self: self.counter_info.unit_description)
+
     def __str__(self):
         return "MOR: %s\nCounter: %s (%s)\nGroup: %s\nDescription: %s\n" \
                "Instance: %s\nValue: %s\nUnit: %s\nTime: %s" % (
@@ -58,8 +80,10 @@ class EntityStatistics:
                                        self.unit_description, self.time)
 
     def __repr__(self):
-        return"<%(mor)s:%(counter)s(%(counter_key)s):%(description)s" \
-              ":%(instance)s:%(value)s:%(unit)s:%(time)s>" % self.__dict__
+        return "<%s:%s(%s):%s:%s:%s:%s:%s>" % (self.mor, self.counter,
+                                               self.counter_key,
+                                               self.description, self.instance,
+                                               self.value, self.unit, self.time)
 
 class Intervals:
     CURRENT = None
@@ -70,36 +94,110 @@ class Intervals:
 
 class PerformanceManager:
     INTERVALS = Intervals
+    #Seconds the provider summaries and available metrics are cached for
+    CACHE_TTL = 300
+    #Max metrics vCenter accepts in a historical statistics query (see
+    #config.vpxd.stats.maxQueryMetrics)
+    MAX_QUERY_METRICS = 64
+    #Default number of entities per request for real-time statistics
+    DEFAULT_BATCH_SIZE = 100
     
     def __init__(self, server, mor):
         self._server = server
         self._mor = mor
         self._properties = VIProperty(server, mor)
         
+        self._supported_intervals = {}
+        oc = server._get_object_properties(mor,
+                                        property_names=['historicalInterval'])
         try:
-            self._supported_intervals = dict([(i.key, i.samplingPeriod) 
-            for i in self._properties.historicalInterval if i.enabled])
-        except:
+            for prop in getattr(oc, "PropSet", []):
+                self._supported_intervals = dict([(i.Key, i.SamplingPeriod)
+                                    for i in prop.Val.PerfInterval if i.Enabled])
+        except AttributeError:
             #not historical intervals supported
-            self._supported_intervals = {}
-
-    def _get_counter_info(self, counter_id, counter_obj):
+            pass
+
+        #counters catalog (loaded on first use) and caches
+        self._counters = None
+        self._counter_ids = None
+        self._counter_infos = {}
+        self._summaries = {}
+        self._metrics = {}
+
+    def _get_counters(self):
+        """Returns a dictionary with the PerfCounterInfo objects of all the
+        counters in the server keyed by counter id. The catalog is retrieved
+        only once."""
+        if self._counters is None:
+            counters = {}
+            counter_ids = {}
+            oc = self._server._get_object_properties(self._mor,
+                                                property_names=['perfCounter'])
+            for prop in getattr(oc, "PropSet", []):
+                for c in prop.Val.PerfCounterInfo:
+                    counters[c.Key] = c
+                    counter_ids["%s.%s.%s" % (c.GroupInfo.Key, c.NameInfo.Key,
+                                              c.RollupType)] = c.Key
+            self._counter_ids = counter_ids
+            self._counters = counters
+        return self._counters
+
+    def _get_counter_id(self, name):
+        """Returns the id of the counter named @name ('group.name.rollup',
+        e.g. 'cpu.usage.average') or None if there's no such counter"""
+        self._get_counters()
+        return self._counter_ids.get(name)
+
+    def _get_counter_info(self, counter_id):
         """Return name, description, group, and unit info of a give counter_id.
-        counter_id [int]: id of the counter.
-        counter_obj [list]: An array consisting of performance
-            counter information for the specified counterIds."""
-        for c in counter_obj:
-            if c.Key == counter_id:
-                return (c.NameInfo.Key, c.NameInfo.Label, c.GroupInfo.Key, 
-                        c.GroupInfo.Label, c.UnitInfo.Key, c.UnitInfo.Label)
-        return None, None, None, None, None, None
-
-    def _get_metric_id(self, metrics, counter_obj, counter_ids):
+        counter_id [int]: id of the counter."""
+        c = self._get_counters().get(counter_id)
+        if c is None:
+            return None, None, None, None, None, None
+        return (c.NameInfo.Key, c.NameInfo.Label, c.GroupInfo.Key, 
+                c.GroupInfo.Label, c.UnitInfo.Key, c.UnitInfo.Label)
+
+    def _get_shared_counter_info(self, counter_id):
+        """Returns the CounterInfo of @counter_id. The same instance is returned
+        for every call with the same id."""
+        info = self._counter_infos.get(counter_id)
+        if info is None:
+            info = CounterInfo(counter_id, *self._get_counter_info(counter_id))
+            self._counter_infos[counter_id] = info
+        return info
+
+    def _get_provider_summary(self, entity):
+        """Same as query_perf_provider_summary, but summaries are cached by
+        entity type for CACHE_TTL seconds"""
+        now = time.time()
+        cached = self._summaries.get(entity.get_attribute_type())
+        if cached and cached[0] > now:
+            return cached[1]
+        summary = self.query_perf_provider_summary(entity)
+        self._summaries[entity.get_attribute_type()] = (now + self.CACHE_TTL,
+                                                        summary)
+        return summary
+
+    def _get_available_metrics(self, entity, interval_id):
+        """Same as query_available_perf_metric, but metrics are cached for
+        CACHE_TTL seconds. They're cached by entity rather than by entity type,
+        as instances (e.g. disks or NICs) are different for each entity."""
+        now = time.time()
+        key = (str(entity), interval_id)
+        cached = self._metrics.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+        metrics = self.query_available_perf_metric(entity,
+                                                   interval_id=interval_id)
+        self._metrics[key] = (now + self.CACHE_TTL, metrics)
+        return metrics
+
+    def _get_metric_id(self, metrics, counter_ids):
         """ Get the metric ID from a metric name.
         metrics [list]: An array of performance metrics with a
             performance counter ID and an instance name.
-        counter_obj [list]: An array consisting of performance
-            counter information for the specified counterIds.
+        counter_ids [list]: the ids of the counters to filter metrics by
         """
         metric_list = []
         for metric in metrics:
@@ -115,30 +213,255 @@ class PerformanceManager:
             interval id for historical statistics see IDs available in
             PerformanceManager.INTERVALS"""
         sampling_period = self._check_and_get_interval_by_id(entity, interval)
-        metrics = self.query_available_perf_metric(entity,
-                                                   interval_id=sampling_period)
+        metrics = self._get_available_metrics(entity, sampling_period)
         if not metrics:
             return {}
-        counter_obj = self.query_perf_counter([metric.CounterId 
-                                               for metric in metrics])
-        return dict([("%s.%s" % (c.GroupInfo.Key, c.NameInfo.Key), c.Key)
-                     for c in counter_obj]) 
+        counters = self._get_counters()
+        ret = {}
+        for metric in metrics:
+            c = counters.get(metric.CounterId)
+            if c is not None:
+                ret["%s.%s" % (c.GroupInfo.Key, c.NameInfo.Key)] = c.Key
+        return ret
         
 
     def get_entity_statistic(self, entity, counters, interval=None,
-                             composite=False):
+                             composite=False, all_samples=False):
         """ Get the give statistics from a given managed object
         entity [mor]: ManagedObject Reference of the managed object from were
             statistics are to be retrieved.
-        counter_id [list of integers or strings]: Counter names or ids 
-                                                 to retrieve stats for.
+        counter_id [list of integers or strings]: Counter names ('group.name'
+            or 'group.name.rollup') or ids to retrieve stats for.
         interval: None (default) for current real-time statistics, or the
             interval id for historical statistics see IDs available in
             PerformanceManager.INTERVALS
         composite [bool] (default False) If true, uses QueryPerfComposite
             instead of QueryPerf.
+        all_samples [bool] (default False) If true, returns an EntityStatistics
+            for every sample returned by the server (e.g. the last hour of
+            real-time statistics) instead of only the latest one.
         """
         sampling_period = self._check_and_get_interval_by_id(entity, interval)
+        counters = self._get_counter_ids(entity, counters, interval)
+                    
+        metrics = self._get_available_metrics(entity, sampling_period)
+        metric = self._get_metric_id(metrics, counters)
+        if not metric:
+            return []
+        max_sample = 1
+        if all_samples:
+            max_sample = None
+        query = self.query_perf(entity, metric_id=metric, max_sample=max_sample,
+                               interval_id=sampling_period, composite=composite)
+
+        statistics = []
+        if not query:
+            return statistics
+        
+        if composite:
+            #child entities values are attributed to each child
+            for child, stats in self._get_composite_statistics(entity, query,
+                                                   all_samples).iteritems():
+                statistics.extend(stats)
+            return statistics
+
+        sample_info = getattr(query[0], "SampleInfo", None)
+        stats = getattr(query[0], "Value", [])
+        return self._get_statistics(entity, stats, sample_info, all_samples)
+
+    def get_composite_statistics(self, entities, counters, interval=None,
+                                 instance="*", all_samples=False, workers=4):
+        """Gets the statistics of hosts and all their virtual machines with a
+        single QueryPerfComposite request per host, instead of one request per
+        virtual machine. Returns a dictionary with the list of EntityStatistics
+        of each host and virtual machine, keyed by their mor.
+        entities [list of mors]: hosts, or clusters (ComputeResources) to get
+            the statistics of all their hosts.
+        counters [list of integers or strings]: Counter names ('group.name'
+            or 'group.name.rollup') or ids to retrieve stats for. 'group.name'
+            names are looked up among the counters available for the first
+            host.
+        interval: None (default) for current real-time statistics, or the
+            interval id for historical statistics see IDs available in
+            PerformanceManager.INTERVALS
+        instance [string]: instance to retrieve for every counter, '*'
+            (default) for all of them, or '' for the aggregated value only.
+        all_samples [bool] (default False) If true, returns an EntityStatistics
+            for every sample returned by the server instead of only the latest
+            one.
+        workers [int]: max number of hosts queried concurrently.
+        """
+        if not isinstance(entities, list):
+            entities = [entities]
+        hosts = []
+        for entity in entities:
+            if entity.get_attribute_type() in (MORTypes.ClusterComputeResource,
+                                               MORTypes.ComputeResource):
+                hosts.extend(self._server.get_hosts(from_mor=entity).keys())
+            else:
+                hosts.append(entity)
+        if not hosts:
+            return {}
+        counters = self._get_counter_ids(hosts[0], counters, interval)
+        if not counters:
+            return dict([(host, []) for host in hosts])
+
+        def query_host(host):
+            spec = {'entity':host,
+                    'counter_ids':counters,
+                    'instance':instance,
+                    'interval_id':self._check_and_get_interval_by_id(host,
+                                                                     interval),
+                    'max_sample':not all_samples and 1 or None}
+            query = self._query_perf_specs([spec], composite=True)
+            return self._get_composite_statistics(host, query, all_samples)
+
+        ret = {}
+        for result in self._server.map(query_host, hosts, workers=workers):
+            ret.update(result)
+        return ret
+
+    def _get_composite_statistics(self, entity, query, all_samples):
+        """Returns a dictionary with the EntityStatistics of @entity and each
+        of its child entities in the PerfCompositeMetric @query, keyed by mor"""
+        ret = {entity:[]}
+        if not query:
+            return ret
+        sample_info = None
+        if hasattr(query, "Entity"):
+            sample_info = getattr(query.Entity, "SampleInfo", None)
+            ret[entity] = self._get_statistics(entity,
+                                               getattr(query.Entity, "Value",
+                                                       []),
+                                               sample_info, all_samples)
+        for item in getattr(query, "ChildEntity", []):
+            child = item.Entity
+            ret.setdefault(child, []).extend(self._get_statistics(child,
+                                      getattr(item, "Value", []),
+                                      getattr(item, "SampleInfo", sample_info),
+                                      all_samples))
+        return ret
+
+    def get_entities_statistics(self, entities, counters, interval=None,
+                                batch_size=None, instance="*",
+                                all_samples=False):
+        """Same as get_entity_statistic but for many entities at once. Instead
+        of a request per entity, the queries of many entities are sent in each
+        QueryPerf request. Returns a dictionary with the list of
+        EntityStatistics of each entity, keyed by entity.
+        entities [list of mors]: the managed objects to get statistics from.
+        counters [list of integers or strings]: Counter names ('group.name'
+            or 'group.name.rollup') or ids to retrieve stats for. 'group.name'
+            names are looked up among the counters available for the first
+            entity.
+        interval: None (default) for current real-time statistics, or the
+            interval id for historical statistics see IDs available in
+            PerformanceManager.INTERVALS
+        batch_size [int]: max number of entities per request. Defaults to
+            DEFAULT_BATCH_SIZE for real-time statistics. For historical
+            statistics it's capped so no request has more than
+            MAX_QUERY_METRICS metrics.
+        instance [string]: instance to retrieve for every counter, '*'
+            (default) for all of them, or '' for the aggregated value only.
+        all_samples [bool] (default False) If true, returns an EntityStatistics
+            for every sample returned by the server instead of only the latest
+            one.
+        """
+        if not entities:
+            return {}
+        counters = self._get_counter_ids(entities[0], counters, interval)
+        if not counters:
+            return dict([(entity, []) for entity in entities])
+        if not batch_size:
+            batch_size = self.DEFAULT_BATCH_SIZE
+        if interval:
+            batch_size = min(batch_size,
+                             max(1, self.MAX_QUERY_METRICS // len(counters)))
+
+        ret = {}
+        for i in xrange(0, len(entities), batch_size):
+            batch = entities[i:i+batch_size]
+            by_mor = dict([(str(entity), entity) for entity in batch])
+            for entity in batch:
+                ret[entity] = []
+            specs = []
+            for entity in batch:
+                specs.append({'entity':entity,
+                              'counter_ids':counters,
+                              'instance':instance,
+                              'interval_id':self._check_and_get_interval_by_id(
+                                                              entity, interval),
+                              'max_sample':not all_samples and 1 or None})
+            query = self._query_perf_specs(specs)
+
+            for entity_metric in query or []:
+                entity = by_mor.get(str(entity_metric.Entity))
+                if entity is None or not hasattr(entity_metric, "Value"):
+                    continue
+                ret[entity].extend(self._get_statistics(entity,
+                                                  entity_metric.Value,
+                                                  getattr(entity_metric,
+                                                          "SampleInfo", None),
+                                                  all_samples))
+        return ret
+
+    def _query_perf_specs(self, specs, composite=False):
+        """Sends a single QueryPerf request with a PerfQuerySpec for each of
+        the dictionaries in @specs and returns the raw result. Each dictionary
+        has an 'entity' (mor) and optionally 'counter_ids', 'instance' (defaults
+        to '*'), 'interval_id', 'max_sample', 'start_time' and 'end_time' (time
+        tuples, server time) and 'format' ('normal' or 'csv'). If @composite,
+        sends a QueryPerfComposite request instead (@specs must have a single
+        host spec)."""
+        try:
+            if composite:
+                request = VI.QueryPerfCompositeRequestMsg()
+            else:
+                request = VI.QueryPerfRequestMsg()
+            mor_qp = request.new__this(self._mor)
+            mor_qp.set_attribute_type(self._mor.get_attribute_type())
+            request.set_element__this(mor_qp)
+
+            query_specs = []
+            for spec in specs:
+                entity = spec['entity']
+                query_spec = request.new_querySpec()
+                spec_entity = query_spec.new_entity(entity)
+                spec_entity.set_attribute_type(entity.get_attribute_type())
+                query_spec.set_element_entity(spec_entity)
+                if spec.get('format', 'normal') != 'normal':
+                    query_spec.set_element_format(spec['format'])
+                if spec.get('interval_id'):
+                    query_spec.set_element_intervalId(spec['interval_id'])
+                if spec.get('max_sample'):
+                    query_spec.set_element_maxSample(spec['max_sample'])
+                if spec.get('start_time'):
+                    query_spec.set_element_startTime(spec['start_time'])
+                if spec.get('end_time'):
+                    query_spec.set_element_endTime(spec['end_time'])
+                if spec.get('counter_ids'):
+                    metric_ids = []
+                    for counter_id in spec['counter_ids']:
+                        metric_id = query_spec.new_metricId()
+                        metric_id.set_element_counterId(counter_id)
+                        metric_id.set_element_instance(spec.get('instance',
+                                                                '*'))
+                        metric_ids.append(metric_id)
+                    query_spec.set_element_metricId(metric_ids)
+                query_specs.append(query_spec)
+
+            if composite:
+                request.set_element_querySpec(query_specs[0])
+                return self._server._proxy.QueryPerfComposite(
+                                                            request)._returnval
+            request.set_element_querySpec(query_specs)
+            return self._server._proxy.QueryPerf(request)._returnval
+        except (VI.ZSI.FaultException), e:
+            raise VIApiException(e)
+
+    def _get_counter_ids(self, entity, counters, interval):
+        """Translates the counter names in @counters (a single counter or a
+        list of them) to counter ids. Names that can't be found are ignored."""
         if not isinstance(counters, list):
             counters = [counters]
             
@@ -149,52 +472,47 @@ class PerformanceManager:
                 if isinstance(c, int):
                     new_list.append(c)
                 else:
-                    counter_id = avail_counters.get(c)
+                    counter_id = avail_counters.get(c) or \
+                                 self._get_counter_id(c)
                     if counter_id:
                         new_list.append(counter_id)
             counters = new_list
-                    
-        metrics = self.query_available_perf_metric(entity,
-                                                   interval_id=sampling_period)
-        counter_obj = self.query_perf_counter(counters)
-        metric = self._get_metric_id(metrics, counter_obj, counters)
-        if not metric:
-            return []
-        query = self.query_perf(entity, metric_id=metric, max_sample=1,
-                               interval_id=sampling_period, composite=composite)
-
-        statistics = []
-        if not query:
-            return statistics
-        
-        stats = []
-        if composite:
-            if hasattr(query, "Entity"):
-                stats.extend(query.Entity.Value)
-            if hasattr(query, "ChildEntity"):
-                for item in query.ChildEntity:
-                    stats.extend(item.Value)
+        return counters
+
+    def _get_statistics(self, entity, stats, sample_info=None,
+                        all_samples=False):
+        """Returns a list of EntityStatistics for the PerfMetricSeries in
+        @stats, retrieved for @entity. Values are time stamped with the server
+        time of their sample in @sample_info (the PerfSampleInfo list of the
+        query result), or with the client's current time if not given, as
+        UTC datetimes. Only the last sample of each series is returned unless
+        @all_samples"""
+        if sample_info:
+            times = [datetime.datetime.utcfromtimestamp(
+                                           _tuple_to_timestamp(info.Timestamp))
+                     for info in sample_info]
         else:
-            if hasattr(query[0], "Value"):
-                stats = query[0].Value
+            times = [datetime.datetime.utcnow()]
+        statistics = []
         for stat in stats:
-            cname, cdesc, gname, gdesc, uname, udesc = self._get_counter_info(
-                                                  stat.Id.CounterId,counter_obj)
-
-            instance_name = str(stat.Id.Instance)
-            stat_value = str(stat.Value[0])
-            date_now = datetime.datetime.utcnow()
-            statistics.append(EntityStatistics(entity, stat.Id.CounterId, cname,
-                                               cdesc, gname, gdesc, uname, 
-                                               udesc, instance_name, stat_value,
-                                               date_now))
+            counter_info = self._get_shared_counter_info(stat.Id.CounterId)
+            instance_name = intern(str(stat.Id.Instance))
+            values = getattr(stat, "Value", None) or []
+            if not all_samples:
+                values = values[-1:]
+            #series are aligned to the end of the sample info list
+            offset = len(times) - len(values)
+            for i, value in enumerate(values):
+                statistics.append(EntityStatistics(entity, counter_info,
+                                                   instance_name, value,
+                                                   times[max(0, offset + i)]))
         return statistics
 
     def _check_and_get_interval_by_id(self, entity, interval):
         """Given an interval ID (or None for refresh rate) verifies if
         the entity or the system supports that interval. Returns the sampling
         period if so, or raises an Exception if not supported"""
-        summary = self.query_perf_provider_summary(entity)
+        summary = self._get_provider_summary(entity)
         if not interval: #must support current (real time) statistics
             if not summary.CurrentSupported:
                 
@@ -335,7 +653,7 @@ class PerformanceManager:
 
     def query_perf(self, entity, format='normal', interval_id=None, 
                    max_sample=None, metric_id=None, start_time=None,
-                   composite=False):
+                   composite=False, end_time=None):
         """Returns performance statistics for the entity. The client can limit
         the returned information by specifying a list of metrics and a suggested
         sample interval ID. Server accepts either the refreshRate or one of the
@@ -365,6 +683,9 @@ class PerformanceManager:
             include the sample at startTime.
         composite: [bool]: If true requests QueryPerfComposite method instead of
             QuerPerf.
+        end_time [timetuple]: The time up to which statistics are retrieved.
+            Corresponds to server time. When endTime is omitted, the returned
+            result includes up to the most recent metric value.
         """
 
         if interval_id:
@@ -408,6 +729,8 @@ class PerformanceManager:
                 query_spec.set_element_metricId(metric_id)
             if start_time:
                 query_spec.set_element_startTime(start_time)
+            if end_time:
+                query_spec.set_element_endTime(end_time)
             
             if composite:
                 request.set_element_querySpec(query_spec)
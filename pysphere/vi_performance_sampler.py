@@ -0,0 +1,247 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#--
+
+import calendar
+import datetime
+import time
+
+from pysphere.resources.vi_exception import VIException, FaultTypes
+from pysphere.vi_performance_series import decode_entity_metric, \
+                                           _timestamp_to_tuple
+
+class PerfSampler(object):
+    """Continuously samples the real-time statistics of a set of entities.
+    Keeps the server time of the last sample received of each entity (its
+    watermark) and uses it as the startTime of the next query, so each poll
+    returns only the samples collected since the previous one, time stamped by
+    the server. The queries of many entities are sent in each QueryPerf
+    request.
+
+    sampler = PerfSampler(server, vm_mors, ['cpu.usage', 'mem.usage'])
+    for series in sampler:
+        print series.entity, series.timestamps, series.values
+    """
+
+    #poll interval used if the providers don't report a refresh rate
+    DEFAULT_REFRESH_RATE = 20
+
+    def __init__(self, server, entities, counters, instance="*",
+                 batch_size=None):
+        """server: a connected VIServer instance.
+        entities [list of mors]: the managed objects to sample.
+        counters [list of integers or strings]: Counter names ('group.name'
+            or 'group.name.rollup') or ids to sample. 'group.name' names are
+            looked up among the counters available for the first entity.
+        instance [string]: instance to retrieve for every counter, '*'
+            (default) for all of them, or '' for the aggregated value only.
+        batch_size [int]: max number of entities per request. Defaults to
+            PerformanceManager.DEFAULT_BATCH_SIZE.
+        """
+        self._pm = server.get_performance_manager()
+        self._entities = list(entities)
+        self._counters = []
+        if self._entities:
+            self._counters = self._pm._get_counter_ids(self._entities[0],
+                                                       counters, None)
+        self._instance = instance
+        self._batch_size = batch_size or self._pm.DEFAULT_BATCH_SIZE
+        self._watermarks = {}
+
+        self._refresh_rates = {}
+        for entity in self._entities:
+            self._refresh_rates[str(entity)] = \
+                        self._pm._check_and_get_interval_by_id(entity, None)
+        rates = [r for r in self._refresh_rates.values() if r]
+        self.refresh_rate = rates and min(rates) or self.DEFAULT_REFRESH_RATE
+
+    def poll(self):
+        """Queries the samples collected since the previous poll (only the
+        latest one for entities not polled yet) and returns a list with a
+        PerfSeries for each entity with new samples."""
+        ret = []
+        if not self._counters:
+            return ret
+        for i in xrange(0, len(self._entities), self._batch_size):
+            specs = []
+            for entity in self._entities[i:i+self._batch_size]:
+                spec = {'entity':entity,
+                        'counter_ids':self._counters,
+                        'instance':self._instance,
+                        'interval_id':self._refresh_rates[str(entity)]}
+                watermark = self._watermarks.get(str(entity))
+                if watermark is None:
+                    spec['max_sample'] = 1
+                else:
+                    spec['start_time'] = _timestamp_to_tuple(watermark)
+                specs.append(spec)
+
+            for entity_metric in self._pm._query_perf_specs(specs) or []:
+                series = decode_entity_metric(entity_metric)
+                key = str(series.entity)
+                watermark = self._watermarks.get(key)
+                if watermark is not None:
+                    #drop anything not newer than the watermark, in case the
+                    #server includes the sample at startTime
+                    first = 0
+                    while (first < len(series) and
+                           series.timestamps[first] <= watermark):
+                        first += 1
+                    if first:
+                        series = _slice_series(series, first)
+                if not len(series):
+                    continue
+                self._watermarks[key] = series.timestamps[-1]
+                ret.append(series)
+        return ret
+
+    def samples(self, count=None):
+        """Generator that polls every refresh_rate seconds and yields the
+        PerfSeries with new samples as they arrive. Stops after @count polls,
+        or runs until closed if @count is None."""
+        polls = 0
+        while count is None or polls < count:
+            start = time.time()
+            for series in self.poll():
+                yield series
+            polls += 1
+            if count is None or polls < count:
+                time.sleep(max(0, self.refresh_rate - (time.time() - start)))
+
+    def __iter__(self):
+        return self.samples()
+
+    def get_watermark(self, entity):
+        """Returns the server time (seconds since the epoch, UTC) of the last
+        sample received for @entity, or None if none was received yet"""
+        return self._watermarks.get(str(entity))
+
+def _slice_series(series, first):
+    """Returns a copy of @series without its first @first samples"""
+    values = dict([(k, v[first:]) for k, v in series.values.iteritems()])
+    return series.__class__(series.entity, series.timestamps[first:],
+                            series.intervals[first:], values)
+
+def backfill(server, entities, counters, start, end, interval=None,
+             instance="*", window_samples=360, workers=4, batch_size=None,
+             sink=None):
+    """Retrieves the statistics of @entities between @start and @end in time
+    windows of @window_samples samples of the interval, instead of one huge
+    response. Up to @workers windows are queried concurrently (see
+    VIServer.map) and the results are streamed window by window: a PerfSeries
+    per entity and window is passed to @sink(series) if given, otherwise this
+    function is a generator that yields them. Windows come in ascending time
+    order, and within a window the series of each entity follow one another
+    (samples of different entities are not interleaved by time). Only @workers
+    windows are held in memory at a time.
+    server: a connected VIServer instance.
+    entities [list of mors]: the managed objects to get statistics from.
+    counters [list of integers or strings]: Counter names ('group.name'
+        or 'group.name.rollup') or ids to retrieve. 'group.name' names are
+        looked up among the counters available for the first entity.
+    start, end [datetime (UTC) or seconds since the epoch]: server time range.
+        Samples at @start are not included, samples at @end are.
+    interval: None (default) for real-time statistics, or the interval id
+        for historical statistics see IDs available in
+        PerformanceManager.INTERVALS (e.g. INTERVALS.PAST_DAY), not its
+        sampling period in seconds
+    instance [string]: instance to retrieve for every counter, '*'
+        (default) for all of them, or '' for the aggregated value only.
+    batch_size [int]: max number of entities per request. Defaults to
+        PerformanceManager.DEFAULT_BATCH_SIZE. For historical statistics it's
+        capped so no request has more than MAX_QUERY_METRICS metrics.
+    """
+    items = _backfill_items(server, entities, counters, start, end, interval,
+                            instance, window_samples, batch_size)
+    if sink is None:
+        return _backfill_iter(server, items, workers)
+    for series in _backfill_iter(server, items, workers):
+        sink(series)
+
+def _backfill_items(server, entities, counters, start, end, interval,
+                    instance, window_samples, batch_size):
+    """Returns the list of (performance manager, specs) requests to send for
+    a backfill, ordered by time window"""
+    pm = server.get_performance_manager()
+    entities = list(entities)
+    if not entities:
+        return []
+    counters = pm._get_counter_ids(entities[0], counters, interval)
+    if not counters:
+        return []
+    if not isinstance(window_samples, int) or window_samples <= 0:
+        raise VIException("window_samples must be a positive integer",
+                          FaultTypes.PARAMETER_ERROR)
+    start = _to_timestamp(start)
+    end = _to_timestamp(end)
+
+    batch_size = batch_size or pm.DEFAULT_BATCH_SIZE
+    if interval:
+        batch_size = min(batch_size,
+                         max(1, pm.MAX_QUERY_METRICS // len(counters)))
+    periods = {}
+    for entity in entities:
+        periods[str(entity)] = pm._check_and_get_interval_by_id(entity,
+                                                                interval)
+    window = (max([p or 0 for p in periods.values()]) or
+              PerfSampler.DEFAULT_REFRESH_RATE) * window_samples
+
+    items = []
+    window_start = start
+    while window_start < end:
+        window_end = min(window_start + window, end)
+        for i in xrange(0, len(entities), batch_size):
+            specs = []
+            for entity in entities[i:i+batch_size]:
+                specs.append({'entity':entity,
+                              'counter_ids':counters,
+                              'instance':instance,
+                              'interval_id':periods[str(entity)],
+                              'start_time':_timestamp_to_tuple(window_start),
+                              'end_time':_timestamp_to_tuple(window_end)})
+            items.append((pm, specs))
+        window_start = window_end
+    return items
+
+def _backfill_iter(server, items, workers):
+    def query(item):
+        pm, specs = item
+        return [decode_entity_metric(entity_metric)
+                for entity_metric in pm._query_perf_specs(specs) or []]
+    for i in xrange(0, len(items), workers):
+        for result in server.map(query, items[i:i+workers], workers=workers):
+            for series in result:
+                if len(series):
+                    yield series
+
+def _to_timestamp(value):
+    """Converts a datetime (UTC) to seconds since the epoch. Numbers are
+    returned as they are"""
+    if isinstance(value, datetime.datetime):
+        return calendar.timegm(value.utctimetuple())
+    return value
@@ -0,0 +1,158 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#--
+
+import calendar
+import time
+from array import array
+
+from pysphere.resources.vi_exception import VIException, FaultTypes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#array type code for the integer columns (values, timestamps and intervals).
+#Python 2 arrays have no 'q' type code, so if a C long can't hold 64 bits
+#doubles are used instead (they are exact up to 2**53)
+if array('l').itemsize >= 8:
+    INT_TYPECODE = 'l'
+else:
+    INT_TYPECODE = 'd'
+
+class PerfSeries(object):
+    """Performance samples of an entity stored in columns: the sample
+    timestamps (seconds since the epoch, UTC), the sampling intervals, and an
+    array of values for each (counter id, instance) pair. Missing samples have
+    a value of -1 (as returned by the server)."""
+
+    def __init__(self, entity, timestamps, intervals, values):
+        self.entity = entity
+        self.timestamps = timestamps
+        self.intervals = intervals
+        self.values = values
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __repr__(self):
+        return "<PerfSeries %s: %d samples, %d metrics>" % (self.entity,
+                                                            len(self),
+                                                            len(self.values))
+
+    def keys(self):
+        """Returns the (counter id, instance) pairs with values"""
+        return self.values.keys()
+
+    def get(self, counter_id, instance=''):
+        """Returns the values array of the counter @counter_id and @instance
+        ('' for the aggregated value), or None if there are no values for it"""
+        return self.values.get((counter_id, instance))
+
+    def as_numpy(self):
+        """Returns a (timestamps, values) tuple, where timestamps is a numpy
+        array and values a dictionary of numpy arrays keyed by (counter id,
+        instance). Arrays are views of the same memory (no copies are made).
+        Requires numpy."""
+        if numpy is None:
+            raise VIException("numpy is required for numpy arrays",
+                              FaultTypes.NOT_SUPPORTED)
+        return (_numpy_view(self.timestamps),
+                dict([(k, _numpy_view(v)) for k, v in self.values.iteritems()]))
+
+def decode_perf_entity_metrics(query_result):
+    """Decodes the result of PerformanceManager.query_perf (either in 'normal'
+    or 'csv' format) into a list of PerfSeries, one for each entity."""
+    ret = []
+    for entity_metric in query_result or []:
+        if hasattr(entity_metric, "SampleInfoCSV"):
+            ret.append(decode_csv_entity_metric(entity_metric))
+        else:
+            ret.append(decode_entity_metric(entity_metric))
+    return ret
+
+def decode_entity_metric(entity_metric):
+    """Decodes a PerfEntityMetric ('normal' format) into a PerfSeries"""
+    timestamps = array(INT_TYPECODE)
+    intervals = array(INT_TYPECODE)
+    for info in getattr(entity_metric, "SampleInfo", []):
+        timestamps.append(_tuple_to_timestamp(info.Timestamp))
+        intervals.append(info.Interval)
+    values = {}
+    for series in getattr(entity_metric, "Value", []):
+        key = (series.Id.CounterId, str(getattr(series.Id, "Instance", "")))
+        values[key] = array(INT_TYPECODE, getattr(series, "Value", []))
+    return PerfSeries(entity_metric.Entity, timestamps, intervals, values)
+
+def decode_csv_entity_metric(entity_metric):
+    """Decodes a PerfEntityMetricCSV ('csv' format) into a PerfSeries"""
+    timestamps = array(INT_TYPECODE)
+    intervals = array(INT_TYPECODE)
+    sample_info = getattr(entity_metric, "SampleInfoCSV", "")
+    if sample_info:
+        #"interval,timestamp,interval,timestamp,..."
+        fields = sample_info.split(",")
+        for i in xrange(0, len(fields) - 1, 2):
+            intervals.append(int(fields[i]))
+            timestamps.append(_iso_to_timestamp(fields[i+1]))
+    values = {}
+    for series in getattr(entity_metric, "Value", []):
+        key = (series.Id.CounterId, str(getattr(series.Id, "Instance", "")))
+        csv = getattr(series, "Value", "")
+        if csv:
+            values[key] = array(INT_TYPECODE, [_csv_value(v)
+                                               for v in csv.split(",")])
+        else:
+            values[key] = array(INT_TYPECODE)
+    return PerfSeries(entity_metric.Entity, timestamps, intervals, values)
+
+def _tuple_to_timestamp(time_tuple):
+    """Converts a ZSI dateTime tuple to seconds since the epoch. ZSI parses
+    dateTime values into local time tuples"""
+    return int(time.mktime(tuple(time_tuple[:6]) + (0, 0, -1)))
+
+def _timestamp_to_tuple(timestamp):
+    """Converts seconds since the epoch to the time tuple ZSI serializes as a
+    dateTime: local time, with the milliseconds field (index 6) zeroed"""
+    time_tuple = list(time.localtime(timestamp))
+    time_tuple[6] = 0
+    return tuple(time_tuple)
+
+def _iso_to_timestamp(text):
+    """Converts an xsd:dateTime in UTC (e.g. '2012-05-10T10:00:20Z') to seconds
+    since the epoch"""
+    return calendar.timegm(time.strptime(text[:19], "%Y-%m-%dT%H:%M:%S"))
+
+def _csv_value(text):
+    if not text:
+        return -1
+    return int(text)
+
+def _numpy_view(arr):
+    return numpy.frombuffer(arr, dtype=numpy.dtype(arr.typecode))
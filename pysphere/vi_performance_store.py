@@ -0,0 +1,351 @@
+#--
+# Copyright (c) 2012, Sebastian Tello
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#   * Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#   * Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#   * Neither the name of copyright holders nor the names of its contributors
+#     may be used to endorse or promote products derived from this software
+#     without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#--
+
+import os
+import mmap
+import time
+import struct
+import urllib
+import calendar
+import threading
+from array import array
+
+from pysphere.resources.vi_exception import VIException, FaultTypes
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#segment file layout: a header with the base timestamp of the segment and
+#then one fixed size record per sample, with the timestamp stored as a delta
+#from the base. Files are only appended to, except on compaction.
+_HEADER = struct.Struct('<4sHHq')   #magic, version, reserved, base timestamp
+_RECORD = struct.Struct('<iq')      #timestamp delta (seconds), value
+_MAGIC = 'PSTS'
+_VERSION = 1
+
+class PerfStore(object):
+    """Local append-only store of performance samples, with a memory mapped
+    segment file per (entity, counter id, instance) in the @path directory.
+    Fed with the PerfSeries of PerfSampler, backfill or decode_perf_entity_metrics
+    (see add) or with EntityStatistics (see add_statistics), it answers range
+    queries without requests to the server. Samples older than @retention
+    seconds (if set) are dropped by compact. E.g.:
+        store = PerfStore('/var/lib/vsphere-perf', retention=7 * 86400)
+        for series in PerfSampler(server, vms, ['cpu.usage']).samples(10):
+            store.add(series)
+        now = time.time()
+        cpu = store.read(vms[0], counter_id, '', now - 6 * 3600, now)
+    """
+
+    def __init__(self, path, retention=None):
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        self.path = path
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._last = {}     #file name -> (base, last timestamp)
+        self._maps = {}     #file name -> (size, mmap)
+
+    def add(self, series):
+        """Appends the samples of a PerfSeries. Samples not newer than the
+        last one stored for the same metric are ignored, as are missing
+        samples (negative values). Returns the number of samples stored."""
+        count = 0
+        timestamps = series.timestamps
+        for (counter_id, instance), values in series.values.iteritems():
+            count += self._append(series.entity, counter_id, instance,
+                                  [(int(timestamps[i]), int(values[i]))
+                                   for i in xrange(len(values))
+                                   if values[i] >= 0])
+        return count
+
+    def add_statistics(self, statistics):
+        """Appends the values of a list of EntityStatistics (see
+        PerformanceManager.get_entity_statistic). Returns the number of
+        samples stored."""
+        metrics = {}
+        for stat in statistics:
+            key = (str(stat.mor), stat.counter_key, stat.instance)
+            metrics.setdefault(key, []).append(
+                      (calendar.timegm(stat.time.utctimetuple()), stat.value))
+        count = 0
+        for (entity, counter_id, instance), samples in metrics.iteritems():
+            samples.sort()
+            count += self._append(entity, counter_id, instance, samples)
+        return count
+
+    def read(self, entity, counter_id, instance='', start=None, end=None):
+        """Returns a RecordsView of the samples of a metric with
+        start < timestamp <= end (@start and @end are seconds since the epoch,
+        None for no limit). The view reads the memory mapped file, no samples
+        are copied."""
+        name = self._file_name(entity, counter_id, instance)
+        self._lock.acquire()
+        try:
+            mm = self._get_map(name)
+        finally:
+            self._lock.release()
+        if mm is None:
+            return RecordsView(None, 0, 0, 0)
+        base = _HEADER.unpack_from(mm, 0)[3]
+        count = (len(mm) - _HEADER.size) // _RECORD.size
+        first, last = 0, count
+        if start is not None:
+            first = _bisect(mm, base, start, 0, count)
+        if end is not None:
+            last = _bisect(mm, base, end, first, count)
+        return RecordsView(mm, base, first, last)
+
+    def keys(self):
+        """Returns the (entity, counter id, instance) of the stored metrics"""
+        ret = []
+        for name in sorted(os.listdir(self.path)):
+            if not name.endswith('.seg'):
+                continue
+            entity, counter_id, instance = name[:-4].split('~')
+            ret.append((urllib.unquote(entity), int(counter_id),
+                        urllib.unquote(instance)))
+        return ret
+
+    def compact(self, now=None):
+        """Drops the samples older than the retention period (relative to @now
+        or the current time), rewriting each segment that has any so it
+        starts at its oldest sample. Segments left empty are removed."""
+        if not self.retention:
+            return
+        if now is None:
+            now = time.time()
+        cutoff = int(now - self.retention)
+        for entity, counter_id, instance in self.keys():
+            self._lock.acquire()
+            try:
+                self._compact(self._file_name(entity, counter_id, instance),
+                              cutoff)
+            finally:
+                self._lock.release()
+
+    def close(self):
+        self._lock.acquire()
+        try:
+            for size, mm in self._maps.values():
+                mm.close()
+            self._maps = {}
+        finally:
+            self._lock.release()
+
+    def _append(self, entity, counter_id, instance, samples):
+        if not samples:
+            return 0
+        name = self._file_name(entity, counter_id, instance)
+        path = os.path.join(self.path, name)
+        self._lock.acquire()
+        try:
+            base, last = self._get_last(name)
+            if base is None:
+                base = samples[0][0]
+            records = []
+            for timestamp, value in samples:
+                if last is not None and timestamp <= last:
+                    continue
+                delta = timestamp - base
+                if not -2**31 <= delta < 2**31:
+                    raise VIException("Sample time out of the segment range",
+                                      FaultTypes.PARAMETER_ERROR)
+                records.append(_RECORD.pack(delta, value))
+                last = timestamp
+            if not records:
+                return 0
+            try:
+                f = open(path, 'r+b')
+            except IOError:
+                f = open(path, 'wb')
+            try:
+                f.seek(0, 2)
+                size = f.tell()
+                end = size - (size - _HEADER.size) % _RECORD.size
+                if size < _HEADER.size:
+                    end = 0
+                if end != size:
+                    #drop what a crash left of the header or the last record,
+                    #or every record appended after it would be misaligned
+                    self._maps.pop(name, None)
+                    f.seek(end)
+                    f.truncate()
+                if end == 0:
+                    f.write(_HEADER.pack(_MAGIC, _VERSION, 0, base))
+                f.write(''.join(records))
+            finally:
+                f.close()
+            self._last[name] = (base, last)
+            return len(records)
+        finally:
+            self._lock.release()
+
+    def _get_last(self, name):
+        """Returns the base and last timestamp of a segment (None, None if it
+        doesn't exist). Must be called holding the lock."""
+        if name not in self._last:
+            mm = self._get_map(name)
+            if mm is None:
+                return None, None
+            base = _HEADER.unpack_from(mm, 0)[3]
+            count = (len(mm) - _HEADER.size) // _RECORD.size
+            last = None
+            if count:
+                last = base + _RECORD.unpack_from(mm, _HEADER.size +
+                                              (count - 1) * _RECORD.size)[0]
+            self._last[name] = (base, last)
+        return self._last[name]
+
+    def _get_map(self, name):
+        """Returns a read only memory map of the segment, remapped if the file
+        grew, or None if there's no segment. Must be called holding the
+        lock."""
+        path = os.path.join(self.path, name)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            self._maps.pop(name, None)
+            return None
+        if size < _HEADER.size:
+            return None
+        cached = self._maps.get(name)
+        if cached and cached[0] == size:
+            return cached[1]
+        f = open(path, 'rb')
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            f.close()
+        magic, version = _HEADER.unpack_from(mm, 0)[:2]
+        if magic != _MAGIC or version != _VERSION:
+            raise VIException("%s is not a performance segment file" % path,
+                              FaultTypes.PARAMETER_ERROR)
+        #views returned by read may still reference the previous map, so it
+        #is left to be closed when no longer referenced
+        self._maps[name] = (size, mm)
+        return mm
+
+    def _compact(self, name, cutoff):
+        mm = self._get_map(name)
+        if mm is None:
+            return
+        base = _HEADER.unpack_from(mm, 0)[3]
+        count = (len(mm) - _HEADER.size) // _RECORD.size
+        first = _bisect(mm, base, cutoff - 1, 0, count)
+        path = os.path.join(self.path, name)
+        if first == 0:
+            return
+        self._maps.pop(name, None)
+        self._last.pop(name, None)
+        if first == count:
+            os.remove(path)
+            return
+        new_base = base + _RECORD.unpack_from(mm, _HEADER.size +
+                                              first * _RECORD.size)[0]
+        tmp_path = path + '.tmp'
+        f = open(tmp_path, 'wb')
+        try:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0, new_base))
+            for i in xrange(first, count):
+                delta, value = _RECORD.unpack_from(mm, _HEADER.size +
+                                                   i * _RECORD.size)
+                f.write(_RECORD.pack(delta + base - new_base, value))
+        finally:
+            f.close()
+        os.rename(tmp_path, path)
+
+    def _file_name(self, entity, counter_id, instance):
+        return "%s~%d~%s.seg" % (urllib.quote(str(entity), safe=''),
+                                 counter_id, urllib.quote(instance, safe=''))
+
+class RecordsView(object):
+    """A range of samples of a segment, read from the memory mapped file.
+    Indexing returns (timestamp, value) tuples."""
+
+    def __init__(self, mm, base, first, last):
+        self._mm = mm
+        self.base = base
+        self._first = first
+        self._last = last
+
+    def __len__(self):
+        return self._last - self._first
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        delta, value = _RECORD.unpack_from(self._mm, _HEADER.size +
+                                    (self._first + index) * _RECORD.size)
+        return self.base + delta, value
+
+    def __iter__(self):
+        for i in xrange(len(self)):
+            yield self[i]
+
+    def timestamps(self):
+        """Returns an array with the timestamps (a copy)"""
+        return array('d', [self.base + _RECORD.unpack_from(self._mm,
+                                _HEADER.size + i * _RECORD.size)[0]
+                           for i in xrange(self._first, self._last)])
+
+    def values(self):
+        """Returns an array with the values (a copy)"""
+        return array('d', [_RECORD.unpack_from(self._mm,
+                                _HEADER.size + i * _RECORD.size)[1]
+                           for i in xrange(self._first, self._last)])
+
+    def as_numpy(self):
+        """Returns a numpy structured array view of the records ('delta' and
+        'value' fields, timestamps are base + delta), without copying them.
+        Requires numpy."""
+        if numpy is None:
+            raise VIException("numpy is required for numpy arrays",
+                              FaultTypes.NOT_SUPPORTED)
+        dtype = numpy.dtype([('delta', '<i4'), ('value', '<i8')])
+        if not len(self):
+            return numpy.zeros(0, dtype=dtype)
+        return numpy.frombuffer(self._mm, dtype=dtype, count=len(self),
+                        offset=_HEADER.size + self._first * _RECORD.size)
+
+def _bisect(mm, base, timestamp, low, high):
+    """Returns the index of the first record (between @low and @high) newer
+    than @timestamp"""
+    while low < high:
+        mid = (low + high) // 2
+        delta = _RECORD.unpack_from(mm, _HEADER.size + mid * _RECORD.size)[0]
+        if base + delta <= timestamp:
+            low = mid + 1
+        else:
+            high = mid
+    return low
@@ -51,8 +51,7 @@ class VIProperty(object):
         #If this is a MOR we need to recurse
         if self._type == 'ManagedObjectReference':
             oc = self._server._get_object_properties(self._obj, get_all=True)
-            ps = oc.get_element_propSet()
-            self._values = dict([(i.Name, i.Val) for i in ps])
+            self._set_prop_set(oc.get_element_propSet())
         #Just inspect the attributes
         else:
             methods = getmembers(self._obj, predicate=inspect.ismethod)
@@ -65,6 +64,12 @@ class VIProperty(object):
                     continue
         self._values_set = True
 
+    def _set_prop_set(self, prop_set):
+        """Sets the values of a managed object reference property from an
+        already retrieved propSet, so they don't have to be requested again"""
+        self._values = dict([(i.Name, i.Val) for i in prop_set])
+        self._values_set = True
+
 
     def __getattr__(self, name):
         if not self._values_set:
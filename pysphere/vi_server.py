@@ -28,17 +28,33 @@
 #--
 
 import sys
+import time
+import threading
+import Queue
 
 from pysphere.resources import VimService_services as VI
+from pysphere.ZSI.writer import StringElementProxy, FragmentList
 
 from pysphere import VIException, VIApiException, FaultTypes
+from pysphere.vi_property import VIProperty
 from pysphere.vi_virtual_machine import VIVirtualMachine
 from pysphere.vi_performance_manager import PerformanceManager
 from pysphere.vi_task_history_collector import VITaskHistoryCollector
 from pysphere.vi_mor import VIMor, MORTypes
+from pysphere.vi_inventory_cache import InventoryCache
+from pysphere.vi_task import VITask, _TaskWaiter
 
 class VIServer:
 
+    #Managed object types that can be the container of a ContainerView
+    _VIEW_CONTAINER_TYPES = [MORTypes.Folder, MORTypes.Datacenter,
+                             MORTypes.ComputeResource,
+                             MORTypes.ClusterComputeResource,
+                             MORTypes.ResourcePool, MORTypes.HostSystem]
+    #Max number of ContainerViews kept for inventory queries, the least
+    #recently used one is destroyed when a new one is needed
+    MAX_CONTAINER_VIEWS = 50
+
     def __init__(self):
         self.__logged = False
         self.__server_type = None
@@ -49,8 +65,18 @@ class VIServer:
         self.__password = None
         #By default impersonate the VI Client to be accepted by Virtual Server
         self.__initial_headers = {"User-Agent":"VMware VI Client/5.0.0"}
-
-    def connect(self, host, user, password, trace_file=None, sock_timeout=None):
+        self.__inventory_cache = None
+        self.__guest_op_managers = None
+        self.__task_waiter = None
+        self.__task_waiter_lock = threading.Lock()
+        self.__traversal_specs = None
+        self.__container_views = None
+        self.__container_views_order = []
+        self.__container_views_lock = threading.Lock()
+        self.__performance_manager = None
+
+    def connect(self, host, user, password, trace_file=None, sock_timeout=None,
+                writerclass=None):
         """Opens a session to a VC/ESX server with the given credentials:
         @host: is the server's hostname or address. If the web service uses
         another protocol or port than the default, you must use the full
@@ -61,6 +87,10 @@ class VIServer:
         @sock_timeout: (optional) only for python >= 2.6, sets the connection
         timeout for sockets, in python 2.5 you'll  have to use
         socket.setdefaulttimeout(secs) to change the global setting.
+        @writerclass: (optional) the class used to write the SOAP requests.
+        By default requests are written as text, without building a DOM
+        (pysphere.ZSI.writer.StringElementProxy), use
+        pysphere.ZSI.wstools.Utility.ElementProxy to go back to the DOM writer.
         """
 
         self.__user = user
@@ -80,7 +110,10 @@ class VIServer:
         try:
             #get the server's proxy
             locator = VI.VimServiceLocator()
-            args = {'url':server_url}
+            #by default requests are written without a DOM, and the traversal
+            #specs are serialized only once (see _build_traversal_specs)
+            args = {'url':server_url,
+                    'writerclass':writerclass or StringElementProxy}
             if trace_file:
                 trace=open(trace_file, 'w')
                 args['tracefile'] = trace
@@ -142,6 +175,16 @@ class VIServer:
         if self.__logged:
             try:
                 self.__logged = False
+                #the cache property collector goes away with the session
+                self.__inventory_cache = None
+                self.__guest_op_managers = None
+                self.__task_waiter = None
+                self.__performance_manager = None
+                try:
+                    self.disable_container_views()
+                except VIApiException:
+                    #views are destroyed along with the session anyway
+                    pass
                 request = VI.LogoutRequestMsg()
                 mor_session_manager = request.new__this(
                                         self._do_service_content.SessionManager)
@@ -150,10 +193,88 @@ class VIServer:
                 self._proxy.Logout(request)
             except (VI.ZSI.FaultException), e:
                 raise VIApiException(e)
+            finally:
+                self._proxy.binding.CloseConnections()
+
+    def enable_inventory_cache(self, properties=None, refresh_interval=0):
+        """Keeps a local copy of the inventory (folders, datacenters, clusters,
+        hosts, datastores, resource pools and VMs) that is updated incrementally
+        from the server, so methods like get_hosts, get_datastores,
+        get_clusters, get_resource_pools or get_registered_vms don't need to
+        traverse the whole inventory on every call. Requires API 4.1 or later.
+        @properties: (optional) dictionary of extra properties to keep for some
+            managed object types, e.g. {'VirtualMachine':['guest.ipAddress']}
+        @refresh_interval: minimum number of seconds between two checks for
+            inventory changes. 0 (default) checks on every lookup, which keeps
+            results always up to date.
+        """
+        if not self.__logged:
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        self.disable_inventory_cache()
+        self.__inventory_cache = InventoryCache(self, properties,
+                                                refresh_interval)
+
+    def disable_inventory_cache(self):
+        """Stops tracking inventory changes and drops the local inventory copy.
+        Lookups query the server again."""
+        cache = self.__inventory_cache
+        self.__inventory_cache = None
+        if cache:
+            cache.destroy()
+
+    def enable_container_views(self):
+        """Makes inventory queries (get_hosts, get_datastores, get_clusters,
+        get_registered_vms, etc.) use ContainerViews instead of the recursive
+        traversal specs, so the server doesn't have to expand the traversal
+        graph on each call. A view is created (and then reused) for each
+        starting point and managed object type queried, up to
+        MAX_CONTAINER_VIEWS views. Requires API 4.0 or later."""
+        if not self.__logged:
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        if self.__api_version < "4.0":
+            raise VIException("Container views require API 4.0 or later",
+                              FaultTypes.NOT_SUPPORTED)
+        self.__container_views_lock.acquire()
+        try:
+            if self.__container_views is None:
+                self.__container_views = {}
+                self.__container_views_order = []
+        finally:
+            self.__container_views_lock.release()
+
+    def disable_container_views(self):
+        """Destroys the container views created for inventory queries and goes
+        back to the recursive traversal specs."""
+        self.__container_views_lock.acquire()
+        try:
+            views = self.__container_views
+            self.__container_views = None
+            self.__container_views_order = []
+        finally:
+            self.__container_views_lock.release()
+        if views:
+            self.__destroy_views(views.values())
+
+    def __destroy_views(self, views):
+        try:
+            for view in views:
+                request = VI.DestroyViewRequestMsg()
+                _this = request.new__this(view)
+                _this.set_attribute_type(MORTypes.ContainerView)
+                request.set_element__this(_this)
+                self._proxy.DestroyView(request)
+        except (VI.ZSI.FaultException), e:
+            raise VIApiException(e)
 
     def get_performance_manager(self):
-        """Returns a Performance Manager entity"""
-        return PerformanceManager(self, self._do_service_content.PerfManager)
+        """Returns a Performance Manager entity. The same instance (and so its
+        counters catalog and caches) is shared during the session."""
+        if not self.__performance_manager:
+            self.__performance_manager = PerformanceManager(self,
+                                          self._do_service_content.PerfManager)
+        return self.__performance_manager
 
     def get_task_history_collector(self, entity=None, recursion=None,
                                    states=None):
@@ -249,10 +370,12 @@ class VIServer:
 
         return ret
 
-    def get_vm_by_path(self, path, datacenter=None):
+    def get_vm_by_path(self, path, datacenter=None, properties=None):
         """Returns an instance of VIVirtualMachine. Where its path matches
         @path. The VM is searched througout all the datacenters, unless the
-        name or MOR of the datacenter the VM belongs to is provided."""
+        name or MOR of the datacenter the VM belongs to is provided.
+        If @properties (a list of property names or paths) is set, only those
+        properties are retrieved now (see VIVirtualMachine)."""
         if not self.__logged:
             raise VIException("Must call 'connect' before invoking this method",
                             FaultTypes.NOT_CONNECTED)
@@ -283,19 +406,22 @@ class VIServer:
                     pass
                 else:
                     if vm:
-                        return VIVirtualMachine(self, vm)
+                        return VIVirtualMachine(self, vm,
+                                                properties=properties)
         except (VI.ZSI.FaultException), e:
             raise VIApiException(e)
 
         raise VIException("Could not find a VM with path '%s'" % path,
                           FaultTypes.OBJECT_NOT_FOUND)
 
-    def get_vm_by_name(self, name, datacenter=None):
+    def get_vm_by_name(self, name, datacenter=None, properties=None):
         """
         Returns an instance of VIVirtualMachine. Where its name matches @name.
         The VM is searched throughout all the datacenters, unless the name or
         MOR of the datacenter the VM belongs to is provided. The first instance
         matching @name is returned.
+        If @properties (a list of property names or paths) is set, only those
+        properties are retrieved now (see VIVirtualMachine).
         NOTE: As names might be duplicated is recommended to use get_vm_by_path
         instead.
         """
@@ -315,13 +441,173 @@ class VIServer:
                                                       from_mor=node)
                 for k,v in vms.iteritems():
                     if v == name:
-                        return VIVirtualMachine(self, k)
+                        return VIVirtualMachine(self, k,
+                                                properties=properties)
         except (VI.ZSI.FaultException), e:
             raise VIApiException(e)
 
         raise VIException("Could not find a VM named '%s'" % name,
                           FaultTypes.OBJECT_NOT_FOUND)
 
+    def get_vms(self, paths_or_mors, batch_size=100, properties=None):
+        """Returns a list of VIVirtualMachine instances, one for each VM path
+        or MOR in @paths_or_mors (in the same order). Unlike calling
+        get_vm_by_path for every VM, all the paths are resolved with a single
+        inventory query, and the VMs properties are retrieved in bulk,
+        @batch_size VMs per request. Raises a VIException if any of the VMs
+        can't be found. If @properties (a list of property names or paths) is
+        set, only those properties are retrieved (see VIVirtualMachine)."""
+        if not self.__logged:
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        mors = []
+        vms_by_path = None
+        for item in paths_or_mors:
+            if VIMor.is_mor(item):
+                mors.append(item)
+                continue
+            if vms_by_path is None:
+                vms_by_path = {}
+                content = self._retrieve_properties_traversal(
+                                    property_names=['config.files.vmPathName'],
+                                    obj_type=MORTypes.VirtualMachine)
+                for o in content or []:
+                    for prop in getattr(o, "PropSet", []):
+                        vms_by_path.setdefault(prop.Val, o.Obj)
+            if item not in vms_by_path:
+                raise VIException("Could not find a VM with path '%s'" % item,
+                                  FaultTypes.OBJECT_NOT_FOUND)
+            mors.append(vms_by_path[item])
+        return self.__get_vms_by_mors(mors, batch_size, properties)
+
+    def get_vms_by_names(self, names, batch_size=100, properties=None):
+        """Same as get_vms but VMs are looked up by name. If names are
+        duplicated, the first VM found with that name is returned (see
+        get_vm_by_name)."""
+        if not self.__logged:
+            raise VIException("Must call 'connect' before invoking this method",
+                              FaultTypes.NOT_CONNECTED)
+        vms_by_name = {}
+        for mor, name in self._get_managed_objects(
+                                        MORTypes.VirtualMachine).iteritems():
+            vms_by_name.setdefault(name, mor)
+        mors = []
+        for name in names:
+            if name not in vms_by_name:
+                raise VIException("Could not find a VM named '%s'" % name,
+                                  FaultTypes.OBJECT_NOT_FOUND)
+            mors.append(vms_by_name[name])
+        return self.__get_vms_by_mors(mors, batch_size, properties)
+
+    def map(self, func, items, workers=8, return_exceptions=False):
+        """Calls @func for every item in @items with up to @workers threads and
+        returns the list of results (in the same order as @items). Each worker
+        thread sends its requests through its own keep-alive connection, so
+        workers should not exceed the connection pool size (10 by default).
+        If any call raises an exception, the first one (in @items order) is
+        re-raised once all the calls finished, unless @return_exceptions is
+        True, then exceptions are returned in place of the results. E.g.:
+            vms = server.map(server.get_vm_by_path, paths)
+            tasks = server.map(lambda vm: vm.power_on(sync_run=False), vms)
+        """
+        if not isinstance(workers, (int, long)) or workers < 1:
+            raise VIException("workers must be a positive integer",
+                              FaultTypes.PARAMETER_ERROR)
+        items = list(items)
+        results = [None] * len(items)
+        errors = {}
+        pending = Queue.Queue()
+        for index, item in enumerate(items):
+            pending.put((index, item))
+
+        def worker():
+            while True:
+                try:
+                    index, item = pending.get_nowait()
+                except Queue.Empty:
+                    return
+                try:
+                    results[index] = func(item)
+                except Exception:
+                    errors[index] = sys.exc_info()
+
+        threads = [threading.Thread(target=worker)
+                   for _ in xrange(min(workers, len(items)))]
+        for t in threads:
+            t.daemon = True
+            t.start()
+        for t in threads:
+            t.join()
+
+        if errors and return_exceptions:
+            for index, exc_info in errors.iteritems():
+                results[index] = exc_info[1]
+        elif errors:
+            exc_info = errors[min(errors)]
+            raise exc_info[0], exc_info[1], exc_info[2]
+        return results
+
+    def as_completed(self, tasks, states=None, check_interval=2, timeout=-1,
+                     progress_callback=None):
+        """Generator that yields each VITask in @tasks as soon as it is in any
+        of the given @states (success or error by default). The state of all the
+        pending tasks is read with a single request every @check_interval
+        seconds. If set, @progress_callback(task, state, progress) is called
+        every time the state or progress of a task changes. Raises an exception
+        if @timeout is reached, or if a task is no longer found in the server
+        (e.g. it was purged from the task history). If @timeout is 0 or
+        negative, waits indefinitely. E.g.:
+            for task in server.as_completed(tasks):
+                if task.get_state() == task.STATE_ERROR:
+                    print task.get_error_message()
+        """
+        if states is None:
+            states = [VITask.STATE_SUCCESS, VITask.STATE_ERROR]
+        elif not isinstance(states, list):
+            states = [states]
+        pending = list(tasks)
+        last_seen = {}
+        start_time = time.time()
+        while pending:
+            content = self._get_object_properties_bulk(
+                                [task._mor for task in pending],
+                                {MORTypes.Task: ['info.state', 'info.progress']})
+            values = {}
+            for o in content or []:
+                values[str(o.Obj)] = dict([(prop.Name, prop.Val)
+                                       for prop in getattr(o, "PropSet", [])])
+            still_pending = []
+            for task in pending:
+                if str(task._mor) not in values:
+                    raise VIException("Task %s not found" % task._mor,
+                                      FaultTypes.OBJECT_NOT_FOUND)
+                task_values = values[str(task._mor)]
+                state = task_values.get('info.state')
+                progress = task_values.get('info.progress')
+                if progress_callback and \
+                   last_seen.get(str(task._mor)) != (state, progress):
+                    last_seen[str(task._mor)] = (state, progress)
+                    progress_callback(task, state, progress)
+                if state in states:
+                    yield task
+                else:
+                    still_pending.append(task)
+            pending = still_pending
+            if not pending:
+                return
+            if timeout > 0 and (time.time() - start_time) > timeout:
+                raise VIException("Timed out waiting for tasks state.",
+                                  FaultTypes.TIME_OUT)
+            time.sleep(check_interval)
+
+    def wait_for_tasks(self, tasks, states=None, check_interval=2, timeout=-1,
+                       progress_callback=None):
+        """Waits for all the VITask in @tasks to be in any of the given @states
+        (success or error by default) and returns them in the order they
+        completed. See as_completed for the other arguments."""
+        return list(self.as_completed(tasks, states, check_interval, timeout,
+                                      progress_callback))
+
     def get_server_type(self):
         """Returns a string containing a the server type name: E.g:
         'VirtualCenter', 'VMware Server' """
@@ -594,6 +880,26 @@ class VIServer:
                                   "(<str> mor_id, <str> mor_type) tuple",
                                   FaultTypes.PARAMETER_ERROR)
 
+            if self.__inventory_cache:
+                ret = self.__inventory_cache.retrieve(property_names,
+                                                      from_node, obj_type)
+                if ret is not None:
+                    return ret
+
+            if self.__container_views is not None and \
+               from_node.get_attribute_type() in self._VIEW_CONTAINER_TYPES:
+                view = self.__get_container_view(from_node, obj_type)
+                #None if views were disabled meanwhile
+                if view is not None:
+                    try:
+                        return self.__retrieve_properties_view(property_names,
+                                                     from_node, obj_type, view)
+                    except (VI.ZSI.FaultException):
+                        #the view may have been destroyed by another thread
+                        #(evicted or views disabled), if so use the traversal
+                        if self.__is_container_view(from_node, obj_type, view):
+                            raise
+
             request, request_call = self._retrieve_property_request()
 
 
@@ -617,124 +923,7 @@ class VIServer:
             do_ObjectSpec_objSet.set_element_obj(mor_obj)
             do_ObjectSpec_objSet.set_element_skip(False)
 
-            #Recurse through all ResourcePools
-            rp_to_rp = VI.ns0.TraversalSpec_Def('rpToRp').pyclass()
-            rp_to_rp.set_element_name('rpToRp')
-            rp_to_rp.set_element_type(MORTypes.ResourcePool)
-            rp_to_rp.set_element_path('resourcePool')
-            rp_to_rp.set_element_skip(False)
-            rp_to_vm= VI.ns0.TraversalSpec_Def('rpToVm').pyclass()
-            rp_to_vm.set_element_name('rpToVm')
-            rp_to_vm.set_element_type(MORTypes.ResourcePool)
-            rp_to_vm.set_element_path('vm')
-            rp_to_vm.set_element_skip(False)
-
-            spec_array_resource_pool = [do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_resource_pool[0].set_element_name('rpToRp')
-            spec_array_resource_pool[1].set_element_name('rpToVm')
-
-            rp_to_rp.set_element_selectSet(spec_array_resource_pool)
-
-            #Traversal through resource pool branch
-            cr_to_rp = VI.ns0.TraversalSpec_Def('crToRp').pyclass()
-            cr_to_rp.set_element_name('crToRp')
-            cr_to_rp.set_element_type(MORTypes.ComputeResource)
-            cr_to_rp.set_element_path('resourcePool')
-            cr_to_rp.set_element_skip(False)
-            spec_array_computer_resource =[do_ObjectSpec_objSet.new_selectSet(),
-                                           do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_computer_resource[0].set_element_name('rpToRp');
-            spec_array_computer_resource[1].set_element_name('rpToVm');
-            cr_to_rp.set_element_selectSet(spec_array_computer_resource)
-
-            #Traversal through host branch
-            cr_to_h = VI.ns0.TraversalSpec_Def('crToH').pyclass()
-            cr_to_h.set_element_name('crToH')
-            cr_to_h.set_element_type(MORTypes.ComputeResource)
-            cr_to_h.set_element_path('host')
-            cr_to_h.set_element_skip(False)
-
-            #Traversal through hostFolder branch
-            dc_to_hf = VI.ns0.TraversalSpec_Def('dcToHf').pyclass()
-            dc_to_hf.set_element_name('dcToHf')
-            dc_to_hf.set_element_type(MORTypes.Datacenter)
-            dc_to_hf.set_element_path('hostFolder')
-            dc_to_hf.set_element_skip(False)
-            spec_array_datacenter_host = [do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_datacenter_host[0].set_element_name('visitFolders')
-            dc_to_hf.set_element_selectSet(spec_array_datacenter_host)
-
-            #Traversal through vmFolder branch
-            dc_to_vmf = VI.ns0.TraversalSpec_Def('dcToVmf').pyclass()
-            dc_to_vmf.set_element_name('dcToVmf')
-            dc_to_vmf.set_element_type(MORTypes.Datacenter)
-            dc_to_vmf.set_element_path('vmFolder')
-            dc_to_vmf.set_element_skip(False)
-            spec_array_datacenter_vm = [do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_datacenter_vm[0].set_element_name('visitFolders')
-            dc_to_vmf.set_element_selectSet(spec_array_datacenter_vm)
-
-            #Traversal through datastore branch
-            dc_to_ds = VI.ns0.TraversalSpec_Def('dcToDs').pyclass()
-            dc_to_ds.set_element_name('dcToDs')
-            dc_to_ds.set_element_type(MORTypes.Datacenter)
-            dc_to_ds.set_element_path('datastore')
-            dc_to_ds.set_element_skip(False)
-            spec_array_datacenter_ds = [do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_datacenter_ds[0].set_element_name('visitFolders')
-            dc_to_ds.set_element_selectSet(spec_array_datacenter_ds)
-
-            #Recurse through all hosts
-            h_to_vm = VI.ns0.TraversalSpec_Def('hToVm').pyclass()
-            h_to_vm.set_element_name('hToVm')
-            h_to_vm.set_element_type(MORTypes.HostSystem)
-            h_to_vm.set_element_path('vm')
-            h_to_vm.set_element_skip(False)
-            spec_array_host_vm = [do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_host_vm[0].set_element_name('visitFolders')
-            h_to_vm.set_element_selectSet(spec_array_host_vm)
-
-            #Recurse through all datastores
-            ds_to_vm = VI.ns0.TraversalSpec_Def('dsToVm').pyclass()
-            ds_to_vm.set_element_name('dsToVm')
-            ds_to_vm.set_element_type(MORTypes.Datastore)
-            ds_to_vm.set_element_path('vm')
-            ds_to_vm.set_element_skip(False)
-            spec_array_datastore_vm = [do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_datastore_vm[0].set_element_name('visitFolders')
-            ds_to_vm.set_element_selectSet(spec_array_datastore_vm)
-
-            #Recurse through the folders
-            visit_folders = VI.ns0.TraversalSpec_Def('visitFolders').pyclass()
-            visit_folders.set_element_name('visitFolders')
-            visit_folders.set_element_type(MORTypes.Folder)
-            visit_folders.set_element_path('childEntity')
-            visit_folders.set_element_skip(False)
-            spec_array_visit_folders = [do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet(),
-                                        do_ObjectSpec_objSet.new_selectSet()]
-            spec_array_visit_folders[0].set_element_name('visitFolders')
-            spec_array_visit_folders[1].set_element_name('dcToHf')
-            spec_array_visit_folders[2].set_element_name('dcToVmf')
-            spec_array_visit_folders[3].set_element_name('crToH')
-            spec_array_visit_folders[4].set_element_name('crToRp')
-            spec_array_visit_folders[5].set_element_name('dcToDs')
-            spec_array_visit_folders[6].set_element_name('hToVm')
-            spec_array_visit_folders[7].set_element_name('dsToVm')
-            spec_array_visit_folders[8].set_element_name('rpToVm')
-            visit_folders.set_element_selectSet(spec_array_visit_folders)
-
-            #Add all of them here
-            spec_array = [visit_folders, dc_to_vmf, dc_to_ds, dc_to_hf, cr_to_h,
-                          cr_to_rp, rp_to_rp, h_to_vm, ds_to_vm, rp_to_vm]
-
+            spec_array = self._build_traversal_specs(do_ObjectSpec_objSet)
             do_ObjectSpec_objSet.set_element_selectSet(spec_array)
             objects_set.append(do_ObjectSpec_objSet)
 
@@ -748,6 +937,236 @@ class VIServer:
                 raise VIApiException(e)
 
 
+    def __retrieve_properties_view(self, property_names, from_node, obj_type,
+                                   view):
+        """Same as _retrieve_properties_traversal, but the objects are taken
+        from @view, the ContainerView of @obj_type objects in @from_node
+        (which must be one of the _VIEW_CONTAINER_TYPES)"""
+        request, request_call = self._retrieve_property_request()
+        _this = request.new__this(self._do_service_content.PropertyCollector)
+        _this.set_attribute_type(MORTypes.PropertyCollector)
+        request.set_element__this(_this)
+
+        spec_set = request.new_specSet()
+        prop_set = spec_set.new_propSet()
+        prop_set.set_element_type(obj_type)
+        prop_set.set_element_pathSet(property_names)
+        spec_set.set_element_propSet([prop_set])
+
+        view_set = spec_set.new_objectSet()
+        obj = view_set.new_obj(view)
+        obj.set_attribute_type(MORTypes.ContainerView)
+        view_set.set_element_obj(obj)
+        view_set.set_element_skip(True)
+        traverse_view = VI.ns0.TraversalSpec_Def('traverseView').pyclass()
+        traverse_view.set_element_name('traverseView')
+        traverse_view.set_element_type(MORTypes.ContainerView)
+        traverse_view.set_element_path('view')
+        traverse_view.set_element_skip(False)
+        view_set.set_element_selectSet([traverse_view])
+        object_sets = [view_set]
+
+        #views don't include their container, while traversals do
+        root_type = from_node.get_attribute_type()
+        if obj_type in (root_type, MORTypes.ManagedEntity) or \
+           (obj_type, root_type) in [
+                    (MORTypes.ComputeResource, MORTypes.ClusterComputeResource),
+                    (MORTypes.ResourcePool, MORTypes.VirtualApp)]:
+            root_set = spec_set.new_objectSet()
+            obj = root_set.new_obj(from_node)
+            obj.set_attribute_type(root_type)
+            root_set.set_element_obj(obj)
+            root_set.set_element_skip(False)
+            object_sets.append(root_set)
+
+        spec_set.set_element_objectSet(object_sets)
+        request.set_element_specSet([spec_set])
+
+        return request_call(request)
+
+    def __get_container_view(self, container, obj_type):
+        """Returns the recursive ContainerView of @obj_type objects in
+        @container, creating it the first time it's requested, or None if
+        container views are disabled. Once MAX_CONTAINER_VIEWS views exist,
+        the least recently used one is destroyed to make room"""
+        key = (str(container), obj_type)
+        evicted = []
+        self.__container_views_lock.acquire()
+        try:
+            views = self.__container_views
+            if views is None:
+                return None
+            order = self.__container_views_order
+            if key in views:
+                order.remove(key)
+                order.append(key)
+                return views[key]
+            request = VI.CreateContainerViewRequestMsg()
+            _this = request.new__this(self._do_service_content.ViewManager)
+            _this.set_attribute_type(MORTypes.ViewManager)
+            request.set_element__this(_this)
+            mor_container = request.new_container(container)
+            mor_container.set_attribute_type(container.get_attribute_type())
+            request.set_element_container(mor_container)
+            request.set_element_type([obj_type])
+            request.set_element_recursive(True)
+            view = self._proxy.CreateContainerView(request)._returnval
+            views[key] = view
+            order.append(key)
+            while len(order) > max(1, self.MAX_CONTAINER_VIEWS):
+                evicted.append(views.pop(order.pop(0)))
+        finally:
+            self.__container_views_lock.release()
+        if evicted:
+            try:
+                self.__destroy_views(evicted)
+            except VIApiException:
+                #the view may already be gone, it's not in use by us anymore
+                pass
+        return view
+
+    def __is_container_view(self, container, obj_type, view):
+        """True if @view is still the cached view for @container/@obj_type"""
+        self.__container_views_lock.acquire()
+        try:
+            views = self.__container_views
+            return views is not None and \
+                   views.get((str(container), obj_type)) is view
+        finally:
+            self.__container_views_lock.release()
+
+    def _build_traversal_specs(self, do_ObjectSpec_objSet):
+        """Returns the list of TraversalSpec objects (to be set as the
+        selectSet of @do_ObjectSpec_objSet) that recurse from a folder through
+        datacenters, compute resources, hosts, datastores, resource pools and
+        virtual machines. As they never change, they're built only once and
+        shared by all the requests, and the XML elements they're serialized
+        to are also reused (see ZSI.writer.FragmentList)."""
+        if self.__traversal_specs is None:
+            self.__traversal_specs = FragmentList(
+                          self.__create_traversal_specs(do_ObjectSpec_objSet))
+        return self.__traversal_specs
+
+    def __create_traversal_specs(self, do_ObjectSpec_objSet):
+        #Recurse through all ResourcePools
+        rp_to_rp = VI.ns0.TraversalSpec_Def('rpToRp').pyclass()
+        rp_to_rp.set_element_name('rpToRp')
+        rp_to_rp.set_element_type(MORTypes.ResourcePool)
+        rp_to_rp.set_element_path('resourcePool')
+        rp_to_rp.set_element_skip(False)
+        rp_to_vm= VI.ns0.TraversalSpec_Def('rpToVm').pyclass()
+        rp_to_vm.set_element_name('rpToVm')
+        rp_to_vm.set_element_type(MORTypes.ResourcePool)
+        rp_to_vm.set_element_path('vm')
+        rp_to_vm.set_element_skip(False)
+
+        spec_array_resource_pool = [do_ObjectSpec_objSet.new_selectSet(),
+                                    do_ObjectSpec_objSet.new_selectSet()]
+        spec_array_resource_pool[0].set_element_name('rpToRp')
+        spec_array_resource_pool[1].set_element_name('rpToVm')
+
+        rp_to_rp.set_element_selectSet(spec_array_resource_pool)
+
+        #Traversal through resource pool branch
+        cr_to_rp = VI.ns0.TraversalSpec_Def('crToRp').pyclass()
+        cr_to_rp.set_element_name('crToRp')
+        cr_to_rp.set_element_type(MORTypes.ComputeResource)
+        cr_to_rp.set_element_path('resourcePool')
+        cr_to_rp.set_element_skip(False)
+        spec_array_computer_resource =[do_ObjectSpec_objSet.new_selectSet(),
+                                       do_ObjectSpec_objSet.new_selectSet()]
+        spec_array_computer_resource[0].set_element_name('rpToRp');
+        spec_array_computer_resource[1].set_element_name('rpToVm');
+        cr_to_rp.set_element_selectSet(spec_array_computer_resource)
+
+        #Traversal through host branch
+        cr_to_h = VI.ns0.TraversalSpec_Def('crToH').pyclass()
+        cr_to_h.set_element_name('crToH')
+        cr_to_h.set_element_type(MORTypes.ComputeResource)
+        cr_to_h.set_element_path('host')
+        cr_to_h.set_element_skip(False)
+
+        #Traversal through hostFolder branch
+        dc_to_hf = VI.ns0.TraversalSpec_Def('dcToHf').pyclass()
+        dc_to_hf.set_element_name('dcToHf')
+        dc_to_hf.set_element_type(MORTypes.Datacenter)
+        dc_to_hf.set_element_path('hostFolder')
+        dc_to_hf.set_element_skip(False)
+        spec_array_datacenter_host = [do_ObjectSpec_objSet.new_selectSet()]
+        spec_array_datacenter_host[0].set_element_name('visitFolders')
+        dc_to_hf.set_element_selectSet(spec_array_datacenter_host)
+
+        #Traversal through vmFolder branch
+        dc_to_vmf = VI.ns0.TraversalSpec_Def('dcToVmf').pyclass()
+        dc_to_vmf.set_element_name('dcToVmf')
+        dc_to_vmf.set_element_type(MORTypes.Datacenter)
+        dc_to_vmf.set_element_path('vmFolder')
+        dc_to_vmf.set_element_skip(False)
+        spec_array_datacenter_vm = [do_ObjectSpec_objSet.new_selectSet()]
+        spec_array_datacenter_vm[0].set_element_name('visitFolders')
+        dc_to_vmf.set_element_selectSet(spec_array_datacenter_vm)
+
+        #Traversal through datastore branch
+        dc_to_ds = VI.ns0.TraversalSpec_Def('dcToDs').pyclass()
+        dc_to_ds.set_element_name('dcToDs')
+        dc_to_ds.set_element_type(MORTypes.Datacenter)
+        dc_to_ds.set_element_path('datastore')
+        dc_to_ds.set_element_skip(False)
+        spec_array_datacenter_ds = [do_ObjectSpec_objSet.new_selectSet()]
+        spec_array_datacenter_ds[0].set_element_name('visitFolders')
+        dc_to_ds.set_element_selectSet(spec_array_datacenter_ds)
+
+        #Recurse through all hosts
+        h_to_vm = VI.ns0.TraversalSpec_Def('hToVm').pyclass()
+        h_to_vm.set_element_name('hToVm')
+        h_to_vm.set_element_type(MORTypes.HostSystem)
+        h_to_vm.set_element_path('vm')
+        h_to_vm.set_element_skip(False)
+        spec_array_host_vm = [do_ObjectSpec_objSet.new_selectSet()]
+        spec_array_host_vm[0].set_element_name('visitFolders')
+        h_to_vm.set_element_selectSet(spec_array_host_vm)
+
+        #Recurse through all datastores
+        ds_to_vm = VI.ns0.TraversalSpec_Def('dsToVm').pyclass()
+        ds_to_vm.set_element_name('dsToVm')
+        ds_to_vm.set_element_type(MORTypes.Datastore)
+        ds_to_vm.set_element_path('vm')
+        ds_to_vm.set_element_skip(False)
+        spec_array_datastore_vm = [do_ObjectSpec_objSet.new_selectSet()]
+        spec_array_datastore_vm[0].set_element_name('visitFolders')
+        ds_to_vm.set_element_selectSet(spec_array_datastore_vm)
+
+        #Recurse through the folders
+        visit_folders = VI.ns0.TraversalSpec_Def('visitFolders').pyclass()
+        visit_folders.set_element_name('visitFolders')
+        visit_folders.set_element_type(MORTypes.Folder)
+        visit_folders.set_element_path('childEntity')
+        visit_folders.set_element_skip(False)
+        spec_array_visit_folders = [do_ObjectSpec_objSet.new_selectSet(),
+                                    do_ObjectSpec_objSet.new_selectSet(),
+                                    do_ObjectSpec_objSet.new_selectSet(),
+                                    do_ObjectSpec_objSet.new_selectSet(),
+                                    do_ObjectSpec_objSet.new_selectSet(),
+                                    do_ObjectSpec_objSet.new_selectSet(),
+                                    do_ObjectSpec_objSet.new_selectSet(),
+                                    do_ObjectSpec_objSet.new_selectSet(),
+                                    do_ObjectSpec_objSet.new_selectSet()]
+        spec_array_visit_folders[0].set_element_name('visitFolders')
+        spec_array_visit_folders[1].set_element_name('dcToHf')
+        spec_array_visit_folders[2].set_element_name('dcToVmf')
+        spec_array_visit_folders[3].set_element_name('crToH')
+        spec_array_visit_folders[4].set_element_name('crToRp')
+        spec_array_visit_folders[5].set_element_name('dcToDs')
+        spec_array_visit_folders[6].set_element_name('hToVm')
+        spec_array_visit_folders[7].set_element_name('dsToVm')
+        spec_array_visit_folders[8].set_element_name('rpToVm')
+        visit_folders.set_element_selectSet(spec_array_visit_folders)
+
+        #Add all of them here
+        spec_array = [visit_folders, dc_to_vmf, dc_to_ds, dc_to_hf, cr_to_h,
+                      cr_to_rp, rp_to_rp, h_to_vm, ds_to_vm, rp_to_vm]
+        return spec_array
+
     def _retrieve_property_request(self):
         """Returns a base request object an call request method pointer for
         either RetrieveProperties or RetrievePropertiesEx depending on
@@ -812,6 +1231,71 @@ class VIServer:
         else:
             self._proxy.binding.ResetHeaders()
 
+    def _get_guest_operation_managers(self):
+        """Returns a tuple with the guest operations auth, file and process
+        managers MORs (None for those the server doesn't support). They are
+        looked up only once per session."""
+        if self.__guest_op_managers is None:
+            auth_mgr = file_mgr = proc_mgr = None
+            try:
+                guest_op = VIProperty(self,
+                                self._do_service_content.GuestOperationsManager)
+                auth_mgr = guest_op.authManager._obj
+                try:
+                    file_mgr = guest_op.fileManager._obj
+                except AttributeError:
+                    #file manager not present
+                    pass
+                try:
+                    proc_mgr = guest_op.processManager._obj
+                except AttributeError:
+                    #process manager not present
+                    pass
+            except AttributeError:
+                #guest operations not supported (since API 5.0)
+                pass
+            self.__guest_op_managers = (auth_mgr, file_mgr, proc_mgr)
+        return self.__guest_op_managers
+
+    def _get_task_waiter(self):
+        """Returns the object shared by all the tasks of this session to wait
+        for their state changes, or None if the server API doesn't support it
+        (tasks must poll their state then)"""
+        if not self.__logged or self.__api_version < "4.1":
+            return None
+        self.__task_waiter_lock.acquire()
+        try:
+            if not self.__task_waiter:
+                self.__task_waiter = _TaskWaiter(self)
+            return self.__task_waiter
+        finally:
+            self.__task_waiter_lock.release()
+
+    def __get_vms_by_mors(self, mors, batch_size, properties=None):
+        """Retrieves the properties of the VMs in @mors (all of them, unless a
+        list of @properties is given) with one request every @batch_size VMs
+        and returns the VIVirtualMachine instances"""
+        path_set = []
+        if properties is not None:
+            #an empty path set would retrieve all the properties
+            path_set = VIVirtualMachine._get_property_paths(properties) or \
+                                                                      ['name']
+        prop_sets = {}
+        for i in xrange(0, len(mors), batch_size):
+            content = self._get_object_properties_bulk(mors[i:i+batch_size],
+                                           {MORTypes.VirtualMachine: path_set})
+            for o in content or []:
+                prop_sets[str(o.Obj)] = getattr(o, "PropSet", [])
+        ret = []
+        for mor in mors:
+            if str(mor) not in prop_sets:
+                raise VIException("Could not find VM '%s'" % mor,
+                                  FaultTypes.OBJECT_NOT_FOUND)
+            ret.append(VIVirtualMachine(self, mor,
+                                        prop_set=prop_sets[str(mor)],
+                                        properties=properties))
+        return ret
+
     def _get_managed_objects(self, mo_type, from_mor=None):
         """Returns a dictionary of managed objects and their names"""
 
@@ -28,9 +28,13 @@
 #--
 
 import time
+import math
+import socket
+import threading
 
 from pysphere import VIException, FaultTypes, VIApiException
 from pysphere.vi_property import VIProperty
+from pysphere.vi_mor import MORTypes
 from pysphere.resources import VimService_services as VI
 
 class VITask:
@@ -57,13 +61,17 @@ class VITask:
             return self.info.state
 
     def wait_for_state(self, states, check_interval=2, timeout=-1):
-        """Waits for the task to be in any of the given states
-        checking the status every @check_interval seconds.
+        """Waits for the task to be in any of the given states. With API 4.1 or
+        later the server notifies the state changes, otherwise the status is
+        checked every @check_interval seconds.
         Raises an exception if @timeout is reached
         If @timeout is 0 or negative, waits indefinitely"""
         
         if not isinstance(states, list):
             states = [states]
+        waiter = self._server._get_task_waiter()
+        if waiter:
+            return waiter.wait(self._mor, states, timeout)
         start_time = time.time()
         while True:
             cur_state = self.get_state()
@@ -118,4 +126,224 @@ class VITask:
             except Exception, e:
                 if i == retries -1:
                     raise e
-            time.sleep(interval)
\ No newline at end of file
+            time.sleep(interval)
+
+class _TaskWaiter(object):
+    """Waits for tasks state changes notified through a dedicated property
+    collector with WaitForUpdatesEx (API 4.1 or later). A single instance is
+    shared by all the threads waiting for tasks of a server: only one of them
+    at a time asks the server for the updates of all the watched tasks, and
+    wakes up the others when they arrive."""
+
+    #max seconds each WaitForUpdatesEx request may block
+    MAX_WAIT = 10
+    #seconds the server must answer before the socket timeout is reached
+    TIMEOUT_MARGIN = 1
+    #seconds between requests when the socket timeout is too short to let the
+    #server hold them
+    POLL_INTERVAL = 2
+
+    def __init__(self, server):
+        self._server = server
+        self._collector = None
+        self._version = ""
+        self._filters = {}
+        self._watchers = {}
+        self._values = {}
+        self._gone = set()
+        self._polling = False
+        self._cond = threading.Condition()
+        self._collector_lock = threading.Lock()
+
+    def wait(self, mor, states, timeout=-1):
+        """Blocks until the task @mor is in any of the given @states and returns
+        that state. Raises an exception if @timeout is reached (if it's 0 or
+        negative, waits indefinitely), or if the task is no longer found in the
+        server (e.g. it was purged from the task history)"""
+        key = str(mor)
+        start_time = time.time()
+        filter_mor = None
+        self._cond.acquire()
+        try:
+            self._watchers[key] = self._watchers.get(key, 0) + 1
+            try:
+                while True:
+                    state = self._values.get(key, {}).get('info.state')
+                    if state in states:
+                        return state
+                    if key in self._gone:
+                        raise VIException("Task %s not found" % key,
+                                          FaultTypes.OBJECT_NOT_FOUND)
+                    max_wait = self._max_wait()
+                    interval = max(max_wait, self.POLL_INTERVAL)
+                    if timeout > 0:
+                        remaining = timeout - (time.time() - start_time)
+                        if remaining <= 0:
+                            raise VIException(
+                                             "Timed out waiting for task state.",
+                                             FaultTypes.TIME_OUT)
+                        max_wait = min(max_wait, remaining)
+                        interval = min(interval, remaining)
+                    if key not in self._filters:
+                        self._add_filter(key, mor)
+                    elif self._polling or not self._filters[key]:
+                        #another thread is already waiting for the updates,
+                        #or creating the filter of this task
+                        self._cond.wait(interval)
+                    else:
+                        self._poll(max_wait, interval)
+            finally:
+                self._watchers[key] -= 1
+                if not self._watchers[key]:
+                    del self._watchers[key]
+                    self._values.pop(key, None)
+                    self._gone.discard(key)
+                    filter_mor = self._filters.pop(key, None)
+        finally:
+            self._cond.release()
+            if filter_mor:
+                self._remove_filter(filter_mor)
+
+    def _add_filter(self, key, mor):
+        """Creates the filter for the task @mor. Must be called with the
+        condition lock acquired, which is released while talking to the
+        server. Meanwhile, the other waiters of the task find a None filter"""
+        self._filters[key] = None
+        self._cond.release()
+        filter_mor = None
+        try:
+            filter_mor = self._create_filter(mor)
+        finally:
+            self._cond.acquire()
+            if filter_mor:
+                self._filters[key] = filter_mor
+            else:
+                del self._filters[key]
+            self._cond.notifyAll()
+
+    def _remove_filter(self, filter_mor):
+        """Destroys a filter no longer used, called without the condition
+        lock. A failure here must not hide the state (or the error) the
+        waiter is returning, and the filter goes away with the session anyway
+        """
+        try:
+            self._destroy_filter(filter_mor)
+        except Exception:
+            pass
+
+    def _max_wait(self):
+        """Seconds each WaitForUpdatesEx request may block, kept below the
+        socket timeout of the server's binding (0 if it's too short)"""
+        sock_timeout = self._server._proxy.binding.transdict.get('timeout') \
+                       or socket.getdefaulttimeout()
+        if not sock_timeout:
+            return self.MAX_WAIT
+        return max(0, min(self.MAX_WAIT,
+                          int(sock_timeout - self.TIMEOUT_MARGIN)))
+
+    def _poll(self, max_wait, interval):
+        """Waits up to @max_wait seconds for updates of the watched tasks, if
+        the server can't hold the request (@max_wait is 0) and there are none,
+        sleeps @interval seconds instead. Must be called with the condition
+        lock acquired, which is released while waiting for the server"""
+        self._polling = True
+        self._cond.release()
+        update_set = None
+        try:
+            update_set = self._wait_for_updates(max_wait)
+            if not update_set and not max_wait:
+                time.sleep(interval)
+        finally:
+            self._cond.acquire()
+            self._polling = False
+            if update_set:
+                self._apply_updates(update_set)
+            self._cond.notifyAll()
+
+    def _wait_for_updates(self, max_wait):
+        try:
+            request = VI.WaitForUpdatesExRequestMsg()
+            _this = request.new__this(self._collector)
+            _this.set_attribute_type(MORTypes.PropertyCollector)
+            request.set_element__this(_this)
+            request.set_element_version(self._version)
+            options = request.new_options()
+            options.set_element_maxWaitSeconds(int(math.ceil(max_wait)))
+            request.set_element_options(options)
+
+            update_set = self._server._proxy.WaitForUpdatesEx(
+                                                             request)._returnval
+            if update_set:
+                self._version = update_set.Version
+            return update_set
+        except (VI.ZSI.FaultException), e:
+            raise VIApiException(e)
+
+    def _apply_updates(self, update_set):
+        for filter_update in getattr(update_set, "FilterSet", []):
+            for obj_update in getattr(filter_update, "ObjectSet", []):
+                key = str(obj_update.Obj)
+                if key not in self._watchers:
+                    continue
+                if getattr(obj_update, "Kind", None) == 'leave':
+                    #the task is gone (e.g. purged from the task history)
+                    self._gone.add(key)
+                    continue
+                self._gone.discard(key)
+                values = self._values.setdefault(key, {})
+                for change in getattr(obj_update, "ChangeSet", []):
+                    if hasattr(change, "Val"):
+                        values[change.Name] = change.Val
+                    else:
+                        values.pop(change.Name, None)
+
+    def _create_filter(self, mor):
+        try:
+            self._collector_lock.acquire()
+            try:
+                if not self._collector:
+                    request = VI.CreatePropertyCollectorRequestMsg()
+                    _this = request.new__this(
+                              self._server._do_service_content.PropertyCollector)
+                    _this.set_attribute_type(MORTypes.PropertyCollector)
+                    request.set_element__this(_this)
+                    self._collector = \
+                        self._server._proxy.CreatePropertyCollector(
+                                                             request)._returnval
+            finally:
+                self._collector_lock.release()
+
+            request = VI.CreateFilterRequestMsg()
+            _this = request.new__this(self._collector)
+            _this.set_attribute_type(MORTypes.PropertyCollector)
+            request.set_element__this(_this)
+
+            spec = request.new_spec()
+            prop_set = spec.new_propSet()
+            prop_set.set_element_type(mor.get_attribute_type())
+            prop_set.set_element_pathSet(['info.state', 'info.progress'])
+            prop_set.set_element_all(False)
+            spec.set_element_propSet([prop_set])
+            object_set = spec.new_objectSet()
+            obj = object_set.new_obj(mor)
+            obj.set_attribute_type(mor.get_attribute_type())
+            object_set.set_element_obj(obj)
+            object_set.set_element_skip(False)
+            spec.set_element_objectSet([object_set])
+
+            request.set_element_spec(spec)
+            request.set_element_partialUpdates(True)
+            return self._server._proxy.CreateFilter(request)._returnval
+
+        except (VI.ZSI.FaultException), e:
+            raise VIApiException(e)
+
+    def _destroy_filter(self, filter_mor):
+        try:
+            request = VI.DestroyPropertyFilterRequestMsg()
+            _this = request.new__this(filter_mor)
+            _this.set_attribute_type(MORTypes.PropertyFilter)
+            request.set_element__this(_this)
+            self._server._proxy.DestroyPropertyFilter(request)
+        except (VI.ZSI.FaultException), e:
+            raise VIApiException(e)
@@ -41,7 +41,32 @@ from pysphere.vi_managed_entity import VIManagedEntity
 
 class VIVirtualMachine(VIManagedEntity):
 
-    def __init__(self, server, mor):
+    #vSphere property paths needed to build each of the get_property values
+    _PROPERTY_PATHS = {
+        'name': ['name'],
+        'path': ['config.files.vmPathName'],
+        'guest_id': ['config.guestId'],
+        'guest_full_name': ['config.guestFullName'],
+        'memory_mb': ['config.hardware.memoryMB'],
+        'num_cpu': ['config.hardware.numCPU'],
+        'hostname': ['guest.hostName'],
+        'ip_address': ['guest.ipAddress'],
+        'net': ['guest.net'],
+        'devices': ['config.hardware.device'],
+        'files': ['layoutEx.file'],
+        'disks': ['config.hardware.device', 'layoutEx.file', 'layoutEx.disk'],
+    }
+
+    def __init__(self, server, mor, prop_set=None, properties=None):
+        """@prop_set: (optional) propSet with the properties of this VM if they
+            were already retrieved (e.g. in bulk by VIServer.get_vms)
+        @properties: (optional) list of the properties to retrieve now. Either
+            get_property names (e.g. 'name', 'path') or vSphere property paths
+            (e.g. 'runtime.powerState', which then can be also read with
+            get_property). Any other property (devices, disks, snapshots,
+            resource pool, etc.) is retrieved on first use, instead of
+            retrieving all the VM properties at once.
+        """
         VIManagedEntity.__init__(self, server, mor)
         self._root_snapshots = []
         self._snapshot_list = []
@@ -52,31 +77,40 @@ class VIVirtualMachine(VIManagedEntity):
         self._resource_pool = None
         self.properties = None
         self._properties = {}
-        self.__update_properties()
+        #property paths retrieved so far and their values (only if @properties
+        #was set, otherwise all the properties are retrieved at once)
+        self.__paths = None
+        self.__values = {}
+        if properties is None:
+            self.__update_properties(prop_set)
+        else:
+            #kept to convert the retrieved values, reading its attributes
+            #retrieves all the properties
+            self.properties = VIProperty(self._server, self._mor)
+            self.__paths = set()
+            self.__load_paths(self._get_property_paths(properties), prop_set)
         self._mor_vm_task_collector = None
-        #Define guest operation managers
-        self._auth_mgr = None
         self._auth_obj = None
-        self._file_mgr = None
-        self._proc_mgr = None
-        try:
-            guest_op = VIProperty(self._server, self._server._do_service_content
-                                                        .GuestOperationsManager)
-            self._auth_mgr = guest_op.authManager._obj
-            try:
-                self._file_mgr = guest_op.fileManager._obj
-            except AttributeError:
-                #file manager not present
-                pass
-            try:
-                #process manager not present
-                self._proc_mgr = guest_op.processManager._obj
-            except:
-                pass
-        except AttributeError:
-            #guest operations not supported (since API 5.0)
-            pass
-        
+
+    #Guest operation managers, looked up by the server on first use
+    _auth_mgr = property(lambda self:
+                             self._server._get_guest_operation_managers()[0])
+    _file_mgr = property(lambda self:
+                             self._server._get_guest_operation_managers()[1])
+    _proc_mgr = property(lambda self:
+                             self._server._get_guest_operation_managers()[2])
+
+    @staticmethod
+    def _get_property_paths(properties):
+        """Returns the vSphere property paths needed to retrieve @properties (a
+        list of get_property names and/or vSphere property paths)"""
+        paths = []
+        for name in properties:
+            for path in VIVirtualMachine._PROPERTY_PATHS.get(name, [name]):
+                if path not in paths:
+                    paths.append(path)
+        return paths
+
     #-------------------#
     #-- POWER METHODS --#
     #-------------------#
@@ -308,10 +342,15 @@ class VIVirtualMachine(VIManagedEntity):
                 except (VI.ZSI.FaultException), e:
                     raise VIApiException(e)            
 
-        self.__update_properties()
-        if not hasattr(self.properties.runtime, "question"):
+        if self.__paths is not None:
+            self.__load_paths(['runtime.question'])
+            question = self.__values.get('runtime.question')
+        else:
+            self.__update_properties()
+            question = getattr(self.properties.runtime, "question", None)
+        if question is None:
             return
-        return VMQuestion(self, self.properties.runtime.question)
+        return VMQuestion(self, question)
      
      
     def is_powering_off(self):
@@ -718,7 +757,7 @@ class VIVirtualMachine(VIManagedEntity):
 
     def get_current_snapshot_name(self):
         """Returns the name of the current snapshot (if any)."""
-        self.__update_properties()
+        self.refresh_snapshot_list()
         if not self.__current_snapshot:
             return None
         for snap in self._snapshot_list:
@@ -767,6 +806,7 @@ class VIVirtualMachine(VIManagedEntity):
         returned. You may additionally provided a managed object reference to a
         host where the VM should be reverted at."""
 
+        self.__require(['snapshot'])
         mor = None
         for snap in self._snapshot_list:
             if snap._name == name:
@@ -811,6 +851,7 @@ class VIVirtualMachine(VIManagedEntity):
         returned. You may additionally provided a managed object reference to a
         host where the VM should be reverted at."""
 
+        self.__require(['snapshot'])
         mor = None
         for snap in self._snapshot_list:
             if snap.get_path() == path and snap._index == index:
@@ -915,6 +956,7 @@ class VIVirtualMachine(VIManagedEntity):
         returns (raises an exception if the task didn't succeed). If sync_run is
         set to False the task is started an a VITask instance is returned."""
 
+        self.__require(['snapshot'])
         mor = None
         for snap in self._snapshot_list:
             if snap._name == name:
@@ -937,6 +979,7 @@ class VIVirtualMachine(VIManagedEntity):
         task is started an a VITask instance is returned.
         """
 
+        self.__require(['snapshot'])
         mor = None
         for snap in self._snapshot_list:
             if snap.get_path() == path and snap._index == index:
@@ -951,7 +994,10 @@ class VIVirtualMachine(VIManagedEntity):
 
     def refresh_snapshot_list(self):
         """Refreshes the internal list of snapshots of this VM"""
-        self.__update_properties()
+        if self.__paths is not None:
+            self.__load_paths(['snapshot'])
+        else:
+            self.__update_properties()
 
     #--------------------------#
     #-- VMWARE TOOLS METHODS --#
@@ -1537,7 +1583,13 @@ class VIVirtualMachine(VIManagedEntity):
             mac_address
             net: [{connected, mac_address, ip_addresses, network},...]
         """
-        if not from_cache:
+        if self.__paths is not None:
+            paths = self._PROPERTY_PATHS.get(name, [])
+            if not from_cache:
+                self.__load_paths(self.__paths.union(paths))
+            else:
+                self.__require(paths)
+        elif not from_cache:
             self.__update_properties()
         return self._properties.get(name)
 
@@ -1546,7 +1598,13 @@ class VIVirtualMachine(VIManagedEntity):
         If you expect to get a volatile property (that might have changed since
         the last time the properties were queried), you may set @from_cache to
         True to refresh all the properties before retrieve them."""
-        if not from_cache:
+        if self.__paths is not None:
+            paths = self._get_property_paths(self._PROPERTY_PATHS.keys())
+            if not from_cache:
+                self.__load_paths(self.__paths.union(paths))
+            else:
+                self.__require(paths)
+        elif not from_cache:
             self.__update_properties()
         return self._properties.copy()
 
@@ -1554,6 +1612,7 @@ class VIVirtualMachine(VIManagedEntity):
     def get_resource_pool_name(self):
         """Returns the name of the resource pool where this VM belongs to. Or
         None if there isn't any or it can't be retrieved"""
+        self.__require(['resourcePool'])
         if self._resource_pool:
             oc = self._server._get_object_properties(
                                    self._resource_pool, property_names=['name'])
@@ -1721,79 +1780,21 @@ class VIVirtualMachine(VIManagedEntity):
         except (VI.ZSI.FaultException), e:
             raise VIApiException(e)
     
-    def __update_properties(self):
+    def __update_properties(self, prop_set=None):
         """Refreshes the properties retrieved from the virtual machine
         (i.e. name, path, snapshot tree, etc). To reduce traffic, all the
         properties are retrieved from one shot, if you expect changes, then you
-        should call this method before other"""
-        
-        def update_devices(devices):
-            for dev in devices:
-                d = {
-                     'key': dev.key,
-                     'type': dev._type,
-                     'unitNumber': getattr(dev,'unitNumber',None),
-                     'label': getattr(getattr(dev,'deviceInfo',None),
-                                      'label',None),
-                     'summary': getattr(getattr(dev,'deviceInfo',None),
-                                        'summary',None),
-                     '_obj': dev
-                     }
-                # Network Device
-                if hasattr(dev,'macAddress'):
-                    d['macAddress'] = dev.macAddress
-                    d['addressType'] = getattr(dev,'addressType',None)
-                # Video Card
-                if hasattr(dev,'videoRamSizeInKB'):
-                    d['videoRamSizeInKB'] = dev.videoRamSizeInKB
-                # Disk
-                if hasattr(dev,'capacityInKB'):
-                    d['capacityInKB'] = dev.capacityInKB
-                # Controller
-                if hasattr(dev,'busNumber'):
-                    d['busNumber'] = dev.busNumber
-                    d['devices'] = getattr(dev,'device',[])
-                    
-                self._devices[dev.key] = d
-        
-        def update_disks(disks):
-            new_disks = []
-            for disk in disks:
-                files = []
-                committed = 0
-                store = None
-                for c in getattr(disk, "chain", []):
-                    for k in c.fileKey:
-                        f = self._files[k]
-                        files.append(f)
-                        if f['type'] == 'diskExtent':
-                            committed += f['size']
-                        if f['type'] == 'diskDescriptor':
-                            store = f['name']
-                dev = self._devices[disk.key]
-                
-                new_disks.append({
-                                   'device': dev,
-                                   'files': files,
-                                   'capacity': dev['capacityInKB'],
-                                   'committed': committed/1024,
-                                   'descriptor': store,
-                                   'label': dev['label'],
-                                   })
-            self._disks = new_disks
-        
-        def update_files(files):
-            for file_info in files:
-                self._files[file_info.key] = {
-                                        'key': file_info.key,
-                                        'name': file_info.name,
-                                        'size': file_info.size,
-                                        'type': file_info.type
-                                        }
-                
-        
+        should call this method before other. If @prop_set is given, it's used
+        instead of requesting the properties to the server."""
+        if self.__paths is not None:
+            #only refresh the properties retrieved so far
+            self.__load_paths(self.__paths)
+            return
+
         try:
             self.properties = VIProperty(self._server, self._mor)
+            if prop_set is not None:
+                self.properties._set_prop_set(prop_set)
         except (VI.ZSI.FaultException), e:
             raise VIApiException(e)      
         
@@ -1811,7 +1812,7 @@ class VIVirtualMachine(VIManagedEntity):
             p['num_cpu'] = self.properties.config.hardware.numCPU
         
             if hasattr(self.properties.config.hardware, "device"):
-                update_devices(self.properties.config.hardware.device)
+                self.__update_devices(self.properties.config.hardware.device)
                 p['devices'] = self._devices
         
         #-----------------------#
@@ -1822,27 +1823,18 @@ class VIVirtualMachine(VIManagedEntity):
                 p['hostname'] = self.properties.guest.hostName
             if hasattr(self.properties.guest, "ipAddress"):
                 p['ip_address'] = self.properties.guest.ipAddress
-            nics = []
             if hasattr(self.properties.guest, "net"):
-                for nic in self.properties.guest.net:
-                    nics.append({
-                                 'connected':getattr(nic, "connected", None),
-                                 'mac_address':getattr(nic, "macAddress", None),
-                                 'ip_addresses':getattr(nic, "ipAddress", []),
-                                 'network':getattr(nic, "network", None)
-                                })
-           
-                p['net'] = nics
+                p['net'] = self.__get_nics(self.properties.guest.net)
         
         #------------------------#
         #-- UPDATE LAYOUT INFO --#
         
         if hasattr(self.properties, "layoutEx"):
             if hasattr(self.properties.layoutEx, "file"):
-                update_files(self.properties.layoutEx.file)
+                self.__update_files(self.properties.layoutEx.file)
                 p['files'] = self._files
             if hasattr(self.properties.layoutEx, "disk"):
-                update_disks(self.properties.layoutEx.disk)
+                self.__update_disks(self.properties.layoutEx.disk)
                 p['disks'] = self._disks
             
         self._properties = p
@@ -1850,23 +1842,156 @@ class VIVirtualMachine(VIManagedEntity):
         #----------------------#
         #-- UPDATE SNAPSHOTS --#
         
-        root_snapshots = []
-        if hasattr(self.properties, "snapshot"):
-            if hasattr(self.properties.snapshot, "currentSnapshot"):
-                self.__current_snapshot = \
-                                   self.properties.snapshot.currentSnapshot._obj
+        self.__update_snapshots(getattr(self.properties, "snapshot", None))
+        
+        #-----------------------#
+        #-- SET RESOURCE POOL --#
+        if hasattr(self.properties, "resourcePool"):
+            self._resource_pool = self.properties.resourcePool._obj
+
+    def __require(self, paths):
+        """Retrieves the property paths in @paths that haven't been retrieved
+        yet. Only VMs created with a properties subset load them on demand, the
+        others already have all of them."""
+        if self.__paths is None:
+            return
+        missing = [path for path in paths if path not in self.__paths]
+        if missing:
+            self.__load_paths(missing)
+
+    def __load_paths(self, paths, prop_set=None):
+        """Retrieves the property paths in @paths (unless a @prop_set with them
+        is given), adds them to the ones already retrieved, and rebuilds the
+        properties of this VM from all of them"""
+        paths = list(paths)
+        if prop_set is None:
+            oc = self._server._get_object_properties(self._mor,
+                                                     property_names=paths)
+            prop_set = getattr(oc, "PropSet", [])
+        if self.__paths.intersection(paths):
+            #refreshed, so are the properties read through self.properties
+            self.properties._flush_cache()
+        for path in paths:
+            self.__values.pop(path, None)
+        #VIProperty knows how to convert the returned data objects
+        for prop in prop_set:
+            self.__values[prop.Name] = self.properties._get_prop_value(prop.Val)
+        self.__paths.update(paths)
+
+        values = self.__values
+        p = {}
+        mapped_paths = ['snapshot', 'resourcePool']
+        for name, path_set in self._PROPERTY_PATHS.iteritems():
+            mapped_paths.extend(path_set)
+            if len(path_set) == 1 and path_set[0] in values:
+                p[name] = values[path_set[0]]
+        if 'guest.net' in values:
+            p['net'] = self.__get_nics(values['guest.net'])
+        if 'config.hardware.device' in values:
+            self.__update_devices(values['config.hardware.device'])
+            p['devices'] = self._devices
+        if 'layoutEx.file' in values:
+            self.__update_files(values['layoutEx.file'])
+            p['files'] = self._files
+            if 'layoutEx.disk' in values and 'devices' in p:
+                self.__update_disks(values['layoutEx.disk'])
+                p['disks'] = self._disks
+        for path, value in values.iteritems():
+            if path not in mapped_paths:
+                p[path] = value
+        self._properties = p
+
+        if 'snapshot' in self.__paths:
+            self.__update_snapshots(values.get('snapshot'))
+        if 'resourcePool' in values:
+            self._resource_pool = values['resourcePool']._obj
+
+    def __update_devices(self, devices):
+        for dev in devices:
+            d = {
+                 'key': dev.key,
+                 'type': dev._type,
+                 'unitNumber': getattr(dev,'unitNumber',None),
+                 'label': getattr(getattr(dev,'deviceInfo',None),
+                                  'label',None),
+                 'summary': getattr(getattr(dev,'deviceInfo',None),
+                                    'summary',None),
+                 '_obj': dev
+                 }
+            # Network Device
+            if hasattr(dev,'macAddress'):
+                d['macAddress'] = dev.macAddress
+                d['addressType'] = getattr(dev,'addressType',None)
+            # Video Card
+            if hasattr(dev,'videoRamSizeInKB'):
+                d['videoRamSizeInKB'] = dev.videoRamSizeInKB
+            # Disk
+            if hasattr(dev,'capacityInKB'):
+                d['capacityInKB'] = dev.capacityInKB
+            # Controller
+            if hasattr(dev,'busNumber'):
+                d['busNumber'] = dev.busNumber
+                d['devices'] = getattr(dev,'device',[])
+                
+            self._devices[dev.key] = d
+    
+    def __update_disks(self, disks):
+        new_disks = []
+        for disk in disks:
+            files = []
+            committed = 0
+            store = None
+            for c in getattr(disk, "chain", []):
+                for k in c.fileKey:
+                    f = self._files[k]
+                    files.append(f)
+                    if f['type'] == 'diskExtent':
+                        committed += f['size']
+                    if f['type'] == 'diskDescriptor':
+                        store = f['name']
+            dev = self._devices[disk.key]
             
+            new_disks.append({
+                               'device': dev,
+                               'files': files,
+                               'capacity': dev['capacityInKB'],
+                               'committed': committed/1024,
+                               'descriptor': store,
+                               'label': dev['label'],
+                               })
+        self._disks = new_disks
+    
+    def __update_files(self, files):
+        for file_info in files:
+            self._files[file_info.key] = {
+                                    'key': file_info.key,
+                                    'name': file_info.name,
+                                    'size': file_info.size,
+                                    'type': file_info.type
+                                    }
+
+    def __get_nics(self, guest_nics):
+        nics = []
+        for nic in guest_nics:
+            nics.append({
+                         'connected':getattr(nic, "connected", None),
+                         'mac_address':getattr(nic, "macAddress", None),
+                         'ip_addresses':getattr(nic, "ipAddress", []),
+                         'network':getattr(nic, "network", None)
+                        })
+        return nics
+
+    def __update_snapshots(self, snapshot):
+        root_snapshots = []
+        if snapshot is not None:
+            if hasattr(snapshot, "currentSnapshot"):
+                self.__current_snapshot = snapshot.currentSnapshot._obj
             
-            for root_snap in self.properties.snapshot.rootSnapshotList:
+            for root_snap in snapshot.rootSnapshotList:
                 root = VISnapshot(root_snap)
                 root_snapshots.append(root)
         self._root_snapshots = root_snapshots
         self.__create_snapshot_list()
-        
-        #-----------------------#
-        #-- SET RESOURCE POOL --#
-        if hasattr(self.properties, "resourcePool"):
-            self._resource_pool = self.properties.resourcePool._obj
             
 
 class VMPowerState:
@@ -69,8 +69,17 @@ class ThreadingTest(TestCase):
         [t.join() for t in threads]
         
         assert self.passes
-        
-        
-        
-                
-        
\ No newline at end of file
+
+    def test_map(self):
+        vms = self.server.get_registered_vms()
+        paths = [vms[random.randint(0, len(vms)-1)] for _ in xrange(10)]
+        results = self.server.map(lambda path:
+                     self.server.get_vm_by_path(path).get_property('path'),
+                     paths, workers=4)
+        assert results == paths
+
+        def fail(path):
+            raise ValueError(path)
+        self.assertRaises(ValueError, self.server.map, fail, paths)
+        results = self.server.map(fail, paths, return_exceptions=True)
+        assert [str(e) for e in results] == paths
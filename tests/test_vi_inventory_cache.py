@@ -0,0 +1,138 @@
+from unittest import TestCase
+
+from pysphere.vi_mor import MORTypes
+from pysphere.vi_inventory_cache import InventoryCache
+
+class _Obj(object):
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+class _Mor(str):
+    def __new__(cls, value, mor_type):
+        return str.__new__(cls, value)
+
+    def __init__(self, value, mor_type):
+        self._mor_type = mor_type
+
+    def get_attribute_type(self):
+        return self._mor_type
+
+class _TraversalSpec(object):
+    def __init__(self, name, mo_type, path, select_set):
+        self._values = {'name': name, 'type': mo_type, 'path': path,
+                        'selectSet': [_SelectionSpec(n) for n in select_set]}
+
+    def __getattr__(self, attr):
+        if not attr.startswith('get_element_'):
+            raise AttributeError(attr)
+        return lambda: self._values[attr[len('get_element_'):]]
+
+class _SelectionSpec(object):
+    def __init__(self, name):
+        self._name = name
+
+    def get_element_name(self):
+        return self._name
+
+#Same graph as VIServer._build_traversal_specs
+_FOLDER_SELECT = ['visitFolders', 'dcToHf', 'dcToVmf', 'crToH', 'crToRp',
+                  'dcToDs', 'hToVm', 'dsToVm', 'rpToVm']
+TRAVERSAL_SPECS = [
+    _TraversalSpec('visitFolders', MORTypes.Folder, 'childEntity',
+                   _FOLDER_SELECT),
+    _TraversalSpec('dcToVmf', MORTypes.Datacenter, 'vmFolder',
+                   ['visitFolders']),
+    _TraversalSpec('dcToDs', MORTypes.Datacenter, 'datastore',
+                   ['visitFolders']),
+    _TraversalSpec('dcToHf', MORTypes.Datacenter, 'hostFolder',
+                   ['visitFolders']),
+    _TraversalSpec('crToH', MORTypes.ComputeResource, 'host', []),
+    _TraversalSpec('crToRp', MORTypes.ComputeResource, 'resourcePool',
+                   ['rpToRp', 'rpToVm']),
+    _TraversalSpec('rpToRp', MORTypes.ResourcePool, 'resourcePool',
+                   ['rpToRp', 'rpToVm']),
+    _TraversalSpec('hToVm', MORTypes.HostSystem, 'vm', ['visitFolders']),
+    _TraversalSpec('dsToVm', MORTypes.Datastore, 'vm', ['visitFolders']),
+    _TraversalSpec('rpToVm', MORTypes.ResourcePool, 'vm', []),
+]
+
+class _OfflineInventoryCache(InventoryCache):
+    def __init__(self, objects):
+        self._properties = {}
+        for mo_type, path_set in self.BASE_PROPERTIES.iteritems():
+            self._properties[mo_type] = path_set[:]
+        self._load_traversal(TRAVERSAL_SPECS)
+        self._objects = {}
+        for key, (mo_type, values) in objects.iteritems():
+            self._objects[key] = (_Mor(key, mo_type), values)
+
+def _array(*keys):
+    return _Obj(ManagedObjectReference=list(keys))
+
+class InventoryCacheTraversalTest(TestCase):
+
+    def setUp(self):
+        self.cache = _OfflineInventoryCache({
+            'root': (MORTypes.Folder, {'childEntity': _array('dc')}),
+            'dc': (MORTypes.Datacenter, {'parent': 'root',
+                                         'hostFolder': 'hf',
+                                         'vmFolder': 'vmf',
+                                         'datastore': _array('ds-1', 'ds-2')}),
+            'hf': (MORTypes.Folder, {'parent': 'dc',
+                                     'childEntity': _array('cluster')}),
+            'vmf': (MORTypes.Folder, {'parent': 'dc',
+                                      'childEntity': _array('vm-1', 'vm-2',
+                                                            'template')}),
+            'dsf': (MORTypes.Folder, {'parent': 'dc',
+                                      'childEntity': _array('ds-2')}),
+            'cluster': (MORTypes.ClusterComputeResource,
+                        {'parent': 'hf', 'host': _array('host'),
+                         'resourcePool': 'rp'}),
+            'host': (MORTypes.HostSystem,
+                     {'parent': 'cluster',
+                      'vm': _array('vm-1', 'vm-2', 'template')}),
+            'rp': (MORTypes.ResourcePool, {'parent': 'cluster',
+                                           'resourcePool': _array('vapp'),
+                                           'vm': _array('vm-1')}),
+            'vapp': (MORTypes.VirtualApp, {'parent': 'rp',
+                                           'vm': _array('vm-2')}),
+            'ds-1': (MORTypes.Datastore, {'parent': 'dsf',
+                                          'vm': _array('vm-1', 'template')}),
+            'ds-2': (MORTypes.Datastore, {'parent': 'dsf',
+                                          'vm': _array('vm-2')}),
+            'vm-1': (MORTypes.VirtualMachine, {'parent': 'vmf',
+                                               'resourcePool': 'rp'}),
+            'vm-2': (MORTypes.VirtualMachine, {'resourcePool': 'vapp'}),
+            'template': (MORTypes.VirtualMachine, {'parent': 'vmf'}),
+        })
+
+    def test_traversal_properties_are_cached(self):
+        properties = self.cache._properties
+        assert 'childEntity' in properties[MORTypes.Folder]
+        assert 'vm' in properties[MORTypes.HostSystem]
+        assert 'host' in properties[MORTypes.ClusterComputeResource]
+        assert 'vm' in properties[MORTypes.VirtualApp]
+
+    def test_descendants_of_datacenter(self):
+        assert self.cache._descendants('dc') == set(
+                      ['dc', 'hf', 'vmf', 'cluster', 'host', 'rp', 'vapp',
+                       'ds-1', 'ds-2', 'vm-1', 'vm-2', 'template'])
+
+    def test_descendants_of_cluster(self):
+        #hosts are reached but not their VMs, so the template isn't found
+        assert self.cache._descendants('cluster') == set(
+                      ['cluster', 'host', 'rp', 'vapp', 'vm-1', 'vm-2'])
+
+    def test_descendants_of_folders(self):
+        assert self.cache._descendants('vmf') == set(
+                      ['vmf', 'vm-1', 'vm-2', 'template'])
+        #VMs are reached through the folder datastores
+        assert self.cache._descendants('dsf') == set(
+                      ['dsf', 'ds-2', 'vm-2'])
+
+    def test_descendants_of_host(self):
+        assert self.cache._descendants('host') == set(
+                      ['host', 'vm-1', 'vm-2', 'template'])
+
+    def test_unknown_root(self):
+        assert self.cache._descendants('unknown') == set(['unknown'])
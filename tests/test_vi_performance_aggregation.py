@@ -0,0 +1,181 @@
+import random
+from array import array
+from unittest import TestCase
+
+from pysphere import VIException
+from pysphere.vi_mor import MORTypes
+from pysphere.vi_performance_series import PerfSeries, INT_TYPECODE
+from pysphere.vi_performance_aggregation import PercentileSketch, \
+                          WindowStats, PerfAggregator, get_inventory_groups
+
+class _Obj(object):
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+class _Mor(str):
+    def __new__(cls, value, mor_type):
+        return str.__new__(cls, value)
+
+    def __init__(self, value, mor_type):
+        self._mor_type = mor_type
+
+    def get_attribute_type(self):
+        return self._mor_type
+
+def _series(entity, timestamps, values):
+    """PerfSeries of counter 2 (aggregated instance) with 20s samples"""
+    return PerfSeries(entity, array(INT_TYPECODE, timestamps),
+                      array(INT_TYPECODE, [20] * len(timestamps)),
+                      {(2, ''): array(INT_TYPECODE, values)})
+
+def _exact_percentile(values, p):
+    values = sorted(values)
+    return values[int(round(p / 100.0 * (len(values) - 1)))]
+
+class PercentileSketchTest(TestCase):
+
+    def test_relative_accuracy(self):
+        rand = random.Random(1)
+        values = [int(rand.expovariate(0.001)) for i in range(5000)]
+        sketch = PercentileSketch(0.01)
+        for value in values:
+            sketch.add(value)
+        assert sketch.count == len(values)
+        for p in (0, 1, 25, 50, 75, 90, 95, 99, 100):
+            exact = _exact_percentile(values, p)
+            assert abs(sketch.percentile(p) - exact) <= exact * 0.01
+
+    def test_empty_and_zeros(self):
+        sketch = PercentileSketch()
+        assert sketch.percentile(50) is None
+        sketch.add(0, 3)
+        sketch.add(100)
+        assert sketch.percentile(50) == 0
+        assert abs(sketch.percentile(100) - 100) <= 1
+
+    def test_merge(self):
+        merged, first, second = [PercentileSketch() for i in range(3)]
+        for value in range(1, 1001):
+            merged.add(value)
+            if value % 2:
+                first.add(value)
+            else:
+                second.add(value)
+        first.merge(second)
+        assert first.count == merged.count
+        for p in (10, 50, 99):
+            assert first.percentile(p) == merged.percentile(p)
+        self.assertRaises(VIException, first.merge, PercentileSketch(0.05))
+
+    def test_max_buckets(self):
+        sketch = PercentileSketch(0.01, max_buckets=10)
+        values = [2 ** i for i in range(40)]
+        for value in values:
+            sketch.add(value)
+        assert len(sketch._buckets) <= 10
+        exact = _exact_percentile(values, 100)
+        assert abs(sketch.percentile(100) - exact) <= exact * 0.01
+
+    def test_invalid_accuracy(self):
+        self.assertRaises(VIException, PercentileSketch, 0)
+        self.assertRaises(VIException, PercentileSketch, 1)
+
+class WindowStatsTest(TestCase):
+
+    def test_stats(self):
+        stats = WindowStats('host-1', 2, '', 0, 60)
+        assert stats.avg() is None and stats.percentile(50) is None
+        for value in (10, 40, 20, 30):
+            stats.add(value)
+        assert stats.count == 4 and stats.sum == 100
+        assert stats.min == 10 and stats.max == 40
+        assert stats.avg() == 25.0
+        assert abs(stats.percentile(100) - 40) <= 0.4
+
+class PerfAggregatorTest(TestCase):
+
+    def test_tumbling_windows(self):
+        aggregator = PerfAggregator(60)
+        aggregator.add(_series('vm-1', [20, 40, 60, 80, 100, 120],
+                                       [1, 2, 3, -1, 5, 6]))
+        windows = aggregator.flush()
+        assert [(w.start, w.end) for w in windows] == [(0, 60), (60, 120)]
+        assert [w.count for w in windows] == [3, 2]
+        assert [w.sum for w in windows] == [6, 11]
+        assert windows[0].group == 'vm-1' and windows[0].counter_id == 2
+        assert aggregator.flush() == []
+
+    def test_sliding_windows(self):
+        aggregator = PerfAggregator(60, step=20)
+        aggregator.add(_series('vm-1', [20, 40, 60, 80], [1, 2, 3, 4]))
+        windows = dict([(w.end, w.sum) for w in aggregator.flush()])
+        assert windows == {20: 1, 40: 3, 60: 6, 80: 9, 100: 7, 120: 4}
+
+    def test_group_by(self):
+        aggregator = PerfAggregator(60, group_by={'vm-1': 'host-1',
+                                                  'vm-2': 'host-1'})
+        aggregator.add(_series('vm-1', [20, 40], [1, 2]))
+        aggregator.add(_series('vm-2', [20, 40], [3, 4]))
+        aggregator.add(_series('vm-3', [20], [5]))
+        windows = dict([(w.group, w) for w in aggregator.flush()])
+        assert sorted(windows) == ['host-1', 'vm-3']
+        assert windows['host-1'].count == 4 and windows['host-1'].sum == 10
+        assert windows['host-1'].max == 4
+
+    def test_flush_until(self):
+        aggregator = PerfAggregator(60)
+        aggregator.add(_series('vm-1', [20, 80, 140], [1, 2, 3]))
+        assert [w.end for w in aggregator.flush(120)] == [60, 120]
+        aggregator.add(_series('vm-1', [160], [4]))
+        windows = aggregator.flush()
+        assert [(w.end, w.sum) for w in windows] == [(180, 7)]
+
+    def test_invalid_window(self):
+        self.assertRaises(VIException, PerfAggregator, 0)
+        self.assertRaises(VIException, PerfAggregator, 60, step=0)
+        self.assertRaises(VIException, PerfAggregator, 60, step=120)
+
+class _OfflineServer(object):
+    def __init__(self, properties):
+        self.properties = properties
+
+    def _get_object_properties_bulk(self, mor_list, properties):
+        ret = []
+        for mor in mor_list:
+            for name in properties.values()[0]:
+                if (str(mor), name) in self.properties:
+                    val = self.properties[(str(mor), name)]
+                    ret.append(_Obj(Obj=mor,
+                                    PropSet=[_Obj(Name=name, Val=val)]))
+        return ret
+
+class InventoryGroupsTest(TestCase):
+
+    def setUp(self):
+        self.host1 = _Mor('host-1', MORTypes.HostSystem)
+        self.host2 = _Mor('host-2', MORTypes.HostSystem)
+        self.cluster = _Mor('domain-c1', MORTypes.ClusterComputeResource)
+        self.server = _OfflineServer({
+            ('vm-1', 'runtime.host'): self.host1,
+            ('vm-2', 'runtime.host'): self.host2,
+            ('host-1', 'parent'): self.cluster,
+            ('host-2', 'parent'): self.cluster})
+        self.entities = [_Mor('vm-1', MORTypes.VirtualMachine),
+                         _Mor('vm-2', MORTypes.VirtualMachine),
+                         _Mor('vm-3', MORTypes.VirtualMachine),
+                         self.host1]
+
+    def test_host_groups(self):
+        groups = get_inventory_groups(self.server, self.entities, 'host',
+                                      batch_size=1)
+        assert groups == {'vm-1': 'host-1', 'vm-2': 'host-2',
+                          'host-1': 'host-1'}
+
+    def test_cluster_groups(self):
+        groups = get_inventory_groups(self.server, self.entities, 'cluster')
+        assert groups == {'vm-1': 'domain-c1', 'vm-2': 'domain-c1',
+                          'host-1': 'domain-c1'}
+
+    def test_invalid_level(self):
+        self.assertRaises(VIException, get_inventory_groups, self.server,
+                          self.entities, 'datacenter')
@@ -0,0 +1,89 @@
+import urllib2
+import threading
+from StringIO import StringIO
+from unittest import TestCase
+
+from pysphere.vi_performance_exporter import PerfExporter, MetricsHTTPServer
+
+class _OfflineServer(object):
+    def get_performance_manager(self):
+        return None
+
+class _FailingSampler(object):
+    refresh_rate = 20
+
+    def __init__(self):
+        self.error = None
+
+    def poll(self):
+        if self.error:
+            raise self.error
+        return []
+
+class MetricsHTTPServerTest(TestCase):
+
+    def setUp(self):
+        self.sampler = _FailingSampler()
+        self.metrics = MetricsHTTPServer(self.sampler,
+                                         PerfExporter(_OfflineServer()),
+                                         port=0, address='127.0.0.1')
+
+    def tearDown(self):
+        self.metrics._httpd.server_close()
+
+    def _scrape(self):
+        out = StringIO()
+        self.metrics.write_metrics(out)
+        return out.getvalue().splitlines()
+
+    def test_poll_errors(self):
+        lines = self._scrape()
+        assert "vsphere_exporter_up 0" in lines
+        assert "vsphere_exporter_poll_errors_total 0" in lines
+        assert lines[-1] == "# EOF"
+
+        self.metrics._poll_once()
+        lines = self._scrape()
+        assert "vsphere_exporter_up 1" in lines
+        assert [l for l in lines
+                if l.startswith("vsphere_exporter_last_success_timestamp")]
+        assert self.metrics.last_error is None
+
+        error = Exception("connection lost")
+        self.sampler.error = error
+        self.metrics._poll_once()
+        self.metrics._poll_once()
+        lines = self._scrape()
+        assert "vsphere_exporter_up 0" in lines
+        assert "vsphere_exporter_poll_errors_total 2" in lines
+        assert self.metrics.last_error is error
+        assert self.metrics.last_error_time is not None
+        assert lines[-1] == "# EOF" and lines.count("# EOF") == 1
+
+        self.sampler.error = None
+        self.metrics._poll_once()
+        assert "vsphere_exporter_up 1" in self._scrape()
+        assert self.metrics.last_error is None
+
+    def _stop(self):
+        stopping = threading.Thread(target=self.metrics.stop)
+        stopping.setDaemon(True)
+        stopping.start()
+        stopping.join(5)
+        assert not stopping.isAlive()
+
+    def test_stop_without_start(self):
+        self._stop()
+        self._stop()
+
+    def test_start_and_stop(self):
+        self.metrics.start()
+        threads = self.metrics._threads
+        response = urllib2.urlopen("http://127.0.0.1:%d/metrics" %
+                                   self.metrics.port)
+        try:
+            assert response.read().endswith("# EOF\n")
+        finally:
+            response.close()
+        self._stop()
+        assert threads and not [t for t in threads if t.isAlive()]
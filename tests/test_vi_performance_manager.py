@@ -0,0 +1,66 @@
+import os
+import time
+import datetime
+from unittest import TestCase
+
+from pysphere.ZSI.TCtimes import gDateTime
+from pysphere.vi_performance_manager import PerformanceManager, CounterInfo
+
+class _Obj(object):
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+class _OfflinePerformanceManager(PerformanceManager):
+    def __init__(self):
+        self._counter_info = CounterInfo(2, "usage", "CPU usage", "cpu", "CPU",
+                                         "percent", "Percentage")
+
+    def _get_shared_counter_info(self, counter_id):
+        return self._counter_info
+
+class PerformanceManagerStatisticsTest(TestCase):
+
+    def setUp(self):
+        self._tz = os.environ.get("TZ")
+        os.environ["TZ"] = "Europe/Madrid"
+        time.tzset()
+
+    def tearDown(self):
+        if self._tz is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = self._tz
+        time.tzset()
+
+    def _query_result(self):
+        sample_info = [_Obj(Timestamp=gDateTime().text_to_data(t, None, None),
+                            Interval=20)
+                       for t in ("2012-05-10T10:00:20Z",
+                                 "2012-05-10T10:00:40Z")]
+        stats = [_Obj(Id=_Obj(CounterId=2, Instance=""), Value=[100, 200])]
+        return sample_info, stats
+
+    def test_statistics_time_is_utc(self):
+        pm = _OfflinePerformanceManager()
+        sample_info, stats = self._query_result()
+        ret = pm._get_statistics("host-1", stats, sample_info)
+        assert len(ret) == 1
+        assert ret[0].value == 200 and ret[0].counter == "usage"
+        assert ret[0].time == datetime.datetime(2012, 5, 10, 10, 0, 40)
+
+    def test_all_samples(self):
+        pm = _OfflinePerformanceManager()
+        sample_info, stats = self._query_result()
+        ret = pm._get_statistics("host-1", stats, sample_info,
+                                 all_samples=True)
+        assert [s.value for s in ret] == [100, 200]
+        assert [s.time for s in ret] == [
+                                    datetime.datetime(2012, 5, 10, 10, 0, 20),
+                                    datetime.datetime(2012, 5, 10, 10, 0, 40)]
+
+    def test_without_sample_info(self):
+        pm = _OfflinePerformanceManager()
+        sample_info, stats = self._query_result()
+        before = datetime.datetime.utcnow()
+        ret = pm._get_statistics("host-1", stats)
+        assert before <= ret[0].time <= datetime.datetime.utcnow()
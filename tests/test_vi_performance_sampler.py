@@ -0,0 +1,62 @@
+import os
+import time
+from unittest import TestCase
+
+from pysphere.ZSI.TCtimes import gDateTime
+from pysphere.vi_performance_manager import PerformanceManager
+from pysphere.vi_performance_sampler import _backfill_items
+
+class _OfflinePerformanceManager(object):
+    DEFAULT_BATCH_SIZE = PerformanceManager.DEFAULT_BATCH_SIZE
+    MAX_QUERY_METRICS = PerformanceManager.MAX_QUERY_METRICS
+
+    def _get_counter_ids(self, entity, counters, interval):
+        return [2, 6]
+
+    def _check_and_get_interval_by_id(self, entity, interval):
+        return {None:20, 1:300}[interval]
+
+class _OfflineServer(object):
+    def __init__(self):
+        self.pm = _OfflinePerformanceManager()
+
+    def get_performance_manager(self):
+        return self.pm
+
+class BackfillWindowsTest(TestCase):
+
+    def setUp(self):
+        self._tz = os.environ.get("TZ")
+        os.environ["TZ"] = "Asia/Kolkata"
+        time.tzset()
+
+    def tearDown(self):
+        if self._tz is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = self._tz
+        time.tzset()
+
+    def test_windows(self):
+        server = _OfflineServer()
+        start = 1336644000 #2012-05-10T10:00:00Z
+        items = _backfill_items(server, ["host-1", "host-2", "host-3"],
+                                ["cpu.usage"], start, start + 7200,
+                                PerformanceManager.INTERVALS.PAST_DAY, "",
+                                window_samples=12, batch_size=2)
+        #two 1h windows, two requests (2 + 1 entities) each
+        assert len(items) == 4
+        assert [len(specs) for pm, specs in items] == [2, 1, 2, 1]
+        times = [(gDateTime().get_formatted_content(specs[0]['start_time']),
+                  gDateTime().get_formatted_content(specs[0]['end_time']))
+                 for pm, specs in items]
+        assert times == [("2012-05-10T10:00:00Z", "2012-05-10T11:00:00Z")] * 2 \
+                      + [("2012-05-10T11:00:00Z", "2012-05-10T12:00:00Z")] * 2
+        for pm, specs in items:
+            for spec in specs:
+                assert spec['interval_id'] == 300
+                assert spec['counter_ids'] == [2, 6]
+
+    def test_no_entities(self):
+        assert _backfill_items(_OfflineServer(), [], ["cpu.usage"], 0, 3600,
+                               None, "*", 360, None) == []
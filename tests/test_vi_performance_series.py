@@ -0,0 +1,96 @@
+import os
+import time
+from unittest import TestCase
+
+from pysphere.ZSI.TCtimes import gDateTime
+from pysphere.vi_performance_series import PerfSeries, numpy, \
+     decode_perf_entity_metrics, decode_entity_metric, \
+     decode_csv_entity_metric, _timestamp_to_tuple
+
+class _Obj(object):
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+def _series(counter_id, instance, value):
+    return _Obj(Id=_Obj(CounterId=counter_id, Instance=instance), Value=value)
+
+TIMES = ["2012-05-10T10:00:20Z", "2012-05-10T10:00:40Z",
+         "2012-12-10T23:59:40Z"]
+#the same instants, in seconds since the epoch
+TIMESTAMPS = [1336644020, 1336644040, 1355183980]
+
+class PerfSeriesDecodingTest(TestCase):
+
+    def setUp(self):
+        #ZSI converts dateTime values to local time, test it away from UTC
+        #and across a DST change
+        self._tz = os.environ.get("TZ")
+        os.environ["TZ"] = "America/New_York"
+        time.tzset()
+
+    def tearDown(self):
+        if self._tz is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = self._tz
+        time.tzset()
+
+    def _normal_metric(self):
+        sample_info = [_Obj(Timestamp=gDateTime().text_to_data(t, None, None),
+                            Interval=20) for t in TIMES]
+        return _Obj(Entity="host-1", SampleInfo=sample_info,
+                    Value=[_series(2, "", [10, 20, 30]),
+                           _series(6, "0", [1, -1, 3])])
+
+    def _csv_metric(self):
+        info = ",".join(["20,%s" % t for t in TIMES])
+        return _Obj(Entity="host-1", SampleInfoCSV=info,
+                    Value=[_series(2, "", "10,20,30"),
+                           _series(6, "0", "1,,3")])
+
+    def test_decode_entity_metric(self):
+        series = decode_entity_metric(self._normal_metric())
+        assert series.entity == "host-1" and len(series) == 3
+        assert list(series.timestamps) == TIMESTAMPS
+        assert list(series.intervals) == [20, 20, 20]
+        assert sorted(series.keys()) == [(2, ""), (6, "0")]
+        assert list(series.get(2)) == [10, 20, 30]
+        assert list(series.get(6, "0")) == [1, -1, 3]
+        assert series.get(6) is None
+
+    def test_normal_and_csv_formats_agree(self):
+        normal = decode_entity_metric(self._normal_metric())
+        csv = decode_csv_entity_metric(self._csv_metric())
+        assert list(csv.timestamps) == list(normal.timestamps)
+        assert list(csv.intervals) == list(normal.intervals)
+        for key in normal.keys():
+            assert list(csv.values[key]) == list(normal.values[key])
+
+    def test_decode_perf_entity_metrics(self):
+        result = decode_perf_entity_metrics([self._normal_metric(),
+                                             self._csv_metric()])
+        assert len(result) == 2
+        assert list(result[0].timestamps) == list(result[1].timestamps)
+        assert decode_perf_entity_metrics(None) == []
+
+    def test_empty_metric(self):
+        series = decode_entity_metric(_Obj(Entity="vm-1"))
+        assert len(series) == 0 and series.keys() == []
+        series = decode_csv_entity_metric(_Obj(Entity="vm-1",
+                                               SampleInfoCSV=""))
+        assert len(series) == 0
+
+    def test_timestamp_to_tuple(self):
+        for text, timestamp in zip(TIMES, TIMESTAMPS):
+            time_tuple = _timestamp_to_tuple(timestamp)
+            assert time_tuple[6] == 0
+            assert gDateTime().get_formatted_content(time_tuple) == text
+
+    def test_as_numpy(self):
+        if numpy is None:
+            return
+        series = decode_entity_metric(self._normal_metric())
+        timestamps, values = series.as_numpy()
+        assert list(timestamps) == TIMESTAMPS
+        assert list(values[(6, "0")]) == [1, -1, 3]
+        assert isinstance(series, PerfSeries)
@@ -0,0 +1,119 @@
+import os
+import shutil
+import datetime
+import tempfile
+from array import array
+from unittest import TestCase
+
+from pysphere import VIException
+from pysphere.vi_performance_series import PerfSeries, INT_TYPECODE
+from pysphere.vi_performance_store import PerfStore, numpy
+
+class _Obj(object):
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+def _series(entity, timestamps, values, instance=''):
+    return PerfSeries(entity, array(INT_TYPECODE, timestamps),
+                      array(INT_TYPECODE, [20] * len(timestamps)),
+                      {(2, instance): array(INT_TYPECODE, values)})
+
+class PerfStoreTest(TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.store = PerfStore(os.path.join(self.path, 'store'),
+                               retention=100)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.path)
+
+    def test_add_and_read(self):
+        assert self.store.add(_series('vm-1', [1000, 1020, 1040, 1060],
+                                      [1, -1, 3, 4])) == 3
+        #samples not newer than the last one are ignored
+        assert self.store.add(_series('vm-1', [1040, 1080], [9, 5])) == 1
+        assert list(self.store.read('vm-1', 2)) == [(1000, 1), (1040, 3),
+                                                    (1060, 4), (1080, 5)]
+        view = self.store.read('vm-1', 2, '', 1000, 1060)
+        assert list(view) == [(1040, 3), (1060, 4)]
+        assert len(view) == 2 and view[-1] == (1060, 4)
+        self.assertRaises(IndexError, view.__getitem__, 2)
+        assert list(view.timestamps()) == [1040, 1060]
+        assert list(view.values()) == [3, 4]
+        assert len(self.store.read('vm-1', 2, '', 2000)) == 0
+        assert len(self.store.read('vm-2', 2)) == 0
+
+    def test_keys_and_reopen(self):
+        self.store.add(_series('vm-1', [1000, 1020], [1, 2], 'vmnic0'))
+        self.store.add(_series('vm~/2', [1000], [7]))
+        assert sorted(self.store.keys()) == [('vm-1', 2, 'vmnic0'),
+                                             ('vm~/2', 2, '')]
+        self.store.close()
+        self.store = PerfStore(self.store.path)
+        assert self.store.add(_series('vm-1', [1020, 1040], [2, 3],
+                                      'vmnic0')) == 1
+        assert list(self.store.read('vm-1', 2, 'vmnic0')) == [
+                                          (1000, 1), (1020, 2), (1040, 3)]
+        assert list(self.store.read('vm~/2', 2)) == [(1000, 7)]
+
+    def test_add_statistics(self):
+        statistics = [_Obj(mor='host-1', counter_key=2, instance='',
+                           time=datetime.datetime(2012, 5, 10, 10, 0, s),
+                           value=s)
+                      for s in (40, 0, 20)]
+        assert self.store.add_statistics(statistics) == 3
+        samples = list(self.store.read('host-1', 2))
+        assert [value for ts, value in samples] == [0, 20, 40]
+        assert samples[0][0] == 1336644000
+
+    def test_compact(self):
+        self.store.add(_series('vm-1', range(1000, 1200, 20), range(10)))
+        self.store.add(_series('vm-2', [1000], [1]))
+        self.store.compact(now=1200)
+        assert list(self.store.read('vm-1', 2)) == [(1100, 5), (1120, 6),
+                                             (1140, 7), (1160, 8), (1180, 9)]
+        assert self.store.keys() == [('vm-1', 2, '')]
+        assert self.store.add(_series('vm-1', [1180, 1200], [0, 10])) == 1
+        assert self.store.read('vm-1', 2)[-1] == (1200, 10)
+
+    def test_not_a_segment(self):
+        f = open(os.path.join(self.store.path, 'vm-1~2~.seg'), 'wb')
+        f.write('x' * 64)
+        f.close()
+        self.assertRaises(VIException, self.store.read, 'vm-1', 2)
+
+    def test_as_numpy(self):
+        if numpy is None:
+            return
+        self.store.add(_series('vm-1', [1000, 1020, 1040], [1, 2, 3]))
+        view = self.store.read('vm-1', 2, '', 1000)
+        records = view.as_numpy()
+        assert list(records['value']) == [2, 3]
+        assert list(view.base + records['delta']) == [1020, 1040]
+
+    def test_partial_record(self):
+        self.store.add(_series('vm-1', [1000, 1020, 1040], [1, 2, 3]))
+        path = os.path.join(self.store.path,
+                            self.store._file_name('vm-1', 2, ''))
+        f = open(path, 'ab')
+        f.write('\x01\x02\x03\x04\x05')
+        f.close()
+        assert list(self.store.read('vm-1', 2)) == [(1000, 1), (1020, 2),
+                                                    (1040, 3)]
+        assert self.store.add(_series('vm-1', [1040, 1060], [3, 4])) == 1
+        assert os.path.getsize(path) == 16 + 4 * 12
+        self.store.close()
+        self.store = PerfStore(self.store.path)
+        assert list(self.store.read('vm-1', 2)) == [(1000, 1), (1020, 2),
+                                                    (1040, 3), (1060, 4)]
+
+    def test_partial_header(self):
+        path = os.path.join(self.store.path,
+                            self.store._file_name('vm-1', 2, ''))
+        f = open(path, 'wb')
+        f.write('PST')
+        f.close()
+        assert self.store.add(_series('vm-1', [1000, 1020], [1, 2])) == 2
+        assert list(self.store.read('vm-1', 2)) == [(1000, 1), (1020, 2)]
@@ -1,10 +1,21 @@
 import os
 import random
+import time
+import shutil
+import tempfile
 import ConfigParser
+from StringIO import StringIO
 from unittest import TestCase
 
 from pysphere import VIServer, VIProperty, MORTypes, VIException, FaultTypes, \
                      VMPowerState, ToolsStatus
+from pysphere.vi_performance_manager import PerformanceManager
+from pysphere.vi_performance_sampler import PerfSampler, backfill
+from pysphere.vi_performance_aggregation import PerfAggregator, \
+                                                get_inventory_groups
+from pysphere.vi_performance_exporter import PerfExporter
+from pysphere.vi_performance_store import PerfStore
+from pysphere.ZSI.wstools.Utility import ElementProxy
 
 class VIServerTest(TestCase):
 
@@ -108,6 +119,19 @@ class VIServerTest(TestCase):
         assert sorted(all_vms) == sorted(vms_by_datacenter) == sorted(
                                                                  vms_by_root_rp)
 
+    def test_element_proxy_writer(self):
+        server = VIServer()
+        server.connect(self.config.get("READ_ONLY_ENV", "host"),
+                       self.config.get("READ_ONLY_ENV", "user"),
+                       self.config.get("READ_ONLY_ENV", "password"),
+                       writerclass=ElementProxy)
+        try:
+            assert server._proxy.binding.writerclass is ElementProxy
+            assert sorted(server.get_registered_vms()) == sorted(
+                                            self.server.get_registered_vms())
+        finally:
+            server.disconnect()
+
     def test_get_registered_vms_by_datacenter(self):
         for dc_key, dc_name in self.server.get_datacenters().items():
             vms1 = self.server.get_registered_vms(datacenter=dc_key)
@@ -292,5 +316,178 @@ class VIServerTest(TestCase):
                 raise AssertionError("Unexpected mor type %s" 
                                      % mor.get_attribute_type())
         assert sorted(all_mors) == sorted(found)
+
+    def test_inventory_cache(self):
+        hosts = self.server.get_hosts()
+        datastores = self.server.get_datastores()
+        clusters = self.server.get_clusters()
+        resource_pools = self.server.get_resource_pools()
+        vms = self.server.get_registered_vms()
+        vms_by_dc = [(dc, self.server.get_registered_vms(datacenter=dc))
+                     for dc in self.server.get_datacenters().keys()]
+        self.server.enable_inventory_cache()
+        try:
+            assert hosts == self.server.get_hosts()
+            assert datastores == self.server.get_datastores()
+            assert clusters == self.server.get_clusters()
+            assert resource_pools == self.server.get_resource_pools()
+            assert sorted(vms) == sorted(self.server.get_registered_vms())
+            for dc, dc_vms in vms_by_dc:
+                assert sorted(dc_vms) == sorted(
+                                self.server.get_registered_vms(datacenter=dc))
+        finally:
+            self.server.disable_inventory_cache()
+
+    def test_get_vms(self):
+        paths = self.server.get_registered_vms()[:10]
+        vms = self.server.get_vms(paths, batch_size=3)
+        assert len(vms) == len(paths)
+        for path, vm in zip(paths, vms):
+            assert vm.get_property('path') == path
+            assert vm.get_properties() == self.server.get_vm_by_path(
+                                                         path).get_properties()
+        self.assertRaises(VIException, self.server.get_vms,
+                          paths + ['[nodatastore] novm/novm.vmx'])
+
+    def test_container_views(self):
+        hosts = self.server.get_hosts()
+        datastores = self.server.get_datastores()
+        resource_pools = self.server.get_resource_pools()
+        vms = self.server.get_registered_vms()
+        hosts_by_dc = [(dc, self.server.get_hosts(from_mor=dc))
+                       for dc in self.server.get_datacenters().keys()]
+        self.server.enable_container_views()
+        try:
+            assert hosts == self.server.get_hosts()
+            assert datastores == self.server.get_datastores()
+            assert resource_pools == self.server.get_resource_pools()
+            assert sorted(vms) == sorted(self.server.get_registered_vms())
+            for dc, dc_hosts in hosts_by_dc:
+                assert dc_hosts == self.server.get_hosts(from_mor=dc)
+        finally:
+            self.server.disable_container_views()
+
+    def test_container_views_eviction(self):
+        hosts = self.server.get_hosts()
+        datastores = self.server.get_datastores()
+        self.server.MAX_CONTAINER_VIEWS = 1
+        self.server.enable_container_views()
+        try:
+            for i in range(2):
+                assert hosts == self.server.get_hosts()
+                assert datastores == self.server.get_datastores()
+        finally:
+            self.server.disable_container_views()
+            del self.server.MAX_CONTAINER_VIEWS
+        assert hosts == self.server.get_hosts()
+
+    def test_perf_sampler(self):
+        hosts = self.server.get_hosts().keys()[:3]
+        sampler = PerfSampler(self.server, hosts, ['cpu.usage'], instance='',
+                              batch_size=2)
+        first = sampler.poll()
+        assert len(first) == len(hosts)
+        watermarks = {}
+        for series in first:
+            assert len(series) == 1
+            watermarks[str(series.entity)] = series.timestamps[-1]
+            assert sampler.get_watermark(series.entity) == series.timestamps[-1]
+        for series in sampler.samples(count=1):
+            assert series.timestamps[0] > watermarks[str(series.entity)]
+
+    def test_backfill(self):
+        hosts = self.server.get_hosts().keys()[:2]
+        end = int(time.time()) // 300 * 300
+        start = end - 86400
+        series = list(backfill(self.server, hosts, ['cpu.usage'], start, end,
+                               interval=PerformanceManager.INTERVALS.PAST_DAY,
+                               instance='', window_samples=24))
+        for host in hosts:
+            timestamps = []
+            for s in series:
+                if str(s.entity) == str(host):
+                    timestamps.extend(s.timestamps)
+            assert timestamps == sorted(set(timestamps))
+            assert timestamps and start < timestamps[0] and \
+                   timestamps[-1] <= end
+
+    def test_perf_aggregation(self):
+        vms = self.server._get_managed_objects(
+                                            MORTypes.VirtualMachine).keys()[:20]
+        groups = get_inventory_groups(self.server, vms, 'cluster')
+        assert groups
+        end = int(time.time()) // 3600 * 3600
+        aggregator = PerfAggregator(3600, group_by=groups)
+        for series in backfill(self.server, vms, ['cpu.usage'],
+                               end - 6 * 3600, end,
+                               interval=PerformanceManager.INTERVALS.PAST_DAY,
+                               instance=''):
+            aggregator.add(series)
+        for stats in aggregator.flush(end):
+            assert stats.end <= end and stats.group in groups.values()
+            assert stats.min <= stats.avg() <= stats.max
+            assert stats.min * 0.98 <= stats.percentile(95) <= stats.max * 1.02
+
+    def test_entity_statistic_all_samples(self):
+        host = self.server.get_hosts().keys()[0]
+        pm = self.server.get_performance_manager()
+        last = pm.get_entity_statistic(host, ['cpu.usage'])
+        stats = pm.get_entity_statistic(host, ['cpu.usage'], all_samples=True)
+        assert len(stats) > len(last) > 0
+        for stat in stats:
+            assert isinstance(stat.value, (int, long))
+            assert stat.counter_info is stats[0].counter_info
+        assert max([s.time for s in stats]) >= max([s.time for s in last])
+
+    def test_perf_exporter(self):
+        hosts = self.server.get_hosts().keys()[:3]
+        series = PerfSampler(self.server, hosts, ['cpu.usage']).poll()
+        for format in PerfExporter.FORMATS:
+            out = StringIO()
+            exporter = PerfExporter(self.server, format)
+            for s in series:
+                exporter.write_series(s, out)
+            lines = out.getvalue().splitlines()
+            assert len(lines) == sum([len(s.values) for s in series])
+            assert all([l.startswith('vsphere_cpu') for l in lines])
+        out = StringIO()
+        PerfExporter(self.server).write_exposition(series, out)
+        assert out.getvalue().startswith('# TYPE vsphere_cpu_usage_')
+        assert out.getvalue().endswith('# EOF\n')
+
+    def test_composite_statistics(self):
+        host = self.server.get_hosts().keys()[0]
+        vms = self.server._get_managed_objects(MORTypes.VirtualMachine,
+                                               from_mor=host)
+        pm = self.server.get_performance_manager()
+        stats = pm.get_composite_statistics([host], ['cpu.usage'])
+        assert host in stats
+        for mor, values in stats.items():
+            assert mor == host or mor in vms
+            for stat in values:
+                assert stat.mor == mor
+
+    def test_perf_store(self):
+        hosts = self.server.get_hosts().keys()[:2]
+        path = tempfile.mkdtemp()
+        try:
+            store = PerfStore(path, retention=3600)
+            end = int(time.time())
+            count = 0
+            for series in backfill(self.server, hosts, ['cpu.usage'],
+                                   end - 7200, end, instance=''):
+                count += store.add(series)
+            assert count and len(store.keys()) == len(hosts)
+            for entity, counter_id, instance in store.keys():
+                samples = list(store.read(entity, counter_id, instance,
+                                          end - 600, end))
+                assert samples and samples == sorted(samples)
+                assert end - 600 < samples[0][0] and samples[-1][0] <= end
+            store.compact(now=end)
+            for key in store.keys():
+                assert store.read(*key)[0][0] >= end - 3600
+            store.close()
+        finally:
+            shutil.rmtree(path)
                 
         
\ No newline at end of file
@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+from pysphere import VIServer, VIException, FaultTypes
+
+class MapTest(TestCase):
+
+    def test_results_order(self):
+        server = VIServer()
+        assert server.map(lambda x: x * 2, range(20), workers=3) == \
+               range(0, 40, 2)
+
+    def test_exceptions(self):
+        server = VIServer()
+        def func(x):
+            if x % 2:
+                raise ValueError(x)
+            return x
+        results = server.map(func, range(4), return_exceptions=True)
+        assert results[0] == 0 and results[2] == 2
+        assert isinstance(results[1], ValueError)
+        try:
+            server.map(func, range(4))
+        except ValueError, e:
+            assert e.args == (1,)
+        else:
+            self.fail("ValueError not raised")
+
+    def test_invalid_workers(self):
+        server = VIServer()
+        for workers in (0, -1, None, 2.5):
+            try:
+                server.map(lambda x: x, [1, 2], workers=workers)
+            except VIException, e:
+                assert e.fault == FaultTypes.PARAMETER_ERROR
+            else:
+                self.fail("VIException not raised for %r" % (workers,))
@@ -0,0 +1,308 @@
+import time
+import socket
+import threading
+from unittest import TestCase
+
+from pysphere import VIServer, VIException, VIApiException, FaultTypes
+from pysphere.vi_task import VITask, _TaskWaiter
+
+class _Obj(object):
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+class _OfflineServer(VIServer):
+    """Answers the task state queries with the @states of each poll"""
+    def __init__(self, states):
+        VIServer.__init__(self)
+        self.states = states
+        self.polls = 0
+
+    def _get_object_properties_bulk(self, mor_list, properties):
+        states = self.states[min(self.polls, len(self.states) - 1)]
+        self.polls += 1
+        return [_Obj(Obj=mor, PropSet=[_Obj(Name='info.state', Val=states[mor]),
+                                       _Obj(Name='info.progress', Val=None)])
+                for mor in mor_list if mor in states]
+
+class AsCompletedTest(TestCase):
+
+    def test_yields_completed_tasks(self):
+        server = _OfflineServer([{'task-1': 'running', 'task-2': 'success'},
+                                 {'task-1': 'error'}])
+        tasks = [VITask('task-1', server), VITask('task-2', server)]
+        completed = list(server.as_completed(tasks, check_interval=0))
+        assert [task._mor for task in completed] == ['task-2', 'task-1']
+
+    def test_missing_task(self):
+        server = _OfflineServer([{'task-1': 'running'}])
+        tasks = [VITask('task-1', server), VITask('task-2', server)]
+        try:
+            list(server.as_completed(tasks, check_interval=0))
+        except VIException, e:
+            assert e.fault == FaultTypes.OBJECT_NOT_FOUND
+            assert 'task-2' in e.message
+        else:
+            self.fail("VIException not raised")
+        assert server.polls == 1
+
+_LEFT = object()
+
+class _FakeProxy(object):
+    """Property collector of a server with a few tasks: WaitForUpdatesEx
+    blocks until the state of a task with a filter changes"""
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.binding = _Obj(transdict={})
+        self.filters = {}
+        self.created = []
+        self.destroyed = []
+        self.polls = 0
+        self.max_waits = set()
+        self.pollers = set()
+        self.polling = 0
+        self.max_polling = 0
+        self._cond = threading.Condition()
+        self._sent = {}
+
+    def set_state(self, key, state):
+        self._cond.acquire()
+        try:
+            self.tasks[key] = state
+            self._cond.notifyAll()
+        finally:
+            self._cond.release()
+
+    def purge(self, key):
+        self._cond.acquire()
+        try:
+            del self.tasks[key]
+            self._cond.notifyAll()
+        finally:
+            self._cond.release()
+
+    def create_filter(self, mor):
+        self._cond.acquire()
+        try:
+            filter_mor = 'filter-%d' % (len(self.created) + 1)
+            self.created.append(filter_mor)
+            self.filters[filter_mor] = str(mor)
+            self._cond.notifyAll()
+            return filter_mor
+        finally:
+            self._cond.release()
+
+    def destroy_filter(self, filter_mor):
+        self._cond.acquire()
+        try:
+            self.destroyed.append(filter_mor)
+            del self.filters[filter_mor]
+            self._sent.pop(filter_mor, None)
+        finally:
+            self._cond.release()
+
+    def wait_for_updates(self, max_wait):
+        self._cond.acquire()
+        try:
+            self.polls += 1
+            self.pollers.add(threading.currentThread())
+            self.max_waits.add(max_wait)
+            self.polling += 1
+            self.max_polling = max(self.max_polling, self.polling)
+            deadline = time.time() + max_wait
+            try:
+                while True:
+                    updates = self._updates()
+                    if updates:
+                        return _Obj(Version=str(self.polls),
+                                    FilterSet=[_Obj(ObjectSet=updates)])
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return None
+                    self._cond.wait(remaining)
+            finally:
+                self.polling -= 1
+        finally:
+            self._cond.release()
+
+    def _updates(self):
+        updates = []
+        for filter_mor, key in self.filters.items():
+            if key not in self.tasks:
+                if self._sent.get(filter_mor, _LEFT) is not _LEFT:
+                    self._sent[filter_mor] = _LEFT
+                    updates.append(_Obj(Kind='leave', Obj=key))
+                continue
+            state = self.tasks.get(key)
+            if self._sent.get(filter_mor) == state:
+                continue
+            self._sent[filter_mor] = state
+            updates.append(_Obj(Kind='modify', Obj=key,
+                                ChangeSet=[_Obj(Name='info.state', Val=state),
+                                           _Obj(Name='info.progress')]))
+        return updates
+
+class _OfflineTaskWaiter(_TaskWaiter):
+    MAX_WAIT = 1
+
+    def _create_filter(self, mor):
+        return self._server._proxy.create_filter(mor)
+
+    def _wait_for_updates(self, max_wait):
+        return self._server._proxy.wait_for_updates(max_wait)
+
+    def _destroy_filter(self, filter_mor):
+        self._server._proxy.destroy_filter(filter_mor)
+
+class _Waiting(threading.Thread):
+    def __init__(self, waiter, mor, states, timeout=-1):
+        threading.Thread.__init__(self)
+        self.setDaemon(True)
+        self.args = (mor, states, timeout)
+        self.waiter = waiter
+        self.result = self.error = None
+        self.start()
+
+    def run(self):
+        try:
+            self.result = self.waiter.wait(*self.args)
+        except Exception, e:
+            self.error = e
+
+class TaskWaiterTest(TestCase):
+
+    def setUp(self):
+        self.proxy = _FakeProxy({'task-1': 'running', 'task-2': 'queued'})
+        self.waiter = _OfflineTaskWaiter(_Obj(_proxy=self.proxy))
+
+    def _join(self, threads):
+        for thread in threads:
+            thread.join(5)
+            assert not thread.isAlive()
+
+    def _assert_clean(self):
+        assert not self.waiter._watchers and not self.waiter._values
+        assert not self.waiter._filters and not self.proxy.filters
+        assert sorted(self.proxy.destroyed) == sorted(self.proxy.created)
+
+    def test_current_state(self):
+        assert self.waiter.wait('task-1', ['running']) == 'running'
+        self._assert_clean()
+
+    def test_several_threads(self):
+        threads = [_Waiting(self.waiter, 'task-1', ['success', 'error'])
+                   for i in range(3)]
+        threads += [_Waiting(self.waiter, 'task-2', ['running'])
+                    for i in range(2)]
+        time.sleep(0.1)
+        self.proxy.set_state('task-2', 'running')
+        self._join(threads[3:])
+        assert [t.result for t in threads[3:]] == ['running', 'running']
+        assert [t.isAlive() for t in threads[:3]] == [True] * 3
+        self.proxy.set_state('task-1', 'error')
+        self._join(threads[:3])
+        assert [t.result for t in threads[:3]] == ['error'] * 3
+        assert len(self.proxy.created) <= 3
+        assert self.proxy.max_polling == 1
+        self._assert_clean()
+
+    def test_polling_hand_off(self):
+        first = _Waiting(self.waiter, 'task-1', ['success'])
+        time.sleep(0.1)
+        second = _Waiting(self.waiter, 'task-2', ['success'])
+        time.sleep(0.1)
+        #the first thread polls for both, and the second one takes over
+        self.proxy.set_state('task-1', 'success')
+        self._join([first])
+        self.proxy.set_state('task-2', 'success')
+        self._join([second])
+        assert (first.result, second.result) == ('success', 'success')
+        assert second in self.proxy.pollers
+        assert self.proxy.max_polling == 1
+        self._assert_clean()
+
+    def test_timeout(self):
+        start = time.time()
+        try:
+            self.waiter.wait('task-1', ['success'], timeout=0.3)
+        except VIException, e:
+            assert e.fault == FaultTypes.TIME_OUT
+        else:
+            self.fail("VIException not raised")
+        assert 0.3 <= time.time() - start < 2
+        self._assert_clean()
+
+    def test_cleanup_on_error(self):
+        def fail(max_wait):
+            raise VIApiException(Exception("boom"))
+        self.waiter._wait_for_updates = fail
+        self.assertRaises(VIApiException, self.waiter.wait, 'task-1', ['success'])
+        self._assert_clean()
+        self.waiter._wait_for_updates = self.proxy.wait_for_updates
+        self.proxy.set_state('task-1', 'success')
+        assert self.waiter.wait('task-1', ['success']) == 'success'
+        self._assert_clean()
+
+    def test_filters_are_created_without_the_lock(self):
+        created = threading.Event()
+        create_filter = self.proxy.create_filter
+        def slow_create_filter(mor):
+            if mor == 'task-2':
+                created.wait(5)
+            return create_filter(mor)
+        self.proxy.create_filter = slow_create_filter
+        slow = _Waiting(self.waiter, 'task-2', ['queued'])
+        time.sleep(0.1)
+        #task-2's filter is still being created
+        assert self.waiter.wait('task-1', ['running'], timeout=1) == 'running'
+        created.set()
+        self._join([slow])
+        assert slow.result == 'queued'
+        self._assert_clean()
+
+    def test_destroy_filter_error(self):
+        def fail(filter_mor):
+            raise VIApiException(Exception("boom"))
+        self.proxy.destroy_filter = fail
+        assert self.waiter.wait('task-1', ['running']) == 'running'
+        try:
+            self.waiter.wait('task-1', ['success'], timeout=0.1)
+        except VIException, e:
+            assert e.fault == FaultTypes.TIME_OUT
+        else:
+            self.fail("VIException not raised")
+        assert not self.waiter._filters and not self.waiter._watchers
+
+    def test_task_leaves(self):
+        waiting = _Waiting(self.waiter, 'task-1', ['success'])
+        time.sleep(0.1)
+        self.proxy.purge('task-1')
+        self._join([waiting])
+        assert isinstance(waiting.error, VIException)
+        assert waiting.error.fault == FaultTypes.OBJECT_NOT_FOUND
+        assert 'task-1' in waiting.error.message
+        self._assert_clean()
+
+    def test_max_wait_below_socket_timeout(self):
+        waiter = _TaskWaiter(_Obj(_proxy=self.proxy))
+        assert waiter._max_wait() == waiter.MAX_WAIT == 10
+        for sock_timeout, max_wait in ((30, 10), (5, 4), (2.5, 1), (1.5, 0)):
+            self.proxy.binding.transdict['timeout'] = sock_timeout
+            assert waiter._max_wait() == max_wait
+        del self.proxy.binding.transdict['timeout']
+        default_timeout = socket.getdefaulttimeout()
+        socket.setdefaulttimeout(3)
+        try:
+            assert waiter._max_wait() == 2
+        finally:
+            socket.setdefaulttimeout(default_timeout)
+
+    def test_short_socket_timeout(self):
+        self.proxy.binding.transdict['timeout'] = 0.5
+        self.waiter.POLL_INTERVAL = 0.05
+        waiting = _Waiting(self.waiter, 'task-1', ['success'])
+        time.sleep(0.2)
+        self.proxy.set_state('task-1', 'success')
+        self._join([waiting])
+        assert waiting.result == 'success'
+        assert self.proxy.polls > 1 and self.proxy.max_waits == set([0])
+        self._assert_clean()
@@ -5,6 +5,7 @@ import ConfigParser
 from unittest import TestCase
 
 from pysphere import VIServer, VMPowerState, ToolsStatus
+from pysphere.vi_virtual_machine import VIVirtualMachine
 
 class VIVirtualMachineTest(TestCase):
 
@@ -99,6 +100,19 @@ class VIVirtualMachineTest(TestCase):
         assert vm.is_powered_off()
         assert not(vm.is_powered_on() or vm.is_suspended())
 
+    def test_wait_for_tasks(self):
+        vm = self.vm_toy
+        if not vm.is_powered_off():
+            vm.power_off()
+        seen = []
+        task = vm.power_on(sync_run=False)
+        done = self.server2.wait_for_tasks([task], timeout=120,
+                              progress_callback=lambda t, s, p: seen.append(s))
+        assert done == [task]
+        assert task.get_state() == task.STATE_SUCCESS
+        assert seen and seen[-1] == task.STATE_SUCCESS
+        vm.power_off()
+
     def test_extra_config(self):
         #just check no exception are raised
         vm = self.vm_toy
@@ -135,6 +149,20 @@ class VIVirtualMachineTest(TestCase):
         props2 = vm.get_properties(from_cache=True)
         assert props == props2
 
+    def test_get_properties_subset(self):
+        vm = self.get_random_vm()
+        path = vm.get_property("path")
+        vm2 = self.server.get_vm_by_path(path, properties=["name", "path",
+                                                       "runtime.powerState"])
+        assert vm2.get_property("name") == vm.get_property("name")
+        assert vm2.get_property("path") == path
+        assert vm2.get_property("runtime.powerState") in ["poweredOn",
+                                                 "poweredOff", "suspended"]
+        for p in ["guest_id", "memory_mb", "num_cpu", "hostname"]:
+            assert vm2.get_property(p) == vm.get_property(p)
+        assert len(vm2.get_snapshots()) == len(vm.get_snapshots())
+        assert vm2.get_resource_pool_name() == vm.get_resource_pool_name()
+
     def test_tools_status(self):
         vm = self.get_random_vm()
         assert vm.get_tools_status() in [ToolsStatus.NOT_INSTALLED,
@@ -308,4 +336,65 @@ class VIVirtualMachineTest(TestCase):
         assert vm.get_tools_status() in [ToolsStatus.RUNNING,
                                          ToolsStatus.RUNNING_OLD]
         vm.properties._flush_cache()
-        return vm
\ No newline at end of file
+        return vm
+
+
+class _Obj(object):
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+class _Mor(str):
+    typecode = _Obj(type=('urn:vim25', 'ManagedObjectReference'))
+
+    def get_attribute_type(self):
+        return 'VirtualMachine'
+
+class _OfflineServer(object):
+    """Answers the property requests with the @values of a single VM"""
+    def __init__(self, values):
+        self.values = values
+        self.requests = []
+
+    def _get_object_properties(self, mor, property_names=[], get_all=False):
+        self.requests.append(get_all and 'all' or sorted(property_names))
+        names = get_all and ['name', 'runtime'] or property_names
+        prop_set = [_Obj(Name=name, Val=self.values[name])
+                    for name in names if name in self.values]
+        return _Obj(PropSet=prop_set, get_element_propSet=lambda: prop_set)
+
+class VIVirtualMachineLazyPropertiesTest(TestCase):
+
+    def setUp(self):
+        question = _Obj(id='q1', text='Continue?',
+                        choice=_Obj(choiceInfo=[_Obj(key='0', label='Yes'),
+                                                _Obj(key='1', label='No')],
+                                    defaultIndex=1))
+        self.server = _OfflineServer({
+            'name': 'vm1',
+            'config.files.vmPathName': '[ds] vm1/vm1.vmx',
+            'runtime.question': question,
+            'runtime': _Obj(question=question)})
+        self.vm = VIVirtualMachine(self.server, _Mor('vm-1'),
+                                   properties=['name'])
+
+    def test_get_question(self):
+        question = self.vm.get_question()
+        assert question.text() == 'Continue?'
+        assert question.default_choice() == ('1', 'No')
+        assert self.server.requests == [['name'], ['runtime.question']]
+        del self.server.values['runtime.question']
+        assert self.vm.get_question() is None
+        assert self.server.requests[2:] == [['runtime.question']]
+        assert self.vm.get_property('name') == 'vm1'
+        assert len(self.server.requests) == 3
+
+    def test_properties_attribute(self):
+        assert self.vm.properties.name == 'vm1'
+        assert self.server.requests == [['name'], 'all']
+        assert self.vm.get_property('path') == '[ds] vm1/vm1.vmx'
+        assert self.vm.properties.name == 'vm1'
+        assert self.server.requests[2:] == [['config.files.vmPathName']]
+        self.vm.get_property('name', from_cache=False)
+        assert self.vm.properties.name == 'vm1'
+        assert self.server.requests[3:] == [['config.files.vmPathName',
+                                             'name'], 'all']
@@ -0,0 +1,152 @@
+import time
+import socket
+import httplib
+import threading
+import SocketServer
+from unittest import TestCase
+
+from pysphere.ZSI import TC
+from pysphere.ZSI.client import _Binding, _ConnectionPool
+
+class _SOAPHandler(SocketServer.StreamRequestHandler):
+    """Answers POST requests on a keep-alive connection. The server's
+    'behaviour' decides what happens after each request is read: 'ok'
+    replies and keeps the connection, 'close' replies and closes it, 'drop'
+    closes it without replying, and 'unauthorized' replies a 401."""
+
+    def handle(self):
+        self.server.connections += 1
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            length = 0
+            while True:
+                header = self.rfile.readline().strip()
+                if not header:
+                    break
+                name, value = header.split(":", 1)
+                if name.lower() == "content-length":
+                    length = int(value)
+            self.rfile.read(length)
+            self.server.requests += 1
+            behaviour = self.server.behaviour
+            if behaviour == "drop":
+                return
+            status = behaviour == "unauthorized" and "401 Unauthorized" \
+                     or "200 OK"
+            body = "<ok/>"
+            self.wfile.write("HTTP/1.1 %s\r\nContent-Type: text/xml\r\n"
+                             "Content-Length: %d\r\n\r\n%s" % (status,
+                                                               len(body), body))
+            self.wfile.flush()
+            if behaviour == "close":
+                return
+
+class _SOAPServer(SocketServer.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        SocketServer.ThreadingTCPServer.__init__(self, ("127.0.0.1", 0),
+                                                 _SOAPHandler)
+        self.connections = 0
+        self.requests = 0
+        self.behaviour = "ok"
+
+class _Connection(object):
+    def __init__(self):
+        self.sock = None
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+class ConnectionPoolTest(TestCase):
+
+    def test_max_size(self):
+        pool = _ConnectionPool(2, 30)
+        conns = [_Connection() for _ in range(3)]
+        for conn in conns:
+            pool.put("key", conn)
+        assert conns[2].closed and not conns[0].closed
+
+    def test_stale_connections_are_discarded(self):
+        pool = _ConnectionPool(2, 30)
+        conn = _Connection()
+        pool.put("key", conn)
+        #a connection without a socket can't be reused
+        assert pool.get("key") is None and conn.closed
+
+    def test_max_idle_and_clear(self):
+        pool = _ConnectionPool(4, 0)
+        conn = _Connection()
+        pool.put("key", conn)
+        time.sleep(0.01)
+        assert pool.get("key") is None and conn.closed
+        conn = _Connection()
+        pool.put("other", conn)
+        pool.clear()
+        assert conn.closed and pool.get("other") is None
+
+class BindingConnectionTest(TestCase):
+
+    def setUp(self):
+        self.server = _SOAPServer()
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.setDaemon(True)
+        thread.start()
+        self.url = "http://127.0.0.1:%d/sdk" % self.server.server_address[1]
+        self.binding = _Binding(url=self.url)
+
+    def tearDown(self):
+        self.binding.CloseConnections()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _call(self):
+        self.binding.Send(None, "Echo", "hello",
+                          requesttypecode=TC.String(pname="Echo"))
+        return self.binding.ReceiveRaw()
+
+    def test_connection_reuse(self):
+        for _ in range(3):
+            assert self._call() == "<ok/>"
+        assert self.server.requests == 3
+        assert self.server.connections == 1
+
+    def test_no_reuse_without_pool(self):
+        self.binding = _Binding(url=self.url, pool_size=0)
+        for _ in range(2):
+            assert self._call() == "<ok/>"
+        assert self.server.connections == 2
+
+    def test_connection_closed_while_idle(self):
+        self.server.behaviour = "close"
+        assert self._call() == "<ok/>"
+        time.sleep(0.2)
+        self.server.behaviour = "ok"
+        assert self._call() == "<ok/>"
+        assert self.server.requests == 2
+        assert self.server.connections == 2
+
+    def test_request_is_not_sent_twice(self):
+        assert self._call() == "<ok/>"
+        self.server.behaviour = "drop"
+        self.assertRaises((httplib.HTTPException, socket.error),
+                          self._call)
+        #the server got the request, sending it again could repeat it
+        assert self.server.requests == 2
+        assert self.binding.local.h is None
+        self.server.behaviour = "ok"
+        assert self._call() == "<ok/>"
+        assert self.server.requests == 3
+
+    def test_connection_is_discarded_on_error(self):
+        self.server.behaviour = "unauthorized"
+        self.assertRaises(RuntimeError, self._call)
+        assert self.binding.local.h is None
+        assert self.server.requests == 1
+        self.server.behaviour = "ok"
+        assert self._call() == "<ok/>"
+        assert self.server.connections == 2
@@ -0,0 +1,108 @@
+from unittest import TestCase
+
+from pysphere.ZSI import TC, SoapWriter, ParsedSoap, FaultFromFaultMessage
+from pysphere.ZSI.TCcompound import ComplexType
+from pysphere.ZSI.parse import CompactReader
+
+NS = 'urn:vim25'
+NS2 = 'urn:other'
+
+class _Spec(object):
+    pass
+
+class _Response(object):
+    pass
+
+SPEC_TC = ComplexType(_Spec,
+    [TC.String(pname=(NS, 'type'), typed=False),
+     TC.String(pname=(NS, 'pathSet'), typed=False, minOccurs=0,
+               maxOccurs='unbounded'),
+     TC.Boolean(pname=(NS, 'all'), minOccurs=0),
+     TC.Integer(pname=(NS2, 'count'), minOccurs=0),
+     TC.AnyType(pname=(NS, 'val'), minOccurs=0)],
+    pname=(NS, 'returnval'), minOccurs=0, maxOccurs='unbounded')
+SPEC_TC.attribute_typecode_dict = {'type': TC.String()}
+
+RESPONSE_TC = ComplexType(_Response,
+    [TC.String(pname=(NS, 'token'), typed=False, minOccurs=0), SPEC_TC],
+    pname=(NS, 'RetrievePropertiesExResponse'))
+
+RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
+<!-- a comment before the envelope -->
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"
+ xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+ xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+<soapenv:Body>
+<RetrievePropertiesExResponse xmlns="urn:vim25" xmlns:o="urn:other">
+  <token>  spaced &amp; escaped  </token>
+  <returnval type="PropertySpec">
+    <type>VirtualMachine</type>
+    <pathSet>name</pathSet>
+    <!-- a comment between children -->
+    <pathSet>a&lt;b&gt;<![CDATA[c&d]]>&#233;</pathSet>
+    <all>true</all>
+    <o:count>7</o:count>
+    <val xsi:type="xsd:int">42</val>
+  </returnval>
+  <returnval><type>Datastore</type><pathSet></pathSet>
+    <val xsi:type="xsd:string">\xc3\xa1rbol
+multi line</val></returnval>
+</RetrievePropertiesExResponse>
+</soapenv:Body>
+</soapenv:Envelope>"""
+
+FAULT = """<soapenv:Envelope
+ xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+<soapenv:Body><soapenv:Fault>
+<faultcode>ServerFaultCode</faultcode>
+<faultstring>The object has already been deleted</faultstring>
+<detail><NotFound xmlns="urn:other"/></detail>
+</soapenv:Fault></soapenv:Body></soapenv:Envelope>"""
+
+def _dump(value):
+    """Turns a parsed value into nested builtins so that two parses can be
+    compared."""
+    if isinstance(value, list):
+        return [_dump(v) for v in value]
+    if hasattr(value, '__dict__'):
+        return (type(value).__name__,
+                sorted((k, _dump(v)) for k, v in value.__dict__.items()))
+    return (type(value).__name__, value)
+
+def _parse(xml, readerclass=None):
+    return ParsedSoap(xml, readerclass=readerclass)
+
+class CompactReaderTest(TestCase):
+
+    def test_same_result(self):
+        expected = _parse(RESPONSE).Parse(RESPONSE_TC)
+        result = _parse(RESPONSE, CompactReader).Parse(RESPONSE_TC)
+        assert _dump(result) == _dump(expected)
+        assert result.token == 'spaced & escaped'
+        assert result.returnval[0].pathSet[1] == 'a<b>c&d\xc3\xa9'
+        assert result.returnval[0]._attrs == {'type': 'PropertySpec'}
+        assert result.returnval[1].val == '\xc3\xa1rbol\nmulti line'
+
+    def test_writer_output(self):
+        sw = SoapWriter(nsdict={'ns0': NS})
+        sw.serialize(_parse(RESPONSE).Parse(RESPONSE_TC), RESPONSE_TC)
+        xml = str(sw)
+        assert _dump(_parse(xml, CompactReader).Parse(RESPONSE_TC)) == \
+               _dump(_parse(xml).Parse(RESPONSE_TC))
+
+    def test_document_navigation(self):
+        expected = _parse(RESPONSE)
+        ps = _parse(RESPONSE, CompactReader)
+        assert not ps.IsAFault()
+        assert ps.body_root.localName == expected.body_root.localName
+        assert ps.body_root.namespaceURI == expected.body_root.namespaceURI
+        assert ps.GetElementNSdict(ps.body_root) == \
+               expected.GetElementNSdict(expected.body_root)
+
+    def test_fault(self):
+        expected = FaultFromFaultMessage(_parse(FAULT))
+        ps = _parse(FAULT, CompactReader)
+        assert ps.IsAFault()
+        fault = FaultFromFaultMessage(ps)
+        assert (fault.code, fault.string) == (expected.code, expected.string)
+        assert fault.string == 'The object has already been deleted'
@@ -0,0 +1,153 @@
+import copy
+from unittest import TestCase
+
+from pysphere.ZSI import TC, SoapWriter, ParsedSoap
+from pysphere.ZSI.TCcompound import ComplexType
+from pysphere.ZSI.schema import GED, ElementDeclaration, TypeDefinition
+from pysphere.ZSI.generate.pyclass import pyclass_type
+
+NS = 'urn:vim25'
+
+class _Outer(object):
+    pass
+
+def _holder(slots, aname='_name'):
+    """Returns a DynamicProperty-shaped pyclass built by pyclass_type."""
+    tc = ComplexType(None, [TC.String(pname=(NS, 'name'), aname=aname,
+                                      typed=False),
+                            TC.AnyType(pname=(NS, 'val'), aname='_val')],
+                     pname=(NS, 'propSet'), minOccurs=0,
+                     maxOccurs='unbounded')
+    tc.attribute_typecode_dict = {'type': TC.String()}
+    class Holder:
+        __metaclass__ = pyclass_type
+        _pyclass_slots = slots
+        typecode = tc
+        def __init__(self):
+            pass
+    tc.pyclass = Holder
+    return Holder
+
+def _round_trip(holder):
+    out_tc = ComplexType(_Outer, [holder.typecode], pname=(NS, 'Out'))
+    outer = _Outer()
+    outer.propSet = []
+    for i in range(3):
+        obj = holder()
+        obj.set_element_name('name%d' % i)
+        obj.Val = i
+        obj.set_attribute_type('t&%d' % i)
+        outer.propSet.append(obj)
+    sw = SoapWriter()
+    sw.serialize(outer, out_tc)
+    return ParsedSoap(str(sw)).Parse(out_tc).propSet
+
+class SlottedHolderTest(TestCase):
+
+    def test_slots(self):
+        holder = _holder(True)
+        assert holder.__slots__ == ('_attrs', '_name', '_val')
+        obj = holder()
+        assert not hasattr(obj, '__dict__')
+        self.assertRaises(AttributeError, setattr, obj, 'bogus', 1)
+        obj.Name = 'vm'
+        obj.set_element_val(5)
+        obj.set_attribute_type('VirtualMachine')
+        assert obj.get_element_name() == 'vm' and obj.Val == 5
+        assert obj.get_attribute_type() == 'VirtualMachine'
+
+    def test_default_keeps_dict(self):
+        assert pyclass_type.use_slots is False
+        holder = pyclass_type('Holder', (),
+                              {'typecode': _holder(True).typecode})
+        assert '__slots__' not in holder.__dict__
+        assert hasattr(holder(), '__dict__')
+        assert hasattr(_holder(False)(), '__dict__')
+
+    def test_mangled_aname_keeps_dict(self):
+        holder = _holder(True, aname='__name')
+        assert '__slots__' not in holder.__dict__
+        obj = holder()
+        obj.Name = 'vm'
+        assert obj.get_element_name() == 'vm'
+
+    def test_round_trip(self):
+        result = _round_trip(_holder(True))
+        expected = _round_trip(_holder(False))
+        assert len(result) == 3
+        for obj, other in zip(result, expected):
+            assert not hasattr(obj, '__dict__')
+            assert (obj.Name, obj.Val, obj.get_attribute_type()) == \
+                   (other.Name, other.Val, other.get_attribute_type())
+        assert (result[2].Name, result[2].Val) == ('name2', 2)
+        assert result[2].get_attribute_type() == 't&2'
+
+    def test_deepcopy(self):
+        obj = _round_trip(_holder(True))[1]
+        clone = copy.deepcopy(obj)
+        assert clone is not obj and type(clone) is type(obj)
+        assert (clone.Name, clone.Val, clone._attrs) == \
+               (obj.Name, obj.Val, obj._attrs)
+        clone.Name = 'other'
+        assert obj.Name == 'name1'
+
+NS_ANY = 'urn:test-pyclass-any'
+
+class _Item_Dec(ComplexType, ElementDeclaration):
+    literal = 'Item'
+    schema = NS_ANY
+    def __init__(self, **kw):
+        kw['pname'] = (NS_ANY, 'Item')
+        kw['aname'] = '_Item'
+        ComplexType.__init__(self, None, [TC.String(pname=(NS_ANY, 'name'),
+                             aname='_name', typed=False)], **kw)
+        class Holder:
+            __metaclass__ = pyclass_type
+            _pyclass_slots = True
+            typecode = self
+            def __init__(self):
+                self._name = None
+        self.pyclass = Holder
+
+class _ItemType_Def(ComplexType, TypeDefinition):
+    type = (NS_ANY, 'ItemType')
+    def __init__(self, pname, **kw):
+        ComplexType.__init__(self, None, [TC.String(pname=(NS_ANY, 'name'),
+                             aname='_name', typed=False)], pname=pname, **kw)
+        class Holder:
+            __metaclass__ = pyclass_type
+            _pyclass_slots = True
+            typecode = self
+            def __init__(self):
+                self._name = None
+        self.pyclass = Holder
+
+ANY_TC = ComplexType(_Outer, [TC.AnyElement(aname='any', minOccurs=0,
+                                            maxOccurs='unbounded')],
+                     pname=(NS_ANY, 'Parent'))
+
+ANY_XML = """<soapenv:Envelope
+ xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"
+ xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+<soapenv:Body><Parent xmlns="%s" xmlns:t="%s">
+<Item><name>element</name></Item>
+<other xsi:type="t:ItemType"><name>type</name></other>
+</Parent></soapenv:Body></soapenv:Envelope>""" % (NS_ANY, NS_ANY)
+
+class SlottedAnyElementTest(TestCase):
+
+    def test_parse(self):
+        item, other = ParsedSoap(ANY_XML).Parse(ANY_TC).any
+        assert not hasattr(item, '__dict__')
+        assert item.typecode is GED(NS_ANY, 'Item')
+        assert item.Name == 'element'
+        assert not hasattr(other, '__dict__')
+        assert isinstance(other.typecode, _ItemType_Def)
+        assert other.typecode.pname == 'other' and other.Name == 'type'
+
+    def test_round_trip(self):
+        parent = ParsedSoap(ANY_XML).Parse(ANY_TC)
+        sw = SoapWriter()
+        sw.serialize(parent, ANY_TC)
+        item, other = ParsedSoap(str(sw)).Parse(ANY_TC).any
+        assert (item.Name, other.Name) == ('element', 'type')
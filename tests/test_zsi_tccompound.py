@@ -0,0 +1,103 @@
+from unittest import TestCase
+
+from pysphere.ZSI import TC, SoapWriter, ParsedSoap
+from pysphere.ZSI.TCcompound import ComplexType
+
+NS = 'urn:vim25'
+NS2 = 'urn:other'
+
+class _Obj(object):
+    pass
+
+class _Outer(object):
+    pass
+
+def _obj_tc(*extra, **kw):
+    fields = [TC.String(pname=(NS, 'f%d' % i), typed=False, minOccurs=0)
+              for i in range(20)]
+    fields.append(TC.Integer(pname=(NS, 'ints'), typed=False, minOccurs=0,
+                             maxOccurs='unbounded'))
+    fields.append(TC.String(pname='unqualified', typed=False, minOccurs=0))
+    fields.append(TC.String(pname=(NS2, 'other'), typed=False, minOccurs=0))
+    fields.extend(extra)
+    return ComplexType(_Obj, fields, pname=(NS, 'obj'), minOccurs=0,
+                       maxOccurs='unbounded', **kw)
+
+def _outer_tc(obj_tc):
+    return ComplexType(_Outer, [obj_tc], pname=(NS, 'Outer'))
+
+def _outer(count):
+    outer = _Outer()
+    outer.obj = []
+    for k in range(count):
+        obj = _Obj()
+        for i in range(20):
+            if (i + k) % 5:
+                setattr(obj, 'f%d' % i, 'v%d_%d' % (k, i))
+        obj.ints = range(k % 4) or None
+        obj.unqualified = 'u%d' % k
+        obj.other = k % 2 and 'o%d' % k or None
+        outer.obj.append(obj)
+    return outer
+
+def _xml(count):
+    sw = SoapWriter()
+    sw.serialize(_outer(count), _outer_tc(_obj_tc()))
+    return str(sw)
+
+def _dump(outer):
+    return [sorted(obj.__dict__.items()) for obj in outer.obj]
+
+def _parse(xml, tc, table=True):
+    for what in (tc, tc.ofwhat[0]):
+        what.__dict__.pop('_child_table', None)
+        if not table:
+            #forces the sequential scan over ofwhat
+            what._child_table = (what.ofwhat, None)
+    return ParsedSoap(xml).Parse(tc)
+
+class ChildTableTest(TestCase):
+
+    def test_same_result(self):
+        xml = _xml(30)
+        tc = _outer_tc(_obj_tc())
+        expected = _dump(_parse(xml, tc, table=False))
+        assert _dump(_parse(xml, tc)) == expected
+        assert tc.ofwhat[0]._get_child_table() is not None
+        assert expected[1][:2] == [('f0', 'v1_0'), ('f1', 'v1_1')]
+
+    def test_unqualified_and_unknown_children(self):
+        xml = _xml(3).replace('<ns1:f3>', '<ns1:unknown>x</ns1:unknown>'
+                                          '<ns1:f3>')
+        assert xml.count('<unqualified>') == 3
+        assert '<ns1:unknown>' in xml
+        tc = _outer_tc(_obj_tc())
+        result = _dump(_parse(xml, tc))
+        assert result == _dump(_parse(xml, tc, table=False))
+        assert ('unqualified', 'u2') in result[2]
+
+    def test_dict_holder(self):
+        xml = _xml(2)
+        tc = _outer_tc(_obj_tc())
+        tc.ofwhat[0].pyclass = None
+        expected = _parse(xml, tc, table=False).obj
+        assert _parse(xml, tc).obj == expected
+        assert expected[0]['unqualified'] == 'u0'
+
+    def test_sequential_content_models(self):
+        assert _obj_tc(inorder=True)._get_child_table() is None
+        wildcard = TC.AnyElement(aname='any', minOccurs=0)
+        assert _obj_tc(wildcard)._get_child_table() is None
+        repeated = TC.String(pname=(NS2, 'f1'), typed=False)
+        assert _obj_tc(repeated)._get_child_table() is None
+        default = TC.String(pname=(NS, 'withdefault'), typed=False)
+        default.default = 'x'
+        assert _obj_tc(default)._get_child_table() is None
+
+    def test_table_follows_ofwhat(self):
+        tc = _obj_tc()
+        table = tc._get_child_table()
+        assert tc._get_child_table() is table
+        assert table[(None, 'unqualified')] is tc.ofwhat[-2]
+        tc.ofwhat = tc.ofwhat[:1]
+        assert tc._get_child_table().keys() == [(NS, 'f0')]
@@ -0,0 +1,134 @@
+from unittest import TestCase
+
+from pysphere.ZSI import TC, SoapWriter
+from pysphere.ZSI.TCcompound import ComplexType
+from pysphere.ZSI.writer import StringElementProxy, FragmentList
+from pysphere.ZSI.wstools.Utility import ElementProxy
+
+NS = 'urn:vim25'
+NS2 = 'urn:other'
+NS3 = 'urn:last'
+
+class _Spec(object):
+    pass
+
+class _Request(object):
+    pass
+
+_SPEC_OFWHAT = [TC.String(pname=(NS, 'type'), typed=False),
+                TC.String(pname=(NS, 'pathSet'), typed=False, minOccurs=0,
+                          maxOccurs='unbounded'),
+                TC.Boolean(pname=(NS, 'all'), minOccurs=0),
+                TC.Integer(pname=(NS2, 'count'), minOccurs=0),
+                TC.String(pname=(NS2, 'note'), minOccurs=0)]
+
+REQUEST_TC = ComplexType(_Request,
+    [TC.String(pname=(NS, '_this'), typed=False),
+     ComplexType(_Spec, _SPEC_OFWHAT, pname=(NS, 'propSet'), minOccurs=0,
+                 maxOccurs='unbounded', typed=True, type=(NS, 'PropertySpec')),
+     TC.String(pname=(NS3, 'last'), typed=False, minOccurs=0)],
+    pname=(NS, 'RetrievePropertiesEx'))
+
+def _specs(count):
+    specs = []
+    for i in range(count):
+        spec = _Spec()
+        spec.type = 'VirtualMachine'
+        spec.pathSet = ['name', 'a&b<c>"d"\n\r\t%d' % i]
+        spec.all = i % 2 == 0
+        spec.count = i % 3 and i or None
+        spec.note = i % 4 == 0 and u'unicode note' or None
+        specs.append(spec)
+    return specs
+
+def _request(specs):
+    request = _Request()
+    request._this = 'propertyCollector'
+    request.propSet = specs
+    request.last = 'last'
+    return request
+
+def _write(request, outputclass, nsdict={}):
+    sw = SoapWriter(nsdict=nsdict, outputclass=outputclass)
+    sw.serialize(request, REQUEST_TC)
+    return str(sw)
+
+class FragmentListTest(TestCase):
+
+    def test_same_output(self):
+        specs = FragmentList(_specs(5))
+        expected = _write(_request(_specs(5)), ElementProxy)
+        for i in range(3):
+            assert _write(_request(specs), StringElementProxy) == expected
+        assert len(specs.fragments) == 1
+
+    def test_namespace_scopes(self):
+        specs = FragmentList(_specs(5))
+        for nsdict in ({}, {'ns1': NS2}, {'': NS}, {}):
+            assert _write(_request(specs), StringElementProxy, nsdict) == \
+                   _write(_request(_specs(5)), ElementProxy, nsdict)
+        assert len(specs.fragments) == 3
+
+    def test_element_proxy(self):
+        specs = FragmentList(_specs(2))
+        assert _write(_request(specs), ElementProxy) == \
+               _write(_request(_specs(2)), StringElementProxy)
+        assert not specs.fragments
+
+class _Mor(str):
+    pass
+
+_MOR_TC = TC.String(pname=(NS, '_this'), typed=False)
+_MOR_TC.attribute_typecode_dict = {'type': TC.String()}
+
+VALUES_TC = ComplexType(_Request,
+    [_MOR_TC,
+     TC.AnyType(pname=(NS, 'val'), minOccurs=0, maxOccurs='unbounded'),
+     ComplexType(_Spec, _SPEC_OFWHAT, pname=(NS2, 'propSet'), minOccurs=0,
+                 maxOccurs='unbounded')],
+    pname=(NS, 'SetValues'))
+
+def _values():
+    request = _Request()
+    request._this = _Mor('propertyCollector')
+    request._this._attrs = {'type': 'Property"Collector<&>',
+                            (NS3, 'extra'): 'x y',
+                            (NS, 'plain'): '1'}
+    request.val = [42, u'caf\xe9 & <bar>', 'str', 1.5, True]
+    request.propSet = _specs(3)
+    for i, spec in enumerate(request.propSet):
+        spec._attrs = {('urn:attr%d' % (i % 2), 'a'): 'v%d' % i}
+    return request
+
+class StringElementProxyTest(TestCase):
+
+    def _check(self, **kw):
+        output = []
+        for outputclass in (ElementProxy, StringElementProxy):
+            sw = SoapWriter(outputclass=outputclass, **kw)
+            sw.serialize(_values(), VALUES_TC)
+            output.append(str(sw))
+        assert output[0] == output[1], output
+
+    def test_same_output(self):
+        self._check()
+
+    def test_nsdict(self):
+        for nsdict in ({'ns9': 'urn:x'}, {'ns1': NS2, 'ns2': NS3},
+                       {'': 'urn:default'}):
+            self._check(nsdict=nsdict)
+
+    def test_header(self):
+        self._check(header=False)
+        self._check(nsdict={'ns1': NS}, header=True)
+
+    def test_no_envelope(self):
+        self._check(envelope=False)
+        self._check(envelope=False, nsdict={'ns1': NS2})
+
+    def test_escaping(self):
+        sw = SoapWriter(outputclass=StringElementProxy)
+        sw.serialize(_values(), VALUES_TC)
+        xml = str(sw)
+        assert 'type="Property&quot;Collector&lt;&amp;>"' in xml
+        assert 'caf\xc3\xa9 &amp; &lt;bar&gt;' in xml